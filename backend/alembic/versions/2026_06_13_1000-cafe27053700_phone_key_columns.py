@@ -0,0 +1,66 @@
+"""Persisted, indexed last-9-digit phone keys.
+
+Revision ID: cafe27053700
+Revises: cafe27053600
+Create Date: 2026-06-13 10:00:00
+
+Phone matching on the last 9 digits used ``RIGHT(REGEXP_REPLACE(...))``
+expressions or leading-wildcard ``ILIKE '%<last9>'`` filters, neither of
+which a plain index can serve. This adds a ``phone_key`` column to the
+tables we match on, backfills it with the same expression the old filters
+used, and indexes it. New rows are kept in sync by the ORM hooks in
+``models/phone_keys.py``.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "cafe27053700"
+down_revision: Union[str, None] = "cafe27053600"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column type, source expression)
+_TABLES = [
+    ("users", sa.Text(), "phone"),
+    ("user_contributors", sa.Text(), "phone"),
+    ("event_attendees", sa.Text(), "guest_phone"),
+    ("wa_message_logs", sa.String(length=9), "COALESCE(NULLIF(normalized_phone, ''), recipient_phone)"),
+]
+
+
+def upgrade() -> None:
+    for table, col_type, source in _TABLES:
+        op.add_column(table, sa.Column("phone_key", col_type, nullable=True))
+        op.execute(
+            f"""
+            UPDATE {table}
+               SET phone_key = RIGHT(REGEXP_REPLACE({source}, '[^0-9]', '', 'g'), 9)
+             WHERE phone_key IS NULL
+               AND LENGTH(REGEXP_REPLACE(COALESCE({source}, ''), '[^0-9]', '', 'g')) >= 9
+            """
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_phone_key "
+            f"ON {table} (phone_key)"
+        )
+
+    # Address-book lookups are always scoped to the owner.
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_user_contributors_owner_phone_key
+        ON user_contributors (user_id, phone_key)
+        """
+    )
+
+    for table, _, _ in _TABLES:
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_user_contributors_owner_phone_key")
+    for table, _, _ in reversed(_TABLES):
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_phone_key")
+        op.drop_column(table, "phone_key")
@@ -0,0 +1,29 @@
+"""Staged upload path on import jobs.
+
+Revision ID: cafe27053800
+Revises: cafe27053700
+Create Date: 2026-06-13 11:00:00
+
+Spreadsheet imports now stage the raw CSV / XLSX on disk and the worker
+streams it, instead of storing every parsed row in the job's JSONB
+``payload``. ``source_path`` records where the staged file lives.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "cafe27053800"
+down_revision: Union[str, None] = "cafe27053700"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("contributor_import_jobs", sa.Column("source_path", sa.Text(), nullable=True))
+    op.add_column("member_import_jobs", sa.Column("source_path", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("member_import_jobs", "source_path")
+    op.drop_column("contributor_import_jobs", "source_path")
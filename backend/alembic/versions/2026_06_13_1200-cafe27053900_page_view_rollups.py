@@ -0,0 +1,74 @@
+"""Hourly / daily page-view rollups.
+
+Revision ID: cafe27053900
+Revises: cafe27053800
+Create Date: 2026-06-13 12:00:00
+
+``GET /admin/analytics`` used to load up to 5,000 raw ``page_views`` rows
+and count them in Python, silently truncating busy ranges. It now reads
+these rollups, rebuilt by ``tasks.analytics.rollup_page_views``. Unique
+visitors / sessions are HyperLogLog sketches (``utils.hll``) stored as
+``bytea`` so they merge across buckets.
+
+After upgrading, backfill once from a worker shell:
+    rollup_page_views.run(hours_back=24 * 90)
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27053900"
+down_revision: Union[str, None] = "cafe27053800"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "page_view_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True,
+                  server_default=sa.text("gen_random_uuid()")),
+        sa.Column("granularity", sa.String(8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("views", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("visitors", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sessions", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("visitor_hll", sa.LargeBinary(), nullable=True),
+        sa.Column("session_hll", sa.LargeBinary(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint("granularity", "bucket_start", name="uq_page_view_rollup_bucket"),
+    )
+    op.create_table(
+        "page_view_rollup_dimensions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True,
+                  server_default=sa.text("gen_random_uuid()")),
+        sa.Column("granularity", sa.String(8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("dimension", sa.String(16), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("views", sa.Integer(), nullable=False, server_default="0"),
+        sa.UniqueConstraint(
+            "granularity", "bucket_start", "dimension", "value",
+            name="uq_page_view_rollup_dimension",
+        ),
+    )
+    op.create_index(
+        "idx_page_view_rollup_dims_lookup",
+        "page_view_rollup_dimensions",
+        ["granularity", "dimension", "bucket_start"],
+    )
+    # Hourly rebuilds scan page_views by time window; the dashboard's
+    # "recent views" list reads the newest rows.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_page_views_created_at "
+        "ON page_views (created_at DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_page_views_created_at")
+    op.drop_index("idx_page_view_rollup_dims_lookup", table_name="page_view_rollup_dimensions")
+    op.drop_table("page_view_rollup_dimensions")
+    op.drop_table("page_view_rollups")
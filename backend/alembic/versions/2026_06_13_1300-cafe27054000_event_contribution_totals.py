@@ -0,0 +1,50 @@
+"""Per-event contribution totals.
+
+Revision ID: cafe27054000
+Revises: cafe27053900
+Create Date: 2026-06-13 13:00:00
+
+``event_contribution_totals`` holds each event's pledged / paid / pending /
+balance sums, contribution counts by status and contributor WhatsApp
+availability counts. Contributor summary endpoints read it by primary key
+instead of loading every contributor with all contributions. Rows are
+built lazily on first read and recomputed on every write, so no backfill
+is required; ``POST /admin/repair/event-contribution-totals`` rebuilds
+them on demand.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054000"
+down_revision: Union[str, None] = "cafe27053900"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_contribution_totals",
+        sa.Column("event_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("total_pledged", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("total_paid", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("total_pending", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("total_balance", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("contributor_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("confirmed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("pending_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rejected_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wa_whatsapp", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wa_not_whatsapp", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wa_unknown", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wa_checking", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wa_failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_contribution_totals")
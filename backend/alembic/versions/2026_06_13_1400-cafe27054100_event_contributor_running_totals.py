@@ -0,0 +1,62 @@
+"""Running payment totals on event_contributors.
+
+Revision ID: cafe27054100
+Revises: cafe27054000
+Create Date: 2026-06-13 14:00:00
+
+Paid / pending / balance per contributor were re-derived in Python from
+every contribution row (forcing ``joinedload(EventContributor.contributions)``
+on every list). ``total_paid``, ``total_pending`` and ``last_payment_at``
+are now stored on the row and refreshed in the writing transaction by
+``services.event_totals``. The expression index backs sorting and
+filtering contributor lists by balance.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "cafe27054100"
+down_revision: Union[str, None] = "cafe27054000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("event_contributors", sa.Column("total_paid", sa.Numeric(), nullable=False, server_default="0"))
+    op.add_column("event_contributors", sa.Column("total_pending", sa.Numeric(), nullable=False, server_default="0"))
+    op.add_column("event_contributors", sa.Column("last_payment_at", sa.DateTime(), nullable=True))
+
+    op.execute("""
+        UPDATE event_contributors ec SET
+            total_paid = agg.paid,
+            total_pending = agg.pending,
+            last_payment_at = agg.last_payment_at
+        FROM (
+            SELECT
+                event_contributor_id AS id,
+                COALESCE(SUM(amount) FILTER (
+                    WHERE confirmation_status IS NULL OR confirmation_status = 'confirmed'
+                ), 0) AS paid,
+                COALESCE(SUM(amount) FILTER (WHERE confirmation_status = 'pending'), 0) AS pending,
+                MAX(COALESCE(contributed_at, created_at)) FILTER (
+                    WHERE confirmation_status IS NULL OR confirmation_status = 'confirmed'
+                ) AS last_payment_at
+            FROM event_contributions
+            GROUP BY event_contributor_id
+        ) agg
+        WHERE ec.id = agg.id
+    """)
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_event_contributors_event_balance "
+        "ON event_contributors (event_id, (COALESCE(pledge_amount, 0) - total_paid))"
+    )
+    op.execute("ANALYZE event_contributors")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_event_contributors_event_balance")
+    op.drop_column("event_contributors", "last_payment_at")
+    op.drop_column("event_contributors", "total_pending")
+    op.drop_column("event_contributors", "total_paid")
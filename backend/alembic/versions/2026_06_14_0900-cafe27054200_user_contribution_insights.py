@@ -0,0 +1,56 @@
+"""Per-user contribution insights snapshot.
+
+Revision ID: cafe27054200
+Revises: cafe27054100
+Create Date: 2026-06-14 09:00:00
+
+``GET /user-contributors/my-contributions/insights`` rebuilt the caller's
+entire giving history (address-book matches, every event link, a currency
+lookup per event, every confirmed payment) on each request. The result is
+now stored per user in ``user_contribution_insights`` and rebuilt by
+``services.contribution_insights`` when a contribution behind it changes.
+Rows are created lazily on first read, so nothing is backfilled here.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054200"
+down_revision: Union[str, None] = "cafe27054100"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_contribution_insights",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("currency", sa.Text(), nullable=False),
+        sa.Column("total_pledged", sa.Numeric(), nullable=False),
+        sa.Column("total_paid", sa.Numeric(), nullable=False),
+        sa.Column("total_pending", sa.Numeric(), nullable=False),
+        sa.Column("total_balance", sa.Numeric(), nullable=False),
+        sa.Column("events_count", sa.Integer(), nullable=False),
+        sa.Column("complete_count", sa.Integer(), nullable=False),
+        sa.Column("active_count", sa.Integer(), nullable=False),
+        sa.Column("pending_count", sa.Integer(), nullable=False),
+        sa.Column("payments_count", sa.Integer(), nullable=False),
+        sa.Column("organisations_supported", sa.Integer(), nullable=False),
+        sa.Column("avg_per_event", sa.Float(), nullable=False),
+        sa.Column("on_time_rate", sa.Float(), nullable=False),
+        sa.Column("first_contribution_at", sa.DateTime(), nullable=True),
+        sa.Column("last_contribution_at", sa.DateTime(), nullable=True),
+        sa.Column("biggest_contribution", postgresql.JSONB(), nullable=True),
+        sa.Column("monthly", postgresql.JSONB(), nullable=False),
+        sa.Column("by_method", postgresql.JSONB(), nullable=False),
+        sa.Column("top_organisers", postgresql.JSONB(), nullable=False),
+        sa.Column("stale", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("computed_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_contribution_insights")
@@ -0,0 +1,106 @@
+"""Denormalized inbox preview and unread counts on conversations.
+
+Revision ID: cafe27054300
+Revises: cafe27054200
+Create Date: 2026-06-14 10:00:00
+
+``GET /messages/`` loaded every conversation of the caller, every hide
+row, the two newest messages and an unread count per conversation, then
+searched the built dicts in Python. Conversations now carry their last
+message (text, sender, time, id), a pointer to the one before it and an
+unread count per participant, maintained by the send / read / delete
+paths. The inbox is keyset-paginated on ``(updated_at, id)`` per side, so
+the ``(user_*, updated_at)`` indexes gain ``id``; search on the last
+message uses a trigram index (``pg_trgm``).
+
+Backfill runs once over ``messages`` with a window function.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054300"
+down_revision: Union[str, None] = "cafe27054200"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (user_*, updated_at) inbox indexes from the model and from a3b4c5d6e7f8,
+# covered by the (user_*, updated_at, id) ones below.
+SUPERSEDED_INDEXES = [
+    ("idx_conversations_user_one_updated", "(user_one_id, updated_at)"),
+    ("idx_conversations_user_two_updated", "(user_two_id, updated_at)"),
+    ("idx_conversations_user_one_updated_desc", "(user_one_id, updated_at DESC)"),
+    ("idx_conversations_user_two_updated_desc", "(user_two_id, updated_at DESC)"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column("conversations", sa.Column("last_message_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column("conversations", sa.Column("last_message_text", sa.Text(), nullable=True))
+    op.add_column("conversations", sa.Column("last_message_sender_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column("conversations", sa.Column("last_message_at", sa.DateTime(), nullable=True))
+    op.add_column("conversations", sa.Column("previous_message_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column("conversations", sa.Column("user_one_unread", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("conversations", sa.Column("user_two_unread", sa.Integer(), nullable=False, server_default="0"))
+
+    # Keyset pagination compares (updated_at, id); a NULL would drop the row.
+    op.execute("UPDATE conversations SET updated_at = COALESCE(created_at, now()) WHERE updated_at IS NULL")
+
+    op.execute("""
+        WITH ranked AS (
+            SELECT id, conversation_id, sender_id, message_text, created_at,
+                   row_number() OVER (PARTITION BY conversation_id
+                                      ORDER BY created_at DESC, id DESC) AS rn
+            FROM messages
+        )
+        UPDATE conversations c SET
+            last_message_id = last.id,
+            last_message_text = last.message_text,
+            last_message_sender_id = last.sender_id,
+            last_message_at = last.created_at,
+            previous_message_id = prev.id
+        FROM ranked last
+        LEFT JOIN ranked prev ON prev.conversation_id = last.conversation_id AND prev.rn = 2
+        WHERE last.conversation_id = c.id AND last.rn = 1
+    """)
+    op.execute("""
+        UPDATE conversations c SET
+            user_one_unread = u.one_unread,
+            user_two_unread = u.two_unread
+        FROM (
+            SELECT m.conversation_id,
+                   count(*) FILTER (WHERE m.sender_id <> cc.user_one_id) AS one_unread,
+                   count(*) FILTER (WHERE m.sender_id <> cc.user_two_id) AS two_unread
+            FROM messages m JOIN conversations cc ON cc.id = m.conversation_id
+            WHERE m.is_read = false
+            GROUP BY m.conversation_id
+        ) u
+        WHERE u.conversation_id = c.id
+    """)
+
+    for name, _ in SUPERSEDED_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.create_index("idx_conversations_user_one_inbox", "conversations", ["user_one_id", "updated_at", "id"])
+    op.create_index("idx_conversations_user_two_inbox", "conversations", ["user_two_id", "updated_at", "id"])
+    op.create_index(
+        "idx_conversations_last_message_trgm", "conversations", ["last_message_text"],
+        postgresql_using="gin", postgresql_ops={"last_message_text": "gin_trgm_ops"},
+    )
+    op.execute("ANALYZE conversations")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_conversations_last_message_trgm", table_name="conversations")
+    op.drop_index("idx_conversations_user_two_inbox", table_name="conversations")
+    op.drop_index("idx_conversations_user_one_inbox", table_name="conversations")
+    for name, cols in SUPERSEDED_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON conversations {cols}")
+    for column in (
+        "user_two_unread", "user_one_unread", "previous_message_id", "last_message_at",
+        "last_message_sender_id", "last_message_text", "last_message_id",
+    ):
+        op.drop_column("conversations", column)
@@ -0,0 +1,70 @@
+"""Indexed search documents for users, services, events and contributors.
+
+Revision ID: cafe27054400
+Revises: cafe27054300
+Create Date: 2026-06-14 11:00:00
+
+User search, the admin user list, service search, the ticketed-events
+list and the event contributor search all filtered with leading-wildcard
+``ILIKE '%q%'`` over several columns, which no B-tree can serve. Each of
+those tables now has a STORED generated ``search_document`` (the searched
+columns lower-cased, phone numbers reduced to digits) with a pg_trgm GIN
+index; ``user_services`` also gets a ``simple``-config ``search_vector``.
+Queries go through ``utils.search.text_match``.
+
+Adding a stored generated column rewrites the table once.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054400"
+down_revision: Union[str, None] = "cafe27054300"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PHONE_DIGITS = "regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g')"
+
+DOCUMENTS = [
+    ("users", "idx_users_search_trgm",
+     "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(username, '')"
+     f" || ' ' || coalesce(email, '') || ' ' || {_PHONE_DIGITS})"),
+    ("user_services", "idx_user_services_search_trgm", "lower(coalesce(title, ''))"),
+    ("events", "idx_events_search_trgm", "lower(coalesce(name, '') || ' ' || coalesce(location, ''))"),
+    ("user_contributors", "idx_user_contributors_search_trgm",
+     f"lower(coalesce(name, '') || ' ' || coalesce(email, '') || ' ' || {_PHONE_DIGITS})"),
+]
+
+SERVICE_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, index, expression in DOCUMENTS:
+        op.add_column(table, sa.Column("search_document", sa.Text(), sa.Computed(expression, persisted=True)))
+        op.create_index(
+            index, table, ["search_document"],
+            postgresql_using="gin", postgresql_ops={"search_document": "gin_trgm_ops"},
+        )
+
+    op.add_column("user_services", sa.Column(
+        "search_vector", postgresql.TSVECTOR(), sa.Computed(SERVICE_VECTOR, persisted=True),
+    ))
+    op.create_index("idx_user_services_search_vector", "user_services", ["search_vector"], postgresql_using="gin")
+
+    for table, _, _ in DOCUMENTS:
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_user_services_search_vector", table_name="user_services")
+    op.drop_column("user_services", "search_vector")
+    for table, index, _ in reversed(DOCUMENTS):
+        op.drop_index(index, table_name=table)
+        op.drop_column(table, "search_document")
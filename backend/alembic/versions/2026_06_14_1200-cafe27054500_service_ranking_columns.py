@@ -0,0 +1,56 @@
+"""Denormalized service ratings and a lat/lng index for service search.
+
+Revision ID: cafe27054500
+Revises: cafe27054400
+Create Date: 2026-06-14 12:00:00
+
+``GET /services/`` with ``sort_by=relevance`` loaded 500 candidates with
+all their ratings, images and packages and ranked them in Python. The
+score is now a SQL expression (``services.service_ranking``), which needs
+the rating average and count on ``user_services`` itself; they are kept in
+step by session hooks on ``UserServiceRating``. ``radius_km`` becomes a
+real filter: a bounding box on ``(latitude, longitude)`` before the exact
+distance.
+
+Backfill is one aggregate over ``user_service_ratings``.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "cafe27054500"
+down_revision: Union[str, None] = "cafe27054400"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("user_services", sa.Column(
+        "rating_avg", sa.Numeric(3, 2), nullable=False, server_default="0",
+    ))
+    op.add_column("user_services", sa.Column(
+        "rating_count", sa.Integer(), nullable=False, server_default="0",
+    ))
+
+    op.execute("""
+        UPDATE user_services s SET
+            rating_avg = r.avg_rating,
+            rating_count = r.n
+        FROM (
+            SELECT user_service_id, avg(rating) AS avg_rating, count(*) AS n
+            FROM user_service_ratings
+            WHERE user_service_id IS NOT NULL
+            GROUP BY user_service_id
+        ) r
+        WHERE r.user_service_id = s.id
+    """)
+
+    op.create_index("idx_user_services_lat_lng", "user_services", ["latitude", "longitude"])
+    op.execute("ANALYZE user_services")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_user_services_lat_lng", table_name="user_services")
+    op.drop_column("user_services", "rating_count")
+    op.drop_column("user_services", "rating_avg")
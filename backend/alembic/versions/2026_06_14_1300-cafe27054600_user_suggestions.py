@@ -0,0 +1,44 @@
+"""Precomputed People You May Know candidates.
+
+Revision ID: cafe27054600
+Revises: cafe27054500
+Create Date: 2026-06-14 13:00:00
+
+``GET /users/search?suggested=true`` expanded the follow, circle,
+invitation and community graph of the caller on every request.
+``user_suggestions`` holds each user's top candidates, rebuilt in batched
+SQL by ``tasks.suggestions`` (dirty users every five minutes, all recently
+active users nightly). Users without rows are computed on first read, so
+the table starts empty; queue ``tasks.suggestions.refresh_all_suggestions``
+once after deploying to warm it.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054600"
+down_revision: Union[str, None] = "cafe27054500"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_suggestions",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("suggested_user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("score", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("mutual_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("computed_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("idx_user_suggestions_user_score", "user_suggestions", ["user_id", "score"])
+    # The suggestion FK cascade scans by suggested_user_id on user deletes.
+    op.create_index("idx_user_suggestions_suggested", "user_suggestions", ["suggested_user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_user_suggestions_suggested", table_name="user_suggestions")
+    op.drop_index("idx_user_suggestions_user_score", table_name="user_suggestions")
+    op.drop_table("user_suggestions")
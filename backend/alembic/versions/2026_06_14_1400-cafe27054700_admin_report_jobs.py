@@ -0,0 +1,51 @@
+"""Background finance report jobs.
+
+Revision ID: cafe27054700
+Revises: cafe27054600
+Create Date: 2026-06-14 14:00:00
+
+PDF finance reports were rendered inside ``GET /admin/payments/reports``.
+They are now produced by ``tasks.admin_reports`` from an
+``admin_report_jobs`` row, which also lets a repeat request for the same
+(type, range) reuse a finished file.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054700"
+down_revision: Union[str, None] = "cafe27054600"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "admin_report_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("report_type", sa.String(64), nullable=False),
+        sa.Column("date_from", sa.Date(), nullable=False),
+        sa.Column("date_to", sa.Date(), nullable=False),
+        sa.Column("format", sa.String(16), nullable=False, server_default="pdf"),
+        sa.Column("status", sa.String(32), nullable=False, server_default="queued"),
+        sa.Column("requested_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("admin_users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("row_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "idx_admin_report_jobs_range", "admin_report_jobs",
+        ["report_type", "date_from", "date_to", "format", "created_at"],
+    )
+    op.create_index("idx_admin_report_jobs_requested_by", "admin_report_jobs", ["requested_by", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_admin_report_jobs_requested_by", table_name="admin_report_jobs")
+    op.drop_index("idx_admin_report_jobs_range", table_name="admin_report_jobs")
+    op.drop_table("admin_report_jobs")
@@ -0,0 +1,69 @@
+"""Daily payment rollups.
+
+Revision ID: cafe27054800
+Revises: cafe27054700
+Create Date: 2026-06-14 15:00:00
+
+The finance summary and collection reports aggregated ``transactions`` with
+``func.date(...)`` filters on every request. ``payment_daily_rollups`` holds
+per-day totals by (country, currency, target type, status) on both the
+completed and created date bases, maintained by ``tasks.payment_rollups``.
+Existing history is backfilled here; plain indexes on ``completed_at`` and
+``created_at`` serve the per-day rebuilds and today's live aggregate.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27054800"
+down_revision: Union[str, None] = "cafe27054700"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_BACKFILL = """
+INSERT INTO payment_daily_rollups
+    (day, basis, country_code, currency_code, target_type, status, tx_count, gross, commission, net)
+SELECT CAST({ts} AS date), '{basis}', country_code, currency_code,
+       CAST(target_type AS varchar), CAST(status AS varchar),
+       count(*), coalesce(sum(gross_amount), 0), coalesce(sum(commission_amount), 0),
+       coalesce(sum(net_amount), 0)
+FROM transactions
+WHERE {ts} IS NOT NULL
+GROUP BY CAST({ts} AS date), country_code, currency_code, target_type, status
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payment_daily_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("basis", sa.String(16), nullable=False),
+        sa.Column("country_code", sa.String(2), nullable=False),
+        sa.Column("currency_code", sa.String(3), nullable=False),
+        sa.Column("target_type", sa.String(32), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("tx_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("gross", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("commission", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("net", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "day", "basis", "country_code", "currency_code", "target_type", "status",
+            name="uq_payment_daily_rollup",
+        ),
+    )
+    op.create_index("ix_transaction_completed_at", "transactions", ["completed_at"])
+    op.create_index("ix_transaction_created_at", "transactions", ["created_at"])
+
+    op.execute(_BACKFILL.format(ts="completed_at", basis="completed"))
+    op.execute(_BACKFILL.format(ts="created_at", basis="created"))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transaction_created_at", table_name="transactions")
+    op.drop_index("ix_transaction_completed_at", table_name="transactions")
+    op.drop_table("payment_daily_rollups")
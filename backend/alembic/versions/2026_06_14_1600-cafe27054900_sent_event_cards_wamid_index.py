@@ -0,0 +1,29 @@
+"""Index sent_event_cards by WhatsApp message id.
+
+Revision ID: cafe27054900
+Revises: cafe27054800
+Create Date: 2026-06-14 16:00:00
+
+Meta delivery statuses are now applied in batches by
+``tasks.whatsapp_statuses`` with one ``UPDATE … FROM (VALUES …)`` per
+table, joined on the wamid. ``wa_messages`` and ``wa_message_logs`` are
+already indexed on it; ``sent_event_cards`` was scanned.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = "cafe27054900"
+down_revision: Union[str, None] = "cafe27054800"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_sent_event_cards_whatsapp_message_id", "sent_event_cards", ["whatsapp_message_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sent_event_cards_whatsapp_message_id", table_name="sent_event_cards")
@@ -0,0 +1,38 @@
+"""Record when each user's suggestions were last computed.
+
+Revision ID: cafe27055000
+Revises: cafe27054900
+Create Date: 2026-06-15 09:00:00
+
+``user_suggestions`` has no row for a user whose refresh found no
+candidates, so the read path couldn't tell them from a user who was never
+computed and re-ran the graph query on every request.
+``user_suggestion_refreshes`` keeps one row per refreshed user. It is
+backfilled from the users that already have suggestions.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "cafe27055000"
+down_revision: Union[str, None] = "cafe27054900"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_suggestion_refreshes",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute("""
+        INSERT INTO user_suggestion_refreshes (user_id, refreshed_at)
+        SELECT user_id, MAX(computed_at) FROM user_suggestions GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("user_suggestion_refreshes")
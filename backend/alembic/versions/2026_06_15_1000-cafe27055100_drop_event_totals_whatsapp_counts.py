@@ -0,0 +1,35 @@
+"""Drop the WhatsApp counts from event_contribution_totals.
+
+Revision ID: cafe27055100
+Revises: cafe27055000
+Create Date: 2026-06-15 10:00:00
+
+The stored counts matched statuses on the phone's bare digits instead of
+its normalized form, so local numbers always counted as unknown, and they
+went stale whenever a delivery callback changed a status. The contributor
+list now counts them on read.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "cafe27055100"
+down_revision: Union[str, None] = "cafe27055000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("wa_whatsapp", "wa_not_whatsapp", "wa_unknown", "wa_checking", "wa_failed")
+
+
+def upgrade() -> None:
+    for name in _COLUMNS:
+        op.drop_column("event_contribution_totals", name)
+
+
+def downgrade() -> None:
+    for name in _COLUMNS:
+        op.add_column(
+            "event_contribution_totals",
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+        )
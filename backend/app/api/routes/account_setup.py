@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from models import User
 from utils.account_setup import lookup_setup_token, consume_setup_token
 from utils.auth import (
@@ -26,7 +27,7 @@ def _generic_invalid():
 
 
 @router.get("/account-setup/validate")
-async def validate_account_setup(token: str = "", db: Session = Depends(get_db)):
+def validate_account_setup(token: str = "", db: Session = Depends(get_db)):
     result = lookup_setup_token(db, token)
     if result.state == "valid" and result.user:
         return standard_response(True, "Token is valid.", {
@@ -40,6 +41,7 @@ async def validate_account_setup(token: str = "", db: Session = Depends(get_db))
 
 
 @router.post("/account-setup/set-password")
+@blocking
 async def set_password(request: Request, db: Session = Depends(get_db)):
     try:
         payload = await request.json()
@@ -89,6 +91,7 @@ async def set_password(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/change-temporary-password")
+@blocking
 async def change_temporary_password(
     request: Request,
     current_user: User = Depends(get_current_user),
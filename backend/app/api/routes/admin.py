@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, func, desc
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     AdminUser, AdminRoleEnum, NameValidationFlag,
     User, UserProfile, UserService, UserServiceVerification, UserServiceVerificationFile,
@@ -41,6 +42,7 @@ from models import (
 from models.enums import VerificationStatusEnum, ChatSessionStatusEnum, NotificationTypeEnum, EventStatusEnum, AppealStatusEnum, AppealContentTypeEnum, CardOrderStatusEnum, AgreementTypeEnum
 from utils.auth import create_access_token, create_refresh_token, verify_refresh_token
 from utils.helpers import standard_response, paginate
+from services.admin_counters import get_counters as get_admin_counters
 import jwt
 from core.config import SECRET_KEY, ALGORITHM
 
@@ -96,6 +98,7 @@ def require_super_admin(request: Request, db: Session = Depends(get_db)) -> Admi
 # ──────────────────────────────────────────────
 
 @router.post("/auth/login")
+@blocking
 async def admin_login(request: Request, db: Session = Depends(get_db)):
     """Separate admin login — only admin_users table is checked."""
     try:
@@ -152,6 +155,7 @@ async def admin_login(request: Request, db: Session = Depends(get_db)):
 # ──────────────────────────────────────────────
 
 @router.post("/auth/refresh")
+@blocking
 async def admin_refresh(request: Request, db: Session = Depends(get_db)):
     try:
         body = await request.json()
@@ -177,28 +181,12 @@ async def admin_refresh(request: Request, db: Session = Depends(get_db)):
 
 @router.get("/stats")
 def get_dashboard_stats(db: Session = Depends(get_db), admin: AdminUser = Depends(require_admin)):
-    total_users = db.query(func.count(User.id)).scalar() or 0
-    total_events = db.query(func.count(Event.id)).scalar() or 0
-    total_services = db.query(func.count(UserService.id)).scalar() or 0
-    pending_kyc = db.query(func.count(UserServiceVerification.id)).filter(
-        UserServiceVerification.verification_status == VerificationStatusEnum.pending
-    ).scalar() or 0
-    open_tickets = db.query(func.count(SupportTicket.id)).filter(SupportTicket.status == 'open').scalar() or 0
-    active_chats = db.query(func.count(LiveChatSession.id)).filter(
-        LiveChatSession.status == ChatSessionStatusEnum.active
-    ).scalar() or 0
-    waiting_chats = db.query(func.count(LiveChatSession.id)).filter(
-        LiveChatSession.status == ChatSessionStatusEnum.waiting
-    ).scalar() or 0
-
+    counters = get_admin_counters(db)
     return standard_response(True, "Dashboard stats", {
-        "total_users": total_users,
-        "total_events": total_events,
-        "total_services": total_services,
-        "pending_kyc": pending_kyc,
-        "open_tickets": open_tickets,
-        "active_chats": active_chats,
-        "waiting_chats": waiting_chats,
+        name: counters[name] for name in (
+            "total_users", "total_events", "total_services", "pending_kyc",
+            "open_tickets", "active_chats", "waiting_chats",
+        )
     })
 
 
@@ -217,14 +205,10 @@ def list_users(
 ):
     query = db.query(User).options(joinedload(User.profile))
     if q:
-        search = f"%{q}%"
-        query = query.filter(or_(
-            User.first_name.ilike(search),
-            User.last_name.ilike(search),
-            User.email.ilike(search),
-            User.username.ilike(search),
-            User.phone.ilike(search),
-        ))
+        from utils.search import text_match
+        match = text_match(User.search_document, q)
+        if match is not None:
+            query = query.filter(match.condition)
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
     query = query.order_by(User.created_at.desc())
@@ -2035,9 +2019,18 @@ def broadcast_notification(
             created_at=now,
         )
         batch.append(n)
+    # Bulk insert: the per-row session hooks in models.notifications (one
+    # push and one counter update per row) are skipped, and replaced by one
+    # pipelined counter reset and one push per user with a shared collapse key.
     db.bulk_save_objects(batch)
     db.commit()
 
+    from services.unread_counters import notifications_bulk_inserted
+    try:
+        notifications_bulk_inserted(db, [user.id for user in users])
+    except Exception as e:
+        print(f"[admin.broadcast] unread reset failed: {e}")
+
     # Fan-out push notifications to every active user (best-effort, async).
     try:
         from utils.fcm import send_push_async
@@ -2781,20 +2774,12 @@ def remove_kyc_requirement_from_type(type_id: str, mapping_id: str, db: Session
 
 @router.get("/stats/extended")
 def get_extended_stats(db: Session = Depends(get_db), admin: AdminUser = Depends(require_admin)):
-    total_posts = db.query(func.count(UserFeed.id)).filter(UserFeed.is_active == True).scalar() or 0
-    total_moments = db.query(func.count(UserMoment.id)).filter(UserMoment.is_active == True).scalar() or 0
-    total_communities = db.query(func.count(Community.id)).scalar() or 0
-    total_bookings = db.query(func.count(ServiceBookingRequest.id)).scalar() or 0
-    pending_bookings = db.query(func.count(ServiceBookingRequest.id)).filter(ServiceBookingRequest.status == 'pending').scalar() or 0
-    pending_card_orders = db.query(func.count(NuruCardOrder.id)).filter(NuruCardOrder.status == 'pending').scalar() or 0
-
+    counters = get_admin_counters(db)
     return standard_response(True, "Extended stats", {
-        "total_posts": total_posts,
-        "total_moments": total_moments,
-        "total_communities": total_communities,
-        "total_bookings": total_bookings,
-        "pending_bookings": pending_bookings,
-        "pending_card_orders": pending_card_orders,
+        name: counters[name] for name in (
+            "total_posts", "total_moments", "total_communities",
+            "total_bookings", "pending_bookings", "pending_card_orders",
+        )
     })
 
 
@@ -3387,6 +3372,7 @@ def admin_list_agreement_versions(
 
 
 @router.post("/agreements/versions")
+@blocking
 async def admin_create_agreement_version(
     request: Request,
     db: Session = Depends(get_db),
@@ -3593,7 +3579,7 @@ def get_ticketed_events_admin(
 
 
 @router.put("/ticketed-events/{event_id}/approve")
-async def approve_ticketed_event(
+def approve_ticketed_event(
     event_id: str,
     db: Session = Depends(get_db),
     admin: AdminUser = Depends(require_admin),
@@ -3637,6 +3623,7 @@ async def approve_ticketed_event(
 
 
 @router.put("/ticketed-events/{event_id}/reject")
+@blocking
 async def reject_ticketed_event(
     event_id: str,
     request: Request,
@@ -3685,6 +3672,7 @@ async def reject_ticketed_event(
 
 
 @router.put("/ticketed-events/{event_id}/remove")
+@blocking
 async def remove_ticketed_event(
     event_id: str,
     request: Request,
@@ -4031,3 +4019,32 @@ def repair_contributor_claim_all(
         limit = None
     summary = claim_for_all_users(db, limit=limit)
     return standard_response(True, "Bulk claim repair completed", summary)
+
+
+# ──────────────────────────────────────────────
+# Repair: Event contribution totals
+# ──────────────────────────────────────────────
+@router.post("/repair/event-contribution-totals")
+def repair_event_contribution_totals(
+    body: dict = Body(default={}),
+    db: Session = Depends(get_db),
+    admin: AdminUser = Depends(require_admin),
+):
+    """Recompute the cached contribution totals for one event (inline) or
+    every event (queued, or inline when Celery is disabled)."""
+    from services.event_totals import get_event_totals, rebuild_all_event_totals, rebuild_event_totals, totals_summary
+    event_id = body.get("event_id")
+    if event_id:
+        try:
+            eid = uuid.UUID(str(event_id))
+        except ValueError:
+            return standard_response(False, "Invalid event ID")
+        rebuild_event_totals(db, [eid])
+        db.commit()
+        return standard_response(True, "Event totals rebuilt", totals_summary(get_event_totals(db, eid)))
+    from core.celery_app import CELERY_ENABLED
+    if not CELERY_ENABLED:
+        return standard_response(True, "All event totals rebuilt", rebuild_all_event_totals(db))
+    from tasks.maintenance import rebuild_event_contribution_totals
+    res = rebuild_event_contribution_totals.delay()
+    return standard_response(True, "Rebuild of all event totals queued", {"task_id": str(res.id)})
@@ -24,6 +24,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from utils.helpers import api_response, paginate
 from api.routes.admin import require_admin
 from models.payments import (
@@ -73,6 +74,7 @@ def admin_list_providers(
 
 
 @router.post("/providers", status_code=201)
+@blocking
 async def admin_create_provider(
     request: Request,
     db: Session = Depends(get_db),
@@ -109,6 +111,7 @@ async def admin_create_provider(
 
 
 @router.patch("/providers/{provider_id}")
+@blocking
 async def admin_update_provider(
     provider_id: str,
     request: Request,
@@ -186,6 +189,7 @@ def admin_list_commissions(
 
 
 @router.post("/commissions", status_code=201)
+@blocking
 async def admin_create_commission(
     request: Request,
     db: Session = Depends(get_db),
@@ -223,6 +227,7 @@ async def admin_create_commission(
 
 
 @router.patch("/commissions/{commission_id}")
+@blocking
 async def admin_update_commission(
     commission_id: str,
     request: Request,
@@ -330,6 +335,7 @@ def admin_get_transaction(
 
 
 @router.post("/transactions/{transaction_id}/mark-settled")
+@blocking
 async def admin_mark_settled(
     transaction_id: str,
     request: Request,
@@ -16,18 +16,19 @@ All routes mounted under /admin/payments and gated by `require_finance_admin`
 
 from __future__ import annotations
 
-import io
 import uuid as uuid_lib
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
+from core.redis import CacheKeys, cache_get, cache_set
 from utils.helpers import api_response, paginate
 
 from models.admin import AdminUser, AdminRoleEnum
@@ -44,8 +45,9 @@ from models.enums import (
     WalletEntryTypeEnum, PaymentTargetTypeEnum,
 )
 from models.admin_payment_logs import AdminPaymentLog
+from models.admin_report_jobs import AdminReportJob
 
-from services import admin_reports
+from services import admin_reports, payment_rollups
 from services.wallet_service import withdrawal as wallet_withdrawal, release as wallet_release
 
 
@@ -202,32 +204,21 @@ def summary(
     week_start = today - timedelta(days=today.weekday())
     month_start = today.replace(day=1)
 
-    def _sum(q):
-        r = q.with_entities(
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-            func.coalesce(func.sum(Transaction.net_amount), 0),
-            func.count(Transaction.id),
-        ).first()
-        return {"gross": _money(r[0]), "commission": _money(r[1]),
-                "net": _money(r[2]), "count": int(r[3])}
-
-    completed_tx = db.query(Transaction).filter(
-        Transaction.status.in_([TransactionStatusEnum.paid, TransactionStatusEnum.credited])
+    # Collections come from the daily rollups (services.payment_rollups);
+    # only today is aggregated from ``transactions``.
+    def _sum(start):
+        r = payment_rollups.totals(db, start, today)[0]
+        return {"gross": _money(r["gross"]), "commission": _money(r["commission"]),
+                "net": _money(r["net"]), "count": r["tx_count"]}
+
+    # Status mix this month, by creation day; failed / reversed counts are
+    # read off it.
+    status_rows = payment_rollups.totals(
+        db, month_start, today, basis="created", statuses=None, group_by=("status",),
     )
-
-    today_q = completed_tx.filter(func.date(Transaction.completed_at) == today)
-    week_q = completed_tx.filter(func.date(Transaction.completed_at) >= week_start)
-    month_q = completed_tx.filter(func.date(Transaction.completed_at) >= month_start)
-
-    failed_count = db.query(func.count(Transaction.id)).filter(
-        Transaction.status == TransactionStatusEnum.failed,
-        func.date(Transaction.created_at) >= month_start,
-    ).scalar() or 0
-    refunded_count = db.query(func.count(Transaction.id)).filter(
-        Transaction.status == TransactionStatusEnum.reversed,
-        func.date(Transaction.created_at) >= month_start,
-    ).scalar() or 0
+    status_counts = {r["status"]: r["tx_count"] for r in status_rows}
+    failed_count = status_counts.get(TransactionStatusEnum.failed.value, 0)
+    refunded_count = status_counts.get(TransactionStatusEnum.reversed.value, 0)
 
     pending_q = db.query(WithdrawalRequest).filter(
         WithdrawalRequest.status.in_([
@@ -255,52 +246,27 @@ def summary(
 
     # 30-day daily series for the area chart.
     series_start = today - timedelta(days=29)
-    series_rows = (
-        completed_tx
-        .filter(func.date(Transaction.completed_at) >= series_start)
-        .with_entities(
-            func.date(Transaction.completed_at).label("d"),
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-            func.coalesce(func.sum(Transaction.net_amount), 0),
-        )
-        .group_by("d").order_by("d").all()
-    )
-    by_day = {str(r[0]): {"gross": _money(r[1]), "commission": _money(r[2]), "net": _money(r[3])}
-              for r in series_rows}
+    by_day = {
+        r["day"]: {"gross": _money(r["gross"]), "commission": _money(r["commission"]), "net": _money(r["net"])}
+        for r in payment_rollups.totals(db, series_start, today, group_by=("day",))
+    }
     series = []
     for i in range(30):
         d = series_start + timedelta(days=i)
-        row = by_day.get(str(d), {"gross": 0.0, "commission": 0.0, "net": 0.0})
+        row = by_day.get(d, {"gross": 0.0, "commission": 0.0, "net": 0.0})
         series.append({"date": d.isoformat(), **row})
 
     # Country mix this month
-    country_rows = (
-        month_q
-        .with_entities(
-            Transaction.country_code,
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.count(Transaction.id),
-        )
-        .group_by(Transaction.country_code)
-        .all()
-    )
-    country_mix = [{"country_code": r[0], "gross": _money(r[1]), "count": int(r[2])}
-                   for r in country_rows]
-
-    # Status mix this month
-    status_rows = (
-        db.query(Transaction.status, func.count(Transaction.id))
-        .filter(func.date(Transaction.created_at) >= month_start)
-        .group_by(Transaction.status)
-        .all()
-    )
-    status_mix = [{"status": s.value if s else "unknown", "count": int(c)} for s, c in status_rows]
+    country_mix = [
+        {"country_code": r["country_code"], "gross": _money(r["gross"]), "count": r["tx_count"]}
+        for r in payment_rollups.totals(db, month_start, today, group_by=("country_code",))
+    ]
+    status_mix = [{"status": r["status"], "count": r["tx_count"]} for r in status_rows]
 
     return api_response(True, "Summary retrieved.", {
-        "today": _sum(today_q),
-        "week": _sum(week_q),
-        "month": _sum(month_q),
+        "today": _sum(today),
+        "week": _sum(week_start),
+        "month": _sum(month_start),
         "failed_count_30d": int(failed_count),
         "refunded_count_30d": int(refunded_count),
         "pending_payouts": {"count": pending_count, "amount": _money(pending_amount)},
@@ -360,9 +326,9 @@ def ledger(
     if max_amount is not None:
         qry = qry.filter(Transaction.gross_amount <= max_amount)
     if date_from:
-        qry = qry.filter(func.date(Transaction.created_at) >= date_from)
+        qry = qry.filter(Transaction.created_at >= payment_rollups.day_range(date_from, date_from)[0])
     if date_to:
-        qry = qry.filter(func.date(Transaction.created_at) <= date_to)
+        qry = qry.filter(Transaction.created_at < payment_rollups.day_range(date_to, date_to)[1])
     if q:
         like = f"%{q.strip()}%"
         qry = qry.filter(or_(
@@ -607,6 +573,7 @@ def _load_settlement(db: Session, sid: str) -> WithdrawalRequest:
 
 
 @router.post("/settlements/{sid}/start-review")
+@blocking
 async def settlement_start_review(
     sid: str, request: Request,
     db: Session = Depends(get_db),
@@ -628,6 +595,7 @@ async def settlement_start_review(
 
 
 @router.post("/settlements/{sid}/mark-paid")
+@blocking
 async def settlement_mark_paid(
     sid: str, request: Request,
     db: Session = Depends(get_db),
@@ -678,6 +646,7 @@ async def settlement_mark_paid(
 
 
 @router.post("/settlements/{sid}/hold")
+@blocking
 async def settlement_hold(
     sid: str, request: Request,
     db: Session = Depends(get_db),
@@ -697,6 +666,7 @@ async def settlement_hold(
 
 
 @router.post("/settlements/{sid}/reject")
+@blocking
 async def settlement_reject(
     sid: str, request: Request,
     db: Session = Depends(get_db),
@@ -729,6 +699,7 @@ async def settlement_reject(
 
 
 @router.post("/settlements/{sid}/escalate")
+@blocking
 async def settlement_escalate(
     sid: str, request: Request,
     db: Session = Depends(get_db),
@@ -744,6 +715,7 @@ async def settlement_escalate(
 
 
 @router.post("/settlements/{sid}/note")
+@blocking
 async def settlement_add_note(
     sid: str, request: Request,
     db: Session = Depends(get_db),
@@ -972,6 +944,10 @@ def report(
     db: Session = Depends(get_db),
     admin: AdminUser = Depends(require_finance_admin),
 ):
+    """``csv`` streams the file, ``json`` is the in-app preview (cached per
+    type and range), ``pdf`` queues a background job — or returns a fresh
+    one for the same type and range — whose status and download link
+    come back as ``data``. Without Celery the PDF itself is returned."""
     if type not in admin_reports.REPORTS:
         raise HTTPException(status_code=400, detail=f"Unknown report type: {type}")
     title, builder = admin_reports.REPORTS[type]
@@ -980,11 +956,38 @@ def report(
     end = date_to or today
     start = date_from or (end - timedelta(days=29))
 
-    headers, rows = builder(db, start, end)
+    if format == "csv":
+        filename = f"nuru-{type}-{start.isoformat()}-{end.isoformat()}.csv"
+        return StreamingResponse(
+            admin_reports.iter_csv_report(builder, start, end),
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename=\"{filename}\""},
+        )
+
+    if format == "pdf":
+        from core.celery_app import CELERY_ENABLED
+        if not CELERY_ENABLED:
+            # No worker consumes the in-memory broker: render in the request.
+            return _render_pdf_inline(db, type, title, builder, start, end, admin)
+        job = admin_reports.reusable_job(db, type, start, end)
+        if job is None:
+            job = AdminReportJob(
+                id=uuid_lib.uuid4(), report_type=type, date_from=start, date_to=end,
+                format="pdf", status="queued", requested_by=admin.id,
+            )
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+            _enqueue_report_job(job.id)
+        return api_response(True, "Report ready." if job.status == "completed" else "Report queued.",
+                            admin_reports.job_dict(job))
 
     # JSON preview — used by the Reports page to render the in-app preview
     # (matches the Contributions / Expenses report flow).
-    if format == "json":
+    cache_key = CacheKeys.for_admin_report_preview(type, start.isoformat(), end.isoformat())
+    preview = cache_get(cache_key)
+    if preview is None:
+        headers, rows = builder(db, start, end)
         # Convert rows (list of tuples) into list of dicts keyed by header.
         dict_rows = [
             {h: (r[i] if i < len(r) else None) for i, h in enumerate(headers)}
@@ -998,32 +1001,104 @@ def report(
             {"label": "From", "value": start.isoformat()},
             {"label": "To",   "value": end.isoformat()},
         ]
-        return api_response(True, "Report generated.", {
-            "title": title,
-            "rows": dict_rows,
-            "columns": columns,
-            "summary": summary,
-            "footer_note": f"Generated by {admin.full_name} · {datetime.utcnow().isoformat()}Z",
-        })
+        preview = {"title": title, "rows": dict_rows, "columns": columns, "summary": summary}
+        cache_set(cache_key, preview, admin_reports.PREVIEW_CACHE_TTL)
+    return api_response(True, "Report generated.", {
+        **preview,
+        "footer_note": f"Generated by {admin.full_name} · {datetime.utcnow().isoformat()}Z",
+    })
 
-    if format == "csv":
-        body = admin_reports.to_csv(headers, rows)
-        filename = f"nuru-{type}-{start.isoformat()}-{end.isoformat()}.csv"
-        return StreamingResponse(
-            io.BytesIO(body),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename=\"{filename}\""},
-        )
 
-    body = admin_reports.to_pdf(title, headers, rows, start, end, generated_by=admin.full_name)
+def _render_pdf_inline(db: Session, type: str, title: str, builder, start: date, end: date,
+                       admin: AdminUser) -> StreamingResponse:
+    import tempfile
+    fh = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    headers, rows = builder(db, start, end)
+    admin_reports.write_pdf(fh, title, headers, rows, start, end, generated_by=admin.full_name)
+    fh.seek(0)
+
+    def _chunks():
+        try:
+            while chunk := fh.read(64 * 1024):
+                yield chunk
+        finally:
+            fh.close()
+
     filename = f"nuru-{type}-{start.isoformat()}-{end.isoformat()}.pdf"
     return StreamingResponse(
-        io.BytesIO(body),
+        _chunks(),
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename=\"{filename}\""},
     )
 
 
+def _enqueue_report_job(job_id) -> None:
+    try:
+        from tasks.admin_reports import generate_report_pdf
+        generate_report_pdf.delay(str(job_id))
+    except Exception as e:
+        # No broker (local dev) — render in a background thread instead.
+        print(f"[admin_reports] celery enqueue failed, running inline: {e}")
+        import threading
+        from tasks.admin_reports import generate_report_pdf as _gen
+        threading.Thread(target=_gen.run, args=(str(job_id),), daemon=True).start()
+
+
+@router.get("/reports/jobs")
+def report_jobs(
+    db: Session = Depends(get_db),
+    _admin: AdminUser = Depends(require_finance_admin),
+):
+    """Recent PDF reports, newest first — polled by the Reports page to show
+    when a queued report is ready. Jobs are shared between finance admins
+    (a repeat request for the same type and range is handed the existing
+    job), so the list isn't limited to the jobs this admin created."""
+    jobs = (
+        db.query(AdminReportJob)
+        .order_by(AdminReportJob.created_at.desc())
+        .limit(20)
+        .all()
+    )
+    return api_response(True, "Report jobs.", {"jobs": [admin_reports.job_dict(j) for j in jobs]})
+
+
+def _report_job_or_404(db: Session, job_id: str) -> AdminReportJob:
+    try:
+        jid = uuid_lib.UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    job = db.query(AdminReportJob).filter(AdminReportJob.id == jid).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return job
+
+
+@router.get("/reports/jobs/{job_id}")
+def report_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    _admin: AdminUser = Depends(require_finance_admin),
+):
+    return api_response(True, "Report job.", admin_reports.job_dict(_report_job_or_404(db, job_id)))
+
+
+@router.get("/reports/jobs/{job_id}/download")
+def download_report_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    _admin: AdminUser = Depends(require_finance_admin),
+):
+    job = _report_job_or_404(db, job_id)
+    path = admin_reports.report_path(job)
+    if job.status != "completed" or not path.exists():
+        raise HTTPException(status_code=404, detail="Report file not available")
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"nuru-{job.report_type}-{job.date_from.isoformat()}-{job.date_to.isoformat()}.pdf",
+    )
+
+
 @router.get("/reports/types")
 def report_types(_admin: AdminUser = Depends(require_finance_admin)):
     return api_response(True, "Report types.", {
@@ -15,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from utils.helpers import api_response, paginate
 from api.routes.admin import require_admin
 from models.payments import Wallet
@@ -90,6 +91,7 @@ def admin_get(
 
 
 @router.post("/{withdrawal_id}/approve")
+@blocking
 async def admin_approve(
     withdrawal_id: str,
     request: Request,
@@ -111,6 +113,7 @@ async def admin_approve(
 
 
 @router.post("/{withdrawal_id}/settle")
+@blocking
 async def admin_settle(
     withdrawal_id: str,
     request: Request,
@@ -157,6 +160,7 @@ async def admin_settle(
 
 
 @router.post("/{withdrawal_id}/reject")
+@blocking
 async def admin_reject(
     withdrawal_id: str,
     request: Request,
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from core.database import get_db
+from core.blocking import blocking
 from models.agreements import AgreementVersion, UserAgreementAcceptance
 from models.enums import AgreementTypeEnum
 from utils.auth import get_current_user
@@ -58,6 +59,7 @@ def check_agreement(
 
 
 @router.post("/accept")
+@blocking
 async def accept_agreement(
     request: Request,
     db: Session = Depends(get_db),
@@ -1,5 +1,11 @@
 """
 Analytics routes — page view tracking and admin analytics dashboard.
+
+Hits are buffered in Redis and bulk-inserted by ``tasks.analytics``; the
+dashboard reads the hourly / daily rollups that task maintains, never the
+raw ``page_views`` table (apart from the 20 most recent rows). Without
+Celery (serverless) hits are inserted directly and nothing maintains the
+rollups, so there the dashboard aggregates ``page_views`` in SQL.
 """
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
@@ -7,7 +13,8 @@ from sqlalchemy import func as sa_func, distinct, cast, Date
 from datetime import datetime, timedelta
 from core.database import get_db
 from utils.auth import get_current_user
-from models import PageView, User
+from utils import hll
+from models import PageView, PageViewRollup, PageViewRollupDimension, User
 
 router = APIRouter(tags=["Analytics"])
 
@@ -15,20 +22,94 @@ router = APIRouter(tags=["Analytics"])
 @router.post("/analytics/page-views")
 def track_page_view(request: Request, body: dict, db: Session = Depends(get_db)):
     """Record a page view — no auth required."""
-    pv = PageView(
-        path=body.get("path", "/"),
-        referrer=body.get("referrer"),
-        user_agent=body.get("user_agent"),
-        device_type=body.get("device_type"),
-        browser=body.get("browser"),
-        session_id=body.get("session_id"),
-        visitor_id=body.get("visitor_id"),
-    )
-    db.add(pv)
-    db.commit()
+    from tasks.analytics import buffer_page_view, page_view_row
+    row = page_view_row(body)
+    if not buffer_page_view(row):
+        db.add(PageView(**row))
+        db.commit()
     return {"success": True, "message": "Page view recorded"}
 
 
+def _range_window(range: str, now: datetime):
+    """(granularity, first bucket) for a dashboard range; None → no lower bound."""
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if range == "today":
+        return "hour", today
+    days = {"7d": 7, "30d": 30, "90d": 90}.get(range)
+    if days:
+        return "day", today - timedelta(days=days - 1)
+    return "day", None  # 'all'
+
+
+def _stats_from_rollups(db: Session, granularity: str, start) -> dict:
+    rollup_q = db.query(
+        PageViewRollup.bucket_start,
+        PageViewRollup.views,
+        PageViewRollup.visitor_hll,
+        PageViewRollup.session_hll,
+    ).filter(PageViewRollup.granularity == granularity)
+    if start:
+        rollup_q = rollup_q.filter(PageViewRollup.bucket_start >= start)
+    buckets = rollup_q.order_by(PageViewRollup.bucket_start).all()
+
+    def _dimension(name: str, limit: int = None):
+        views = sa_func.sum(PageViewRollupDimension.views)
+        q = db.query(PageViewRollupDimension.value, views).filter(
+            PageViewRollupDimension.granularity == granularity,
+            PageViewRollupDimension.dimension == name,
+        )
+        if start:
+            q = q.filter(PageViewRollupDimension.bucket_start >= start)
+        q = q.group_by(PageViewRollupDimension.value).order_by(views.desc())
+        if limit:
+            q = q.limit(limit)
+        return [(v, int(c or 0)) for v, c in q]
+
+    daily_counts: dict[str, int] = {}
+    for b in buckets:
+        day = b.bucket_start.strftime("%Y-%m-%d")
+        daily_counts[day] = daily_counts.get(day, 0) + b.views
+
+    return {
+        "total_views": sum(b.views for b in buckets),
+        "unique_visitors": hll.count(hll.merge(b.visitor_hll for b in buckets)),
+        "unique_sessions": hll.count(hll.merge(b.session_hll for b in buckets)),
+        "top_pages": _dimension("path", 10),
+        "devices": _dimension("device"),
+        "browsers": _dimension("browser"),
+        "daily": sorted(daily_counts.items()),
+    }
+
+
+def _stats_from_page_views(db: Session, start) -> dict:
+    window = [PageView.created_at >= start] if start else []
+    views = sa_func.count(PageView.id)
+    total_views, unique_visitors, unique_sessions = db.query(
+        views,
+        sa_func.count(distinct(PageView.visitor_id)),
+        sa_func.count(distinct(PageView.session_id)),
+    ).filter(*window).one()
+
+    def _dimension(column, limit: int = None):
+        value = sa_func.coalesce(column, "unknown")
+        q = db.query(value, views).filter(*window).group_by(value).order_by(views.desc())
+        if limit:
+            q = q.limit(limit)
+        return [(v, int(c or 0)) for v, c in q]
+
+    day = cast(PageView.created_at, Date)
+    daily = db.query(day, views).filter(*window).group_by(day).order_by(day)
+    return {
+        "total_views": int(total_views or 0),
+        "unique_visitors": int(unique_visitors or 0),
+        "unique_sessions": int(unique_sessions or 0),
+        "top_pages": _dimension(PageView.path, 10),
+        "devices": _dimension(PageView.device_type),
+        "browsers": _dimension(PageView.browser),
+        "daily": [(d.isoformat(), int(c)) for d, c in daily],
+    }
+
+
 @router.get("/admin/analytics")
 def get_analytics(
     range: str = "7d",
@@ -36,66 +117,23 @@ def get_analytics(
     current_user: User = Depends(get_current_user),
 ):
     """Admin-only analytics dashboard data."""
-    # Compute start date
-    now = datetime.utcnow()
-    start_date = None
-    if range == "today":
-        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    elif range == "7d":
-        start_date = now - timedelta(days=7)
-    elif range == "30d":
-        start_date = now - timedelta(days=30)
-    # 'all' → no filter
-
-    base = db.query(PageView)
-    if start_date:
-        base = base.filter(PageView.created_at >= start_date)
-
-    views = base.order_by(PageView.created_at.desc()).limit(5000).all()
-
-    total_views = len(views)
-    unique_visitors = len(set(v.visitor_id for v in views if v.visitor_id))
-    unique_sessions = len(set(v.session_id for v in views if v.session_id))
-
-    # Top pages
-    page_counts: dict[str, int] = {}
-    for v in views:
-        page_counts[v.path] = page_counts.get(v.path, 0) + 1
-    top_pages = sorted(
-        [{"path": p, "views": c} for p, c in page_counts.items()],
-        key=lambda x: x["views"],
-        reverse=True,
-    )[:10]
-
-    # Device breakdown
-    device_counts: dict[str, int] = {}
-    for v in views:
-        d = v.device_type or "unknown"
-        device_counts[d] = device_counts.get(d, 0) + 1
-    device_breakdown = [{"device_type": k, "count": v} for k, v in device_counts.items()]
-
-    # Browser breakdown
-    browser_counts: dict[str, int] = {}
-    for v in views:
-        b = v.browser or "unknown"
-        browser_counts[b] = browser_counts.get(b, 0) + 1
-    browser_breakdown = sorted(
-        [{"browser": k, "count": v} for k, v in browser_counts.items()],
-        key=lambda x: x["count"],
-        reverse=True,
-    )
+    from core.celery_app import CELERY_ENABLED
 
-    # Daily views
-    daily_counts: dict[str, int] = {}
-    for v in views:
-        day = v.created_at.strftime("%Y-%m-%d") if v.created_at else "unknown"
-        daily_counts[day] = daily_counts.get(day, 0) + 1
-    daily_views = sorted(
-        [{"date": d, "views": c} for d, c in daily_counts.items()],
-        key=lambda x: x["date"],
-    )
+    granularity, start = _range_window(range, datetime.utcnow())
+    if CELERY_ENABLED:
+        stats = _stats_from_rollups(db, granularity, start)
+    else:
+        # Serverless: no beat maintains the rollups, and hits are written
+        # straight to page_views, so aggregate it in SQL instead.
+        stats = _stats_from_page_views(db, start)
 
     # Recent views
+    recent = (
+        db.query(PageView.path, PageView.device_type, PageView.browser, PageView.created_at)
+        .order_by(PageView.created_at.desc())
+        .limit(20)
+        .all()
+    )
     recent_views = [
         {
             "path": v.path,
@@ -103,19 +141,19 @@ def get_analytics(
             "browser": v.browser,
             "created_at": v.created_at.isoformat() if v.created_at else None,
         }
-        for v in views[:20]
+        for v in recent
     ]
 
     return {
         "success": True,
         "data": {
-            "totalViews": total_views,
-            "uniqueVisitors": unique_visitors,
-            "totalSessions": unique_sessions,
-            "topPages": top_pages,
-            "deviceBreakdown": device_breakdown,
-            "browserBreakdown": browser_breakdown,
-            "dailyViews": daily_views,
+            "totalViews": stats["total_views"],
+            "uniqueVisitors": stats["unique_visitors"],
+            "totalSessions": stats["unique_sessions"],
+            "topPages": [{"path": p, "views": c} for p, c in stats["top_pages"]],
+            "deviceBreakdown": [{"device_type": d, "count": c} for d, c in stats["devices"]],
+            "browserBreakdown": [{"browser": b, "count": c} for b, c in stats["browsers"]],
+            "dailyViews": [{"date": d, "views": c} for d, c in stats["daily"]],
             "recentViews": recent_views,
         },
     }
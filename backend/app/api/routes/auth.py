@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from models import PasswordResetToken, User, UserVerificationOTP
 from models.enums import OTPVerificationTypeEnum
 from core.database import get_db
+from core.blocking import blocking
 from utils.auth import (
     generate_reset_token,
     get_current_user,
@@ -32,6 +33,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # Sign In
 # ──────────────────────────────────────────────
 @router.post("/signin")
+@blocking
 async def signin(request: Request, response: Response, db: Session = Depends(get_db)):
     """Authenticates a user and returns access token."""
     if request.headers.get("content-type") != "application/json":
@@ -134,6 +136,7 @@ async def signin(request: Request, response: Response, db: Session = Depends(get
 # Logout
 # ──────────────────────────────────────────────
 @router.post("/logout")
+@blocking
 async def logout(
     request: Request,
     response: Response,
@@ -223,7 +226,7 @@ async def refresh_token(request: Request):
 # Get Current User
 # ──────────────────────────────────────────────
 @router.get("/me")
-async def get_current_user_profile(
+def get_current_user_profile(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -236,6 +239,7 @@ async def get_current_user_profile(
 # Forgot Password
 # ──────────────────────────────────────────────
 @router.post("/forgot-password")
+@blocking
 async def forgot_password(request: Request, db: Session = Depends(get_db)):
     """Initiates password reset process."""
     payload = await request.json()
@@ -274,6 +278,7 @@ async def forgot_password(request: Request, db: Session = Depends(get_db)):
 # Reset Password
 # ──────────────────────────────────────────────
 @router.post("/reset-password")
+@blocking
 async def reset_password(request: Request, db: Session = Depends(get_db)):
     """Resets password using reset token."""
     payload = await request.json()
@@ -332,6 +337,7 @@ async def reset_password(request: Request, db: Session = Depends(get_db)):
 # Forgot Password (Phone / SMS OTP)
 # ──────────────────────────────────────────────
 @router.post("/forgot-password-phone")
+@blocking
 async def forgot_password_phone(request: Request, db: Session = Depends(get_db)):
     """Sends a password-reset OTP via SMS for phone-only accounts."""
     payload = await request.json()
@@ -386,6 +392,7 @@ async def forgot_password_phone(request: Request, db: Session = Depends(get_db))
 # Verify Reset OTP (Phone)
 # ──────────────────────────────────────────────
 @router.post("/verify-reset-otp")
+@blocking
 async def verify_reset_otp(request: Request, db: Session = Depends(get_db)):
     """Verifies an SMS OTP for password reset and returns a one-time reset token."""
     payload = await request.json()
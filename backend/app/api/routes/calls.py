@@ -6,7 +6,8 @@ Powers the WhatsApp-style calling flow:
     POST /calls/{id}/answer  → callee accepts → returns LiveKit token
     POST /calls/{id}/decline → callee declines
     POST /calls/{id}/end     → either party ends/cancels
-    GET  /calls/incoming     → polled by mobile app for ringing calls
+    WS   /calls/ws           → per-user signaling stream (ring/answer/decline/end)
+    GET  /calls/incoming     → catch-up read for a ringing call (after (re)connect)
     GET  /calls/conversation/{conv_id} → call history for chat bubbles
     POST /calls/devices      → register FCM/APNs token for VoIP push
     DELETE /calls/devices    → unregister token (logout)
@@ -16,25 +17,32 @@ Design notes
 * LiveKit credentials are reused from the meetings feature
   (``LIVEKIT_URL``/``LIVEKIT_API_KEY``/``LIVEKIT_API_SECRET``) so no new env
   vars are required.
-* Signaling is pull-based via ``/calls/incoming`` (3s poll on the client).
-  When VoIP push is configured later, the same payload will be delivered
-  through FCM/APNs so the lock screen rings via CallKit; the client UX does
-  not change.
-* A call older than ``RING_TIMEOUT_SECONDS`` is auto-marked ``missed`` to
-  prevent ghost ringing if the caller's network drops.
+* Signaling is pushed: every state change made by the handlers below is
+  published on both participants' ``Channels.for_user_calls`` channel and
+  delivered over ``/calls/ws``. ``/calls/incoming`` and
+  ``/calls/{id}/status`` remain as read-only catch-up calls for a client
+  that just (re)connected. VoIP push (FCM/APNs) still rings a killed app.
+* A call still ringing after ``RING_TIMEOUT_SECONDS`` is marked ``missed``
+  by a Celery task scheduled when the call starts (plus a one-minute sweep
+  as a safety net), so reads never write. Without Celery the reads fall
+  back to expiring stale calls themselves.
 """
 from __future__ import annotations
 
 import uuid
 from datetime import datetime, timedelta
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Body, BackgroundTasks
-from sqlalchemy import or_, and_
+from fastapi import APIRouter, Depends, HTTPException, Body, BackgroundTasks, Query, WebSocket
+from sqlalchemy import or_, and_, update
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from core.database import get_db
+from core import realtime
+from core.celery_app import CELERY_ENABLED
+from core.database import SessionLocal, get_db
 from models import Conversation, User, UserProfile, CallLog, DeviceToken
-from utils.auth import get_current_user
+from utils.auth import get_current_user, get_user_from_token
 from utils.helpers import standard_response
 
 router = APIRouter(prefix="/calls", tags=["Calls"])
@@ -57,8 +65,14 @@ def _user_brief(db: Session, user_id) -> dict:
     }
 
 
-def _serialize_call(db: Session, call: CallLog, viewer_id) -> dict:
-    """Build a chat-friendly call payload. Computes ``direction`` per viewer."""
+def _serialize_call(db: Session, call: CallLog, viewer_id, briefs: dict | None = None) -> dict:
+    """Build a chat-friendly call payload. Computes ``direction`` per viewer.
+
+    ``briefs`` ({user_id: brief}) lets callers serializing the same call for
+    both participants look each user up once.
+    """
+    if briefs is None:
+        briefs = {uid: _user_brief(db, uid) for uid in (call.caller_id, call.callee_id)}
     direction = "outgoing" if str(call.caller_id) == str(viewer_id) else "incoming"
     other_id = call.callee_id if direction == "outgoing" else call.caller_id
     return {
@@ -73,29 +87,63 @@ def _serialize_call(db: Session, call: CallLog, viewer_id) -> dict:
         "ended_at": call.ended_at.isoformat() if call.ended_at else None,
         "duration_seconds": call.duration_seconds or 0,
         "end_reason": call.end_reason,
-        "caller": _user_brief(db, call.caller_id),
-        "callee": _user_brief(db, call.callee_id),
-        "other_user": _user_brief(db, other_id),
+        "caller": briefs[call.caller_id],
+        "callee": briefs[call.callee_id],
+        "other_user": briefs[other_id],
     }
 
 
-def _expire_stale_ringing(db: Session) -> None:
-    """Mark calls that have been ringing too long as ``missed``.
+def publish_call_event(db: Session, call: CallLog, event_type: str) -> None:
+    """Push ``event_type`` with the call as each participant sees it."""
+    briefs = {uid: _user_brief(db, uid) for uid in (call.caller_id, call.callee_id)}
+    for uid in (call.caller_id, call.callee_id):
+        realtime.publish(
+            realtime.Channels.for_user_calls(uid), event_type,
+            _serialize_call(db, call, uid, briefs),
+        )
+
 
-    Cheap to run on every poll because the (callee_id, status) index makes
-    the candidate set tiny in practice.
+def expire_stale_ringing(db: Session, call_id=None) -> int:
+    """Mark calls that have been ringing too long as ``missed``, push
+    ``call.missed`` for each, and return how many were expired.
+
+    ``call_id`` limits the check to one call (the delayed task scheduled at
+    start); without it every stale call is swept.
     """
-    cutoff = datetime.utcnow() - timedelta(seconds=RING_TIMEOUT_SECONDS)
-    stale = db.query(CallLog).filter(
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=RING_TIMEOUT_SECONDS)
+    # One conditional UPDATE, so a call answered (or ended) between the
+    # check and the write is left alone instead of being overwritten.
+    stmt = update(CallLog).where(
         CallLog.status == "ringing",
         CallLog.started_at < cutoff,
-    ).all()
-    for c in stale:
-        c.status = "missed"
-        c.ended_at = datetime.utcnow()
-        c.end_reason = "timeout"
+    )
+    if call_id is not None:
+        stmt = stmt.where(CallLog.id == call_id)
+    stmt = stmt.values(status="missed", ended_at=now, end_reason="timeout").returning(CallLog)
+    stale = db.scalars(stmt.execution_options(populate_existing=True)).all()
     if stale:
         db.commit()
+    for c in stale:
+        publish_call_event(db, c, "call.missed")
+    return len(stale)
+
+
+def _expire_on_read(db: Session) -> None:
+    # With a worker, the task scheduled at start owns expiry and reads stay
+    # read-only; serverless deployments keep the old opportunistic sweep.
+    if not CELERY_ENABLED:
+        expire_stale_ringing(db)
+
+
+def _schedule_ring_timeout(call: CallLog) -> None:
+    if not CELERY_ENABLED:
+        return
+    try:
+        from tasks.call_signaling import expire_ringing_call
+        expire_ringing_call.apply_async((str(call.id),), countdown=RING_TIMEOUT_SECONDS + 1)
+    except Exception as e:
+        print(f"[calls] could not schedule ring timeout for {call.id}: {e}")
 
 
 def _livekit_token_for(call: CallLog, user: User) -> dict:
@@ -193,6 +241,8 @@ def start_call(
     db.refresh(call)
 
     token = _livekit_token_for(call, current_user)
+    publish_call_event(db, call, "call.ringing")
+    _schedule_ring_timeout(call)
     caller_brief = _user_brief(db, current_user.id)
     push_payload = {
         "type": "incoming_call",
@@ -244,6 +294,7 @@ def answer_call(
         call.answered_at = datetime.utcnow()
         db.commit()
         db.refresh(call)
+        publish_call_event(db, call, "call.answered")
 
     token = _livekit_token_for(call, current_user)
     return standard_response(True, "Joined call.", data={
@@ -271,6 +322,7 @@ def decline_call(
     call.end_reason = "declined_by_callee"
     db.commit()
     db.refresh(call)
+    publish_call_event(db, call, "call.declined")
     return standard_response(True, "Call declined.", data=_serialize_call(db, call, current_user.id))
 
 
@@ -292,6 +344,7 @@ def end_call(
         raise HTTPException(status_code=403, detail="Not a participant in this call.")
 
     now = datetime.utcnow()
+    was_live = call.status in ("ringing", "ongoing")
     if call.status == "ringing":
         # Caller cancelled before pickup → missed for the callee.
         if str(current_user.id) == str(call.caller_id):
@@ -311,6 +364,8 @@ def end_call(
 
     db.commit()
     db.refresh(call)
+    if was_live:
+        publish_call_event(db, call, "call.ended")
     return standard_response(True, "Call ended.", data=_serialize_call(db, call, current_user.id))
 
 
@@ -319,17 +374,23 @@ def get_incoming(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Polled every few seconds by the mobile app to detect a ringing call.
+    """Catch-up read for clients that just opened ``/calls/ws``.
 
     Returns the *single* most recent ringing call addressed to the user, or
-    ``null`` if none. This endpoint also opportunistically expires stale
-    ringing calls so the UI never shows a phantom incoming screen.
+    ``null`` if none. Calls past the ring timeout are skipped even if the
+    expiry task hasn't marked them yet, so the UI never shows a phantom
+    incoming screen.
     """
-    _expire_stale_ringing(db)
+    _expire_on_read(db)
 
+    cutoff = datetime.utcnow() - timedelta(seconds=RING_TIMEOUT_SECONDS)
     call = (
         db.query(CallLog)
-        .filter(CallLog.callee_id == current_user.id, CallLog.status == "ringing")
+        .filter(
+            CallLog.callee_id == current_user.id,
+            CallLog.status == "ringing",
+            CallLog.started_at >= cutoff,
+        )
         .order_by(CallLog.started_at.desc())
         .first()
     )
@@ -344,9 +405,9 @@ def get_call_status(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Polled by the active call screen so the caller's UI can dismiss the
-    moment the other side declines / ends the call (or it times out)."""
-    _expire_stale_ringing(db)
+    """Current state of one call — the active call screen's catch-up read
+    after (re)connecting to ``/calls/ws``."""
+    _expire_on_read(db)
     call = db.query(CallLog).filter(CallLog.id == call_id).first()
     if not call:
         raise HTTPException(status_code=404, detail="Call not found.")
@@ -355,6 +416,33 @@ def get_call_status(
     return standard_response(True, "OK", data=_serialize_call(db, call, current_user.id))
 
 
+def _socket_user_id(token: Optional[str]):
+    db = SessionLocal()
+    try:
+        user = get_user_from_token(db, token)
+        return user.id if user else None
+    finally:
+        db.close()
+
+
+@router.websocket("/ws")
+async def call_socket(websocket: WebSocket, token: Optional[str] = Query(None)):
+    """Signaling stream for the authenticated user.
+
+    Events: ``call.ringing``, ``call.answered``, ``call.declined``,
+    ``call.ended`` and ``call.missed``, each carrying the call as
+    serialized for this user (``direction``, ``other_user``)."""
+    user_id = await run_in_threadpool(_socket_user_id, token)
+    if user_id is None:
+        await websocket.close(code=4401)
+        return
+    await websocket.accept()
+    await realtime.serve_websocket(
+        websocket, [realtime.Channels.for_user_calls(user_id)],
+        ready={"user_id": str(user_id)},
+    )
+
+
 @router.get("/conversation/{conversation_id}")
 def list_conversation_calls(
     conversation_id: str,
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     InvitationCardTemplate,
     Event,
@@ -117,6 +118,7 @@ def get_card_template(
 
 
 @router.post("/card-templates")
+@blocking
 async def create_card_template(
     pdf: UploadFile = File(...),
     name: str = Form(...),
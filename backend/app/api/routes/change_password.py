@@ -4,6 +4,7 @@ from fastapi import APIRouter, Request, Depends
 from sqlalchemy.orm import Session
 from models import User
 from core.database import get_db
+from core.blocking import blocking
 from utils.auth import get_current_user, verify_password, hash_password
 from utils.helpers import standard_response
 
@@ -11,6 +12,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.post("/change-password")
+@blocking
 async def change_password(
     request: Request,
     current_user: User = Depends(get_current_user),
@@ -7,10 +7,11 @@ from datetime import datetime
 import pytz
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sa_func
+from sqlalchemy import delete, func as sa_func
 
 from core.database import get_db
 from models import UserCircle, User, UserProfile
+from services.people_suggestions import mark_suggestions_dirty
 from utils.auth import get_current_user
 from utils.helpers import standard_response
 
@@ -320,6 +321,13 @@ def remove_circle_member(circle_id: str, user_id: str, db: Session = Depends(get
 @router.delete("/{circle_id}")
 def delete_circle(circle_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """Clear all circle members."""
-    db.query(UserCircle).filter(UserCircle.user_id == current_user.id).delete(synchronize_session=False)
+    removed = db.execute(
+        delete(UserCircle).where(UserCircle.user_id == current_user.id)
+        .returning(UserCircle.circle_member_id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
     db.commit()
+    # A bulk delete skips the session hooks that queue suggestion refreshes.
+    if removed:
+        mark_suggestions_dirty([current_user.id, *removed])
     return standard_response(True, "Circle cleared")
@@ -14,7 +14,7 @@ from sqlalchemy import func as sa_func
 from sqlalchemy.orm import Session
 
 from core.database import get_db
-from models import User, Notification, UserFeed, UserFeedImage, FeedVisibilityEnum
+from models import User, UserFeed, UserFeedImage, FeedVisibilityEnum
 from utils.auth import get_current_user
 from utils.helpers import standard_response
 
@@ -39,11 +39,14 @@ def app_init(
       GET /posts/feed?page=1
     """
     from core.redis import cache_get, cache_set
+    from services.unread_counters import NOTIFICATIONS, get_unread
 
     uid = str(current_user.id)
     cache_key = f"combined:init:{uid}:{feed_limit}"
     cached = cache_get(cache_key)
     if cached is not None:
+        # The badge is a live counter; only the rest of the payload is cached.
+        cached["unread_count"] = get_unread(db, current_user.id, NOTIFICATIONS)
         return standard_response(True, "App init data", cached)
 
     # 1. User payload
@@ -51,10 +54,7 @@ def app_init(
     user_data = build_user_payload(db, current_user)
 
     # 2. Unread notification count
-    unread = db.query(sa_func.count(Notification.id)).filter(
-        Notification.recipient_id == current_user.id,
-        Notification.is_read == False,
-    ).scalar() or 0
+    unread = get_unread(db, current_user.id, NOTIFICATIONS)
 
     # 3. Feed page 1
     from api.routes.posts import _visible_feed_query
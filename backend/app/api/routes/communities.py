@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func as sa_func
 
 from core.database import get_db
+from core.blocking import blocking
 from models import Community, CommunityMember, CommunityPost, CommunityPostImage, CommunityPostGlow, CommunityPostComment, CommunityPostSave, CommunityPostShare, CommunityMute, User, UserProfile, UserFeed, UserFeedImage
 from utils.auth import get_current_user
 from utils.helpers import standard_response, paginate
@@ -135,6 +136,7 @@ def get_recommended_communities(
 
 
 @router.post("/")
+@blocking
 async def create_community(
     name: str = Form(...),
     description: Optional[str] = Form(None),
@@ -212,6 +214,7 @@ def get_community(community_id: str, db: Session = Depends(get_db), current_user
 
 
 @router.put("/{community_id}/cover")
+@blocking
 async def update_community_cover(
     community_id: str,
     cover_image: UploadFile = File(...),
@@ -439,6 +442,7 @@ def get_community_posts(community_id: str, page: int = 1, limit: int = 20, db: S
 
 
 @router.post("/{community_id}/posts")
+@blocking
 async def create_community_post(
     community_id: str,
     content: Optional[str] = Form(None),
@@ -30,6 +30,7 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session, joinedload
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     CardTemplate,
     Event,
@@ -701,6 +702,7 @@ def upsert_event_card(
 
 
 @router.post("/events/{event_id}/cards/{category}/upload-render")
+@blocking
 async def upload_browser_rendered_card(
     event_id: str,
     category: str,
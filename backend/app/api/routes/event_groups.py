@@ -7,12 +7,14 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 
 import pytz
-from fastapi import APIRouter, Depends, Body, Query, HTTPException, Header
+from fastapi import APIRouter, Depends, Body, Query, HTTPException, Header, WebSocket
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy import func as sa_func, or_, and_, exists, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, joinedload
 
-from core.database import get_db
+from core import realtime
+from core.database import SessionLocal, get_db
 from core.config import SECRET_KEY, ALGORITHM
 import jwt
 from models import (
@@ -25,7 +27,7 @@ from models.event_groups import (
     EventGroupMessageReaction, EventGroupInviteToken,
     GroupMemberRoleEnum, GroupMessageTypeEnum,
 )
-from utils.auth import get_current_user, get_optional_user
+from utils.auth import get_current_user, get_optional_user, get_user_from_token
 from utils.helpers import standard_response
 
 EAT = pytz.timezone("Africa/Nairobi")
@@ -285,18 +287,11 @@ def _member_dict(db: Session, m: EventGroupMember) -> dict:
     }
 
 
-def _message_dict(db: Session, msg: EventGroupMessage, members_by_id: dict) -> dict:
-    sender = members_by_id.get(msg.sender_member_id) if msg.sender_member_id else None
-    sender_name = None
-    sender_avatar = None
-    if sender:
-        sender_name = sender.get("name")
-        sender_avatar = sender.get("avatar")
-
+def _reaction_list(reactions) -> list:
     reaction_members: dict[str, list[str]] = {}
-    for r in msg.reactions:
+    for r in reactions:
         reaction_members.setdefault(r.emoji, []).append(str(r.member_id))
-    reactions = [
+    return [
         {
             "emoji": emoji,
             "count": len(member_ids),
@@ -305,6 +300,17 @@ def _message_dict(db: Session, msg: EventGroupMessage, members_by_id: dict) -> d
         for emoji, member_ids in reaction_members.items()
     ]
 
+
+def _message_dict(db: Session, msg: EventGroupMessage, members_by_id: dict) -> dict:
+    sender = members_by_id.get(msg.sender_member_id) if msg.sender_member_id else None
+    sender_name = None
+    sender_avatar = None
+    if sender:
+        sender_name = sender.get("name")
+        sender_avatar = sender.get("avatar")
+
+    reactions = _reaction_list(msg.reactions)
+
     reply_to = None
     if msg.reply_to_id:
         reply_msg = db.query(EventGroupMessage).filter(EventGroupMessage.id == msg.reply_to_id).first()
@@ -716,6 +722,7 @@ def remove_member(
         return standard_response(False, "Cannot remove yourself")
     db.delete(target)
     db.commit()
+    _publish_group_event(gid, "member.removed", {"member_id": str(mid)})
     return standard_response(True, "Member removed")
 
 
@@ -988,6 +995,84 @@ def claim_invite(
     })
 
 
+# ══════════════════════════════════════════════
+# REAL-TIME — push channel per group
+# ══════════════════════════════════════════════
+#
+# Events (``{"type", "data"}``):
+#   message.created   full message dict, as returned by send
+#   message.updated   full message dict after an edit
+#   message.deleted   {"id"}
+#   reaction.updated  {"message_id", "reactions"}
+#   member.removed    {"member_id"} — that member's sockets are closed (4403)
+#
+# ``GET /{group_id}/messages?after=`` stays the catch-up path: clients
+# fetch it after the socket's ``ready`` frame and after every reconnect.
+
+def _publish_group_event(group_id, event_type: str, data: dict) -> None:
+    realtime.publish(realtime.Channels.for_event_group(group_id), event_type, data)
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    try:
+        exp = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("exp")
+    except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
+        return None
+    return float(exp) if exp is not None else None
+
+
+def _socket_member_id(group_id: uuid.UUID, token: Optional[str], guest_token: Optional[str]):
+    """Same rules as ``_resolve_member``, on a session that is closed again
+    before the socket starts streaming. Returns ``(member_id, expires_at)``,
+    the expiry being that of whichever token let the caller in."""
+    db = SessionLocal()
+    try:
+        user = get_user_from_token(db, token)
+        member = _resolve_member(db, group_id, user, guest_token)
+        if not member:
+            return None, None
+        via_user = user is not None and member.user_id == user.id
+        return member.id, _token_expiry(token if via_user else guest_token)
+    finally:
+        db.close()
+
+
+@router.websocket("/{group_id}/ws")
+async def group_socket(
+    websocket: WebSocket,
+    group_id: str,
+    token: Optional[str] = Query(None),
+    guest_token: Optional[str] = Query(None),
+):
+    """Live messages, edits, deletions and reactions for one group.
+
+    Browsers can't set headers on a WebSocket, so the access token (or the
+    group guest token) travels in the query string. The socket is closed
+    when its member is removed from the group or its token expires."""
+    try:
+        gid = uuid.UUID(group_id)
+    except ValueError:
+        await websocket.close(code=4400)
+        return
+    member_id, expires_at = await run_in_threadpool(_socket_member_id, gid, token, guest_token)
+    if member_id is None:
+        await websocket.close(code=4403)
+        return
+    await websocket.accept()
+
+    def removed(event: dict) -> bool:
+        return (
+            event.get("type") == "member.removed"
+            and (event.get("data") or {}).get("member_id") == str(member_id)
+        )
+
+    await realtime.serve_websocket(
+        websocket, [realtime.Channels.for_event_group(gid)],
+        ready={"group_id": str(gid), "member_id": str(member_id)},
+        close_on=removed, expires_at=expires_at,
+    )
+
+
 # ══════════════════════════════════════════════
 # MESSAGES
 # ══════════════════════════════════════════════
@@ -1087,8 +1172,9 @@ def send_message(
     viewer.last_read_at = datetime.utcnow()
     db.commit()
     sender = _member_dict(db, viewer)
-    return standard_response(True, "Sent",
-                             _message_dict(db, msg, {viewer.id: sender}))
+    data = _message_dict(db, msg, {viewer.id: sender})
+    _publish_group_event(gid, "message.created", data)
+    return standard_response(True, "Sent", data)
 
 
 @router.patch("/{group_id}/messages/{message_id}")
@@ -1133,8 +1219,9 @@ def edit_message(
     db.refresh(msg)
     # Build members_by_id for this single sender so reply lookups still work.
     sender = _member_dict(db, viewer)
-    return standard_response(True, "Updated",
-                             _message_dict(db, msg, {viewer.id: sender}))
+    data = _message_dict(db, msg, {viewer.id: sender})
+    _publish_group_event(gid, "message.updated", data)
+    return standard_response(True, "Updated", data)
 
 
 @router.delete("/{group_id}/messages/{message_id}")
@@ -1162,6 +1249,7 @@ def delete_message(
         return standard_response(False, "You can only delete your own messages")
     msg.is_deleted = True
     db.commit()
+    _publish_group_event(gid, "message.deleted", {"id": str(mid)})
     return standard_response(True, "Deleted")
 
 
@@ -1269,6 +1357,7 @@ def add_reaction(
             # Toggle off the same emoji.
             db.delete(same)
             db.commit()
+            _publish_reactions(db, gid, mid)
             return standard_response(True, "Removed", {"toggled": "off", "emoji": emoji})
         # Otherwise replace: drop all of this member's reactions on this msg.
         for r in existing:
@@ -1283,9 +1372,20 @@ def add_reaction(
         )
     )
     db.commit()
+    _publish_reactions(db, gid, mid)
     return standard_response(True, "Added", {"toggled": "on", "emoji": emoji})
 
 
+def _publish_reactions(db: Session, group_id: uuid.UUID, message_id: uuid.UUID) -> None:
+    reactions = db.query(EventGroupMessageReaction).filter(
+        EventGroupMessageReaction.message_id == message_id,
+    ).all()
+    _publish_group_event(group_id, "reaction.updated", {
+        "message_id": str(message_id),
+        "reactions": _reaction_list(reactions),
+    })
+
+
 # ══════════════════════════════════════════════
 # SCOREBOARD — premium contributor view
 # ══════════════════════════════════════════════
@@ -1322,9 +1422,10 @@ def scoreboard(
         if cur:
             currency = cur.code.strip()
 
+    # Paid / last payment come from the running totals on EventContributor,
+    # so contributions are never loaded here.
     ecs = db.query(EventContributor).options(
         joinedload(EventContributor.contributor),
-        joinedload(EventContributor.contributions),
     ).filter(EventContributor.event_id == event.id).all()
 
     # Batch-fetch avatars for all linked Nuru users in ONE query (was N+1).
@@ -1341,17 +1442,12 @@ def scoreboard(
             avatar_by_user[uid] = url
 
     rows = []
-    total_pledged = 0.0
-    total_paid = 0.0
     for ec in ecs:
         contributor = ec.contributor
         if not contributor:
             continue
         pledged = float(ec.pledge_amount or 0)
-        paid = sum(
-            float(c.amount or 0) for c in ec.contributions
-            if c.confirmation_status is None or c.confirmation_status == ContributionStatusEnum.confirmed
-        )
+        paid = float(ec.total_paid or 0)
         balance = max(0, pledged - paid)
         if pledged > 0 and paid >= pledged:
             status = "completed"
@@ -1378,13 +1474,8 @@ def scoreboard(
             "balance": balance,
             "progress": progress,
             "status": status,
-            "last_payment_at": max(
-                (c.contributed_at or c.created_at for c in ec.contributions if c.contributed_at or c.created_at),
-                default=None,
-            ),
+            "last_payment_at": ec.last_payment_at,
         })
-        total_pledged += pledged
-        total_paid += paid
 
     # Sort: completed first, then by % desc, then alphabetical (case-insensitive)
     # within the same percentage band — so "Aisha 80%" comes before "Zawadi 80%".
@@ -1397,6 +1488,10 @@ def scoreboard(
         if r["last_payment_at"]:
             r["last_payment_at"] = r["last_payment_at"].isoformat()
 
+    from services.event_totals import get_event_totals, totals_summary
+    totals = totals_summary(get_event_totals(db, event.id))
+    total_pledged = totals["total_pledged"]
+    total_paid = totals["total_paid"]
     outstanding = max(0, total_pledged - total_paid)
     collection_rate = ((total_paid / total_pledged) * 100) if total_pledged > 0 else 0.0
 
@@ -1590,6 +1685,7 @@ def post_payment_system_message(
     )
     db.add(msg)
     db.commit()
+    _publish_group_event(group.id, "message.created", _message_dict(db, msg, {}))
 
 
 def _post_join_system_message(db: Session, group_id: uuid.UUID, joiner_name: str):
@@ -1606,5 +1702,6 @@ def _post_join_system_message(db: Session, group_id: uuid.UUID, joiner_name: str
         )
         db.add(msg)
         db.commit()
+        _publish_group_event(group_id, "message.created", _message_dict(db, msg, {}))
     except Exception:
         db.rollback()
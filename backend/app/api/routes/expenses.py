@@ -17,6 +17,7 @@ from models import (
     User, UserProfile, Currency, UserService, EventContribution,
 )
 from models.enums import ContributionStatusEnum
+from services.committee_permissions import get_member_permissions
 from utils.event_owner import event_owner_id, get_event_owner_display_name
 from utils.auth import get_current_user
 from utils.helpers import standard_response, format_price
@@ -53,22 +54,15 @@ def _check_expense_access(db: Session, event_id: str, current_user, require_mana
     if is_creator:
         return event, None
 
-    cm = db.query(EventCommitteeMember).filter(
-        EventCommitteeMember.event_id == eid,
-        EventCommitteeMember.user_id == current_user.id,
-    ).first()
-    if not cm:
+    perms = get_member_permissions(db, eid, current_user.id)
+    if not perms:
         return None, standard_response(False, "You do not have permission to access this event")
 
-    perms = db.query(CommitteePermission).filter(
-        CommitteePermission.committee_member_id == cm.id
-    ).first()
-
     if require_manage:
-        if not perms or not perms.can_manage_expenses:
+        if not perms.can_manage_expenses:
             return None, standard_response(False, "You do not have permission to manage expenses")
     else:
-        if not perms or not (perms.can_view_expenses or perms.can_manage_expenses):
+        if not (perms.can_view_expenses or perms.can_manage_expenses):
             return None, standard_response(False, "You do not have permission to view expenses")
 
     return event, None
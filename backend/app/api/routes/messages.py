@@ -3,17 +3,19 @@
 
 import uuid
 from datetime import datetime
+from typing import Optional
 
 import pytz
 from fastapi import APIRouter, Depends, Body
-from sqlalchemy import func as sa_func, or_, and_
+from sqlalchemy import func as sa_func, or_, and_, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from core.database import get_db
 from models import Conversation, Message, User, UserProfile, UserService, UserServiceImage, ConversationTypeEnum, CallLog, ConversationHide
 from utils.auth import get_current_user
-from utils.helpers import standard_response
+from utils.helpers import decode_cursor, encode_cursor, standard_response
+from utils.search import text_match
 
 EAT = pytz.timezone("Africa/Nairobi")
 router = APIRouter(prefix="/messages", tags=["Messages"])
@@ -86,65 +88,134 @@ def _conversation_dict(db, conv, current_user_id):
     }
 
 
+def _record_message(conv, msg):
+    """Move the conversation's inbox preview to ``msg`` and bump the
+    recipient's unread count. SQL expressions, so concurrent sends in the
+    same conversation serialize on the row instead of losing updates;
+    ``previous_message_id`` takes the *old* ``last_message_id``."""
+    conv.previous_message_id = Conversation.last_message_id
+    conv.last_message_id = msg.id
+    conv.last_message_text = msg.message_text
+    conv.last_message_sender_id = msg.sender_id
+    # Same transaction timestamp as the message's server-side created_at.
+    conv.last_message_at = sa_func.now()
+    if str(conv.user_one_id) == str(msg.sender_id):
+        conv.user_two_unread = Conversation.user_two_unread + 1
+    else:
+        conv.user_one_unread = Conversation.user_one_unread + 1
+
+
+def _mark_conversation_read(db, conv, user_id) -> int:
+    """Mark everything the other participant sent as read and zero the
+    caller's unread count. Locks the conversation row first so a message
+    sent concurrently is either marked here or counted after. Leaves
+    ``updated_at`` alone: reading must not reorder the inbox or un-hide it.
+    Returns the number of messages that flipped."""
+    db.query(Conversation.id).filter(Conversation.id == conv.id).with_for_update().first()
+    read = db.query(Message).filter(
+        Message.conversation_id == conv.id,
+        Message.sender_id != user_id,
+        Message.is_read == False,
+    ).update({"is_read": True}, synchronize_session=False)
+    unread_col = Conversation.user_one_unread if str(conv.user_one_id) == str(user_id) else Conversation.user_two_unread
+    db.query(Conversation).filter(Conversation.id == conv.id).update(
+        {unread_col: 0, Conversation.updated_at: Conversation.updated_at}, synchronize_session=False,
+    )
+    return read
+
+
 @router.get("/unread/count")
 def get_unread_count(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """Returns total unread message count across all conversations."""
-    conv_ids = [
-        r[0] for r in db.query(Conversation.id).filter(
-            or_(Conversation.user_one_id == current_user.id, Conversation.user_two_id == current_user.id)
-        ).all()
-    ]
-    if not conv_ids:
-        return standard_response(True, "Unread count retrieved", {"count": 0})
-
-    count = db.query(sa_func.count(Message.id)).filter(
-        Message.conversation_id.in_(conv_ids),
-        Message.sender_id != current_user.id,
-        Message.is_read == False
-    ).scalar() or 0
+    from services.unread_counters import MESSAGES, get_unread
+    count = get_unread(db, current_user.id, MESSAGES)
     return standard_response(True, "Unread count retrieved", {"count": count})
 
 
+def _inbox_branch(db, user_id, mine_col, other_col, search, after):
+    """The caller's visible conversations on one side (user_one / user_two).
+
+    Kept as two index-ordered branches instead of one ``OR`` so each can
+    walk its (user_*, updated_at, id) index and stop after a page."""
+    hidden = db.query(ConversationHide.id).filter(
+        ConversationHide.conversation_id == Conversation.id,
+        ConversationHide.user_id == user_id,
+        ConversationHide.hidden_at >= Conversation.updated_at,
+    ).exists()
+    q = db.query(Conversation).filter(mine_col == user_id, Conversation.is_active == True, ~hidden)
+    if after:
+        q = q.filter(tuple_(Conversation.updated_at, Conversation.id) < tuple_(*after))
+    if search:
+        term = f"%{search}%"
+        match = text_match(User.search_document, search)
+        q = q.join(User, User.id == other_col).outerjoin(
+            UserService, UserService.id == Conversation.service_id,
+        ).filter(or_(
+            match.condition,
+            UserService.title.ilike(term),
+            Conversation.last_message_text.ilike(term),
+        ))
+    return q.order_by(Conversation.updated_at.desc(), Conversation.id.desc())
+
+
 @router.get("/")
 def get_conversations(
     search: str = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Returns all conversations for the current user.
+    """Returns the current user's conversations, most recent first.
 
-    Optional ``?search=`` filters conversations whose other participant's
-    display name, username or email contains the term (case-insensitive).
+    Optional ``?search=`` filters on the other participant's name, username
+    or email, the service title and the last message (case-insensitive).
+
+    With ``?limit=`` (and ``?cursor=`` from the previous page's
+    ``pagination.next_cursor``) the inbox is keyset-paginated on
+    ``(updated_at, id)``. Without either, the whole list is returned as a
+    plain array, as older clients expect.
+
+    Conversations the user hid stay hidden until a newer message arrives
+    (WhatsApp-like behavior).
     """
     from utils.batch_loaders import build_conversation_dicts
-    convs = db.query(Conversation).filter(
-        or_(Conversation.user_one_id == current_user.id, Conversation.user_two_id == current_user.id),
-        Conversation.is_active == True
-    ).order_by(Conversation.updated_at.desc()).all()
-
-    # Filter out conversations the user has hidden — but bring them back if a
-    # new message arrived after they hid it (WhatsApp-like behavior).
-    hides = {
-        str(h.conversation_id): h.hidden_at
-        for h in db.query(ConversationHide).filter(ConversationHide.user_id == current_user.id).all()
+
+    paged = limit is not None or cursor is not None
+    page_size = min(max(limit or 30, 1), 100)
+    after = decode_cursor(cursor)
+    if cursor and after is None:
+        return standard_response(False, "Invalid cursor")
+    term = search.strip() if search and search.strip() else None
+
+    branches = [
+        _inbox_branch(db, current_user.id, mine, other, term, after)
+        for mine, other in (
+            (Conversation.user_one_id, Conversation.user_two_id),
+            (Conversation.user_two_id, Conversation.user_one_id),
+        )
+    ]
+    if paged:
+        branches = [b.limit(page_size + 1) for b in branches]
+    query = branches[0].union_all(branches[1]).order_by(
+        Conversation.updated_at.desc(), Conversation.id.desc(),
+    )
+    convs = query.limit(page_size + 1).all() if paged else query.all()
+
+    if not paged:
+        return standard_response(True, "Conversations retrieved successfully", build_conversation_dicts(db, convs, current_user.id))
+
+    has_more = len(convs) > page_size
+    convs = convs[:page_size]
+    pagination = {
+        "limit": page_size,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(convs[-1].updated_at, convs[-1].id) if has_more else None,
     }
-    if hides:
-        convs = [
-            c for c in convs
-            if str(c.id) not in hides or (c.updated_at and c.updated_at > hides[str(c.id)])
-        ]
-
-    data = build_conversation_dicts(db, convs, current_user.id)
-    if search and search.strip():
-        term = search.strip().lower()
-        data = [c for c in data if term in (
-            f"{c.get('other_user_name','')} "
-            f"{c.get('other_user_username','')} "
-            f"{c.get('other_user_email','')} "
-            f"{c.get('service_name','')} "
-            f"{(c.get('last_message') or {}).get('content','')}"
-        ).lower()]
-    return standard_response(True, "Conversations retrieved successfully", data)
+    return standard_response(
+        True, "Conversations retrieved successfully",
+        build_conversation_dicts(db, convs, current_user.id), pagination=pagination,
+    )
 
 
 # ── Static /start route MUST come before /{conversation_id} to avoid route conflict ──
@@ -223,8 +294,9 @@ def start_conversation(body: dict = Body(...), db: Session = Depends(get_db), cu
     initial_message = body.get("message", "").strip()
     if initial_message:
         db.flush()
-        msg = Message(conversation_id=conv.id, sender_id=current_user.id, message_text=initial_message, is_read=False)
+        msg = Message(id=uuid.uuid4(), conversation_id=conv.id, sender_id=current_user.id, message_text=initial_message, is_read=False)
         db.add(msg)
+        _record_message(conv, msg)
 
     try:
         db.commit()
@@ -242,6 +314,10 @@ def start_conversation(body: dict = Body(...), db: Session = Depends(get_db), cu
             return standard_response(True, "Conversation already exists", build_conversation_dicts(db, [existing], current_user.id)[0])
         return standard_response(False, "Could not start conversation")
 
+    if initial_message:
+        from services.unread_counters import MESSAGES, adjust
+        adjust(db, rid, MESSAGES, 1, conversation_id=str(conv.id))
+
     db.refresh(conv)
     from utils.batch_loaders import build_conversation_dicts
     return standard_response(True, "Conversation started successfully", build_conversation_dicts(db, [conv], current_user.id)[0])
@@ -371,6 +447,7 @@ def send_message(conversation_id: str, body: dict = Body(...), db: Session = Dep
 
     now = datetime.now(EAT)
     msg = Message(
+        id=uuid.uuid4(),
         conversation_id=cid,
         sender_id=current_user.id,
         message_text=content,
@@ -382,13 +459,17 @@ def send_message(conversation_id: str, body: dict = Body(...), db: Session = Dep
         reply_snapshot_sender=snapshot_sender,
     )
     db.add(msg)
+    _record_message(conv, msg)
     conv.updated_at = now
     db.commit()
     db.refresh(msg)
 
+    recipient_id = conv.user_two_id if str(conv.user_one_id) == str(current_user.id) else conv.user_one_id
+    from services.unread_counters import MESSAGES, adjust
+    adjust(db, recipient_id, MESSAGES, 1, conversation_id=str(conv.id))
+
     # ── Push notification fan-out to the other participant ─────────────
     try:
-        recipient_id = conv.user_two_id if str(conv.user_one_id) == str(current_user.id) else conv.user_one_id
         if recipient_id and str(recipient_id) != str(current_user.id):
             from utils.fcm import send_push_async
             sender_name = f"{current_user.first_name or ''} {current_user.last_name or ''}".strip() or "Someone"
@@ -440,12 +521,18 @@ def mark_as_read(conversation_id: str, db: Session = Depends(get_db), current_us
     except ValueError:
         return standard_response(False, "Invalid conversation ID")
 
-    db.query(Message).filter(
-        Message.conversation_id == cid,
-        Message.sender_id != current_user.id,
-        Message.is_read == False
-    ).update({"is_read": True}, synchronize_session=False)
+    conv = db.query(Conversation).filter(
+        Conversation.id == cid,
+        or_(Conversation.user_one_id == current_user.id, Conversation.user_two_id == current_user.id),
+    ).first()
+    if not conv:
+        return standard_response(False, "Conversation not found")
+
+    read = _mark_conversation_read(db, conv, current_user.id)
     db.commit()
+
+    from services.unread_counters import MESSAGES, adjust
+    adjust(db, current_user.id, MESSAGES, -read, conversation_id=str(cid))
     return standard_response(True, "Messages marked as read")
 
 
@@ -462,6 +549,12 @@ def delete_message(conversation_id: str, message_id: str, db: Session = Depends(
         return standard_response(False, "Message not found or not yours")
 
     msg.message_text = "[Message deleted]"
+    db.query(Conversation).filter(
+        Conversation.id == msg.conversation_id, Conversation.last_message_id == msg.id,
+    ).update({
+        Conversation.last_message_text: msg.message_text,
+        Conversation.updated_at: Conversation.updated_at,
+    }, synchronize_session=False)
     db.commit()
     return standard_response(True, "Message deleted successfully")
 
@@ -525,10 +618,9 @@ def hide_conversation(conversation_id: str, db: Session = Depends(get_db), curre
         db.add(ConversationHide(conversation_id=cid, user_id=current_user.id, hidden_at=now))
 
     # Mark all unread messages as read for this user so the inbox badge clears.
-    db.query(Message).filter(
-        Message.conversation_id == cid,
-        Message.sender_id != current_user.id,
-        Message.is_read == False,
-    ).update({"is_read": True}, synchronize_session=False)
+    read = _mark_conversation_read(db, conv, current_user.id)
     db.commit()
+
+    from services.unread_counters import MESSAGES, adjust
+    adjust(db, current_user.id, MESSAGES, -read, conversation_id=str(cid))
     return standard_response(True, "Conversation removed")
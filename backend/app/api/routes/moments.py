@@ -13,6 +13,8 @@ from sqlalchemy.orm import Session
 
 from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
+from core.redis import CacheKeys, cache_get, cache_set, invalidate_moment_trays
 from models import (
     UserMoment, UserMomentSticker, UserMomentViewer,
     UserMomentHighlight, UserMomentHighlightItem, User, UserProfile,
@@ -22,54 +24,33 @@ from models import (
 )
 from utils.auth import get_current_user, get_optional_user
 
+from utils.batch_loaders import build_moment_dicts
 from utils.helpers import standard_response
 
 EAT = pytz.timezone("Africa/Nairobi")
 router = APIRouter(prefix="/moments", tags=["Moments/Stories"])
 
 
-def _moment_content_type(value):
-    if hasattr(value, "value"):
-        return value.value
-    raw = str(value or "image")
-    return raw.split(".")[-1]
+TRAY_CACHE_TTL = 60
 
 
 def _moment_dict(db, m, current_user_id=None):
-    user = db.query(User).filter(User.id == m.user_id).first()
-    profile = db.query(UserProfile).filter(UserProfile.user_id == m.user_id).first() if user else None
-    # Exclude the author from viewer counts — viewing your own glimpse must not inflate the count.
-    viewer_count = db.query(UserMomentViewer).filter(
-        UserMomentViewer.moment_id == m.id,
-        UserMomentViewer.viewer_id != m.user_id,
-    ).count()
-    has_seen = False
-    if current_user_id:
-        has_seen = db.query(UserMomentViewer).filter(UserMomentViewer.moment_id == m.id, UserMomentViewer.viewer_id == current_user_id).first() is not None
-
-    ct = _moment_content_type(m.content_type)
-    media_url = m.media_url
-    background_color = None
-    if isinstance(media_url, str) and media_url.startswith("text:"):
-        ct = "text"
-        background_color = media_url[5:] or None
-        media_url = None
-
-    return {
-        "id": str(m.id),
-        "author": {"id": str(user.id), "name": f"{user.first_name} {user.last_name}", "avatar": profile.profile_picture_url if profile else None, "is_verified": user.is_identity_verified or False} if user else None,
-        "caption": m.caption, "content_type": ct,
-        "media_url": media_url,
-        "thumbnail_url": m.thumbnail_url if hasattr(m, "thumbnail_url") else None,
-        "background_color": background_color,
-        "location": m.location if hasattr(m, "location") else None,
-        "viewer_count": viewer_count, "has_seen": has_seen,
-        "is_active": m.is_active,
-        "expires_at": m.expires_at.isoformat() if m.expires_at else None,
-        "created_at": m.created_at.isoformat() if m.created_at else None,
-    }
+    return build_moment_dicts(db, [m], current_user_id)[0]
 
 
+def _invalidate_trays_showing(db, author_id):
+    """Bust the cached tray of everyone whose tray shows ``author_id``:
+    followers, users with the author in their accepted circle, and the
+    author."""
+    follower_ids = db.query(UserFollower.follower_id).filter(UserFollower.following_id == author_id)
+    circle_ids = db.query(UserCircle.user_id).filter(
+        UserCircle.circle_member_id == author_id,
+        UserCircle.status == 'accepted',
+    )
+    audience = {r[0] for r in follower_ids.union(circle_ids).all()}
+    audience.add(author_id)
+    invalidate_moment_trays(audience)
+
 
 # ──────────────────────────────────────────────
 # MY REMOVED MOMENTS — must be before /{moment_id} wildcard
@@ -145,7 +126,7 @@ def get_public_trending_moments(limit: int = 12, db: Session = Depends(get_db)):
         .all()
     )
     moments = [r[0] for r in rows]
-    return standard_response(True, "Trending moments", [_moment_dict(db, m) for m in moments])
+    return standard_response(True, "Trending moments", build_moment_dicts(db, moments))
 
 
 @router.get("/")
@@ -154,7 +135,15 @@ def get_moments_feed(db: Session = Depends(get_db), current_user: User = Depends
 
     Visibility: only authors that the current user follows OR has in their
     accepted circle, plus the current user's own moments.
+
+    Cached per user for ``TRAY_CACHE_TTL``; busted when a visible author
+    posts or deletes a moment and when the user marks one seen.
     """
+    cache_key = CacheKeys.for_moments_tray(str(current_user.id))
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return standard_response(True, "Moments feed retrieved", cached)
+
     now = datetime.now(EAT)
 
     # People I follow
@@ -171,8 +160,6 @@ def get_moments_feed(db: Session = Depends(get_db), current_user: User = Depends
         ).all()
     }
     allowed_author_ids = following_ids | circle_ids | {current_user.id}
-    if not allowed_author_ids:
-        return standard_response(True, "Moments feed retrieved", [])
 
     moments = db.query(UserMoment).filter(
         UserMoment.is_active == True,
@@ -182,25 +169,23 @@ def get_moments_feed(db: Session = Depends(get_db), current_user: User = Depends
 
     # Group by user, latest first per user
     user_moments = {}
-    for m in moments:
-        uid = str(m.user_id)
-        user_moments.setdefault(uid, []).append(_moment_dict(db, m, current_user.id))
+    for m, item in zip(moments, build_moment_dicts(db, moments, current_user.id)):
+        user_moments.setdefault(str(m.user_id), []).append(item)
 
     feed = []
     for uid, items in user_moments.items():
-        user = db.query(User).filter(User.id == uuid.UUID(uid)).first()
-        profile = db.query(UserProfile).filter(UserProfile.user_id == uuid.UUID(uid)).first() if user else None
+        author = items[0]["author"]
         items = sorted(items, key=lambda item: item["created_at"] or "")
         latest_created_at = items[-1]["created_at"] if items else None
         all_seen = all(item["has_seen"] for item in items)
         feed.append({
             "user": {
                 "id": uid,
-                "name": f"{user.first_name} {user.last_name}" if user else None,
-                "avatar": profile.profile_picture_url if profile else None,
+                "name": author["name"] if author else None,
+                "avatar": author["avatar"] if author else None,
                 "is_self": uid == str(current_user.id),
-                "is_verified": bool(user.is_identity_verified) if user else False,
-                "is_identity_verified": bool(user.is_identity_verified) if user else False,
+                "is_verified": bool(author["is_verified"]) if author else False,
+                "is_identity_verified": bool(author["is_verified"]) if author else False,
             },
             "moments": items,
             "all_seen": all_seen,
@@ -208,8 +193,6 @@ def get_moments_feed(db: Session = Depends(get_db), current_user: User = Depends
         })
 
     # Self first, then by latest moment desc
-    feed.sort(key=lambda f: (not f["user"]["is_self"], f["latest_created_at"] or ""), reverse=False)
-    # reverse=False keeps is_self first (False<True), but we want latest desc — re-sort:
     self_entries = [f for f in feed if f["user"]["is_self"]]
     other_entries = sorted(
         [f for f in feed if not f["user"]["is_self"]],
@@ -218,13 +201,14 @@ def get_moments_feed(db: Session = Depends(get_db), current_user: User = Depends
     )
     feed = self_entries + other_entries
 
+    cache_set(cache_key, feed, TRAY_CACHE_TTL)
     return standard_response(True, "Moments feed retrieved", feed)
 
 
 @router.get("/me")
 def get_my_moments(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     moments = db.query(UserMoment).filter(UserMoment.user_id == current_user.id, UserMoment.is_active == True).order_by(UserMoment.created_at.desc()).all()
-    return standard_response(True, "Your moments retrieved", [_moment_dict(db, m, current_user.id) for m in moments])
+    return standard_response(True, "Your moments retrieved", build_moment_dicts(db, moments, current_user.id))
 
 
 @router.get("/user/{user_id}")
@@ -235,10 +219,11 @@ def get_user_moments(user_id: str, db: Session = Depends(get_db), current_user:
         return standard_response(False, "Invalid user ID")
     now = datetime.now(EAT)
     moments = db.query(UserMoment).filter(UserMoment.user_id == uid, UserMoment.is_active == True, UserMoment.expires_at > now).order_by(UserMoment.created_at.asc()).all()
-    return standard_response(True, "User moments retrieved", [_moment_dict(db, m, current_user.id) for m in moments])
+    return standard_response(True, "User moments retrieved", build_moment_dicts(db, moments, current_user.id))
 
 
 @router.post("/")
+@blocking
 async def create_moment(
     content: Optional[str] = Form(None), location: Optional[str] = Form(None),
     media: Optional[UploadFile] = File(None), duration_hours: int = Form(24),
@@ -307,6 +292,7 @@ async def create_moment(
         moment.location = location.strip()
     db.add(moment)
     db.commit()
+    _invalidate_trays_showing(db, current_user.id)
 
     return standard_response(True, "Moment created successfully", _moment_dict(db, moment, current_user.id))
 
@@ -346,6 +332,7 @@ def delete_moment(moment_id: str, db: Session = Depends(get_db), current_user: U
         return standard_response(False, "Moment not found")
     m.is_active = False
     db.commit()
+    _invalidate_trays_showing(db, current_user.id)
     return standard_response(True, "Moment deleted")
 
 
@@ -365,6 +352,8 @@ def mark_moment_seen(moment_id: str, db: Session = Depends(get_db), current_user
     if not existing:
         db.add(UserMomentViewer(id=uuid.uuid4(), moment_id=mid, viewer_id=current_user.id, viewed_at=datetime.now(EAT)))
         db.commit()
+        # The viewer's "seen" ring and the author's viewer count.
+        invalidate_moment_trays([current_user.id, m.user_id])
     return standard_response(True, "Moment marked as seen")
 
 
@@ -2,14 +2,19 @@
 
 import uuid
 from datetime import datetime
+from typing import Optional
 
 import pytz
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Query, Request, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from core.database import get_db
+from core import realtime
+from core.database import SessionLocal, get_db
 from models import Notification, User
-from utils.auth import get_current_user
+from services import unread_counters
+from utils.auth import get_current_user, get_user_from_token
 from utils.helpers import standard_response, paginate
 
 EAT = pytz.timezone("Africa/Nairobi")
@@ -24,13 +29,17 @@ def get_notifications(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    from core.redis import cache_get, cache_set, CacheKeys
+    from core.redis import cache_get, cache_set, notifications_version, CacheKeys
 
     use_cache = not (search and search.strip())
-    cache_key = CacheKeys.for_notifications(str(current_user.id), page, limit) if use_cache else None
+    cache_key = None
+    if use_cache:
+        uid = str(current_user.id)
+        cache_key = CacheKeys.for_notifications(uid, page, limit, notifications_version(uid))
     if use_cache:
         cached = cache_get(cache_key)
         if cached is not None:
+            cached["unread_count"] = unread_counters.get_unread(db, current_user.id, unread_counters.NOTIFICATIONS)
             return standard_response(True, "Notifications retrieved", cached)
 
     from utils.batch_loaders import build_notification_dicts
@@ -49,33 +58,72 @@ def get_notifications(
     items, pagination = paginate(query, page, limit)
     data = build_notification_dicts(db, items)
 
-    unread = db.query(sa_func.count(Notification.id)).filter(
-        Notification.recipient_id == current_user.id, Notification.is_read == False
-    ).scalar() or 0
-
-    result = {"notifications": data, "unread_count": unread, "pagination": pagination}
+    result = {"notifications": data, "pagination": pagination}
     if use_cache:
         cache_set(cache_key, result, ttl_seconds=60)
+    result["unread_count"] = unread_counters.get_unread(db, current_user.id, unread_counters.NOTIFICATIONS)
     return standard_response(True, "Notifications retrieved", result)
 
 
 @router.get("/unread/count")
 def get_unread_count(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    from core.redis import cache_get, cache_set, CacheKeys
-
-    cache_key = CacheKeys.for_unread(str(current_user.id))
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return standard_response(True, "Unread count retrieved", cached)
-
-    from sqlalchemy import func as sa_func
-    count = db.query(sa_func.count(Notification.id)).filter(
-        Notification.recipient_id == current_user.id, Notification.is_read == False
-    ).scalar() or 0
-
-    result = {"count": count}
-    cache_set(cache_key, result, ttl_seconds=30)  # 30 sec TTL
-    return standard_response(True, "Unread count retrieved", result)
+    count = unread_counters.get_unread(db, current_user.id, unread_counters.NOTIFICATIONS)
+    return standard_response(True, "Unread count retrieved", {"count": count})
+
+
+# ──────────────────────────────────────────────
+# Per-user real-time stream
+# ──────────────────────────────────────────────
+# One connection per signed-in client replaces polling the unread counts
+# and the notification list. Events on the user's channel:
+#   notification.created  – payload as in GET /notifications
+#   unread.updated        – {"notifications": n} and/or {"messages": n}
+# plus the call signaling events of /calls/ws. The ``ready`` frame
+# carries the current counts, so no count request is needed on connect.
+
+def _stream_ready(token: Optional[str]):
+    db = SessionLocal()
+    try:
+        user = get_user_from_token(db, token)
+        if not user:
+            return None, None
+        return user.id, {
+            "user_id": str(user.id),
+            "unread": unread_counters.get_unread_counts(db, user.id),
+        }
+    finally:
+        db.close()
+
+
+def _stream_channels(user_id):
+    return [realtime.Channels.for_user(user_id), realtime.Channels.for_user_calls(user_id)]
+
+
+@router.websocket("/ws")
+async def notification_socket(websocket: WebSocket, token: Optional[str] = Query(None)):
+    user_id, ready = await run_in_threadpool(_stream_ready, token)
+    if user_id is None:
+        await websocket.close(code=4401)
+        return
+    await websocket.accept()
+    await realtime.serve_websocket(websocket, _stream_channels(user_id), ready=ready)
+
+
+@router.get("/stream")
+async def notification_stream(request: Request, token: Optional[str] = Query(None)):
+    """Same events as ``/ws`` over Server-Sent Events. ``EventSource``
+    can't set headers, so the token comes from the query string or the
+    session cookie."""
+    if not realtime.REDIS_ENABLED:
+        return standard_response(False, "Live updates are unavailable")
+    user_id, ready = await run_in_threadpool(_stream_ready, token or request.cookies.get("session_id"))
+    if user_id is None:
+        return standard_response(False, "Not authenticated")
+    return StreamingResponse(
+        realtime.stream_sse(_stream_channels(user_id), ready=ready),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.put("/{notification_id}/read")
@@ -84,15 +132,21 @@ def mark_as_read(notification_id: str, db: Session = Depends(get_db), current_us
         nid = uuid.UUID(notification_id)
     except ValueError:
         return standard_response(False, "Invalid notification ID")
-    n = db.query(Notification).filter(Notification.id == nid, Notification.recipient_id == current_user.id).first()
-    if not n:
+    # Conditional update: only the request that actually flips the row
+    # decrements the counter.
+    flipped = db.query(Notification).filter(
+        Notification.id == nid, Notification.recipient_id == current_user.id, Notification.is_read == False
+    ).update({"is_read": True}, synchronize_session=False)
+    if not flipped and not db.query(Notification.id).filter(
+        Notification.id == nid, Notification.recipient_id == current_user.id
+    ).first():
         return standard_response(False, "Notification not found")
-    n.is_read = True
     db.commit()
 
     # Invalidate caches
     from core.redis import invalidate_user_notifications
     invalidate_user_notifications(str(current_user.id))
+    unread_counters.adjust(db, current_user.id, unread_counters.NOTIFICATIONS, -flipped)
 
     return standard_response(True, "Notification marked as read")
 
@@ -104,6 +158,7 @@ def mark_all_as_read(db: Session = Depends(get_db), current_user: User = Depends
 
     from core.redis import invalidate_user_notifications
     invalidate_user_notifications(str(current_user.id))
+    unread_counters.reset(current_user.id, unread_counters.NOTIFICATIONS)
 
     return standard_response(True, "All notifications marked as read")
 
@@ -117,11 +172,14 @@ def delete_notification(notification_id: str, db: Session = Depends(get_db), cur
     n = db.query(Notification).filter(Notification.id == nid, Notification.recipient_id == current_user.id).first()
     if not n:
         return standard_response(False, "Notification not found")
+    was_unread = not n.is_read
     db.delete(n)
     db.commit()
 
     from core.redis import invalidate_user_notifications
     invalidate_user_notifications(str(current_user.id))
+    if was_unread:
+        unread_counters.adjust(db, current_user.id, unread_counters.NOTIFICATIONS, -1)
 
     return standard_response(True, "Notification deleted")
 
@@ -133,5 +191,6 @@ def clear_all_notifications(db: Session = Depends(get_db), current_user: User =
 
     from core.redis import invalidate_user_notifications
     invalidate_user_notifications(str(current_user.id))
+    unread_counters.reset(current_user.id, unread_counters.NOTIFICATIONS)
 
     return standard_response(True, "All notifications cleared")
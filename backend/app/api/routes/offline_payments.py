@@ -22,6 +22,7 @@ from models import (
     CommitteePermission, User, UserService, Currency,
     OfflineVendorPayment,
 )
+from services.committee_permissions import get_member_permissions
 from utils.auth import get_current_user
 from utils.helpers import standard_response
 from utils.sms import _send as sms_send
@@ -81,15 +82,7 @@ def _format_amount(currency: str, amount) -> str:
 def _is_organiser_or_committee(db: Session, event: Event, user: User) -> bool:
     if str(event.organizer_id) == str(user.id):
         return True
-    cm = db.query(EventCommitteeMember).filter(
-        EventCommitteeMember.event_id == event.id,
-        EventCommitteeMember.user_id == user.id,
-    ).first()
-    if not cm:
-        return False
-    perm = db.query(CommitteePermission).filter(
-        CommitteePermission.committee_member_id == cm.id
-    ).first()
+    perm = get_member_permissions(db, event.id, user.id)
     return bool(perm and (perm.can_manage_expenses or perm.can_manage_budget))
 
 
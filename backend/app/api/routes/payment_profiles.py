@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from utils.auth import get_current_user
 from utils.helpers import api_response
 from models.users import User
@@ -109,6 +110,7 @@ def required_status(
 
 
 @router.post("", status_code=201)
+@blocking
 async def create_profile(
     request: Request,
     db: Session = Depends(get_db),
@@ -194,6 +196,7 @@ async def create_profile(
 
 
 @router.patch("/{profile_id}")
+@blocking
 async def update_profile(
     profile_id: str,
     request: Request,
@@ -36,6 +36,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from utils.auth import get_current_user
 from utils.helpers import api_response, paginate
 from models.users import User
@@ -310,7 +311,6 @@ def _sync_target_after_payment(db: Session, tx: Transaction):
             UserContributor, EventContributor, EventContribution,
         )
         from models.enums import ContributionStatusEnum, PaymentMethodEnum
-        from sqlalchemy import func as _sa_func
 
         event_id = tx.target_id
         payer_id = tx.payer_user_id
@@ -352,10 +352,7 @@ def _sync_target_after_payment(db: Session, tx: Transaction):
                     .join(UserContributor, UserContributor.id == EventContributor.contributor_id)
                     .filter(
                         EventContributor.event_id == event_id,
-                        _sa_func.right(
-                            _sa_func.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'),
-                            9,
-                        ) == phone_digits,
+                        UserContributor.phone_key == phone_digits,
                     )
                     .first()
                 )
@@ -499,7 +496,6 @@ def _notify_event_contributor_payment_recorded(db: Session, tx: Transaction) ->
             .first()
         )
         if not ec and getattr(payer, "phone", None):
-            from sqlalchemy import func as _sa_func
             digits = "".join(ch for ch in str(payer.phone) if ch.isdigit())[-9:]
             if digits:
                 ec = (
@@ -508,10 +504,7 @@ def _notify_event_contributor_payment_recorded(db: Session, tx: Transaction) ->
                     .join(UserContributor, UserContributor.id == EventContributor.contributor_id)
                     .filter(
                         EventContributor.event_id == tx.target_id,
-                        _sa_func.right(
-                            _sa_func.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'),
-                            9,
-                        ) == digits,
+                        UserContributor.phone_key == digits,
                     )
                     .first()
                 )
@@ -829,6 +822,7 @@ def fee_preview(
 # ──────────────────────────────────────────────
 
 @router.post("/initiate", status_code=201)
+@blocking
 async def initiate_payment(
     request: Request,
     db: Session = Depends(get_db),
@@ -1320,6 +1314,7 @@ def _resolve_offline_receipt(db: Session, identifier: str) -> Optional[dict]:
 
 
 @router.get("/{transaction_id}/status")
+@blocking
 async def transaction_status(
     transaction_id: str,
     db: Session = Depends(get_db),
@@ -1803,6 +1798,7 @@ async def _apply_successful_payment(db: Session, tx: Transaction, attempt: Mobil
 
 
 @router.post("/callback")
+@blocking
 async def payment_callback(request: Request, db: Session = Depends(get_db)):
     """SasaPay C2B Callback — invoked once per `request-payment` outcome.
 
@@ -1884,6 +1880,7 @@ async def payment_callback(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/ipn")
+@blocking
 async def payment_ipn(request: Request, db: Session = Depends(get_db)):
     """SasaPay Instant Payment Notification — back-office reconciliation.
 
@@ -2107,6 +2104,7 @@ def my_pending_transactions(
 
 
 @router.post("/verify-pending")
+@blocking
 async def verify_pending_transactions(
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
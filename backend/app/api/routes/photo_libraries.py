@@ -1,19 +1,19 @@
 # Photo Libraries Routes - /photo-libraries/...
 # Photography service providers can create event photo libraries and upload images
 
+import asyncio
 import os
 import secrets
 import uuid
 from datetime import datetime
 from typing import Optional
 
-import httpx
 import pytz
 from fastapi import APIRouter, Depends, File, Form, UploadFile, Query
 from sqlalchemy.orm import Session
 
-from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     UserService, Event, EventImage, EventService, ServicePhotoLibrary, ServicePhotoLibraryImage,
     ServicePhotoLibraryFavorite,
@@ -21,6 +21,7 @@ from models import (
 )
 from utils.auth import get_current_user, get_optional_user
 from utils.helpers import standard_response
+from utils.upload_service import UploadError, forward_upload, upload_size
 from utils.event_owner import get_event_owner_display_name
 from services.share_links import host_for_currency
 
@@ -402,6 +403,7 @@ def update_library(
 # (allowed for service owner OR event organizer)
 # ──────────────────────────────────────────────
 @router.post("/{library_id}/upload")
+@blocking
 async def upload_photo(
     library_id: str,
     file: UploadFile = File(...),
@@ -447,8 +449,9 @@ async def upload_photo(
     is_video = content_type in ALLOWED_VIDEO_MIMES
     media_type = 'video' if is_video else 'photo'
 
-    content = await file.read()
-    file_size = len(content)
+    # Sized from the spooled upload; the bytes are streamed to the upload
+    # service rather than read into memory.
+    file_size = upload_size(file)
 
     per_item_cap = MAX_VIDEO_SIZE_BYTES if is_video else MAX_IMAGE_SIZE_BYTES
     if file_size > per_item_cap:
@@ -475,22 +478,14 @@ async def upload_photo(
     _, ext = os.path.splitext(file.filename or ("video.mp4" if is_video else "image.jpg"))
     unique_name = f"{uuid.uuid4().hex}{ext}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.post(
-                UPLOAD_SERVICE_URL,
-                data={"target_path": folder_path},
-                files={"file": (unique_name, content, content_type)},
-                timeout=180 if is_video else 60,
-            )
-        except Exception as e:
-            return standard_response(False, f"Upload failed: {str(e)}")
-
-    result = resp.json()
-    if not result.get("success"):
-        return standard_response(False, result.get("message", "Upload failed"))
+    try:
+        data = await asyncio.to_thread(
+            forward_upload, file, unique_name, folder_path, content_type, 180 if is_video else 60,
+        )
+    except UploadError as e:
+        return standard_response(False, str(e))
 
-    url = result["data"]["url"]
+    url = data["url"]
     now = datetime.now(EAT)
 
     existing_count = db.query(ServicePhotoLibraryImage).filter(
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     UserFeed, UserFeedImage, UserFeedGlow, UserFeedEcho,
     UserFeedSpark, UserFeedComment, UserFeedCommentGlow,
@@ -432,6 +433,7 @@ def get_post(post_id: str, db: Session = Depends(get_db), current_user: User = D
 
 
 @router.post("/")
+@blocking
 async def create_post(
     content: Optional[str] = Form(None), location: Optional[str] = Form(None),
     visibility: Optional[str] = Form("public"),
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from models import User, UserProfile, UserIdentityVerification, IdentityDocumentRequirement, VerificationStatusEnum
 from utils.auth import get_current_user
 from utils.helpers import standard_response
@@ -31,6 +32,7 @@ def get_my_profile(db: Session = Depends(get_db), current_user: User = Depends(g
 
 
 @router.put("/profile")
+@blocking
 async def update_profile(
     first_name: Optional[str] = Form(None),
     last_name: Optional[str] = Form(None),
@@ -410,6 +412,7 @@ def get_verification_status(
 
 
 @router.post("/verify-identity")
+@blocking
 async def submit_identity_verification(
     id_front: UploadFile = File(...),
     id_back: Optional[UploadFile] = File(None),
@@ -33,6 +33,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from utils.helpers import api_response
 from models import (
     Event, User, Currency, UserContributor,
@@ -192,6 +193,7 @@ def get_public_state(token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{token}/initiate", status_code=201)
+@blocking
 async def public_initiate(token: str, request: Request, db: Session = Depends(get_db)):
     """Initiate a guest mobile-money payment toward this contributor's pledge.
 
@@ -330,6 +332,7 @@ async def public_initiate(token: str, request: Request, db: Session = Depends(ge
 
 
 @router.get("/{token}/transactions/{transaction_id}")
+@blocking
 async def public_transaction_status(
     token: str,
     transaction_id: str,
@@ -16,6 +16,7 @@ from models import (
     RSVPStatusEnum, GuestTypeEnum,
 )
 from utils.helpers import standard_response, format_phone_display
+from utils.phone_numbers import match_phone_key, phone_key
 
 router = APIRouter(prefix="/rsvp", tags=["RSVP"])
 
@@ -228,21 +229,20 @@ def lookup_by_phone(phone: str):
     if not phone or len(phone) > 30:
         return standard_response(False, "Invalid phone number")
 
-    # Normalize: strip leading + and spaces
-    normalized = phone.strip().lstrip("+").replace(" ", "")
-    last9 = normalized[-9:]  # match last 9 digits for flexible lookup
+    # Match on the indexed last-9-digit phone key (see models/phone_keys.py)
+    if not phone_key(phone):
+        return standard_response(False, "No invitation found for this phone number")
 
     db = SessionLocal()
     try:
         inv = None
 
         # 1. Search by registered user phone
-        users = db.query(User).filter(
-            User.phone.ilike(f"%{last9}")
-        ).all()
+        user_ids = [
+            row.id for row in db.query(User.id).filter(match_phone_key(User.phone_key, phone)).all()
+        ]
 
-        if users:
-            user_ids = [u.id for u in users]
+        if user_ids:
             inv = db.query(EventInvitation).filter(
                 EventInvitation.invited_user_id.in_(user_ids),
                 EventInvitation.invitation_code.isnot(None),
@@ -250,21 +250,25 @@ def lookup_by_phone(phone: str):
 
         # 2. If not found, search by contributor phone
         if not inv:
-            contributors = db.query(UserContributor).filter(
-                UserContributor.phone.ilike(f"%{last9}")
-            ).all()
+            contributor_ids = [
+                row.id for row in db.query(UserContributor.id).filter(
+                    match_phone_key(UserContributor.phone_key, phone)
+                ).all()
+            ]
 
-            if contributors:
-                contributor_ids = [c.id for c in contributors]
+            if contributor_ids:
                 inv = db.query(EventInvitation).filter(
                     EventInvitation.contributor_id.in_(contributor_ids),
                     EventInvitation.invitation_code.isnot(None),
                 ).order_by(EventInvitation.created_at.desc()).first()
 
-        # 3. Fallback: search by guest_phone on the invitation itself
+        # 3. Fallback: search by the guest phone on the attendee row linked
+        #    to the invitation (invitations don't carry a phone themselves)
         if not inv:
-            inv = db.query(EventInvitation).filter(
-                EventInvitation.guest_phone.ilike(f"%{last9}"),
+            inv = db.query(EventInvitation).join(
+                EventAttendee, EventAttendee.invitation_id == EventInvitation.id
+            ).filter(
+                match_phone_key(EventAttendee.phone_key, phone),
                 EventInvitation.invitation_code.isnot(None),
             ).order_by(EventInvitation.created_at.desc()).first()
 
@@ -1,6 +1,5 @@
 from datetime import datetime
 import json
-import math
 import os
 import re
 import uuid
@@ -12,6 +11,7 @@ from sqlalchemy.orm import Session, selectinload, joinedload
 from sqlalchemy import func as sa_func, or_, case, literal
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     EventTypeService, EventService, Event, EventInvitation, EventCommitteeMember,
     ServiceType, UserService, ServicePackage, UserServiceRating,
@@ -21,6 +21,8 @@ from core.redis import cache_get, cache_set, cache_delete_pattern
 from utils.auth import get_current_user
 
 from utils.helpers import format_price, standard_response, paginate
+from utils.search import text_match
+from services.service_ranking import relevance_score, within_radius
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -34,74 +36,6 @@ VALID_STATUS_FILTERS = {"draft", "confirmed", "cancelled", "completed", "all"}
 router = APIRouter(prefix="/services", tags=["Public Services"])
 
 
-# =============================================================================
-# Helper: Personalized ranking score
-# =============================================================================
-def _compute_relevance_score(service, user_event_type_ids=None, user_lat=None, user_lng=None):
-    """
-    Multi-factor scoring algorithm for service ranking:
-    Score = W1(Rating) + W2(Reviews) + W3(EventMatch) + W4(Proximity) + W5(Verified) + W6(Completeness)
-    """
-    score = 0.0
-
-    # W1: Rating quality (0-25 pts)
-    avg_rating = 0
-    if service.ratings:
-        avg_rating = sum(r.rating for r in service.ratings) / len(service.ratings)
-    score += (avg_rating / 5.0) * 25
-
-    # W2: Social proof - review volume (0-20 pts, log scale)
-    review_count = len(service.ratings) if service.ratings else 0
-    if review_count > 0:
-        score += min(math.log(review_count + 1, 10) * 10, 20)
-
-    # W3: Event type match - boost services matching user's event types (0-20 pts)
-    if user_event_type_ids and service.service_type_id:
-        # Check if this service type is recommended for user's event types
-        # We pass pre-computed matching service_type_ids
-        if str(service.service_type_id) in user_event_type_ids:
-            score += 20
-
-    # W4: Location proximity (0-15 pts)
-    if user_lat and user_lng and service.latitude and service.longitude:
-        dist = _haversine(user_lat, user_lng, float(service.latitude), float(service.longitude))
-        if dist <= 10:
-            score += 15
-        elif dist <= 25:
-            score += 12
-        elif dist <= 50:
-            score += 8
-        elif dist <= 100:
-            score += 4
-
-    # W5: Verification trust (0-10 pts)
-    if service.is_verified and service.verification_status == "verified":
-        score += 10
-
-    # W6: Profile completeness (0-10 pts)
-    completeness = 0
-    if service.description and len(service.description) > 50:
-        completeness += 2
-    if service.images and len(service.images) > 0:
-        completeness += 3
-    if service.min_price:
-        completeness += 2
-    if service.packages and len(service.packages) > 0:
-        completeness += 3
-    score += completeness
-
-    return score
-
-
-def _haversine(lat1, lon1, lat2, lon2):
-    """Calculate distance in km between two lat/lng points."""
-    R = 6371
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-
 # =============================================================================
 # 9.1 Search Services (Smart Ranking)
 # =============================================================================
@@ -126,14 +60,14 @@ def search_services(
 ):
     """
     Searches, filters, and ranks public service listings.
-    Uses a multi-factor relevance algorithm when sort_by=relevance.
-    Supports geo-proximity when lat/lng provided.
+    Uses a multi-factor relevance score (services.service_ranking) when
+    sort_by=relevance; ranking and pagination both happen in SQL.
+    With lat/lng, only services within radius_km (or without coordinates)
+    are returned.
     """
 
     query = db.query(UserService).options(
-        selectinload(UserService.ratings),
         selectinload(UserService.images),
-        selectinload(UserService.packages),
         joinedload(UserService.user).joinedload(User.profile),
         joinedload(UserService.category),
         joinedload(UserService.service_type),
@@ -144,9 +78,9 @@ def search_services(
         UserService.verification_status == "verified"
     )
 
-    if q:
-        search = f"%{q}%"
-        query = query.filter(or_(UserService.title.ilike(search), UserService.description.ilike(search)))
+    match = text_match(UserService.search_document, q, vector=UserService.search_vector)
+    if match is not None:
+        query = query.filter(match.condition)
 
     if category_id:
         try:
@@ -188,6 +122,9 @@ def search_services(
     if available:
         query = query.filter(UserService.availability == "available")
 
+    if lat is not None and lng is not None and radius_km and radius_km > 0:
+        query = query.filter(within_radius(lat, lng, radius_km))
+
     # ── Determine user context for personalized ranking ──
     user_event_type_service_ids = set()
     current_user = None
@@ -233,61 +170,27 @@ def search_services(
             recommended = db.query(EventTypeService.service_type_id).filter(
                 EventTypeService.event_type_id.in_([uuid.UUID(x) for x in user_event_type_ids_raw])
             ).all()
-            user_event_type_service_ids = {str(r[0]) for r in recommended}
+            user_event_type_service_ids = {r[0] for r in recommended}
 
-    # ── Fetch and rank services ──
-    # For relevance sorting, limit the candidate pool to prevent full-table scan.
-    # Score using denormalized data instead of loading all rows into memory.
+    # ── Rank and paginate ──
     if sort_by == "relevance":
-        # Cap candidate pool to 500 instead of loading all rows
-        MAX_RELEVANCE_POOL = 500
-        all_services = query.limit(MAX_RELEVANCE_POOL).all()
-
-        scored = []
-        for s in all_services:
-            score = _compute_relevance_score(
-                s,
-                user_event_type_ids=user_event_type_service_ids if user_event_type_service_ids else None,
-                user_lat=lat,
-                user_lng=lng
-            )
-            if location and s.location and location.lower() in s.location.lower():
-                score += 15
-            scored.append((s, score))
-
-        scored.sort(key=lambda x: (-x[1], x[0].created_at))
-
-        total = len(scored)
-        start = (page - 1) * limit
-        end = start + limit
-        page_items = [s for s, _ in scored[start:end]]
-
-        total_pages = math.ceil(total / limit) if limit > 0 else 1
-        pagination = {
-            "page": page,
-            "limit": limit,
-            "total_items": total,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_previous": page > 1
-        }
-        items = page_items
+        score = relevance_score(user_event_type_service_ids, lat, lng, location)
+        order = [score.desc()]
+        if match is not None:
+            order.append(match.rank.desc())
+        query = query.order_by(*order, UserService.created_at.asc(), UserService.id)
+    elif sort_by == "price_low":
+        query = query.order_by(UserService.min_price.asc().nullslast(), UserService.id)
+    elif sort_by == "price_high":
+        query = query.order_by(UserService.min_price.desc().nullslast(), UserService.id)
+    elif sort_by == "rating":
+        query = query.order_by(UserService.rating_avg.desc(), UserService.rating_count.desc(), UserService.id)
+    elif sort_by == "reviews":
+        query = query.order_by(UserService.rating_count.desc(), UserService.rating_avg.desc(), UserService.id)
     else:
-        # Standard sorting
-        if sort_by == "newest":
-            query = query.order_by(UserService.created_at.desc())
-        elif sort_by == "price_low":
-            query = query.order_by(UserService.min_price.asc().nullslast())
-        elif sort_by == "price_high":
-            query = query.order_by(UserService.min_price.desc().nullslast())
-        elif sort_by == "rating":
-            query = query.order_by(UserService.created_at.desc())  # fallback, rating computed
-        elif sort_by == "reviews":
-            query = query.order_by(UserService.created_at.desc())  # fallback
-        else:
-            query = query.order_by(UserService.created_at.desc())
+        query = query.order_by(UserService.created_at.desc(), UserService.id)
 
-        items, pagination = paginate(query, page, limit)
+    items, pagination = paginate(query, page, limit)
 
     # ── Batch load completed events count ──
     service_ids = [s.id for s in items]
@@ -316,9 +219,6 @@ def search_services(
 
     result = []
     for s in items:
-        ratings = s.ratings
-        avg = sum(r.rating for r in ratings) / len(ratings) if ratings else 0
-
         primary_image = None
         for img in s.images:
             if img.is_featured:
@@ -366,8 +266,8 @@ def search_services(
             "longitude": float(s.longitude) if s.longitude else None,
             "primary_image": primary_image,
             "images": [{"id": str(img.id), "url": img.image_url, "is_primary": img.is_featured} for img in (s.images or [])],
-            "rating": round(avg, 1),
-            "review_count": len(ratings),
+            "rating": round(float(s.rating_avg or 0), 1),
+            "review_count": s.rating_count or 0,
             "verification_status": s.verification_status if hasattr(s, "verification_status") else "unverified",
             "verified": s.is_verified,
             "availability": s.availability.value if hasattr(s.availability, "value") else s.availability,
@@ -686,6 +586,7 @@ def get_service_calendar(
 # 9.4 Submit Service Review (Authenticated)
 # =============================================================================
 @router.post("/{service_id}/reviews")
+@blocking
 async def submit_service_review(
     service_id: str,
     request: Request,
@@ -13,9 +13,10 @@ from sqlalchemy.orm import Session
 from core.database import get_db
 from models import (
     Event, EventType, EventTemplate, EventTemplateTask, EventChecklistItem,
-    EventCommitteeMember, CommitteePermission, User, UserProfile,
+    EventCommitteeMember, User, UserProfile,
     PriorityLevelEnum, ChecklistItemStatusEnum,
 )
+from services.committee_permissions import get_member_permissions
 from utils.auth import get_current_user
 from utils.helpers import standard_response
 
@@ -36,16 +37,12 @@ def _verify_event_access(db: Session, event_id, current_user, required_permissio
     is_creator = str(event.organizer_id) == str(current_user.id)
     if is_creator:
         return event, None
-    cm = db.query(EventCommitteeMember).filter(
-        EventCommitteeMember.event_id == event_id,
-        EventCommitteeMember.user_id == current_user.id,
-    ).first()
-    if not cm:
+    perms = get_member_permissions(db, event.id, current_user.id)
+    if not perms:
         return None, standard_response(False, "You do not have permission to access this event")
     if not required_permission:
         return event, None
-    perms = db.query(CommitteePermission).filter(CommitteePermission.committee_member_id == cm.id).first()
-    if not perms or not getattr(perms, required_permission, False):
+    if not getattr(perms, required_permission, False):
         return None, standard_response(False, "You do not have permission to perform this action")
     return event, None
 
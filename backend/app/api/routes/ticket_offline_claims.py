@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func as sa_func
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     User, Event, EventTicketClass, EventTicket,
     TicketOrderStatusEnum, PaymentStatusEnum, PaymentMethodEnum,
@@ -62,6 +63,7 @@ def _claim_dict(claim: TicketOfflineClaim, *, include_audit: bool = True) -> dic
 # Submit an offline-payment claim for a ticket
 # ──────────────────────────────────────────────
 @router.post("/classes/{class_id}/offline-claim")
+@blocking
 async def submit_ticket_offline_claim(
     class_id: str,
     quantity: int = Form(1),
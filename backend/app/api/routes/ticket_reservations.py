@@ -33,6 +33,7 @@ from sqlalchemy import func as sa_func
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     User, Event, EventTicketClass, EventTicket,
     TicketOrderStatusEnum, PaymentStatusEnum, TicketApprovalStatusEnum,
@@ -115,6 +116,7 @@ def _reserved_qty(db: Session, ticket_class_id) -> int:
 # POST /ticketing/reserve
 # ──────────────────────────────────────────────
 @router.post("/reserve")
+@blocking
 async def reserve_ticket(
     request: Request,
     db: Session = Depends(get_db),
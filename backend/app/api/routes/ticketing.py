@@ -6,6 +6,7 @@ from fastapi import APIRouter, Request, Depends
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     User, Event, EventTicketClass, EventTicket, EventImage,
     TicketStatusEnum, TicketOrderStatusEnum, PaymentStatusEnum,
@@ -208,6 +209,7 @@ def get_my_ticket_classes(
 # Create/Update ticket classes (organizer)
 # ──────────────────────────────────────────────
 @router.post("/events/{event_id}/ticket-classes")
+@blocking
 async def create_ticket_class(
     event_id: str,
     request: Request,
@@ -261,6 +263,7 @@ async def create_ticket_class(
 
 
 @router.put("/ticket-classes/{class_id}")
+@blocking
 async def update_ticket_class(
     class_id: str,
     request: Request,
@@ -349,6 +352,7 @@ def delete_ticket_class(
 # Purchase tickets
 # ──────────────────────────────────────────────
 @router.post("/purchase")
+@blocking
 async def purchase_ticket(
     request: Request,
     db: Session = Depends(get_db),
@@ -436,6 +440,7 @@ async def purchase_ticket(
 # Bulk purchase (multiple ticket classes in one order)
 # ──────────────────────────────────────────────
 @router.post("/purchase-bulk")
+@blocking
 async def purchase_tickets_bulk(
     request: Request,
     db: Session = Depends(get_db),
@@ -734,6 +739,7 @@ def get_event_tickets(
 # Organizer: Approve / Reject a ticket
 # ──────────────────────────────────────────────
 @router.put("/tickets/{ticket_id}/status")
+@blocking
 async def update_ticket_status(
     ticket_id: str,
     request: Request,
@@ -980,13 +986,11 @@ def get_ticketed_events(
     else:
         query = db.query(Event).filter(*base_filter, visibility_filter)
 
-    # Live search filter
-    if search and search.strip():
-        search_term = f"%{search.strip().lower()}%"
-        query = query.filter(
-            sa_func.lower(Event.name).like(search_term) |
-            sa_func.lower(Event.location).like(search_term)
-        )
+    # Live search filter (name + location, trigram-indexed)
+    from utils.search import text_match
+    match = text_match(Event.search_document, search)
+    if match is not None:
+        query = query.filter(match.condition)
 
     query = query.order_by(Event.start_date.asc())
 
@@ -1,21 +1,22 @@
 # Uploads Routes - /uploads/...
 
+import asyncio
 import os
 import uuid
 from datetime import datetime
 from typing import List
 import enum
 
-import httpx
 import pytz
 from fastapi import APIRouter, Depends, File, UploadFile
 from sqlalchemy.orm import Session
 
-from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from models import FileUpload, User
 from utils.auth import get_current_user
 from utils.helpers import standard_response
+from utils.upload_service import UploadError, forward_upload, forward_uploads, upload_size
 
 EAT = pytz.timezone("Africa/Nairobi")
 router = APIRouter(prefix="/uploads", tags=["Uploads"])
@@ -36,29 +37,26 @@ def map_mime_to_enum(mime: str) -> str:
 
 
 @router.post("/")
+@blocking
 async def upload_file(file: UploadFile = File(...), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if not file or not file.filename:
         return standard_response(False, "No file provided")
 
-    content = await file.read()
     _, ext = os.path.splitext(file.filename)
     unique_name = f"{uuid.uuid4().hex}{ext}"
     now = datetime.now(EAT)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.post(UPLOAD_SERVICE_URL, data={"target_path": f"nuru/uploads/general/{current_user.id}/"}, files={"file": (unique_name, content, file.content_type)}, timeout=20)
-        except Exception as e:
-            return standard_response(False, f"Upload failed: {str(e)}")
-
-    result = resp.json()
-    if not result.get("success"):
-        return standard_response(False, result.get("message", "Upload failed"))
+    try:
+        data = await asyncio.to_thread(
+            forward_upload, file, unique_name, f"nuru/uploads/general/{current_user.id}/", None, 20,
+        )
+    except UploadError as e:
+        return standard_response(False, str(e))
 
-    url = result["data"]["url"]
+    url = data["url"]
     file_enum_type = map_mime_to_enum(file.content_type)
 
-    upload = FileUpload(id=uuid.uuid4(), user_id=current_user.id, file_url=url, original_name=file.filename, file_type=file_enum_type, file_size=len(content), created_at=now)
+    upload = FileUpload(id=uuid.uuid4(), user_id=current_user.id, file_url=url, original_name=file.filename, file_type=file_enum_type, file_size=upload_size(file), created_at=now)
     db.add(upload)
     db.commit()
 
@@ -66,32 +64,29 @@ async def upload_file(file: UploadFile = File(...), db: Session = Depends(get_db
 
 
 @router.post("/bulk")
+@blocking
 async def upload_files(files: List[UploadFile] = File(...), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Forwards the files concurrently and returns one entry per file:
+    ``{"file_name", "success", "id", "url"}`` or ``{"file_name", "success", "message"}``."""
     now = datetime.now(EAT)
-    uploaded = []
+    files = [f for f in files if f and f.filename]
+
+    items = [(f, f"{uuid.uuid4().hex}{os.path.splitext(f.filename)[1]}") for f in files]
+    results = await forward_uploads(items, f"nuru/uploads/general/{current_user.id}/", timeout=20)
 
-    for file in files:
-        if not file or not file.filename:
+    data = []
+    for file, result in zip(files, results):
+        if not result["success"]:
+            data.append({"file_name": file.filename, "success": False, "message": result["message"]})
             continue
-        content = await file.read()
-        _, ext = os.path.splitext(file.filename)
-        unique_name = f"{uuid.uuid4().hex}{ext}"
-
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.post(UPLOAD_SERVICE_URL, data={"target_path": f"nuru/uploads/general/{current_user.id}/"}, files={"file": (unique_name, content, file.content_type)}, timeout=20)
-                result = resp.json()
-                if result.get("success"):
-                    url = result["data"]["url"]
-                    file_enum_type = map_mime_to_enum(file.content_type)
-                    upload = FileUpload(id=uuid.uuid4(), user_id=current_user.id, file_url=url, original_name=file.filename, file_type=file_enum_type, file_size=len(content), created_at=now)
-                    db.add(upload)
-                    uploaded.append({"id": str(upload.id), "url": url, "file_name": file.filename})
-            except Exception:
-                pass
+        url = result["data"]["url"]
+        upload = FileUpload(id=uuid.uuid4(), user_id=current_user.id, file_url=url, original_name=file.filename, file_type=map_mime_to_enum(file.content_type), file_size=upload_size(file), created_at=now)
+        db.add(upload)
+        data.append({"id": str(upload.id), "url": url, "file_name": file.filename, "success": True})
 
     db.commit()
-    return standard_response(True, f"{len(uploaded)} files uploaded", uploaded)
+    uploaded = sum(1 for d in data if d["success"])
+    return standard_response(True, f"{uploaded} of {len(data)} files uploaded", data)
 
 
 @router.get("/{upload_id}")
@@ -109,6 +104,7 @@ def get_upload(upload_id: str, db: Session = Depends(get_db), current_user: User
 
 
 @router.delete("/{upload_id}")
+@blocking
 async def delete_upload(upload_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     try:
         uid = uuid.UUID(upload_id)
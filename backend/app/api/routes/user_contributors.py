@@ -9,19 +9,23 @@ from typing import Optional
 import pytz
 from fastapi import APIRouter, Depends, Body, Query, File, Form, UploadFile, Request, BackgroundTasks
 from sqlalchemy import func as sa_func, or_, and_, text
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, joinedload
 
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     UserContributor, EventContributor, EventContribution,
     ContributionThankYouMessage,
     Event, EventImage, User, Currency,
-    EventCommitteeMember, CommitteePermission,
+    EventCommitteeMember,
     PaymentMethodEnum, ContributionStatusEnum,
     EventMessagingTemplate,
 )
+from services.committee_permissions import get_member_permissions
 from utils.auth import get_current_user
+from utils.exports import EXPORT_FORMATS, export_response, iter_query_batches
 from utils.helpers import standard_response, format_phone_display
+from utils.search import text_match
 from utils.validation_functions import validate_phone_number
 from utils.event_owner import get_event_owner_display_name
 
@@ -131,10 +135,9 @@ def _build_nuru_user_map(db: Session, contribs) -> dict:
             digits.add(d)
     if not digits:
         return {}
-    from sqlalchemy import func as _f
     rows = db.query(User).filter(
         User.phone.isnot(None),
-        _f.right(_f.regexp_replace(User.phone, r'[^0-9]', '', 'g'), 9).in_(list(digits)),
+        User.phone_key.in_(list(digits)),
     ).all()
     out = {}
     for u in rows:
@@ -159,10 +162,9 @@ def _find_user_by_phone(db: Session, phone: str):
     target = _normalize_phone_digits(phone)
     if not target:
         return None
-    from sqlalchemy import func as _f
     matches = db.query(User).filter(
         User.phone.isnot(None),
-        _f.right(_f.regexp_replace(User.phone, r'[^0-9]', '', 'g'), 9) == target,
+        User.phone_key == target,
     ).limit(1).all()
     return matches[0] if matches else None
 
@@ -181,7 +183,7 @@ def _collect_contributor_phones(contribs) -> list:
 
 def _event_contributor_dict(ec: EventContributor, show_recorder: bool = False,
                             wa_map: Optional[dict] = None) -> dict:
-    total_paid = sum(float(c.amount or 0) for c in ec.contributions if c.confirmation_status is None or c.confirmation_status == ContributionStatusEnum.confirmed)
+    total_paid = float(ec.total_paid or 0)
     pledge = float(ec.pledge_amount or 0)
     has_link = bool(getattr(ec, "share_token_hash", None)) and not getattr(ec, "share_token_revoked_at", None)
     return {
@@ -191,7 +193,9 @@ def _event_contributor_dict(ec: EventContributor, show_recorder: bool = False,
         "contributor": _contributor_dict(ec.contributor, wa_map=wa_map) if ec.contributor else None,
         "pledge_amount": pledge,
         "total_paid": total_paid,
+        "total_pending": float(ec.total_pending or 0),
         "balance": max(0.0, pledge - total_paid),
+        "last_payment_at": ec.last_payment_at.isoformat() if ec.last_payment_at else None,
         "notes": ec.notes,
         # Secondary contact + notification routing (comms-only).
         "secondary_phone": getattr(ec, "secondary_phone", None),
@@ -273,11 +277,10 @@ def _aggregate_summary_for(db: Session, user_id: uuid.UUID, event_id: uuid.UUID)
         UserContributor.contributor_user_id == user.id
     ).all()
     if me_phone_digits:
-        from sqlalchemy import func as _f
         legacy = db.query(UserContributor).filter(
             UserContributor.contributor_user_id.is_(None),
             UserContributor.phone.isnot(None),
-            _f.right(_f.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'), 9) == me_phone_digits,
+            UserContributor.phone_key == me_phone_digits,
         ).all()
         contribs.extend(legacy)
     if not contribs:
@@ -389,23 +392,18 @@ def verify_contribution_token(
 
 
 def _get_event_access(db: Session, event_id, current_user) -> tuple:
-    """Returns (event, is_creator, committee_member_or_None, permissions_or_None)"""
+    """Returns (event, is_creator, committee_member_or_None, permissions_or_None).
+    For committee members both are the cached ``MemberPermissions``."""
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         return None, False, None, None
     is_creator = str(event.organizer_id) == str(current_user.id)
     if is_creator:
         return event, True, None, None
-    cm = db.query(EventCommitteeMember).filter(
-        EventCommitteeMember.event_id == event_id,
-        EventCommitteeMember.user_id == current_user.id,
-    ).first()
-    if not cm:
+    perms = get_member_permissions(db, event.id, current_user.id)
+    if not perms:
         return event, False, None, None
-    perms = db.query(CommitteePermission).filter(
-        CommitteePermission.committee_member_id == cm.id
-    ).first()
-    return event, False, cm, perms
+    return event, False, perms, perms
 
 
 def _currency_code(db: Session, event: Event) -> str:
@@ -497,26 +495,17 @@ def my_contributions_insights(
     pledged/paid/balance, giving streak (consecutive months with at least
     one payment), monthly trend (last 12 months), method mix, top
     organisations supported, biggest gift, on-time completion rate and
-    a friendly impact message. Used by the mobile Insights screen."""
-    me_phone_digits = _normalize_phone_digits(current_user.phone) if getattr(current_user, "phone", None) else ""
-    contribs = db.query(UserContributor).filter(
-        UserContributor.contributor_user_id == current_user.id
-    ).all()
-    if me_phone_digits:
-        from sqlalchemy import func as _f
-        legacy = db.query(UserContributor).filter(
-            UserContributor.contributor_user_id.is_(None),
-            UserContributor.phone.isnot(None),
-            _f.right(_f.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'), 9) == me_phone_digits,
-        ).all()
-        contribs.extend(legacy)
+    a friendly impact message. Used by the mobile Insights screen.
 
-    user_currency = (getattr(current_user, "currency_code", None) or "").strip() or "TZS"
+    Served from the per-user snapshot in ``user_contribution_insights``,
+    which contribution writes keep current."""
+    from services.contribution_insights import get_user_insights, insights_payload
 
-    if not contribs:
+    row = get_user_insights(db, current_user)
+    if not row.events_count:
         return standard_response(True, "No insights yet", {
             "summary": {"total_pledged": 0, "total_paid": 0, "total_balance": 0,
-                        "total_pending": 0, "currency": user_currency},
+                        "total_pending": 0, "currency": row.currency},
             "counts": {"events_count": 0, "complete_count": 0, "active_count": 0,
                        "pending_count": 0, "payments_count": 0, "organisations_supported": 0},
             "streak_months": 0, "biggest_contribution": None,
@@ -525,191 +514,7 @@ def my_contributions_insights(
             "by_month": [], "by_method": [], "top_organisers": [],
             "impact_message": "Make your first contribution to see your impact.",
         })
-
-    contributor_ids = [c.id for c in contribs]
-    ecs = db.query(EventContributor).options(
-        joinedload(EventContributor.event),
-        joinedload(EventContributor.contributions),
-    ).filter(EventContributor.contributor_id.in_(contributor_ids)).all()
-
-    per_event = []
-    for ec in ecs:
-        if not ec.event:
-            continue
-        ev = ec.event
-        if ev.currency_id:
-            cur = db.query(Currency).filter(Currency.id == ev.currency_id).first()
-            currency = (cur.code.strip() if cur else user_currency)
-        else:
-            currency = user_currency
-        pledge = float(ec.pledge_amount or 0)
-        paid = sum(
-            float(c.amount or 0) for c in ec.contributions
-            if c.confirmation_status is None or c.confirmation_status == ContributionStatusEnum.confirmed
-        )
-        pending = sum(
-            float(c.amount or 0) for c in ec.contributions
-            if c.confirmation_status == ContributionStatusEnum.pending
-        )
-        balance = max(0.0, pledge - paid - pending)
-        complete = pledge > 0 and balance == 0 and pending == 0
-        per_event.append({"ec": ec, "event": ev, "currency": currency,
-                          "pledge": pledge, "paid": paid, "pending": pending,
-                          "balance": balance, "complete": complete})
-
-    cur_amounts = {}
-    for r in per_event:
-        cur_amounts[r["currency"]] = cur_amounts.get(r["currency"], 0) + r["paid"] + r["pledge"]
-    dominant_currency = max(cur_amounts.items(), key=lambda x: x[1])[0] if cur_amounts else user_currency
-
-    filtered = [r for r in per_event if r["currency"] == dominant_currency]
-    total_pledged = sum(r["pledge"] for r in filtered)
-    total_paid = sum(r["paid"] for r in filtered)
-    total_pending = sum(r["pending"] for r in filtered)
-    total_balance = sum(r["balance"] for r in filtered)
-    events_count = len(filtered)
-    complete_count = sum(1 for r in filtered if r["complete"])
-    active_count = sum(1 for r in filtered if not r["complete"] and (r["paid"] > 0 or r["pending"] > 0))
-    pending_count = sum(1 for r in filtered if r["paid"] == 0 and r["pending"] == 0)
-    organisations_supported = len({str(r["event"].organizer_id) for r in filtered if r["event"].organizer_id})
-
-    payments = []
-    for r in filtered:
-        for p in r["ec"].contributions:
-            if not (p.confirmation_status is None or p.confirmation_status == ContributionStatusEnum.confirmed):
-                continue
-            payments.append({"p": p, "event": r["event"], "currency": r["currency"]})
-    payments_count = len(payments)
-
-    biggest = None
-    if payments:
-        bp = max(payments, key=lambda x: float(x["p"].amount or 0))
-        d = bp["p"].contributed_at or bp["p"].confirmed_at or bp["p"].created_at
-        biggest = {
-            "amount": float(bp["p"].amount or 0),
-            "currency": bp["currency"],
-            "event_id": str(bp["event"].id),
-            "event_name": bp["event"].name,
-            "contributed_at": d.isoformat() if d else None,
-        }
-
-    payment_dates = [
-        (x["p"].contributed_at or x["p"].confirmed_at or x["p"].created_at)
-        for x in payments
-        if (x["p"].contributed_at or x["p"].confirmed_at or x["p"].created_at)
-    ]
-    first_at = min(payment_dates).isoformat() if payment_dates else None
-    last_at = max(payment_dates).isoformat() if payment_dates else None
-
-    from collections import OrderedDict
-    now_eat = datetime.now(EAT)
-    months = OrderedDict()
-    for i in range(11, -1, -1):
-        y = now_eat.year + ((now_eat.month - 1 - i) // 12)
-        m = ((now_eat.month - 1 - i) % 12) + 1
-        months[f"{y:04d}-{m:02d}"] = {"month": f"{y:04d}-{m:02d}", "amount": 0.0, "count": 0}
-    for x in payments:
-        d = x["p"].contributed_at or x["p"].confirmed_at or x["p"].created_at
-        if not d:
-            continue
-        try:
-            d_local = d.astimezone(EAT) if d.tzinfo else EAT.localize(d)
-        except Exception:
-            d_local = d
-        key = f"{d_local.year:04d}-{d_local.month:02d}"
-        if key in months:
-            months[key]["amount"] += float(x["p"].amount or 0)
-            months[key]["count"] += 1
-    by_month = list(months.values())
-
-    streak = 0
-    for k in reversed(list(months.keys())):
-        if months[k]["count"] > 0:
-            streak += 1
-        else:
-            break
-
-    method_totals = {}
-    for x in payments:
-        m = x["p"].payment_method.value if x["p"].payment_method else (
-            "manual" if x["p"].recorded_by else "other"
-        )
-        method_totals.setdefault(m, {"method": m, "amount": 0.0, "count": 0})
-        method_totals[m]["amount"] += float(x["p"].amount or 0)
-        method_totals[m]["count"] += 1
-    mt_total = sum(v["amount"] for v in method_totals.values()) or 1
-    by_method = sorted(
-        [{**v, "percent": round((v["amount"] / mt_total) * 100, 1)} for v in method_totals.values()],
-        key=lambda v: v["amount"], reverse=True,
-    )
-
-    org_totals = {}
-    for r in filtered:
-        oid = str(r["event"].organizer_id) if r["event"].organizer_id else None
-        if not oid:
-            continue
-        org_totals.setdefault(oid, {"organizer_id": oid, "amount": 0.0, "events": 0, "name": None})
-        org_totals[oid]["amount"] += r["paid"]
-        org_totals[oid]["events"] += 1
-    if org_totals:
-        org_users = db.query(User).filter(User.id.in_(list(org_totals.keys()))).all()
-        for u in org_users:
-            org_totals[str(u.id)]["name"] = f"{u.first_name or ''} {u.last_name or ''}".strip() or "Organiser"
-    top_organisers = sorted(org_totals.values(), key=lambda v: v["amount"], reverse=True)[:5]
-
-    pledged_events = [r for r in filtered if r["pledge"] > 0]
-    on_time_total = len(pledged_events)
-    on_time_kept = 0
-    for r in pledged_events:
-        if not r["complete"]:
-            continue
-        ev_d = r["event"].start_date
-        if not ev_d:
-            on_time_kept += 1
-            continue
-        last_pay = max(
-            (c.contributed_at for c in r["ec"].contributions if c.contributed_at),
-            default=None,
-        )
-        # event.start_date is a `date`; contributed_at is a `datetime`.
-        # Compare as dates to avoid TypeError.
-        last_pay_d = last_pay.date() if hasattr(last_pay, 'date') else last_pay
-        ev_d_d = ev_d.date() if hasattr(ev_d, 'date') and hasattr(ev_d, 'hour') else ev_d
-        if last_pay is None or last_pay_d <= ev_d_d:
-            on_time_kept += 1
-    on_time_rate = round((on_time_kept / on_time_total) * 100, 1) if on_time_total else 0.0
-    avg_per_event = round((total_paid / events_count), 2) if events_count else 0
-
-    if total_paid <= 0:
-        impact_message = "Your generosity story starts with your first contribution."
-    elif organisations_supported >= 3:
-        impact_message = (f"You've helped {organisations_supported} organisers across "
-                          f"{events_count} event{'s' if events_count != 1 else ''}. Keep showing up.")
-    elif streak >= 3:
-        impact_message = f"{streak} months of giving in a row — that's real consistency."
-    else:
-        impact_message = (f"You've contributed {payments_count} time"
-                          f"{'s' if payments_count != 1 else ''} so far. Every gift counts.")
-
-    return standard_response(True, "Insights fetched", {
-        "summary": {"total_pledged": total_pledged, "total_paid": total_paid,
-                    "total_pending": total_pending, "total_balance": total_balance,
-                    "currency": dominant_currency},
-        "counts": {"events_count": events_count, "complete_count": complete_count,
-                   "active_count": active_count, "pending_count": pending_count,
-                   "payments_count": payments_count,
-                   "organisations_supported": organisations_supported},
-        "streak_months": streak,
-        "biggest_contribution": biggest,
-        "first_contribution_at": first_at,
-        "last_contribution_at": last_at,
-        "avg_per_event": avg_per_event,
-        "on_time_rate": on_time_rate,
-        "by_month": by_month,
-        "by_method": by_method,
-        "top_organisers": top_organisers,
-        "impact_message": impact_message,
-    })
+    return standard_response(True, "Insights fetched", insights_payload(row))
 
 
 @router.get("/my-contributions/{event_id}/payments")
@@ -733,11 +538,10 @@ def my_contribution_payments(
         UserContributor.contributor_user_id == current_user.id
     ).all()
     if me_phone_digits:
-        from sqlalchemy import func as _f
         legacy = db.query(UserContributor).filter(
             UserContributor.contributor_user_id.is_(None),
             UserContributor.phone.isnot(None),
-            _f.right(_f.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'), 9) == me_phone_digits,
+            UserContributor.phone_key == me_phone_digits,
         ).all()
         contribs.extend(legacy)
     if not contribs:
@@ -1037,9 +841,19 @@ def get_event_contributors(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=5000),
     search: Optional[str] = Query(None),
+    status: str = Query("all"),
+    sort_by: str = Query("created_at"),
+    sort_order: str = Query("desc"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """Paginated event contributors.
+
+    ``status`` filters on the stored running totals: ``completed`` (pledge
+    met), ``partial`` (paid something, balance left), ``unpaid`` (pledged,
+    nothing paid) or ``no_pledge``. ``sort_by`` is ``created_at`` (default),
+    ``balance``, ``total_paid``, ``pledge_amount`` or ``last_payment_at``.
+    """
     try:
         eid = uuid.UUID(event_id)
     except ValueError:
@@ -1054,40 +868,48 @@ def get_event_contributors(
     # Build base query WITHOUT joinedload (to avoid row inflation from one-to-many JOINs)
     base_q = db.query(EventContributor).filter(EventContributor.event_id == eid)
 
-    if search:
-        like = f"%{search}%"
-        base_q = base_q.join(UserContributor).filter(or_(
-            UserContributor.name.ilike(like),
-            UserContributor.email.ilike(like),
-            UserContributor.phone.ilike(like),
-        ))
+    match = text_match(UserContributor.search_document, search)
+    if match is not None:
+        base_q = base_q.join(UserContributor).filter(match.condition)
+
+    pledge = sa_func.coalesce(EventContributor.pledge_amount, 0)
+    if status == "completed":
+        base_q = base_q.filter(pledge > 0, EventContributor.balance <= 0)
+    elif status == "partial":
+        base_q = base_q.filter(EventContributor.total_paid > 0, EventContributor.balance > 0)
+    elif status == "unpaid":
+        base_q = base_q.filter(pledge > 0, EventContributor.total_paid == 0)
+    elif status == "no_pledge":
+        base_q = base_q.filter(pledge == 0)
 
     total = base_q.count()
 
-    # Paginate on IDs FIRST — use (created_at DESC, id DESC) for stable ordering
-    # Without the id tiebreaker, records with identical timestamps shift between pages
-    id_rows = base_q.with_entities(EventContributor.id).order_by(
-        EventContributor.created_at.desc(),
-        EventContributor.id.desc(),
-    ).offset((page - 1) * limit).limit(limit).all()
+    # Paginate on IDs FIRST. The id tiebreaker keeps ordering stable —
+    # without it, records with identical sort keys shift between pages.
+    sort_col = {
+        "created_at": EventContributor.created_at,
+        "balance": EventContributor.balance,
+        "total_paid": EventContributor.total_paid,
+        "pledge_amount": pledge,
+        "last_payment_at": EventContributor.last_payment_at,
+    }.get(sort_by, EventContributor.created_at)
+    if sort_order == "asc":
+        order = (sort_col.asc().nullsfirst(), EventContributor.id.asc())
+    else:
+        order = (sort_col.desc().nullslast(), EventContributor.id.desc())
+    id_rows = base_q.with_entities(EventContributor.id).order_by(*order).offset(
+        (page - 1) * limit
+    ).limit(limit).all()
     ec_ids = [r[0] for r in id_rows]
 
-    # Now load full objects with relationships for just those IDs
+    # Now load full objects for just those IDs. Paid / pending come from the
+    # stored running totals, so contributions are never loaded here.
     if ec_ids:
         ecs = db.query(EventContributor).options(
             joinedload(EventContributor.contributor),
-            joinedload(EventContributor.contributions),
         ).filter(EventContributor.id.in_(ec_ids)).all()
-        # Deduplicate (joinedload may still produce duplicate parent rows)
-        seen = set()
-        unique_ecs = []
-        for ec in ecs:
-            if ec.id not in seen:
-                seen.add(ec.id)
-                unique_ecs.append(ec)
-        # Restore original ordering (created_at desc, id desc)
         id_order = {eid: idx for idx, eid in enumerate(ec_ids)}
-        ecs = sorted(unique_ecs, key=lambda ec: id_order.get(ec.id, 0))
+        ecs.sort(key=lambda ec: id_order.get(ec.id, 0))
     else:
         ecs = []
 
@@ -1096,40 +918,23 @@ def get_event_contributors(
     wa_map = statuses_by_phones(db, _collect_contributor_phones(all_contribs))
     ec_dicts = [_event_contributor_dict(ec, wa_map=wa_map) for ec in ecs]
 
-    # Compute summary from ALL event contributors (not just current page)
-    all_ecs_for_summary = db.query(EventContributor).options(
-        joinedload(EventContributor.contributions),
-    ).filter(EventContributor.event_id == eid).all()
-    # Deduplicate
-    seen_summary = set()
-    unique_summary_ecs = []
-    for ec in all_ecs_for_summary:
-        if ec.id not in seen_summary:
-            seen_summary.add(ec.id)
-            unique_summary_ecs.append(ec)
-    summary_contribs = [ec.contributor for ec in unique_summary_ecs if ec.contributor]
-    summary_wa_map = statuses_by_phones(db, _collect_contributor_phones(summary_contribs))
-    all_dicts = [_event_contributor_dict(ec, wa_map=summary_wa_map) for ec in unique_summary_ecs]
-    total_pledged = sum(d["pledge_amount"] for d in all_dicts)
-    total_paid = sum(d["total_paid"] for d in all_dicts)
-    total_balance = sum(d.get("balance", 0) for d in all_dicts)
+    # Event-wide summary comes from the maintained totals row (one PK lookup)
+    # rather than re-deriving it from every contributor on each page load.
+    from services.event_totals import get_event_totals, totals_summary, whatsapp_counts
+    totals = totals_summary(get_event_totals(db, eid))
     currency = _currency_code(db, event)
 
-    # WhatsApp availability rollup (uses primary phone)
-    wa_counts = {"whatsapp": 0, "not_whatsapp": 0, "unknown": 0, "checking": 0, "failed": 0}
-    for d in all_dicts:
-        st = ((d.get("contributor") or {}).get("whatsapp_status")) or "unknown"
-        wa_counts[st] = wa_counts.get(st, 0) + 1
-
     return standard_response(True, "Event contributors fetched", {
         "event_contributors": ec_dicts,
         "summary": {
-            "total_pledged": total_pledged,
-            "total_paid": total_paid,
-            "total_balance": total_balance,
+            "total_pledged": totals["total_pledged"],
+            "total_paid": totals["total_paid"],
+            "total_pending": totals["total_pending"],
+            "total_balance": totals["total_balance"],
             "count": total,
             "currency": currency,
-            "whatsapp": wa_counts,
+            "contributions": totals["contributions"],
+            "whatsapp": whatsapp_counts(db, eid),
         },
         "pagination": {
             "page": page,
@@ -1262,7 +1067,6 @@ def add_to_event(event_id: str, body: dict = Body(...), background_tasks: Backgr
     # Reload with relationships
     ec = db.query(EventContributor).options(
         joinedload(EventContributor.contributor),
-        joinedload(EventContributor.contributions),
     ).filter(EventContributor.id == ec.id).first()
 
     # Auto-add this contributor to the event group workspace if one exists
@@ -1336,7 +1140,6 @@ def update_event_contributor(event_id: str, ec_id: str, body: dict = Body(...),
 
     ec = db.query(EventContributor).options(
         joinedload(EventContributor.contributor),
-        joinedload(EventContributor.contributions),
     ).filter(EventContributor.id == ecid, EventContributor.event_id == eid).first()
     if not ec:
         return standard_response(False, "Event contributor not found")
@@ -1518,11 +1321,8 @@ def record_payment(
         if not cm or not perms or not perms.can_manage_contributions:
             return standard_response(False, "You do not have permission to record contributions")
 
-    # Load contributor + ALL existing contributions in one round-trip so the
-    # total_paid recompute below doesn't trigger a lazy SELECT.
     ec = db.query(EventContributor).options(
         joinedload(EventContributor.contributor),
-        selectinload(EventContributor.contributions),
     ).filter(EventContributor.id == ecid, EventContributor.event_id == eid).first()
     if not ec:
         return standard_response(False, "Event contributor not found")
@@ -1584,11 +1384,8 @@ def record_payment(
     contributor = ec.contributor
     contrib_name = contributor.name if contributor else "Someone"
     pledge_amount_snapshot = float(ec.pledge_amount or 0)
-    total_paid_after = sum(
-        float(c.amount or 0) for c in ec.contributions
-        if c.confirmation_status is None
-        or c.confirmation_status == ContributionStatusEnum.confirmed
-    )
+    # The commit above refreshed the running total; this reloads the row.
+    total_paid_after = float(ec.total_paid or 0)
     currency = _currency_code(db, event)
     organizer = db.query(User).filter(User.id == event.organizer_id).first()
     organizer_phone = format_phone_display(organizer.phone) if organizer and organizer.phone else None
@@ -1707,11 +1504,8 @@ def send_thank_you_sms(event_id: str, ec_id: str, body: dict = Body(default={}),
     custom_message = (body.get("custom_message") or "").strip()
     organizer_phone = format_phone_display(current_user.phone) if current_user.phone else None
 
-    # Compute total contributed amount (confirmed contributions) for this contributor on this event
-    total_paid = sum(
-        float(c.amount or 0) for c in ec.contributions
-        if c.confirmation_status is None or c.confirmation_status == ContributionStatusEnum.confirmed
-    )
+    # Total contributed amount (confirmed contributions) for this contributor on this event
+    total_paid = float(ec.total_paid or 0)
     currency_code = _currency_code(db, event)
 
     try:
@@ -1776,8 +1570,8 @@ def bulk_add_contributors(event_id: str, body: dict = Body(...), db: Session = D
     if not rows or not isinstance(rows, list):
         return standard_response(False, "No contributors provided")
 
-    if len(rows) > 2000:
-        return standard_response(False, "Maximum 2000 contributors per upload")
+    if len(rows) > 10000:
+        return standard_response(False, "Maximum 10000 contributors per upload")
 
     from models import ContributorImportJob
     job = ContributorImportJob(
@@ -1792,6 +1586,60 @@ def bulk_add_contributors(event_id: str, body: dict = Body(...), db: Session = D
         payload={"contributors": rows},
         errors=[],
     )
+    return _queue_contributor_import(db, job)
+
+
+@router.post("/events/{event_id}/contributors/bulk/upload")
+def bulk_upload_contributors(
+    event_id: str,
+    file: UploadFile = File(...),
+    send_sms: bool = Form(False),
+    mode: str = Form("targets"),
+    payment_method: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Queue a contributor import from a CSV / XLSX upload.
+
+    Columns (by header or in order): name, phone, amount. The raw file is
+    staged once on disk and the worker streams it in bounded chunks, so
+    sheet size doesn't bloat the job row or worker memory. Poll progress
+    exactly like the JSON ``/contributors/bulk`` endpoint.
+    """
+    try:
+        eid = uuid.UUID(event_id)
+    except ValueError:
+        return standard_response(False, "Invalid event ID")
+
+    from utils.event_owner import user_can_manage_event
+    event = db.query(Event).filter(Event.id == eid).first()
+    if not event or not user_can_manage_event(event, current_user):
+        return standard_response(False, "Only the event owner or creator can perform bulk uploads")
+
+    from utils.import_files import store_import_upload
+    try:
+        source_path = store_import_upload(file, "contributors")
+    except ValueError as e:
+        return standard_response(False, str(e))
+
+    from models import ContributorImportJob
+    job = ContributorImportJob(
+        id=uuid.uuid4(),
+        event_id=eid,
+        created_by=current_user.id,
+        status="queued",
+        mode=(mode or "targets"),
+        payment_method=payment_method,
+        send_sms=bool(send_sms),
+        total_rows=0,
+        payload={"filename": file.filename},
+        source_path=source_path,
+        errors=[],
+    )
+    return _queue_contributor_import(db, job)
+
+
+def _queue_contributor_import(db: Session, job):
     db.add(job)
     db.commit()
     db.refresh(job)
@@ -2217,6 +2065,7 @@ def confirm_contributions(event_id: str, body: dict = Body(...), db: Session = D
     currency = _currency_code(db, event)
     confirmed_count = 0
     notify_targets = []  # collect (phone, msg) tuples for after-commit dispatch
+    announcements = []  # (event contributor, amount) in confirmation order
 
     for cid_str in ids:
         try:
@@ -2249,30 +2098,31 @@ def confirm_contributions(event_id: str, body: dict = Body(...), db: Session = D
                 )
                 for phone in contributor_notify_phones(ec):
                     notify_targets.append((phone, msg))
-
-                # Now that the contribution is approved, announce it in the
-                # event group chat. We deliberately skip this on initial
-                # submission so members never see contributions that may
-                # later be rejected.
-                try:
-                    from api.routes.event_groups import post_payment_system_message
-                    total_paid_after = sum(
-                        float(x.amount or 0) for x in ec.contributions
-                        if x.confirmation_status is None
-                        or x.confirmation_status == ContributionStatusEnum.confirmed
-                    )
-                    pledge_amount = float(ec.pledge_amount or 0)
-                    post_payment_system_message(
-                        db, eid,
-                        ec.contributor.name if ec.contributor else "Someone",
-                        float(c.amount or 0), pledge_amount,
-                        total_paid_after, currency,
-                    )
-                except Exception:
-                    pass
+                announcements.append((ec, float(c.amount or 0)))
 
     db.commit()
 
+    # Now that the contributions are approved, announce them in the event
+    # group chat. We deliberately skip this on initial submission so members
+    # never see contributions that may later be rejected. The commit
+    # refreshed each contributor's running total; walking back from it
+    # gives the total as of each payment when one contributor has several.
+    posts = []
+    remaining = {}
+    for ec, amount in reversed(announcements):
+        total_paid_after = remaining.get(ec.id, float(ec.total_paid or 0))
+        remaining[ec.id] = total_paid_after - amount
+        posts.append((
+            ec.contributor.name if ec.contributor else "Someone",
+            amount, float(ec.pledge_amount or 0), total_paid_after,
+        ))
+    for name, amount, pledge_amount, total_paid_after in reversed(posts):
+        try:
+            from api.routes.event_groups import post_payment_system_message
+            post_payment_system_message(db, eid, name, amount, pledge_amount, total_paid_after, currency)
+        except Exception:
+            pass
+
     # Fire WhatsApp + SMS-fallback notifications (best-effort, post-commit)
     try:
         from utils.notify_channels import notify_user_wa_sms
@@ -2408,16 +2258,79 @@ def delete_contribution(event_id: str, ec_id: str, payment_id: str, db: Session
 # CONTRIBUTION REPORT (date-filtered)
 # ══════════════════════════════════════════════
 
+CONTRIBUTION_REPORT_HEADERS = ["Name", "Phone", "Pledged", "Paid", "Balance"]
+
+
+def _contribution_report_query(db: Session, eid, from_dt=None, to_dt=None):
+    """``(name, phone, pledge_amount, paid)`` per contributor. With a date
+    range, ``paid`` is the confirmed payments in range and contributors
+    without any are dropped."""
+    rows_q = db.query(
+        UserContributor.name,
+        UserContributor.phone,
+        EventContributor.pledge_amount,
+        EventContributor.total_paid,
+    ).select_from(EventContributor).outerjoin(
+        UserContributor, UserContributor.id == EventContributor.contributor_id,
+    ).filter(EventContributor.event_id == eid)
+
+    if from_dt or to_dt:
+        # Confirmed payments within the range, summed in SQL.
+        # ``contributed_at`` is stored as naive EAT time.
+        paid_q = db.query(
+            EventContribution.event_contributor_id.label("ec_id"),
+            sa_func.sum(EventContribution.amount).label("paid"),
+        ).filter(
+            EventContribution.event_id == eid,
+            or_(
+                EventContribution.confirmation_status.is_(None),
+                EventContribution.confirmation_status == ContributionStatusEnum.confirmed,
+            ),
+        )
+        if from_dt:
+            paid_q = paid_q.filter(EventContribution.contributed_at >= from_dt.replace(tzinfo=None))
+        if to_dt:
+            paid_q = paid_q.filter(EventContribution.contributed_at <= to_dt.replace(tzinfo=None))
+        paid_sq = paid_q.group_by(EventContribution.event_contributor_id).subquery()
+        # When date-filtered, only include contributors with payments in range.
+        rows_q = rows_q.join(paid_sq, paid_sq.c.ec_id == EventContributor.id).filter(
+            paid_sq.c.paid > 0
+        ).with_entities(
+            UserContributor.name,
+            UserContributor.phone,
+            EventContributor.pledge_amount,
+            paid_sq.c.paid,
+        )
+    # Unfiltered reports include ALL event contributors — even those with no
+    # pledge/target and no payments yet. Owners want the full roster on the
+    # PDF, not just active payers — and read paid from the running totals.
+    return rows_q
+
+
+def _iter_contribution_report_rows(eid, from_dt, to_dt):
+    for _db, rows in iter_query_batches(
+        lambda db: _contribution_report_query(db, eid, from_dt, to_dt).order_by(
+            sa_func.coalesce(UserContributor.name, "Unknown"), EventContributor.id,
+        )
+    ):
+        for name, phone, pledge_amount, paid in rows:
+            pledge = float(pledge_amount or 0)
+            paid = float(paid or 0)
+            yield (name or "Unknown", phone, pledge, paid, max(0, pledge - paid))
+
+
 @router.get("/events/{event_id}/contribution-report")
 def get_contribution_report(
     event_id: str,
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
+    format: str = Query("json"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Returns contributor payment totals filtered by date range.
+    ``format=csv|xlsx`` streams the contributor rows as a download instead.
     Only payments (EventContribution) within the date range are summed.
     Pledges are shown as-is (not date-filtered) for context, but the
     report header warns that balances may be partial.
@@ -2447,78 +2360,30 @@ def get_contribution_report(
         except ValueError:
             return standard_response(False, "Invalid date_to format, use YYYY-MM-DD")
 
-    # Get all event contributors (deduplicate joinedload inflation)
-    raw_ecs = db.query(EventContributor).options(
-        joinedload(EventContributor.contributor),
-        joinedload(EventContributor.contributions),
-    ).filter(EventContributor.event_id == eid).all()
-    seen_ids = set()
-    ecs = []
-    for ec in raw_ecs:
-        if ec.id not in seen_ids:
-            seen_ids.add(ec.id)
-            ecs.append(ec)
+    if format in EXPORT_FORMATS:
+        return export_response(
+            format, f"contribution-report-{eid}", CONTRIBUTION_REPORT_HEADERS,
+            _iter_contribution_report_rows(eid, from_dt, to_dt), "Contribution Report",
+        )
 
     currency = _currency_code(db, event)
-    results = []
-    # Full (all-time) totals for summary cards
-    full_total_pledged = 0
-    full_total_paid = 0
-    full_total_balance = 0
+    # All-time totals for the summary cards come from the maintained row.
+    from services.event_totals import get_event_totals, totals_summary
+    totals = totals_summary(get_event_totals(db, eid))
 
-    for ec in ecs:
-        pledge = float(ec.pledge_amount or 0)
-        # All confirmed payments (for full summary)
-        all_confirmed = [
-            c for c in ec.contributions
-            if (not hasattr(c, 'confirmation_status') or c.confirmation_status is None or c.confirmation_status == ContributionStatusEnum.confirmed)
-        ]
-        all_paid = sum(float(c.amount or 0) for c in all_confirmed)
-        all_balance = max(0, pledge - all_paid)
-        full_total_pledged += pledge
-        full_total_paid += all_paid
-        full_total_balance += all_balance
-
-        # Filter payments by date range (for table rows)
-        if from_dt or to_dt:
-            def _make_aware(dt):
-                """Ensure datetime is timezone-aware for comparison."""
-                if dt is None:
-                    return None
-                if dt.tzinfo is None:
-                    return EAT.localize(dt)
-                return dt
-
-            filtered_payments = [
-                c for c in all_confirmed
-                if (not from_dt or (c.contributed_at and _make_aware(c.contributed_at) >= from_dt))
-                and (not to_dt or (c.contributed_at and _make_aware(c.contributed_at) <= to_dt))
-            ]
-            paid_in_range = sum(float(c.amount or 0) for c in filtered_payments)
-        else:
-            paid_in_range = all_paid
-
-        # When date-filtered, only include contributors with payments in range
-        if from_dt or to_dt:
-            if paid_in_range > 0:
-                results.append({
-                    "name": ec.contributor.name if ec.contributor else "Unknown",
-                    "phone": ec.contributor.phone if ec.contributor else None,
-                    "pledged": pledge,
-                    "paid": paid_in_range,
-                    "balance": max(0, pledge - paid_in_range),
-                })
-        else:
-            # Include ALL event contributors in unfiltered reports — even
-            # those with no pledge/target and no payments yet. Owners want
-            # the full roster on the PDF, not just active payers.
-            results.append({
-                "name": ec.contributor.name if ec.contributor else "Unknown",
-                "phone": ec.contributor.phone if ec.contributor else None,
-                "pledged": pledge,
-                "paid": paid_in_range,
-                "balance": max(0, pledge - paid_in_range),
-            })
+    rows_q = _contribution_report_query(db, eid, from_dt, to_dt)
+
+    results = []
+    for name, phone, pledge_amount, paid in rows_q:
+        pledge = float(pledge_amount or 0)
+        paid_in_range = float(paid or 0)
+        results.append({
+            "name": name or "Unknown",
+            "phone": phone,
+            "pledged": pledge,
+            "paid": paid_in_range,
+            "balance": max(0, pledge - paid_in_range),
+        })
 
     # Sort alphabetically
     results.sort(key=lambda r: r["name"])
@@ -2528,10 +2393,10 @@ def get_contribution_report(
     return standard_response(True, "Report data fetched", {
         "contributors": results,
         "full_summary": {
-            "total_pledged": full_total_pledged,
-            "total_paid": full_total_paid,
-            "total_balance": full_total_balance,
-            "count": len(ecs),
+            "total_pledged": totals["total_pledged"],
+            "total_paid": totals["total_paid"],
+            "total_balance": totals["total_balance"],
+            "count": totals["contributor_count"],
             "currency": currency,
         },
         "filtered_summary": {
@@ -2631,7 +2496,6 @@ def send_bulk_contributor_message(event_id: str, body: dict = Body(...), db: Ses
 
     ecs = db.query(EventContributor).options(
         joinedload(EventContributor.contributor),
-        joinedload(EventContributor.contributions)
     ).filter(
         EventContributor.event_id == eid,
         EventContributor.id.in_(ec_uuids)
@@ -2773,11 +2637,10 @@ def my_contributions(
     contributors = q.all()
 
     if me_phone_digits:
-        from sqlalchemy import func as _f
         legacy = db.query(UserContributor).filter(
             UserContributor.contributor_user_id.is_(None),
             UserContributor.phone.isnot(None),
-            _f.right(_f.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'), 9) == me_phone_digits,
+            UserContributor.phone_key == me_phone_digits,
         ).all()
         # Opportunistically backfill the FK so future queries are fast.
         if legacy:
@@ -2795,10 +2658,9 @@ def my_contributions(
     contributor_ids = [c.id for c in contributors]
 
     # 2. Fetch every EventContributor row for those contributors, joined with
-    #    the event and contributions.
+    #    the event. Paid / pending come from the stored running totals.
     ecs = db.query(EventContributor).options(
         joinedload(EventContributor.event),
-        joinedload(EventContributor.contributions),
     ).filter(EventContributor.contributor_id.in_(contributor_ids)).all()
 
     # Fallback currency: prefer the signed-in user's profile currency over a
@@ -2819,16 +2681,8 @@ def my_contributions(
         else:
             currency = user_currency or "TZS"
         pledge = float(ec.pledge_amount or 0)
-        paid = sum(
-            float(c.amount or 0)
-            for c in ec.contributions
-            if c.confirmation_status is None or c.confirmation_status == ContributionStatusEnum.confirmed
-        )
-        pending = sum(
-            float(c.amount or 0)
-            for c in ec.contributions
-            if c.confirmation_status == ContributionStatusEnum.pending
-        )
+        paid = float(ec.total_paid or 0)
+        pending = float(ec.total_pending or 0)
         organizer = db.query(User).filter(User.id == event.organizer_id).first()
 
         cover = event.cover_image_url
@@ -2869,10 +2723,7 @@ def my_contributions(
             "pending_amount": pending,
             "balance": balance_val,
             "status": status,
-            "last_payment_at": max(
-                (c.contributed_at for c in ec.contributions if c.contributed_at),
-                default=None,
-            ).isoformat() if any(c.contributed_at for c in ec.contributions) else None,
+            "last_payment_at": ec.last_payment_at.isoformat() if ec.last_payment_at else None,
         })
 
     # Sort by upcoming event date asc, then by name
@@ -3024,6 +2875,7 @@ def upsert_messaging_template(
 
 
 @router.post("/events/{event_id}/self-contribute")
+@blocking
 async def self_contribute(
     event_id: str,
     # Backwards compatible: accept either JSON body OR multipart/form-data.
@@ -3099,10 +2951,9 @@ async def self_contribute(
     )
     candidates = {str(c.id): c for c in contributor_q.all()}
     if me_phone_digits:
-        from sqlalchemy import func as _f
         more = db.query(UserContributor).filter(
             UserContributor.phone.isnot(None),
-            _f.right(_f.regexp_replace(UserContributor.phone, r'[^0-9]', '', 'g'), 9) == me_phone_digits,
+            UserContributor.phone_key == me_phone_digits,
         ).all()
         for c in more:
             candidates[str(c.id)] = c
@@ -18,6 +18,7 @@ from sqlalchemy.orm import Session
 
 from core.config import ALLOWED_IMAGE_EXTENSIONS, MAX_EVENT_IMAGES, MAX_IMAGE_SIZE, UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     Event, EventType, EventImage, EventVenueCoordinate, EventSetting,
     EventCommitteeMember, CommitteeRole, CommitteePermission,
@@ -25,13 +26,15 @@ from models import (
     ContributionThankYouMessage, UserContributor,
     EventInvitation, EventAttendee, EventGuestPlusOne,
     EventService, EventServicePayment, EventScheduleItem, EventBudgetItem,
-    EventExpense, EventTicket, EventTicketClass,
+    EventTicket, EventTicketClass,
     Currency, User, UserProfile, UserSocialAccount, ServiceType, UserService,
     EventServiceStatusEnum, EventStatusEnum, PaymentMethodEnum, RSVPStatusEnum,
     GuestTypeEnum, EventTypeService, ServicePackage, TicketOrderStatusEnum,
-    EventSponsor,
 )
+from services.committee_permissions import get_member_permissions, invalidate_member_permissions
+from services.people_suggestions import mark_suggestions_dirty
 from utils.auth import get_current_user
+from utils.exports import EXPORT_FORMATS, export_response, iter_query_batches
 from utils.helpers import format_price, standard_response, format_phone_display
 from api.routes.rsvp import generate_rsvp_code
 from utils.validation_functions import validate_phone_number
@@ -401,20 +404,14 @@ def _verify_event_access(db: Session, event_id, current_user, required_permissio
     if is_creator:
         return event, None
 
-    cm = db.query(EventCommitteeMember).filter(
-        EventCommitteeMember.event_id == event_id,
-        EventCommitteeMember.user_id == current_user.id,
-    ).first()
-    if not cm:
+    perms = get_member_permissions(db, event.id, current_user.id)
+    if not perms:
         return None, standard_response(False, "You do not have permission to access this event")
 
     if not required_permission:
         return event, None
 
-    perms = db.query(CommitteePermission).filter(
-        CommitteePermission.committee_member_id == cm.id
-    ).first()
-    if not perms or not getattr(perms, required_permission, False):
+    if not getattr(perms, required_permission, False):
         return None, standard_response(False, "You do not have permission to perform this action")
 
     return event, None
@@ -439,6 +436,27 @@ PERMISSION_MAP = {
 }
 
 
+def _committee_permissions_payload(perms) -> dict:
+    """``my-permissions`` payload for a non-creator, from
+    ``get_member_permissions`` (``None`` when not on the committee)."""
+    if perms is None:
+        return {"is_creator": False, "role": None, **{f: False for f in PERMISSION_FIELDS}}
+
+    flags = {f: bool(getattr(perms, f, False)) for f in PERMISSION_FIELDS}
+    # Auto-grant view when manage is granted (defensive, should already be set in DB)
+    if flags.get("can_manage_contributions"):
+        flags["can_view_contributions"] = True
+    if flags.get("can_manage_budget"):
+        flags["can_view_budget"] = True
+    if flags.get("can_manage_guests"):
+        flags["can_view_guests"] = True
+    if flags.get("can_manage_vendors"):
+        flags["can_view_vendors"] = True
+    if flags.get("can_manage_expenses"):
+        flags["can_view_expenses"] = True
+    return {"is_creator": False, "role": perms.role or "member", **flags}
+
+
 # ──────────────────────────────────────────────
 # Get Current User's Permissions for an Event
 # ──────────────────────────────────────────────
@@ -467,40 +485,7 @@ def get_my_permissions(
         print(f"[my-permissions] payload={payload}")
         return standard_response(True, "Permissions retrieved", payload)
 
-    cm = db.query(EventCommitteeMember).filter(
-        EventCommitteeMember.event_id == eid,
-        EventCommitteeMember.user_id == current_user.id,
-    ).first()
-    if not cm:
-        perms = {field: False for field in PERMISSION_FIELDS}
-        payload = {"is_creator": False, "role": None, **perms}
-        print(f"[my-permissions] payload={payload}")
-        return standard_response(True, "Permissions retrieved", payload)
-
-    role_obj = db.query(CommitteeRole).filter(CommitteeRole.id == cm.role_id).first() if cm.role_id else None
-    perm_row = db.query(CommitteePermission).filter(CommitteePermission.committee_member_id == cm.id).first()
-
-    perms = {}
-    for field in PERMISSION_FIELDS:
-        perms[field] = bool(getattr(perm_row, field, False)) if perm_row else False
-
-    # Auto-grant view when manage is granted (defensive, should already be set in DB)
-    if perms.get("can_manage_contributions"):
-        perms["can_view_contributions"] = True
-    if perms.get("can_manage_budget"):
-        perms["can_view_budget"] = True
-    if perms.get("can_manage_guests"):
-        perms["can_view_guests"] = True
-    if perms.get("can_manage_vendors"):
-        perms["can_view_vendors"] = True
-    if perms.get("can_manage_expenses"):
-        perms["can_view_expenses"] = True
-
-    payload = {
-        "is_creator": False,
-        "role": role_obj.role_name if role_obj else "member",
-        **perms,
-    }
+    payload = _committee_permissions_payload(get_member_permissions(db, eid, current_user.id))
     print(f"[my-permissions] payload={payload}")
     return standard_response(True, "Permissions retrieved", payload)
 
@@ -525,124 +510,8 @@ def get_management_overview(
     if not event:
         return standard_response(False, "Event not found")
 
-    # ── Ticket sales (per class)
-    classes = db.query(EventTicketClass).filter(EventTicketClass.event_id == eid).order_by(EventTicketClass.display_order).all()
-    ticket_classes_payload = []
-    tickets_sold = 0
-    tickets_capacity = 0
-    ticket_revenue = 0.0
-    for tc in classes:
-        sold_q = db.query(
-            sa_func.coalesce(sa_func.sum(EventTicket.quantity), 0),
-            sa_func.coalesce(sa_func.sum(EventTicket.total_amount), 0),
-        ).filter(
-            EventTicket.ticket_class_id == tc.id,
-            # Only count tickets with verified payments (confirmed or admin-approved)
-            EventTicket.status.in_([TicketOrderStatusEnum.confirmed, TicketOrderStatusEnum.approved]),
-        ).first()
-        sold = int(sold_q[0] or 0)
-        rev = float(sold_q[1] or 0)
-        tickets_sold += sold
-        tickets_capacity += tc.quantity or 0
-        ticket_revenue += rev
-        ticket_classes_payload.append({
-            "id": str(tc.id), "name": tc.name,
-            "price": float(tc.price), "quantity": tc.quantity,
-            "sold": sold, "revenue": rev,
-        })
-
-    # ── Contribution totals (paid + pledged)
-    paid_total = float(db.query(sa_func.coalesce(sa_func.sum(EventContribution.amount), 0)).filter(
-        EventContribution.event_id == eid,
-        EventContribution.confirmation_status == "confirmed",
-    ).scalar() or 0)
-    paid_count = int(db.query(sa_func.count(EventContribution.id)).filter(
-        EventContribution.event_id == eid,
-        EventContribution.confirmation_status == "confirmed",
-    ).scalar() or 0)
-    pledged_total = float(db.query(sa_func.coalesce(sa_func.sum(EventContributor.pledge_amount), 0)).filter(
-        EventContributor.event_id == eid,
-    ).scalar() or 0)
-    pledged_count = int(db.query(sa_func.count(EventContributor.id)).filter(
-        EventContributor.event_id == eid,
-    ).scalar() or 0)
-
-    # ── Sponsors
-    sponsors = db.query(EventSponsor).filter(EventSponsor.event_id == eid).all()
-    sponsor_revenue = sum(float(s.contribution_amount or 0) for s in sponsors if s.status == "accepted")
-    sponsor_summary = {
-        "total": len(sponsors),
-        "accepted": sum(1 for s in sponsors if s.status == "accepted"),
-        "pending": sum(1 for s in sponsors if s.status == "pending"),
-        "declined": sum(1 for s in sponsors if s.status == "declined"),
-        "revenue": sponsor_revenue,
-    }
-
-    # ── Days to go
-    days_to_go = 0
-    if event.start_date:
-        delta = (event.start_date - datetime.utcnow().date()).days if hasattr(event.start_date, 'year') else 0
-        days_to_go = max(0, delta)
-
-    # ── Revenue trend vs previous 7 days (tickets only — confirmed contributions also)
-    from datetime import timedelta
-    now = datetime.utcnow()
-    last7_start = now - timedelta(days=7)
-    prev7_start = now - timedelta(days=14)
-    def _rev_window(start, end):
-        t = float(db.query(sa_func.coalesce(sa_func.sum(EventTicket.total_amount), 0)).filter(
-            EventTicket.event_id == eid,
-            EventTicket.status.notin_([TicketOrderStatusEnum.rejected, TicketOrderStatusEnum.cancelled]),
-            EventTicket.created_at >= start, EventTicket.created_at < end,
-        ).scalar() or 0)
-        c = float(db.query(sa_func.coalesce(sa_func.sum(EventContribution.amount), 0)).filter(
-            EventContribution.event_id == eid,
-            EventContribution.confirmation_status == "confirmed",
-            EventContribution.created_at >= start, EventContribution.created_at < end,
-        ).scalar() or 0)
-        return t + c
-    last7 = _rev_window(last7_start, now)
-    prev7 = _rev_window(prev7_start, last7_start)
-    trend_pct = None
-    if prev7 > 0:
-        trend_pct = round(((last7 - prev7) / prev7) * 100)
-    elif last7 > 0:
-        trend_pct = 100
-
-    total_revenue = ticket_revenue + paid_total + sponsor_revenue
-    is_ticketed = bool(event.sells_tickets) and len(classes) > 0
-
-    return standard_response(True, "Overview retrieved", {
-        "is_ticketed": is_ticketed,
-        "kpis": {
-            "tickets_sold": tickets_sold,
-            "tickets_capacity": tickets_capacity,
-            "total_revenue": total_revenue,
-            "contributions_count": pledged_count or paid_count,
-            "days_to_go": days_to_go,
-        },
-        "ticket_sales": {
-            "total_sold": tickets_sold,
-            "total_capacity": tickets_capacity,
-            "classes": ticket_classes_payload,
-        },
-        "contribution_status": {
-            "paid_count": paid_count,
-            "pledged_count": pledged_count,
-            "outstanding_count": max(0, pledged_count - paid_count),
-            "paid_total": paid_total,
-            "pledged_total": pledged_total,
-        },
-        "revenue_summary": {
-            "total_revenue": total_revenue,
-            "tickets": ticket_revenue,
-            "contributions": paid_total,
-            "sponsors": sponsor_revenue,
-            "trend_pct": trend_pct,
-            "trend_window_days": 7,
-        },
-        "sponsors": sponsor_summary,
-    })
+    from services.event_overview import build_management_overview
+    return standard_response(True, "Overview retrieved", build_management_overview(db, event))
 
 
 
@@ -1107,10 +976,7 @@ def get_event(
     is_owner = user_can_manage_event(event, current_user)
     cm = None
     if not is_owner:
-        cm = db.query(EventCommitteeMember).filter(
-            EventCommitteeMember.event_id == eid,
-            EventCommitteeMember.user_id == current_user.id,
-        ).first()
+        cm = get_member_permissions(db, eid, current_user.id)
     is_committee = cm is not None
 
     is_invited = False
@@ -1181,26 +1047,8 @@ def get_event(
     # ── Inline permissions so clients don't need a second round-trip ──
     if is_owner:
         data["permissions"] = {"is_creator": True, "role": "creator", **{f: True for f in PERMISSION_FIELDS}}
-    elif is_committee and cm is not None:
-        role_obj = db.query(CommitteeRole).filter(CommitteeRole.id == cm.role_id).first() if cm.role_id else None
-        perm_row = db.query(CommitteePermission).filter(CommitteePermission.committee_member_id == cm.id).first()
-        perms = {f: bool(getattr(perm_row, f, False)) if perm_row else False for f in PERMISSION_FIELDS}
-        # Auto-grant view when manage is granted
-        if perms.get("can_manage_contributions"): perms["can_view_contributions"] = True
-        if perms.get("can_manage_budget"):        perms["can_view_budget"] = True
-        if perms.get("can_manage_guests"):        perms["can_view_guests"] = True
-        if perms.get("can_manage_vendors"):       perms["can_view_vendors"] = True
-        if perms.get("can_manage_expenses"):      perms["can_view_expenses"] = True
-        data["permissions"] = {
-            "is_creator": False,
-            "role": role_obj.role_name if role_obj else "member",
-            **perms,
-        }
     else:
-        data["permissions"] = {
-            "is_creator": False, "role": None,
-            **{f: False for f in PERMISSION_FIELDS},
-        }
+        data["permissions"] = _committee_permissions_payload(cm)
 
     # ── ESSENTIAL MODE: stop here. Tabs lazy-load their own data. ──
     if fields != "full":
@@ -1387,6 +1235,7 @@ def get_event(
 # Create Event
 # ──────────────────────────────────────────────
 @router.post("/")
+@blocking
 async def create_event(
     title: Optional[str] = Form(None), description: Optional[str] = Form(None),
     event_type_id: Optional[str] = Form(None), start_date: Optional[str] = Form(None),
@@ -1656,6 +1505,7 @@ async def create_event(
 # Update Event
 # ──────────────────────────────────────────────
 @router.put("/{event_id}")
+@blocking
 async def update_event(
     event_id: str,
     title: Optional[str] = Form(None), description: Optional[str] = Form(None),
@@ -1699,12 +1549,8 @@ async def update_event(
     # member with explicit ``can_edit_event``.
     from utils.event_owner import user_can_manage_event
     if not user_can_manage_event(event, current_user):
-        cm = db.query(EventCommitteeMember).filter(EventCommitteeMember.event_id == eid, EventCommitteeMember.user_id == current_user.id).first()
-        if cm:
-            perms = db.query(CommitteePermission).filter(CommitteePermission.committee_member_id == cm.id).first()
-            if not perms or not perms.can_edit_event:
-                return standard_response(False, "You do not have permission to edit this event")
-        else:
+        perms = get_member_permissions(db, eid, current_user.id)
+        if not perms or not perms.can_edit_event:
             return standard_response(False, "You do not have permission to edit this event")
 
     # Apply event-owner changes (only creator/current owner may change them).
@@ -2058,6 +1904,7 @@ def update_event_status(event_id: str, body: dict = Body(...), db: Session = Dep
 # Upload Event Images
 # ──────────────────────────────────────────────
 @router.post("/{event_id}/images")
+@blocking
 async def upload_event_images(event_id: str, images: List[UploadFile] = File(...), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     try:
         eid = uuid.UUID(event_id)
@@ -2322,7 +2169,7 @@ def add_guest(event_id: str, body: dict = Body(...), db: Session = Depends(get_d
                 last9 = digits[-9:]
                 dup_phone = db.query(EventAttendee).filter(
                     EventAttendee.event_id == eid,
-                    sa_func.right(sa_func.regexp_replace(EventAttendee.guest_phone, r'\D', '', 'g'), 9) == last9,
+                    EventAttendee.phone_key == last9,
                 ).first()
                 if dup_phone:
                     return standard_response(False, f"A guest with phone {contributor.phone} is already on the guest list for this event.")
@@ -2429,7 +2276,7 @@ def add_guest(event_id: str, body: dict = Body(...), db: Session = Depends(get_d
                 last9 = digits[-9:]
                 dup_att = db.query(EventAttendee).filter(
                     EventAttendee.event_id == eid,
-                    sa_func.right(sa_func.regexp_replace(EventAttendee.guest_phone, r'\D', '', 'g'), 9) == last9,
+                    EventAttendee.phone_key == last9,
                 ).first()
                 if dup_att:
                     return standard_response(False, f"A guest with phone {phone} is already on the guest list for this event.")
@@ -2554,7 +2401,7 @@ def add_guests_bulk(event_id: str, body: dict = Body(...), db: Session = Depends
                 last9 = digits[-9:]
                 dup = db.query(EventAttendee).filter(
                     EventAttendee.event_id == eid,
-                    sa_func.right(sa_func.regexp_replace(EventAttendee.guest_phone, r'\D', '', 'g'), 9) == last9,
+                    EventAttendee.phone_key == last9,
                 ).first()
                 if dup:
                     skipped += 1
@@ -2644,7 +2491,7 @@ def add_contributors_as_guests(event_id: str, body: dict = Body(...), db: Sessio
                 last9 = digits[-9:]
                 dup_phone = db.query(EventAttendee).filter(
                     EventAttendee.event_id == eid,
-                    sa_func.right(sa_func.regexp_replace(EventAttendee.guest_phone, r'\D', '', 'g'), 9) == last9,
+                    EventAttendee.phone_key == last9,
                 ).first()
                 if dup_phone:
                     skipped += 1
@@ -2790,8 +2637,12 @@ def remove_guest(event_id: str, guest_id: str, db: Session = Depends(get_db), cu
             inv_q = inv_q.filter(EventInvitation.contributor_id == att.contributor_id)
         inv_q.delete()
 
+    uninvited = att.attendee_id
     db.delete(att)
     db.commit()
+    # The invitation went through a bulk delete, which skips the session
+    # hook that queues a suggestions refresh.
+    mark_suggestions_dirty([uninvited])
     return standard_response(True, "Guest removed successfully")
 
 
@@ -2807,6 +2658,7 @@ def remove_guests_bulk(event_id: str, body: dict = Body(...), db: Session = Depe
         return err
 
     deleted = 0
+    uninvited = []
     for gid_str in body.get("guest_ids", []):
         try:
             att = db.query(EventAttendee).filter(EventAttendee.id == uuid.UUID(gid_str), EventAttendee.event_id == eid).first()
@@ -2814,12 +2666,14 @@ def remove_guests_bulk(event_id: str, body: dict = Body(...), db: Session = Depe
                 db.query(EventGuestPlusOne).filter(EventGuestPlusOne.attendee_id == att.id).delete()
                 if att.invitation_id:
                     db.query(EventInvitation).filter(EventInvitation.id == att.invitation_id).delete()
+                    uninvited.append(att.attendee_id)
                 db.delete(att)
                 deleted += 1
         except ValueError:
             continue
 
     db.commit()
+    mark_suggestions_dirty(uninvited)
     return standard_response(True, f"{deleted} guests removed successfully", {"deleted": deleted})
 
 
@@ -3341,8 +3195,31 @@ def undo_checkin(event_id: str, guest_id: str, db: Session = Depends(get_db), cu
     return standard_response(True, "Check-in reverted successfully", {"guest_id": str(att.id), "checked_in": False})
 
 
+GUEST_EXPORT_HEADERS = [
+    "Name", "Guest Type", "Phone", "Email", "RSVP Status", "Plus Ones", "Plus One Names",
+    "Dietary Requirements", "Meal Preference", "Special Requests", "Invitation Sent",
+    "Checked In", "Checked In At", "Notes",
+]
+
+
+def _iter_guest_export_rows(eid):
+    from utils.batch_loaders import build_event_attendee_dicts
+    for db, attendees in iter_query_batches(
+        lambda db: db.query(EventAttendee).filter(EventAttendee.event_id == eid).order_by(EventAttendee.created_at, EventAttendee.id)
+    ):
+        for g in build_event_attendee_dicts(db, attendees):
+            yield (
+                g["name"], g["guest_type"], g["phone"], g["email"], g["rsvp_status"],
+                g["plus_ones"], "; ".join(g["plus_one_names"]),
+                g["dietary_requirements"], g["meal_preference"], g["special_requests"],
+                "Yes" if g["invitation_sent"] else "No",
+                "Yes" if g["checked_in"] else "No", g["checked_in_at"], g["notes"],
+            )
+
+
 @router.get("/{event_id}/guests/export")
-def export_guests(event_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def export_guests(event_id: str, format: str = Query("json"), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """``format=csv|xlsx`` streams a download; the default keeps the JSON list."""
     try:
         eid = uuid.UUID(event_id)
     except ValueError:
@@ -3352,6 +3229,9 @@ def export_guests(event_id: str, db: Session = Depends(get_db), current_user: Us
     if err:
         return err
 
+    if format in EXPORT_FORMATS:
+        return export_response(format, f"guests-{eid}", GUEST_EXPORT_HEADERS, _iter_guest_export_rows(eid), "Guests")
+
     attendees = db.query(EventAttendee).filter(EventAttendee.event_id == eid).all()
     from utils.batch_loaders import build_event_attendee_dicts
     data = build_event_attendee_dicts(db, attendees)
@@ -3363,33 +3243,8 @@ def export_guests(event_id: str, db: Session = Depends(get_db), current_user: Us
 # ──────────────────────────────────────────────
 
 def _member_dict(db: Session, cm) -> dict:
-    member_user = db.query(User).filter(User.id == cm.user_id).first() if cm.user_id else None
-    profile = db.query(UserProfile).filter(UserProfile.user_id == cm.user_id).first() if cm.user_id else None
-    role = db.query(CommitteeRole).filter(CommitteeRole.id == cm.role_id).first() if cm.role_id else None
-    perms = db.query(CommitteePermission).filter(CommitteePermission.committee_member_id == cm.id).first()
-    assigned_user = db.query(User).filter(User.id == cm.assigned_by).first() if cm.assigned_by else None
-
-    permissions_list = []
-    if perms:
-        for api_name, db_field in PERMISSION_MAP.items():
-            if getattr(perms, db_field, False):
-                permissions_list.append(api_name)
-
-    return {
-        "id": str(cm.id), "event_id": str(cm.event_id),
-        "user_id": str(cm.user_id) if cm.user_id else None,
-        "name": f"{member_user.first_name} {member_user.last_name}" if member_user else "Invited Member",
-        "email": member_user.email if member_user else (cm.invited_email if hasattr(cm, 'invited_email') else None),
-        "phone": member_user.phone if member_user else None,
-        "avatar": profile.profile_picture_url if profile else None,
-        "role": role.role_name if role else None,
-        "role_description": role.description if role else None,
-        "permissions": permissions_list,
-        "status": "active" if cm.user_id else "invited",
-        "assigned_by": {"id": str(assigned_user.id), "name": f"{assigned_user.first_name} {assigned_user.last_name}"} if assigned_user else None,
-        "assigned_at": cm.assigned_at.isoformat() if cm.assigned_at else None,
-        "created_at": cm.created_at.isoformat() if cm.created_at else None,
-    }
+    from utils.batch_loaders import build_committee_member_dicts
+    return build_committee_member_dicts(db, [cm], PERMISSION_MAP)[0]
 
 
 @router.get("/{event_id}/committee")
@@ -3480,6 +3335,7 @@ def add_committee_member(event_id: str, body: dict = Body(...), db: Session = De
     except Exception as e:
         db.rollback()
         return standard_response(False, f"Failed to add committee member: {str(e)}")
+    invalidate_member_permissions(eid, [member_user.id])
 
     # Create notification + send SMS for the committee member
     if member_user and member_user.id != current_user.id:
@@ -3553,6 +3409,7 @@ def update_committee_member(event_id: str, member_id: str, body: dict = Body(...
 
     cm.updated_at = now
     db.commit()
+    invalidate_member_permissions(eid, [cm.user_id])
     return standard_response(True, "Committee member updated successfully", _member_dict(db, cm))
 
 
@@ -3576,8 +3433,10 @@ def remove_committee_member(event_id: str, member_id: str, db: Session = Depends
 
     # Delete associated permissions first to avoid NOT NULL violation
     db.query(CommitteePermission).filter(CommitteePermission.committee_member_id == mid).delete()
+    removed_user_id = cm.user_id
     db.delete(cm)
     db.commit()
+    invalidate_member_permissions(eid, [removed_user_id])
     return standard_response(True, "Committee member removed successfully")
 
 
@@ -3621,6 +3480,7 @@ def update_committee_permissions(event_id: str, member_id: str, body: dict = Bod
     perms.updated_at = now
 
     db.commit()
+    invalidate_member_permissions(eid, [cm.user_id])
     return standard_response(True, "Permissions updated successfully", _member_dict(db, cm))
 
 
@@ -3810,8 +3670,44 @@ def delete_contribution(event_id: str, contribution_id: str, db: Session = Depen
     return standard_response(True, "Contribution deleted successfully")
 
 
+CONTRIBUTION_EXPORT_HEADERS = [
+    "Contributor", "Phone", "Email", "Amount", "Currency", "Payment Method", "Reference",
+    "Status", "Thank You Sent", "Recorded At", "Contributed At",
+]
+
+
+def _iter_contribution_export_rows(eid, currency: str):
+    def build_query(db):
+        return db.query(
+            EventContribution, UserContributor.phone, UserContributor.email, ContributionThankYouMessage.is_sent,
+        ).outerjoin(
+            EventContributor, EventContributor.id == EventContribution.event_contributor_id,
+        ).outerjoin(
+            UserContributor, UserContributor.id == EventContributor.contributor_id,
+        ).outerjoin(
+            ContributionThankYouMessage, ContributionThankYouMessage.contribution_id == EventContribution.id,
+        ).filter(EventContribution.event_id == eid).order_by(EventContribution.created_at, EventContribution.id)
+
+    for _db, rows in iter_query_batches(build_query):
+        for c, phone, email, thank_you_sent in rows:
+            contact = c.contributor_contact or {}
+            status = c.confirmation_status
+            yield (
+                c.contributor_name or "Anonymous",
+                phone or contact.get("phone"), email or contact.get("email"),
+                float(c.amount or 0), currency,
+                c.payment_method.value if hasattr(c.payment_method, "value") else c.payment_method,
+                c.transaction_ref,
+                (status.value if hasattr(status, "value") else status) or "confirmed",
+                "Yes" if thank_you_sent else "No",
+                c.created_at.isoformat() if c.created_at else None,
+                c.contributed_at.isoformat() if c.contributed_at else None,
+            )
+
+
 @router.get("/{event_id}/contributions/export")
-def export_contributions(event_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def export_contributions(event_id: str, format: str = Query("json"), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """``format=csv|xlsx`` streams a download; the default keeps the JSON list."""
     try:
         eid = uuid.UUID(event_id)
     except ValueError:
@@ -3821,6 +3717,15 @@ def export_contributions(event_id: str, db: Session = Depends(get_db), current_u
     if not event:
         return standard_response(False, "Event not found")
 
+    if format in EXPORT_FORMATS:
+        event, err = _verify_event_access(db, eid, current_user, "can_view_contributions")
+        if err:
+            return err
+        return export_response(
+            format, f"contributions-{eid}", CONTRIBUTION_EXPORT_HEADERS,
+            _iter_contribution_export_rows(eid, _currency_code(db, event.currency_id)), "Contributions",
+        )
+
     contributions = db.query(EventContribution).filter(EventContribution.event_id == eid).all()
     return standard_response(True, "Contributions exported", [_contribution_dict(db, c, event.currency_id) for c in contributions])
 
@@ -3931,86 +3836,8 @@ def get_recent_activity(event_id: str, limit: int = 10, db: Session = Depends(ge
     if not event:
         return standard_response(False, "Event not found")
 
-    items: list[dict] = []
-
-    def _name_for_user(uid):
-        if not uid:
-            return None
-        u = db.query(User).filter(User.id == uid).first()
-        if not u:
-            return None
-        full = f"{u.first_name or ''} {u.last_name or ''}".strip()
-        return full or u.username or None
-
-    # Contributions — distinguish pledge vs payment using payment_method/status
-    try:
-        contribs = db.query(EventContribution).filter(EventContribution.event_id == eid).order_by(EventContribution.created_at.desc()).limit(limit).all()
-        for c in contribs:
-            status = (c.confirmation_status.value if hasattr(c.confirmation_status, 'value') else str(c.confirmation_status or '')).lower()
-            is_payment = bool(c.payment_method) or status == 'confirmed'
-            verb = 'paid' if is_payment else 'pledged'
-            items.append({
-                'type': 'contribution',
-                'subtype': 'payment' if is_payment else 'pledge',
-                'actor_name': c.contributor_name or 'A contributor',
-                'title': f"{c.contributor_name or 'A contributor'} {verb}",
-                'amount': float(c.amount or 0),
-                'time': (c.created_at or c.contributed_at).isoformat() if (c.created_at or c.contributed_at) else None,
-            })
-    except Exception:
-        pass
-
-    # Ticket purchases
-    try:
-        tickets = db.query(EventTicket).filter(EventTicket.event_id == eid).order_by(EventTicket.created_at.desc()).limit(limit).all()
-        for t in tickets:
-            buyer = t.buyer_name or _name_for_user(t.buyer_user_id) or 'A guest'
-            items.append({
-                'type': 'ticket',
-                'subtype': 'purchase',
-                'actor_name': buyer,
-                'title': f"{buyer} bought {t.quantity or 1} ticket(s)",
-                'amount': float(t.total_amount or 0),
-                'time': t.created_at.isoformat() if t.created_at else None,
-            })
-    except Exception:
-        pass
-
-    # Expenses
-    try:
-        expenses = db.query(EventExpense).filter(EventExpense.event_id == eid).order_by(EventExpense.created_at.desc()).limit(limit).all()
-        for e in expenses:
-            recorder = _name_for_user(e.recorded_by) or 'Organiser'
-            items.append({
-                'type': 'expense',
-                'subtype': 'recorded',
-                'actor_name': recorder,
-                'title': f"{recorder} recorded expense: {e.description or e.category or 'Expense'}",
-                'amount': float(e.amount or 0),
-                'time': e.created_at.isoformat() if e.created_at else None,
-            })
-    except Exception:
-        pass
-
-    # RSVPs (confirmed)
-    try:
-        rsvps = db.query(EventAttendee).filter(EventAttendee.event_id == eid, EventAttendee.rsvp_status == RSVPStatusEnum.confirmed).order_by(EventAttendee.updated_at.desc()).limit(limit).all()
-        for a in rsvps:
-            who = a.guest_name or _name_for_user(a.attendee_id) or 'A guest'
-            items.append({
-                'type': 'rsvp',
-                'subtype': 'confirmed',
-                'actor_name': who,
-                'title': f"{who} confirmed attendance",
-                'amount': None,
-                'time': (a.updated_at or a.created_at).isoformat() if (a.updated_at or a.created_at) else None,
-            })
-    except Exception:
-        pass
-
-    # Sort by time desc and trim
-    items.sort(key=lambda x: x.get('time') or '', reverse=True)
-    items = items[:limit]
+    from services.event_overview import build_recent_activity
+    items = build_recent_activity(db, eid, max(1, min(limit, 50)))
 
     return standard_response(True, "Recent activity retrieved", {
         'items': items,
@@ -4566,72 +4393,11 @@ def respond_to_invitation(
 # ──────────────────────────────────────────────
 # Bulk member import (committee + guests) — CSV / XLSX
 # Triggered from EventCommittee + EventGuestList "Import from file"
-# action. Parses the upload synchronously into a row payload, persists a
-# MemberImportJob, and queues the Celery worker for the heavy lifting so
-# the request returns immediately.
+# action. Stages the raw upload on disk, persists a MemberImportJob, and
+# queues the Celery worker, which streams and parses the file in bounded
+# chunks (tasks.member_imports), so the request returns immediately.
 # ──────────────────────────────────────────────
 
-def _parse_member_upload(
-    file_bytes: bytes,
-    filename: str,
-    mode: str,
-) -> tuple[list[dict], list[dict]]:
-    """Returns (rows, parse_errors). Accepts CSV.
-
-    XLSX is converted to CSV in the browser before upload (see
-    MemberImportDialog.tsx), so this parser only needs to handle CSV.
-
-    Expected columns (case-insensitive, in order or by header):
-      committee → s/n, full name, phone
-      guests    → s/n, full name, phone, common name
-    """
-    def _norm_header(h: str) -> str:
-        return (h or "").strip().lower().replace("/", "").replace("_", " ").replace("-", " ").strip()
-
-    raw_rows: list[list[str]] = []
-    try:
-        import csv
-        from io import StringIO
-        text = file_bytes.decode("utf-8-sig", errors="replace")
-        reader = csv.reader(StringIO(text))
-        for row in reader:
-            raw_rows.append([("" if c is None else str(c)) for c in row])
-    except Exception as e:
-        return ([], [{"row": 0, "message": f"Could not read CSV file: {e}"}])
-
-    if not raw_rows:
-        return ([], [{"row": 0, "message": "File is empty"}])
-
-    header = [_norm_header(c) for c in raw_rows[0]]
-    has_header = any(h in header for h in ("full name", "phone", "name", "common name"))
-    start_idx = 1 if has_header else 0
-
-    # Column resolution — by header name if available, else by position.
-    def _col(row: list[str], names: list[str], pos: int) -> str:
-        if has_header:
-            for n in names:
-                if n in header:
-                    i = header.index(n)
-                    return row[i] if i < len(row) else ""
-        return row[pos] if pos < len(row) else ""
-
-    rows: list[dict] = []
-    parse_errors: list[dict] = []
-    for i in range(start_idx, len(raw_rows)):
-        cells = raw_rows[i]
-        if not any((c or "").strip() for c in cells):
-            continue
-        row_num = i + 1
-        full_name = _col(cells, ["full name", "name"], 1).strip()
-        phone = _col(cells, ["phone", "phone number", "mobile"], 2).strip()
-        item = {"_row": row_num, "full_name": full_name, "phone": phone}
-        if mode == "guests":
-            item["common_name"] = _col(cells, ["common name", "card name", "display name"], 3).strip()
-        rows.append(item)
-
-    return (rows, parse_errors)
-
-
 def _enqueue_member_import(
     db: Session,
     event_id: uuid.UUID,
@@ -4641,23 +4407,12 @@ def _enqueue_member_import(
     notify_sms: bool,
 ):
     from models import MemberImportJob
+    from utils.import_files import store_import_upload
 
     try:
-        contents = file.file.read()
-    finally:
-        try:
-            file.file.close()
-        except Exception:
-            pass
-    if not contents:
-        return standard_response(False, "Uploaded file is empty")
-    if len(contents) > 5 * 1024 * 1024:
-        return standard_response(False, "File is too large (max 5 MB)")
-
-    rows, parse_errors = _parse_member_upload(contents, file.filename or "", mode)
-    if not rows:
-        msg = parse_errors[0]["message"] if parse_errors else "No data rows found in file"
-        return standard_response(False, msg)
+        source_path = store_import_upload(file, f"members-{mode}")
+    except ValueError as e:
+        return standard_response(False, str(e))
 
     job = MemberImportJob(
         id=uuid.uuid4(),
@@ -4666,9 +4421,10 @@ def _enqueue_member_import(
         mode=mode,
         status="queued",
         notify_sms=bool(notify_sms),
-        total_rows=len(rows),
-        payload={"rows": rows, "filename": file.filename, "parse_errors": parse_errors},
-        errors=list(parse_errors),
+        total_rows=0,
+        payload={"filename": file.filename},
+        source_path=source_path,
+        errors=[],
     )
     db.add(job)
     db.commit()
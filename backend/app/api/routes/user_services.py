@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from core.config import UPLOAD_SERVICE_URL
 from core.database import get_db
+from core.blocking import blocking
 from sqlalchemy import func as sa_func, or_
 from models import (
     UserService, UserServiceImage, UserServiceVerification,
@@ -374,6 +375,7 @@ def get_service(service_id: str, db: Session = Depends(get_db), current_user: Us
 # Create Service
 # ──────────────────────────────────────────────
 @router.post("/")
+@blocking
 async def create_service(
     title: str = Form(...), description: Optional[str] = Form(None),
     category_id: Optional[str] = Form(None), service_type_id: Optional[str] = Form(None),
@@ -459,7 +461,7 @@ async def create_service(
 # Update Service
 # ──────────────────────────────────────────────
 @router.put("/{service_id}")
-async def update_service(
+def update_service(
     service_id: str, title: Optional[str] = Form(None), description: Optional[str] = Form(None),
     category_id: Optional[str] = Form(None),
     service_category_id: Optional[str] = Form(None),
@@ -609,6 +611,7 @@ def get_kyc_status(service_id: str, db: Session = Depends(get_db), current_user:
 
 
 @router.post("/{service_id}/kyc")
+@blocking
 async def upload_kyc_document(
     service_id: str, kyc_requirement_id: str = Form(...),
     file: UploadFile = File(...),
@@ -803,6 +806,7 @@ def reorder_packages(service_id: str, body: dict = Body(...), db: Session = Depe
 # IMAGES
 # ──────────────────────────────────────────────
 @router.post("/{service_id}/images")
+@blocking
 async def upload_service_images(service_id: str, images: List[UploadFile] = File(...), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     try:
         sid = uuid.UUID(service_id)
@@ -1036,6 +1040,7 @@ def get_my_business_phones(db: Session = Depends(get_db), current_user: User = D
 
 
 @router.post("/business-phones")
+@blocking
 async def add_business_phone(
     request: Request,
     db: Session = Depends(get_db),
@@ -1101,6 +1106,7 @@ async def add_business_phone(
 
 
 @router.post("/business-phones/{phone_id}/verify")
+@blocking
 async def verify_business_phone(
     phone_id: str,
     request: Request,
@@ -1151,7 +1157,7 @@ async def verify_business_phone(
 
 
 @router.post("/business-phones/{phone_id}/resend-otp")
-async def resend_business_phone_otp(
+def resend_business_phone_otp(
     phone_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -1227,6 +1233,7 @@ def get_intro_media(service_id: str, db: Session = Depends(get_db), current_user
 
 
 @router.post("/{service_id}/intro-media")
+@blocking
 async def add_intro_media(
     service_id: str,
     media_type: str = Form(...),  # "video" or "audio"
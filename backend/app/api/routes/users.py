@@ -5,13 +5,14 @@ from datetime import datetime
 from uuid import UUID
 from fastapi import APIRouter, Request, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func as sa_func
+from sqlalchemy import exists, or_, func as sa_func
 import re
 from core.database import get_db
+from core.blocking import blocking
 from models import (
     User, UserVerificationOTP, UserProfile, UserSetting, UserFollower, UserCircle,
     OTPVerificationTypeEnum, UserService, Event, UserFeed, UserFeedImage, UserFeedGlow,
-    UserFeedComment, EventInvitation, CommunityMember, EventStatusEnum,
+    UserFeedComment, EventStatusEnum,
     UserSocialAccount,
 )
 from utils.auth import get_current_user
@@ -64,6 +65,7 @@ def _generate_unique_username(db: Session, first_name: str, last_name: str) -> s
 # Sign Up
 # ──────────────────────────────────────────────
 @router.post("/signup")
+@blocking
 async def signup(request: Request, db: Session = Depends(get_db)):
     """Creates a new user account."""
     if request.headers.get("content-type") != "application/json":
@@ -217,6 +219,7 @@ async def signup(request: Request, db: Session = Depends(get_db)):
 # Request OTP
 # ──────────────────────────────────────────────
 @router.post("/request-otp")
+@blocking
 async def request_otp(request: Request, db: Session = Depends(get_db)):
     """Sends a new OTP code to user's email or phone."""
     if request.headers.get("content-type") != "application/json":
@@ -279,6 +282,7 @@ async def request_otp(request: Request, db: Session = Depends(get_db)):
 # Verify OTP
 # ──────────────────────────────────────────────
 @router.post("/verify-otp")
+@blocking
 async def verify_otp(request: Request, db: Session = Depends(get_db)):
     """Verifies email or phone using OTP code."""
     if request.headers.get("content-type") != "application/json":
@@ -352,7 +356,7 @@ async def verify_otp(request: Request, db: Session = Depends(get_db)):
 # Search Users
 # ──────────────────────────────────────────────
 @router.get("/search")
-async def search_users(
+def search_users(
     q: str = "",
     page: int = 1,
     limit: int = 20,
@@ -364,112 +368,28 @@ async def search_users(
 
     # ── PEOPLE YOU MAY KNOW ─────────────────────────────────────────────────
     if suggested:
-        import uuid as uuid_mod
-        from collections import defaultdict
+        from services.people_suggestions import get_suggestions
 
         me = current_user.id
         lim = max(1, min(limit or 10, 50))
 
-        # 1. Collect IDs the current user already knows about
-        my_following_ids = set(
-            row[0] for row in db.query(UserFollower.following_id)
-            .filter(UserFollower.follower_id == me).all()
-        )
-        my_follower_ids = set(
-            row[0] for row in db.query(UserFollower.follower_id)
-            .filter(UserFollower.following_id == me).all()
-        )
-        my_circle_ids = set(
-            row[0] for row in db.query(UserCircle.circle_member_id)
-            .filter(UserCircle.user_id == me).all()
-        )
-        known_ids = {me} | my_following_ids | my_follower_ids | my_circle_ids
-
-        # Score map: candidate_id -> weighted score
-        scores: defaultdict = defaultdict(float)
-
-        # ── SIGNAL 1: Friends-of-friends (my follows' follows) ─────────────
-        # BFS level-1: everyone my followings follow (weight 3.0)
-        if my_following_ids:
-            fof_rows = db.query(UserFollower.following_id).filter(
-                UserFollower.follower_id.in_(my_following_ids),
-                UserFollower.following_id.notin_(known_ids)
-            ).all()
-            for (uid,) in fof_rows:
-                scores[uid] += 3.0
-
-        # ── SIGNAL 2: Circle-of-circle (people my circle members know) ─────
-        # People in my circle members' circles (weight 2.5)
-        if my_circle_ids:
-            coc_rows = db.query(UserCircle.circle_member_id).filter(
-                UserCircle.user_id.in_(my_circle_ids),
-                UserCircle.circle_member_id.notin_(known_ids)
-            ).all()
-            for (uid,) in coc_rows:
-                scores[uid] += 2.5
-
-        # ── SIGNAL 3: Mutual followers (people who follow back my follows) ──
-        # i.e., both follow each other and aren't in my network yet (weight 2.0)
-        if my_following_ids:
-            mutual_rows = db.query(UserFollower.follower_id).filter(
-                UserFollower.follower_id.notin_(known_ids),
-                UserFollower.following_id.in_(my_following_ids)
-            ).all()
-            for (uid,) in mutual_rows:
-                scores[uid] += 2.0
-
-        # ── SIGNAL 4: Co-event attendees (shared events) ───────────────────
-        # People who attended same events as me (weight 1.5)
-        try:
-            my_event_ids = set(
-                row[0] for row in db.query(EventInvitation.event_id)
-                .filter(EventInvitation.invited_user_id == me).all()
-            )
-            if my_event_ids:
-                event_peers = db.query(EventInvitation.invited_user_id).filter(
-                    EventInvitation.event_id.in_(my_event_ids),
-                    EventInvitation.invited_user_id.notin_(known_ids)
-                ).all()
-                for (uid,) in event_peers:
-                    scores[uid] += 1.5
-        except Exception:
-            pass
-
-        # ── SIGNAL 5: Community co-members ────────────────────────────────
-        try:
-            my_community_ids = set(
-                row[0] for row in db.query(CommunityMember.community_id)
-                .filter(CommunityMember.user_id == me).all()
-            )
-            if my_community_ids:
-                community_peers = db.query(CommunityMember.user_id).filter(
-                    CommunityMember.community_id.in_(my_community_ids),
-                    CommunityMember.user_id.notin_(known_ids)
-                ).all()
-                for (uid,) in community_peers:
-                    scores[uid] += 1.0
-        except Exception:
-            pass
-
-        # ── Sort by score descending, take top lim ─────────────────────────
-        if scores:
-            top_ids = sorted(scores, key=lambda uid: scores[uid], reverse=True)[:lim * 3]
-            # Fetch and filter active users only
-            users_q = db.query(User).filter(
-                User.id.in_(top_ids),
-                User.is_active == True
-            ).all()
-            # Re-sort by score after DB fetch
-            id_to_user = {u.id: u for u in users_q}
-            sorted_users = [id_to_user[uid] for uid in top_ids if uid in id_to_user][:lim]
+        # Precomputed by tasks.suggestions (one indexed read)
+        ranked = get_suggestions(db, me, lim)
+        if ranked:
+            sorted_users = [u for u, _, _ in ranked]
+            scores = {u.id: score for u, score, _ in ranked}
+            mutual_map = {u.id: mutual for u, _, mutual in ranked}
         else:
             # Cold start: return recent active users not yet followed
+            scores, mutual_map = {}, {}
             sorted_users = db.query(User).filter(
-                User.id.notin_(known_ids),
-                User.is_active == True
+                User.id != me,
+                User.is_active == True,
+                ~exists().where(UserFollower.follower_id == me, UserFollower.following_id == User.id),
+                ~exists().where(UserFollower.follower_id == User.id, UserFollower.following_id == me),
+                ~exists().where(UserCircle.user_id == me, UserCircle.circle_member_id == User.id),
             ).order_by(User.created_at.desc()).limit(lim).all()
 
-        # Batch profiles for sorted users (was N+1)
         sorted_ids = [u.id for u in sorted_users]
         profile_map = {
             p.user_id: p for p in db.query(UserProfile).filter(
@@ -477,19 +397,6 @@ async def search_users(
             ).all()
         } if sorted_ids else {}
 
-        # Batch mutual-follower counts in a single grouped query:
-        # for each candidate u, count how many of my_following_ids u also follows.
-        mutual_map: dict = {}
-        if my_following_ids and sorted_ids:
-            mutual_rows = db.query(
-                UserFollower.follower_id,
-                sa_func.count(UserFollower.following_id),
-            ).filter(
-                UserFollower.follower_id.in_(sorted_ids),
-                UserFollower.following_id.in_(list(my_following_ids)),
-            ).group_by(UserFollower.follower_id).all()
-            mutual_map = {fid: int(cnt) for fid, cnt in mutual_rows}
-
         results = []
         for u in sorted_users:
             profile = profile_map.get(u.id)
@@ -518,24 +425,20 @@ async def search_users(
     limit = max(1, min(limit, 50))
     offset = (page - 1) * limit
 
-    # Search by username, first_name, last_name, phone, email
-    search_term = f"%{q}%"
+    # Search by username, first_name, last_name, phone, email (one
+    # trigram-indexed document), best matches first.
+    from utils.search import text_match
+    match = text_match(User.search_document, q)
+    if match is None:
+        return standard_response(True, "Please provide a search term", [])
     query = db.query(User).filter(
-        and_(
-            User.id != current_user.id,
-            User.is_active == True,
-            or_(
-                User.username.ilike(search_term),
-                User.first_name.ilike(search_term),
-                User.last_name.ilike(search_term),
-                User.email.ilike(search_term),
-                User.phone.ilike(search_term),
-            )
-        )
+        User.id != current_user.id,
+        User.is_active == True,
+        match.condition,
     )
 
     total = query.count()
-    users = query.limit(limit).offset(offset).all()
+    users = query.order_by(match.rank.desc(), User.id).limit(limit).offset(offset).all()
 
     # Batch-load profiles + social avatars to avoid N+1
     user_ids = [u.id for u in users]
@@ -829,7 +732,7 @@ def get_public_user_profile_by_phone(
     target = (
         db.query(User)
         .filter(User.is_active == True, User.phone.isnot(None))
-        .filter(sa_func.right(sa_func.regexp_replace(User.phone, r'[^0-9]', '', 'g'), 9) == last9)
+        .filter(User.phone_key == last9)
         .first()
     )
     if not target:
@@ -1351,6 +1254,7 @@ def get_user_following(
 # Update Email (post-login)
 # ──────────────────────────────────────────────
 @router.post("/update-email")
+@blocking
 async def update_email(
     request: Request,
     db: Session = Depends(get_db),
@@ -20,6 +20,8 @@ from sqlalchemy import desc
 from core.database import get_db
 from models import WAConversation, WAMessage, WAMessageDirectionEnum, WAMessageStatusEnum, AdminUser, User, UserProfile
 from utils.helpers import standard_response, paginate
+from utils.phone_numbers import match_phone_key
+from services.whatsapp_status_stream import apply_statuses, enqueue_statuses
 
 EAT = pytz.timezone("Africa/Nairobi")
 router = APIRouter(tags=["WhatsApp"])
@@ -215,11 +217,10 @@ def list_wa_conversations(
     name_map: dict = {}
     for c in items:
         if c.phone:
-            last9 = c.phone[-9:] if len(c.phone) >= 9 else c.phone
             user = (
                 db.query(User)
                 .options(joinedload(User.profile))
-                .filter(User.phone.ilike(f"%{last9}"))
+                .filter(match_phone_key(User.phone_key, c.phone))
                 .first()
             )
             if user:
@@ -383,7 +384,8 @@ def mark_wa_conversation_read(
 #
 # This endpoint REPLACES the old supabase/functions/whatsapp-webhook relay.
 # Meta now POSTs straight into the backend so:
-#   • status callbacks update phone_whatsapp_statuses via record_delivery_outcome
+#   • status callbacks are queued on a Redis stream and applied in batches
+#     (services.whatsapp_status_stream)
 #   • incoming messages are stored locally without a hop through Supabase
 
 _TITLE_PATTERN = re.compile(
@@ -530,13 +532,135 @@ def whatsapp_webhook_verify(request: Request):
     raise HTTPException(status_code=403, detail="Forbidden")
 
 
+def _handle_incoming_message(db: Session, value: dict, message: dict) -> None:
+    """Store one inbound message and send the RSVP bot reply, if any."""
+    from_phone = message.get("from") or ""
+    text = ((message.get("text") or {}).get("body") or "").strip()
+    contacts = value.get("contacts") or []
+    wa_name = ((contacts[0].get("profile") or {}).get("name") if contacts else "") or "Guest"
+    wamid_in = message.get("id")
+
+    # Resolve a stored representation of the inbound message.
+    interactive = (message.get("interactive") or {}).get("button_reply") or {}
+    template_btn = message.get("button") or {}
+    stored_content = interactive.get("title") or template_btn.get("text") or text
+
+    # Inbound media (image / document / video / audio) — fetch a temporary
+    # CDN-style URL from Meta so the admin inbox can display it.
+    media_url = None
+    media_type = None
+    for mt in ("image", "document", "video", "audio"):
+        obj = message.get(mt)
+        if obj and obj.get("id"):
+            media_type = mt
+            stored_content = stored_content or obj.get("caption") or f"[{mt}]"
+            try:
+                media_url = _fetch_media_url(obj.get("id"))
+            except Exception as e:  # noqa: BLE001
+                print(f"[wa-webhook] fetch media url failed: {e}")
+            break
+
+    if stored_content or media_url:
+        try:
+            _store_incoming(
+                db,
+                phone=from_phone,
+                content=stored_content or "",
+                wa_message_id=wamid_in,
+                contact_name=wa_name,
+                media_url=media_url,
+                media_type=media_type,
+            )
+        except Exception as e:  # noqa: BLE001
+            print(f"[wa-webhook] store inbound failed: {e}")
+
+    # ── RSVP bot reply ────────────────────────────────────────────
+    reply_text = ""
+    try:
+        button_payload = interactive.get("id") or template_btn.get("payload") or ""
+        from api.routes import rsvp as rsvp_module  # type: ignore
+        lookup = None
+        try:
+            if hasattr(rsvp_module, "_lookup_by_phone"):
+                lookup = rsvp_module._lookup_by_phone(from_phone, db=db)  # type: ignore
+        except Exception:
+            lookup = None
+        guest_full = (lookup or {}).get("guest_name") if isinstance(lookup, dict) else None
+        guest_display_name = (guest_full or wa_name or "Guest").strip()
+        invitation_code = (lookup or {}).get("code") if isinstance(lookup, dict) else None
+
+        def _do_rsvp(code, status):
+            if not code:
+                return f"Sorry {guest_display_name}, I couldn't find an invitation linked to your number."
+            applied = False
+            try:
+                if hasattr(rsvp_module, "_respond_internal"):
+                    applied = bool(rsvp_module._respond_internal(db, code, status))  # type: ignore
+            except Exception as e:  # noqa: BLE001
+                print(f"[wa-webhook] rsvp respond failed: {e}")
+            if not applied:
+                return f"Sorry {guest_display_name}, I couldn't update your RSVP. Please open the invitation link and try again."
+            if status == "confirmed":
+                return f"Great news {guest_display_name}! Your attendance has been confirmed."
+            if status == "maybe":
+                return (
+                    f"Thanks {guest_display_name}, we've noted that you might attend. "
+                    "Tap Confirm or Decline anytime to update your response."
+                )
+            return f"Thank you {guest_display_name}. Your response has been recorded."
+
+        if button_payload:
+            m_conf = re.match(r"^rsvp_confirm_(.+)$", button_payload)
+            m_maybe = re.match(r"^rsvp_maybe_(.+)$", button_payload)
+            m_dec = re.match(r"^rsvp_decline_(.+)$", button_payload)
+            if m_conf:
+                reply_text = _do_rsvp(m_conf.group(1), "confirmed")
+            elif m_maybe:
+                reply_text = _do_rsvp(m_maybe.group(1), "maybe")
+            elif m_dec:
+                reply_text = _do_rsvp(m_dec.group(1), "declined")
+        elif text:
+            up = text.upper()
+            if up in ("YES", "CONFIRM"):
+                reply_text = _do_rsvp(invitation_code, "confirmed")
+            elif up in ("NO", "DECLINE"):
+                reply_text = _do_rsvp(invitation_code, "declined")
+            elif up in ("MAYBE", "TENTATIVE"):
+                reply_text = _do_rsvp(invitation_code, "maybe")
+            elif up == "HELP":
+                reply_text = (
+                    f"Hi {first_name}! Here's how to use Nuru:\n\n"
+                    "YES or CONFIRM: Accept an invitation\n"
+                    "MAYBE: Mark that you might attend\n"
+                    "NO or DECLINE: Decline an invitation\n"
+                    "HELP: Show this menu"
+                )
+    except Exception as e:  # noqa: BLE001
+        print(f"[wa-webhook] bot reply skipped: {e}")
+        reply_text = ""
+
+    if reply_text:
+        sent_id = _send_whatsapp_text(from_phone, reply_text)
+        if sent_id:
+            try:
+                _store_incoming(
+                    db, phone=from_phone, content=reply_text,
+                    wa_message_id=sent_id, contact_name="Nuru Bot",
+                    direction="outbound",
+                )
+            except Exception:
+                pass
+
+
 @router.post("/whatsapp/webhook")
 def whatsapp_webhook_receive(body: dict = Body(...), db: Session = Depends(get_db)):
     """Receive Meta Cloud API webhook payload directly.
 
-    Handles:
-      • statuses[] — feeds record_delivery_outcome so phone_whatsapp_statuses
-        only marks numbers as WhatsApp once Meta confirms delivery.
+    Reads every ``entry[].changes[]`` (Meta batches them). Handles:
+      • statuses[] — appended to a Redis stream and applied in batches by
+        tasks.whatsapp_statuses (services.whatsapp_status_stream), which
+        updates wa_messages, sent_event_cards, wa_message_logs and
+        phone_whatsapp_statuses. Applied inline when Redis is unavailable.
       • messages[] — stores inbound messages and (optionally) replies to
         RSVP keywords (YES / NO / HELP).
 
@@ -544,167 +668,28 @@ def whatsapp_webhook_receive(body: dict = Body(...), db: Session = Depends(get_d
     individual errors are logged.
     """
     try:
-        entry = (body.get("entry") or [{}])[0]
-        change = (entry.get("changes") or [{}])[0]
-        value = change.get("value") or {}
+        values = [
+            change.get("value") or {}
+            for entry in body.get("entry") or []
+            for change in entry.get("changes") or []
+        ]
 
         # ── 1. Delivery status callbacks ───────────────────────────────
-        statuses = value.get("statuses") or []
-        if statuses:
-            from utils.whatsapp_availability import record_delivery_outcome
-            for st in statuses:
-                wamid = st.get("id")
-                status = (st.get("status") or "").lower()  # sent/delivered/read/failed
-                recipient = st.get("recipient_id") or st.get("recipient_phone")
-                errs = st.get("errors") or []
-                error_code = None
-                error_message = None
-                if errs:
-                    first = errs[0] or {}
-                    error_code = str(first.get("code")) if first.get("code") is not None else None
-                    error_message = first.get("title") or first.get("message") or first.get("details")
-
-                # Update authoritative availability cache.
-                if recipient and status:
-                    try:
-                        record_delivery_outcome(
-                            db, recipient,
-                            delivery_status=status,
-                            error_code=error_code,
-                            error_message=error_message,
-                        )
-                    except Exception as e:  # noqa: BLE001
-                        print(f"[wa-webhook] availability update failed: {e}")
-
-                # Mirror the bump to local wa_messages, sent_event_cards
-                # and wa_message_logs.
-                if wamid and status:
-                    _mirror_delivery_status(db, wamid, status,
-                                            error_message=error_message,
-                                            error_code=error_code,
-                                            webhook_payload=st)
-
-        # ── 2. Incoming messages ──────────────────────────────────────
-        messages = value.get("messages") or []
-        if not messages:
-            return {"status": "ok"}
-        message = messages[0]
-        from_phone = message.get("from") or ""
-        text = ((message.get("text") or {}).get("body") or "").strip()
-        contacts = value.get("contacts") or []
-        wa_name = ((contacts[0].get("profile") or {}).get("name") if contacts else "") or "Guest"
-        wamid_in = message.get("id")
-
-        # Resolve a stored representation of the inbound message.
-        interactive = (message.get("interactive") or {}).get("button_reply") or {}
-        template_btn = message.get("button") or {}
-        stored_content = interactive.get("title") or template_btn.get("text") or text
-
-        # Inbound media (image / document / video / audio) — fetch a temporary
-        # CDN-style URL from Meta so the admin inbox can display it.
-        media_url = None
-        media_type = None
-        for mt in ("image", "document", "video", "audio"):
-            obj = message.get(mt)
-            if obj and obj.get("id"):
-                media_type = mt
-                stored_content = stored_content or obj.get("caption") or f"[{mt}]"
-                try:
-                    media_url = _fetch_media_url(obj.get("id"))
-                except Exception as e:  # noqa: BLE001
-                    print(f"[wa-webhook] fetch media url failed: {e}")
-                break
-
-        if stored_content or media_url:
+        for value in values:
+            statuses = value.get("statuses") or []
+            if not statuses or enqueue_statuses(statuses):
+                continue
             try:
-                _store_incoming(
-                    db,
-                    phone=from_phone,
-                    content=stored_content or "",
-                    wa_message_id=wamid_in,
-                    contact_name=wa_name,
-                    media_url=media_url,
-                    media_type=media_type,
-                )
+                apply_statuses(db, statuses)
+                db.commit()
             except Exception as e:  # noqa: BLE001
-                print(f"[wa-webhook] store inbound failed: {e}")
+                db.rollback()
+                print(f"[wa-webhook] inline status apply failed: {e}")
 
-        # ── 3. RSVP bot replies ───────────────────────────────────────
-        reply_text = ""
-        try:
-            button_payload = interactive.get("id") or template_btn.get("payload") or ""
-            from api.routes import rsvp as rsvp_module  # type: ignore
-            lookup = None
-            try:
-                if hasattr(rsvp_module, "_lookup_by_phone"):
-                    lookup = rsvp_module._lookup_by_phone(from_phone, db=db)  # type: ignore
-            except Exception:
-                lookup = None
-            guest_full = (lookup or {}).get("guest_name") if isinstance(lookup, dict) else None
-            guest_display_name = (guest_full or wa_name or "Guest").strip()
-            invitation_code = (lookup or {}).get("code") if isinstance(lookup, dict) else None
-
-            def _do_rsvp(code, status):
-                if not code:
-                    return f"Sorry {guest_display_name}, I couldn't find an invitation linked to your number."
-                applied = False
-                try:
-                    if hasattr(rsvp_module, "_respond_internal"):
-                        applied = bool(rsvp_module._respond_internal(db, code, status))  # type: ignore
-                except Exception as e:  # noqa: BLE001
-                    print(f"[wa-webhook] rsvp respond failed: {e}")
-                if not applied:
-                    return f"Sorry {guest_display_name}, I couldn't update your RSVP. Please open the invitation link and try again."
-                if status == "confirmed":
-                    return f"Great news {guest_display_name}! Your attendance has been confirmed."
-                if status == "maybe":
-                    return (
-                        f"Thanks {guest_display_name}, we've noted that you might attend. "
-                        "Tap Confirm or Decline anytime to update your response."
-                    )
-                return f"Thank you {guest_display_name}. Your response has been recorded."
-
-            if button_payload:
-                m_conf = re.match(r"^rsvp_confirm_(.+)$", button_payload)
-                m_maybe = re.match(r"^rsvp_maybe_(.+)$", button_payload)
-                m_dec = re.match(r"^rsvp_decline_(.+)$", button_payload)
-                if m_conf:
-                    reply_text = _do_rsvp(m_conf.group(1), "confirmed")
-                elif m_maybe:
-                    reply_text = _do_rsvp(m_maybe.group(1), "maybe")
-                elif m_dec:
-                    reply_text = _do_rsvp(m_dec.group(1), "declined")
-            elif text:
-                up = text.upper()
-                if up in ("YES", "CONFIRM"):
-                    reply_text = _do_rsvp(invitation_code, "confirmed")
-                elif up in ("NO", "DECLINE"):
-                    reply_text = _do_rsvp(invitation_code, "declined")
-                elif up in ("MAYBE", "TENTATIVE"):
-                    reply_text = _do_rsvp(invitation_code, "maybe")
-                elif up == "HELP":
-                    reply_text = (
-                        f"Hi {first_name}! Here's how to use Nuru:\n\n"
-                        "YES or CONFIRM: Accept an invitation\n"
-                        "MAYBE: Mark that you might attend\n"
-                        "NO or DECLINE: Decline an invitation\n"
-                        "HELP: Show this menu"
-                    )
-        except Exception as e:  # noqa: BLE001
-            print(f"[wa-webhook] bot reply skipped: {e}")
-            reply_text = ""
-
-        if reply_text:
-            sent_id = _send_whatsapp_text(from_phone, reply_text)
-            if sent_id:
-                try:
-                    _store_incoming(
-                        db, phone=from_phone, content=reply_text,
-                        wa_message_id=sent_id, contact_name="Nuru Bot",
-                        direction="outbound",
-                    )
-                except Exception:
-                    pass
+        # ── 2. Incoming messages (and RSVP bot replies) ────────────────
+        for value in values:
+            for message in value.get("messages") or []:
+                _handle_incoming_message(db, value, message)
 
         return {"status": "ok"}
     except Exception as e:  # noqa: BLE001
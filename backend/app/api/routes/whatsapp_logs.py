@@ -28,6 +28,7 @@ from models.events import Event
 from models.wa_message_log import WAMessageLog
 from utils.auth import get_current_user
 from utils.helpers import standard_response, paginate
+from utils.phone_numbers import match_phone_key, phone_key
 
 router = APIRouter(prefix="/whatsapp/logs", tags=["WhatsApp Logs"])
 
@@ -59,11 +60,8 @@ def _scope_to_user(query, db: Session, current_user: User):
     if own_norm:
         conds.append(WAMessageLog.normalized_phone == own_norm)
         conds.append(WAMessageLog.recipient_phone == own_norm)
-        digits = "".join(c for c in own_norm if c.isdigit())
-        last9 = digits[-9:] if len(digits) >= 9 else digits
-        if last9:
-            conds.append(WAMessageLog.normalized_phone.ilike(f"%{last9}"))
-            conds.append(WAMessageLog.recipient_phone.ilike(f"%{last9}"))
+        if phone_key(own_norm):
+            conds.append(match_phone_key(WAMessageLog.phone_key, own_norm))
 
     # Events the user owns / organizes
     try:
@@ -198,7 +196,12 @@ def _apply_filters(query, *,
             query = query.filter(WAMessageLog.whatsapp_available.is_(None))
     if recipient:
         last9 = _phone_last9(recipient)
-        if last9:
+        if phone_key(recipient):
+            query = query.filter(or_(
+                match_phone_key(WAMessageLog.phone_key, recipient),
+                WAMessageLog.recipient_name.ilike(f"%{recipient}%"),
+            ))
+        elif last9:
             query = query.filter(or_(
                 WAMessageLog.recipient_phone.ilike(f"%{last9}"),
                 WAMessageLog.normalized_phone.ilike(f"%{last9}"),
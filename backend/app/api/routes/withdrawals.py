@@ -17,6 +17,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.blocking import blocking
 from utils.auth import get_current_user
 from utils.helpers import api_response, paginate
 from models.users import User
@@ -72,6 +73,7 @@ def _next_request_code(db: Session) -> str:
 
 
 @router.post("", status_code=201)
+@blocking
 async def create_withdrawal(
     request: Request,
     db: Session = Depends(get_db),
@@ -0,0 +1,76 @@
+"""
+Blocking work off the event loop
+================================
+Provides:
+  - ``blocking`` – decorator for ``async def`` route handlers that use the
+                   synchronous ``Session`` (``get_db``). The handler still
+                   awaits ``request.json()``, ``UploadFile.read()``, httpx
+                   calls etc., but the whole coroutine runs on a worker
+                   thread, so a slow query no longer stalls every other
+                   request on the Uvicorn worker.
+
+FastAPI already runs plain ``def`` handlers in its threadpool; an
+``async def`` handler runs on the loop itself, and every ``db.query`` in it
+blocks the loop for the length of the round trip. Handlers that await
+nothing should simply be ``def``. The rest are decorated::
+
+    @router.post("/purchase")
+    @blocking
+    async def purchase_ticket(request: Request, db: Session = Depends(get_db)):
+        body = await request.json()
+        ...
+
+How it works: the request body is read on the server's loop first (the
+ASGI ``receive`` channel belongs to it; Starlette caches the body, so the
+handler's own ``await request.json()`` is served from memory). The
+coroutine is then driven to completion by ``asyncio.run`` on a worker
+thread (a fresh loop per request, about 0.2 ms, so nothing it leaves
+behind leaks into the next request). The thread comes from the same AnyIO
+limiter as FastAPI's sync handlers.
+
+Do not use it on WebSocket / streaming handlers, or on handlers that
+start tasks expected to outlive the request: they belong on the server
+loop. Code that is natively async end to end can use
+``core.database.get_async_db`` instead.
+"""
+
+import asyncio
+import functools
+import inspect
+
+import anyio
+from starlette.requests import Request
+
+
+def _run_to_completion(handler, args, kwargs):
+    return asyncio.run(handler(*args, **kwargs))
+
+
+async def _prefetch_body(request: Request) -> None:
+    try:
+        await request.body()
+    except RuntimeError:
+        # Stream already consumed by FastAPI's form parsing; ``request.form()``
+        # is cached on the request instead.
+        pass
+
+
+def blocking(handler):
+    """Run an ``async def`` handler on a worker thread (see module docs)."""
+    if not inspect.iscoroutinefunction(handler):
+        raise TypeError(f"@blocking expects an async handler, got {handler!r}")
+
+    @functools.wraps(handler)
+    async def wrapper(*args, **kwargs):
+        for value in (*args, *kwargs.values()):
+            if isinstance(value, Request):
+                await _prefetch_body(value)
+        return await anyio.to_thread.run_sync(_run_to_completion, handler, args, kwargs)
+
+    # FastAPI resolves string annotations against the endpoint's module
+    # globals, which a wrapper doesn't carry; hand it the evaluated ones.
+    try:
+        wrapper.__signature__ = inspect.signature(handler, eval_str=True)
+    except (NameError, TypeError):
+        pass
+    return wrapper
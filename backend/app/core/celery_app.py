@@ -50,6 +50,13 @@ celery_app = Celery(
         "tasks.contributor_imports",
         "tasks.member_imports",
         "tasks.whatsapp_availability",
+        "tasks.analytics",
+        "tasks.call_signaling",
+        "tasks.suggestions",
+        "tasks.admin_reports",
+        "tasks.payment_rollups",
+        "tasks.admin_counters",
+        "tasks.whatsapp_statuses",
     ],
 )
 
@@ -141,17 +148,77 @@ celery_app.conf.update(
             "task": "tasks.maintenance.expire_stale_delivery_otps",
             "schedule": crontab(minute="*/10"),
         },
+        # Drain the Redis page-view buffer into page_views in bulk.
+        "flush-page-views": {
+            "task": "tasks.analytics.flush_page_views",
+            "schedule": crontab(minute="*"),
+        },
+        # Recompute the current/previous hour (and their day) rollups that
+        # back GET /admin/analytics.
+        "rollup-page-views": {
+            "task": "tasks.analytics.rollup_page_views",
+            "schedule": crontab(minute="*/5"),
+        },
         # Analytics retention — drop page_views older than 90 days.
         "prune-old-page-views": {
             "task": "tasks.maintenance.prune_old_page_views",
             "schedule": crontab(minute=30, hour=3),  # daily at 03:30 EAT
         },
+        # Repair drift in the per-event contribution totals and refresh
+        # their WhatsApp availability counts.
+        "rebuild-event-contribution-totals": {
+            "task": "tasks.maintenance.rebuild_event_contribution_totals",
+            "schedule": crontab(minute=15, hour=4),  # daily at 04:15 EAT
+        },
+        # Safety net for ring timeouts whose per-call task was lost.
+        "expire-stale-calls": {
+            "task": "tasks.call_signaling.expire_stale_calls",
+            "schedule": crontab(minute="*"),
+        },
+        # People You May Know: users whose own edges changed, then a nightly
+        # rebuild for everyone active in the last 30 days.
+        "refresh-dirty-suggestions": {
+            "task": "tasks.suggestions.refresh_dirty_suggestions",
+            "schedule": crontab(minute="*/5"),
+        },
+        "refresh-all-suggestions": {
+            "task": "tasks.suggestions.refresh_all_suggestions",
+            "schedule": crontab(minute=45, hour=2),  # daily at 02:45 EAT
+        },
+        # Finance report PDFs are kept for a week.
+        "prune-report-files": {
+            "task": "tasks.admin_reports.prune_report_files",
+            "schedule": crontab(minute=0, hour=5),  # daily at 05:00 EAT
+        },
+        # Daily payment rollups behind the finance dashboard: days touched
+        # by a transaction change, then a nightly rebuild of the last week
+        # (after the UTC day has closed).
+        "refresh-dirty-payment-rollups": {
+            "task": "tasks.payment_rollups.refresh_dirty_rollups",
+            "schedule": crontab(minute="*"),
+        },
+        "reconcile-payment-rollups": {
+            "task": "tasks.payment_rollups.reconcile_rollups",
+            "schedule": crontab(minute=20, hour=3),  # daily at 03:20 EAT
+        },
+        # Recount the admin dashboard counters that the session hooks keep
+        # current between runs.
+        "reconcile-admin-counters": {
+            "task": "tasks.admin_counters.reconcile_admin_counters",
+            "schedule": crontab(minute="*/10"),
+        },
         # Reminder automation scheduler — picks up due automations and
         # dispatches them to per-recipient send tasks.
         "scan-due-reminder-automations": {
             "task": "tasks.reminder_dispatch.scan_due_automations",
             "schedule": crontab(minute="*/5"),
         },
+        # Apply queued Meta delivery statuses (see POST /whatsapp/webhook).
+        # Each run drains the stream and exits.
+        "apply-whatsapp-statuses": {
+            "task": "tasks.whatsapp_statuses.apply_whatsapp_statuses",
+            "schedule": crontab(minute="*"),
+        },
         # WhatsApp availability — active probing is disabled by policy.
         # Availability is learned opportunistically from real Nuru sends,
         # so no beat schedule is required here.
@@ -35,3 +35,41 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# 4. Async engine / session for natively async code (asyncpg).
+# Created on first use so processes that never touch it (Celery, scripts)
+# don't need asyncpg or hold a second pool. Its pool is separate from the
+# sync one above; size both with Postgres' max_connections in mind.
+# Async handlers that use ``get_db`` run through ``core.blocking`` instead.
+_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "5"))
+_ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "10"))
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(
+            config.ASYNC_DATABASE_URL,
+            echo=False,
+            pool_size=_ASYNC_POOL_SIZE, max_overflow=_ASYNC_MAX_OVERFLOW,
+            pool_timeout=_POOL_TIMEOUT, pool_recycle=1800,
+            pool_pre_ping=True,
+        )
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False,
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    """FastAPI dependency yielding an ``AsyncSession``. Relationships are
+    not lazy-loaded on it; use ``selectinload`` / ``joinedload``."""
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,307 @@
+"""
+Real-time fan-out over Redis pub/sub
+=====================================
+Provides:
+  - ``publish``   – fire-and-forget event from any (sync) request handler
+                    or Celery task to every subscriber of a channel, on
+                    every Gunicorn worker.
+  - ``subscribe`` – async context manager giving a WebSocket / SSE handler
+                    an ``asyncio.Queue`` of events for a set of channels.
+  - ``Channels``  – centralized channel naming, like ``CacheKeys``.
+  - ``serve_websocket`` / ``stream_sse`` – pump a subscription to a
+                    WebSocket or a Server-Sent Events response.
+
+Each worker process holds ONE Redis pub/sub connection (``_Hub``) and
+fans incoming messages out to its local sockets in-process, so a thousand
+open sockets cost one Redis connection per worker, not a thousand.
+Sockets never hold a DB session: handlers authenticate with a short-lived
+session and then only wait on their queue.
+
+Delivery is best-effort. A subscriber whose queue overflows, or every
+subscriber when the Redis connection drops, receives ``None`` and should
+close; clients reconnect and catch up through the REST endpoint they used
+to poll. With Redis disabled ``publish`` is a no-op and ``subscribe``
+raises ``RealtimeUnavailable``.
+
+Wire format (JSON): ``{"type": "<event>", "data": {...}}``.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Set
+
+from core.redis import REDIS_ENABLED, REDIS_URL, get_redis
+
+QUEUE_SIZE = 256
+HEARTBEAT_SECONDS = 25
+
+
+class RealtimeUnavailable(RuntimeError):
+    pass
+
+
+class Channels:
+    """Centralized pub/sub channel templates."""
+
+    EVENT_GROUP = "rt:event_group:{group_id}"
+    USER = "rt:user:{user_id}"
+    USER_CALLS = "rt:user:{user_id}:calls"
+
+    @staticmethod
+    def for_event_group(group_id) -> str:
+        return Channels.EVENT_GROUP.format(group_id=group_id)
+
+    @staticmethod
+    def for_user(user_id) -> str:
+        return Channels.USER.format(user_id=user_id)
+
+    @staticmethod
+    def for_user_calls(user_id) -> str:
+        return Channels.USER_CALLS.format(user_id=user_id)
+
+
+def encode(event_type: str, data: Any = None) -> str:
+    return json.dumps({"type": event_type, "data": data}, default=str)
+
+
+def has_subscribers(channels: Iterable[str]) -> Set[str]:
+    """Channels (of ``channels``) with at least one subscriber on any worker.
+    Lets publishers skip building payloads nobody will receive."""
+    channels = list(channels)
+    try:
+        r = get_redis()
+        if r is None or not channels:
+            return set()
+        return {c for c, n in r.pubsub_numsub(*channels) if n}
+    except Exception as e:
+        print(f"[realtime] numsub failed: {e}")
+        return set()
+
+
+def publish(channel: str, event_type: str, data: Any = None) -> bool:
+    """Publish an event. Returns False (never raises) if Redis is unavailable."""
+    try:
+        r = get_redis()
+        if r is None:
+            return False
+        r.publish(channel, encode(event_type, data))
+        return True
+    except Exception as e:
+        print(f"[realtime] publish to {channel} failed: {e}")
+        return False
+
+
+# ─────────────────────────────────────────────────────────
+# Per-process subscription hub
+# ─────────────────────────────────────────────────────────
+
+class _Hub:
+    def __init__(self):
+        self._queues: Dict[str, Set[asyncio.Queue]] = {}
+        self._client = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _ensure_started(self):
+        if self._reader and not self._reader.done():
+            return
+        import redis.asyncio as aioredis
+
+        self._client = aioredis.from_url(
+            REDIS_URL, decode_responses=True, socket_connect_timeout=2,
+        )
+        self._pubsub = self._client.pubsub()
+        self._reader = asyncio.create_task(self._read())
+
+    async def _read(self):
+        try:
+            while True:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(0.5)
+                    continue
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if not message or message.get("type") != "message":
+                    continue
+                for queue in list(self._queues.get(message["channel"], ())):
+                    try:
+                        queue.put_nowait(message["data"])
+                    except asyncio.QueueFull:
+                        # Slow consumer: tell it to reconnect and catch up.
+                        self._drop(queue)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[realtime] pub/sub reader stopped: {e}")
+        finally:
+            # Every local subscriber reconnects; the next one restarts the reader.
+            for queues in list(self._queues.values()):
+                for queue in list(queues):
+                    self._drop(queue)
+            self._queues.clear()
+            with contextlib.suppress(Exception):
+                await self._pubsub.aclose()
+            with contextlib.suppress(Exception):
+                await self._client.aclose()
+
+    def _drop(self, queue: asyncio.Queue):
+        for queues in self._queues.values():
+            queues.discard(queue)
+        # The sentinel must get in even when the queue is full; the oldest
+        # events are lost anyway, the client catches up after reconnecting.
+        while True:
+            try:
+                queue.put_nowait(None)
+                return
+            except asyncio.QueueFull:
+                queue.get_nowait()
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, channels: Iterable[str]) -> AsyncIterator[asyncio.Queue]:
+        if not REDIS_ENABLED:
+            raise RealtimeUnavailable("Redis is disabled")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        channels = list(dict.fromkeys(channels))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        async with self._lock:
+            new = [c for c in channels if not self._queues.get(c)]
+            for c in channels:
+                self._queues.setdefault(c, set()).add(queue)
+            try:
+                await self._ensure_started()
+                if new:
+                    await self._pubsub.subscribe(*new)
+            except Exception as e:
+                self._drop(queue)
+                raise RealtimeUnavailable(str(e)) from e
+        try:
+            yield queue
+        finally:
+            async with self._lock:
+                idle = []
+                for c in channels:
+                    queues = self._queues.get(c)
+                    if queues is not None:
+                        queues.discard(queue)
+                        if not queues:
+                            self._queues.pop(c, None)
+                            idle.append(c)
+                if idle and self._pubsub is not None and self._reader and not self._reader.done():
+                    with contextlib.suppress(Exception):
+                        await self._pubsub.unsubscribe(*idle)
+
+
+_hub = _Hub()
+
+
+def subscribe(*channels: str):
+    """``async with subscribe(ch) as queue:`` — ``await queue.get()`` yields
+    raw JSON strings, or ``None`` when the subscriber must reconnect."""
+    return _hub.subscribe(channels)
+
+
+async def next_event(queue: asyncio.Queue, timeout: float = HEARTBEAT_SECONDS) -> Optional[str]:
+    """Next raw event, or a heartbeat frame after ``timeout`` idle seconds.
+    Returns ``None`` when the subscription was dropped."""
+    try:
+        return await asyncio.wait_for(queue.get(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return encode("ping")
+
+
+# ─────────────────────────────────────────────────────────
+# WebSocket pump
+# ─────────────────────────────────────────────────────────
+
+async def serve_websocket(
+    websocket,
+    channels: Iterable[str],
+    ready: Any = None,
+    close_on: Optional[Callable[[dict], bool]] = None,
+    expires_at: Optional[float] = None,
+) -> None:
+    """Stream ``channels`` to an accepted WebSocket until either side goes away.
+
+    Sends ``{"type": "ready"}`` once subscribed — everything published
+    after that reaches this socket, so clients should run their REST
+    catch-up *after* it. Closes with 1012 ("service restart") when the
+    subscription is dropped, telling the client to reconnect.
+
+    Access is checked once, at connect. ``close_on`` is shown every decoded
+    event before it is forwarded and revokes the socket (4403) when it
+    returns True; ``expires_at`` (epoch seconds, normally the token's
+    ``exp``) caps its lifetime (4401).
+    """
+    code = 1012
+    try:
+        async with subscribe(*channels) as queue:
+            await websocket.send_text(encode("ready", ready))
+
+            async def pump():
+                nonlocal code
+                while True:
+                    timeout = HEARTBEAT_SECONDS
+                    if expires_at is not None:
+                        left = expires_at - time.time()
+                        if left <= 0:
+                            code = 4401
+                            return
+                        timeout = min(timeout, left)
+                    raw = await next_event(queue, timeout)
+                    if raw is None:
+                        return
+                    if close_on is not None:
+                        with contextlib.suppress(ValueError):
+                            if close_on(json.loads(raw)):
+                                code = 4403
+                                return
+                    await websocket.send_text(raw)
+
+            async def drain():
+                # Clients don't talk on these sockets; reading is only how
+                # a disconnect is noticed between heartbeats.
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+
+            tasks = {asyncio.create_task(pump()), asyncio.create_task(drain())}
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                with contextlib.suppress(Exception):
+                    task.result()
+    except RealtimeUnavailable:
+        pass
+    with contextlib.suppress(Exception):
+        await websocket.close(code=code)
+
+
+# ─────────────────────────────────────────────────────────
+# Server-Sent Events
+# ─────────────────────────────────────────────────────────
+
+SSE_RETRY_MS = 3000
+
+
+def _sse(raw: str) -> str:
+    return f"data: {raw}\n\n"
+
+
+async def stream_sse(channels: Iterable[str], ready: Any = None) -> AsyncIterator[str]:
+    """Body for a ``text/event-stream`` ``StreamingResponse``: the same frames
+    as ``serve_websocket`` (``ready`` first, heartbeats while idle), one per
+    SSE ``data:`` line. The stream simply ends when the subscription is
+    dropped; ``EventSource`` reconnects on its own after ``retry``."""
+    try:
+        async with subscribe(*channels) as queue:
+            yield f"retry: {SSE_RETRY_MS}\n" + _sse(encode("ready", ready))
+            while True:
+                raw = await next_event(queue)
+                if raw is None:
+                    return
+                yield _sse(raw)
+    except RealtimeUnavailable:
+        return
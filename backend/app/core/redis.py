@@ -16,6 +16,7 @@ import json
 import os
 import functools
 import hashlib
+import time
 from typing import Optional, Any, Callable
 from datetime import timedelta
 
@@ -145,16 +146,35 @@ class CacheKeys:
 
     # Per-user
     FEED = "feed:{user_id}:p{page}:l{limit}:m{mode}"             # TTL 2 min
-    NOTIFICATIONS = "notif:{user_id}:p{page}:l{limit}"           # TTL 1 min
-    UNREAD_COUNT = "notif:unread:{user_id}"                       # TTL 30 sec
+    NOTIFICATIONS = "notif:{user_id}:v{version}:p{page}:l{limit}"  # TTL 1 min
+    NOTIFICATIONS_VERSION = "notif:ver:{user_id}"                 # TTL 1 day
+    MOMENTS_TRAY = "moments:tray:{user_id}"                       # TTL 1 min
+
+    # Per (event, user)
+    COMMITTEE_PERMISSIONS = "committee:perms:{event_id}:{user_id}"  # TTL 10 min
+
+    # Admin finance report previews, per (type, range)
+    ADMIN_REPORT_PREVIEW = "admin:report:{type}:{start}:{end}"   # TTL 5 min
+
+    # Admin dashboard totals (services.admin_counters), hash, no TTL
+    ADMIN_COUNTERS = "admin:counters"
+
+    # Live counters (services.unread_counters), recounted when the TTL runs out
+    UNREAD_NOTIFICATIONS = "unread:notif:{user_id}"               # TTL 6 h
+    UNREAD_MESSAGES = "unread:msg:{user_id}"                      # TTL 6 h
 
     # Reference data (rarely changes)
     EVENT_TYPES = "ref:event_types"                               # TTL 30 min
     SERVICE_CATEGORIES = "ref:service_categories"                 # TTL 30 min
 
+    # Write buffers (drained by Celery, no TTL)
+    PAGE_VIEW_BUFFER = "analytics:page_views:buffer"              # list of JSON rows
+    SUGGESTIONS_DIRTY = "suggestions:dirty"                       # set of user ids
+    PAYMENT_ROLLUP_DIRTY = "payments:rollup:dirty"                # set of ISO dates
+    WA_STATUS_STREAM = "wa:webhook:statuses"                      # stream of Meta status lists
+
     # Invalidation patterns
     PAT_USER_FEED = "feed:{user_id}:*"
-    PAT_USER_NOTIF = "notif:{user_id}:*"
     PAT_TRENDING = "posts:trending:*"
     PAT_ALL_FEEDS = "feed:*"
 
@@ -167,12 +187,32 @@ class CacheKeys:
         return CacheKeys.FEED.format(user_id=user_id, page=page, limit=limit, mode=mode)
 
     @staticmethod
-    def for_notifications(user_id: str, page: int, limit: int) -> str:
-        return CacheKeys.NOTIFICATIONS.format(user_id=user_id, page=page, limit=limit)
+    def for_notifications(user_id: str, page: int, limit: int, version: str = "0") -> str:
+        return CacheKeys.NOTIFICATIONS.format(user_id=user_id, version=version, page=page, limit=limit)
+
+    @staticmethod
+    def for_notifications_version(user_id: str) -> str:
+        return CacheKeys.NOTIFICATIONS_VERSION.format(user_id=user_id)
+
+    @staticmethod
+    def for_moments_tray(user_id: str) -> str:
+        return CacheKeys.MOMENTS_TRAY.format(user_id=user_id)
+
+    @staticmethod
+    def for_committee_permissions(event_id: str, user_id: str) -> str:
+        return CacheKeys.COMMITTEE_PERMISSIONS.format(event_id=event_id, user_id=user_id)
+
+    @staticmethod
+    def for_admin_report_preview(report_type: str, start, end) -> str:
+        return CacheKeys.ADMIN_REPORT_PREVIEW.format(type=report_type, start=start, end=end)
+
+    @staticmethod
+    def for_unread_notifications(user_id: str) -> str:
+        return CacheKeys.UNREAD_NOTIFICATIONS.format(user_id=user_id)
 
     @staticmethod
-    def for_unread(user_id: str) -> str:
-        return CacheKeys.UNREAD_COUNT.format(user_id=user_id)
+    def for_unread_messages(user_id: str) -> str:
+        return CacheKeys.UNREAD_MESSAGES.format(user_id=user_id)
 
 
 # ─────────────────────────────────────────────────────────
@@ -184,10 +224,49 @@ def invalidate_user_feed(user_id: str):
     cache_delete_pattern(CacheKeys.PAT_USER_FEED.format(user_id=user_id))
 
 
+def notifications_version(user_id: str) -> str:
+    """Current version of a user's cached notification pages (part of
+    their cache key); "0" until the first invalidation."""
+    try:
+        return get_redis().get(CacheKeys.for_notifications_version(user_id)) or "0"
+    except Exception:
+        return "0"
+
+
+def invalidate_notifications(user_ids) -> None:
+    """Bust cached notification pages for many users: one SET of a new,
+    unique version per user, pipelined 500 at a time, so old pages are
+    simply never read again (no SCAN). The unread count is a live counter
+    (services.unread_counters) and is never invalidated here."""
+    keys = [CacheKeys.for_notifications_version(str(u)) for u in user_ids if u]
+    try:
+        r = get_redis()
+        version = str(time.time_ns())
+        for start in range(0, len(keys), 500):
+            pipe = r.pipeline(transaction=False)
+            for key in keys[start:start + 500]:
+                pipe.set(key, version, ex=86400)
+            pipe.execute()
+    except Exception:
+        pass
+
+
 def invalidate_user_notifications(user_id: str):
-    """Bust cached notification pages + unread count for a user."""
-    cache_delete_pattern(CacheKeys.PAT_USER_NOTIF.format(user_id=user_id))
-    cache_delete(CacheKeys.for_unread(user_id))
+    """Bust cached notification pages for a user."""
+    invalidate_notifications([user_id])
+
+
+def invalidate_moment_trays(user_ids) -> int:
+    """Bust the cached moments tray of each user (one DEL per 500 keys)."""
+    keys = [CacheKeys.for_moments_tray(str(u)) for u in user_ids if u]
+    try:
+        r = get_redis()
+        deleted = 0
+        for start in range(0, len(keys), 500):
+            deleted += r.delete(*keys[start:start + 500])
+        return deleted
+    except Exception:
+        return 0
 
 
 def invalidate_trending():
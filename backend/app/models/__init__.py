@@ -66,6 +66,9 @@ from models.contributions import (
     UserContributor, EventContributionTarget, EventContributor,
     EventContribution, ContributionThankYouMessage,
 )
+from models.event_contribution_totals import EventContributionTotals
+from models.user_contribution_insights import UserContributionInsights
+from models.user_suggestions import UserSuggestion, UserSuggestionRefresh
 from models.invitations import (
     EventInvitation, EventAttendee, AttendeeProfile, EventGuestPlusOne,
 )
@@ -90,7 +93,7 @@ from models.feed_ranking import (
     UserInteractionLog, UserInterestProfile, AuthorAffinityScore,
     PostQualityScore, FeedImpression,
 )
-from models.page_views import PageView
+from models.page_views import PageView, PageViewRollup, PageViewRollupDimension
 from models.whatsapp import WAConversation, WAMessage
 from models.wa_message_log import WAMessageLog
 from models.phone_whatsapp import PhoneWhatsAppStatus
@@ -121,5 +124,8 @@ from models.reminder_automations import (
 )
 from models.contributor_import_jobs import ContributorImportJob
 from models.member_import_jobs import MemberImportJob
+from models.admin_report_jobs import AdminReportJob
+from models.payment_rollups import PaymentDailyRollup
+from models import admin_counters  # noqa: F401  (session hooks)
 from models.event_cards import CardTemplate, EventCard, SentEventCard
 from models.card_url_mapping import CardUrlMapping
@@ -0,0 +1,117 @@
+"""Admin dashboard counters kept in step with ORM writes.
+
+``GET /admin/stats`` and ``/admin/stats/extended`` read their totals from
+one Redis hash (``services.admin_counters``) instead of counting the
+tables on every load. Each counter in ``COUNTERS`` counts the rows of one
+model, optionally only those whose ``attr`` value is in ``values``.
+
+The session hooks below work out, per flush, how many rows entered or left
+each counter — inserts and deletes, and updates that move ``attr`` in or
+out of ``values`` — and apply the net deltas once the transaction commits.
+Bulk ``query.update()`` / ``delete()`` calls bypass the ORM and are picked
+up by the periodic reconcile in ``tasks.admin_counters``.
+"""
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+# counter name -> (model, attr, values)
+COUNTERS = {
+    "total_users":         ("User", None, None),
+    "total_events":        ("Event", None, None),
+    "total_services":      ("UserService", None, None),
+    "pending_kyc":         ("UserServiceVerification", "verification_status", {"pending"}),
+    "open_tickets":        ("SupportTicket", "status", {"open"}),
+    "active_chats":        ("LiveChatSession", "status", {"active"}),
+    "waiting_chats":       ("LiveChatSession", "status", {"waiting"}),
+    "total_posts":         ("UserFeed", "is_active", {True}),
+    "total_moments":       ("UserMoment", "is_active", {True}),
+    "total_communities":   ("Community", None, None),
+    "total_bookings":      ("ServiceBookingRequest", None, None),
+    "pending_bookings":    ("ServiceBookingRequest", "status", {"pending"}),
+    "pending_card_orders": ("NuruCardOrder", "status", {"pending"}),
+}
+
+
+@lru_cache(maxsize=1)
+def counter_specs() -> tuple:
+    """``(name, model class, attr, values)`` for every counter."""
+    import models
+
+    return tuple(
+        (name, getattr(models, model), attr, values)
+        for name, (model, attr, values) in COUNTERS.items()
+    )
+
+
+def _normalise(value):
+    return getattr(value, "value", value)
+
+
+def _default(model, attr):
+    default = model.__table__.c[attr].default
+    return default.arg if default is not None and default.is_scalar else None
+
+
+def _matches(values, value) -> bool:
+    return values is None or _normalise(value) in values
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Incremental deltas, applied after commit.
+# ─────────────────────────────────────────────────────────────────────
+_DELTAS_KEY = "admin_counter_deltas"
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_counter_deltas(session, flush_context, instances):  # noqa: ANN001
+    deltas = None
+
+    def bump(name, n):
+        nonlocal deltas
+        if deltas is None:
+            deltas = session.info.setdefault(_DELTAS_KEY, {})
+        deltas[name] = deltas.get(name, 0) + n
+
+    specs = counter_specs()
+    for obj in session.new:
+        for name, model, attr, values in specs:
+            if isinstance(obj, model):
+                value = getattr(obj, attr) if attr else None
+                if attr and value is None:
+                    value = _default(model, attr)
+                if _matches(values, value):
+                    bump(name, 1)
+
+    for obj in session.deleted:
+        for name, model, attr, values in specs:
+            if isinstance(obj, model) and _matches(values, getattr(obj, attr) if attr else None):
+                bump(name, -1)
+
+    for obj in session.dirty:
+        for name, model, attr, values in specs:
+            if not attr or not isinstance(obj, model):
+                continue
+            hist = get_history(obj, attr)
+            # Without the previous value the move can't be told apart
+            # from a no-op; the reconcile corrects it.
+            if hist.added and hist.deleted:
+                moved = _matches(values, hist.added[0]) - _matches(values, hist.deleted[0])
+                if moved:
+                    bump(name, moved)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_counter_deltas(session):  # noqa: ANN001
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        from services.admin_counters import apply_deltas
+
+        apply_deltas(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_counter_deltas(session):  # noqa: ANN001
+    session.info.pop(_DELTAS_KEY, None)
@@ -0,0 +1,39 @@
+"""Background finance report job.
+
+``GET /admin/payments/reports?format=pdf`` no longer renders the PDF in the
+request: it records an ``AdminReportJob`` and ``tasks.admin_reports``
+writes the file to ``services.admin_reports.REPORT_OUTPUT_DIR``. The
+dashboard polls ``/reports/jobs`` for finished reports, and a fresh
+completed job is handed back for repeat requests of the same (type, range).
+"""
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from core.base import Base
+
+
+class AdminReportJob(Base):
+    __tablename__ = "admin_report_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    report_type = Column(String(64), nullable=False)
+    date_from = Column(Date, nullable=False)
+    date_to = Column(Date, nullable=False)
+    format = Column(String(16), nullable=False, default="pdf")
+    # status: queued | processing | completed | failed
+    status = Column(String(32), nullable=False, default="queued")
+    requested_by = Column(UUID(as_uuid=True), ForeignKey("admin_users.id", ondelete="SET NULL"), nullable=True)
+
+    row_count = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_admin_report_jobs_range", "report_type", "date_from", "date_to", "format", "created_at"),
+        Index("idx_admin_report_jobs_requested_by", "requested_by", "created_at"),
+    )
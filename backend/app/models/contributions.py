@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Numeric, Text, Enum, UniqueConstraint, Index
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Numeric, Text, Enum, UniqueConstraint, Index, literal_column, Computed
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, deferred, relationship
 from sqlalchemy.sql import func
 from core.base import Base
 from models.enums import PaymentMethodEnum, ContributionStatusEnum
+from models.phone_keys import track_phone_key
 
 
 # ──────────────────────────────────────────────
@@ -24,6 +25,8 @@ class UserContributor(Base):
     common_name = Column(Text, nullable=True)
     email = Column(Text)
     phone = Column(Text)
+    # Last 9 digits of ``phone`` — see models/phone_keys.py.
+    phone_key = Column(Text, nullable=True, index=True)
     notes = Column(Text)
     # Default secondary contact + notification routing (comms-only). These act
     # as defaults when the contributor is added to an event; the per-event
@@ -33,9 +36,17 @@ class UserContributor(Base):
     notify_target = Column(Text, nullable=False, server_default='primary')
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Name, email and phone digits for utils.search (trigram-indexed).
+    search_document = deferred(Column(Text, Computed(
+        "lower(coalesce(name, '') || ' ' || coalesce(email, '') || ' ' || regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g'))",
+        persisted=True,
+    )))
 
     __table_args__ = (
         UniqueConstraint('user_id', 'phone', name='uq_user_contributor_phone'),
+        Index('idx_user_contributors_owner_phone_key', 'user_id', 'phone_key'),
+        Index('idx_user_contributors_search_trgm', 'search_document',
+              postgresql_using='gin', postgresql_ops={'search_document': 'gin_trgm_ops'}),
     )
 
     # Relationships
@@ -44,6 +55,9 @@ class UserContributor(Base):
     event_contributors = relationship("EventContributor", back_populates="contributor")
 
 
+track_phone_key(UserContributor, "phone")
+
+
 class EventContributionTarget(Base):
     __tablename__ = 'event_contribution_targets'
 
@@ -84,11 +98,24 @@ class EventContributor(Base):
     share_token_revoked_at = Column(DateTime, nullable=True)
     share_link_last_opened_at = Column(DateTime, nullable=True)
     share_link_sms_last_sent_at = Column(DateTime, nullable=True)
+    # Running totals over this contributor's contributions, refreshed in the
+    # writing transaction by services.event_totals (see the session hooks in
+    # models/event_contribution_totals.py). total_paid counts confirmed and
+    # legacy NULL-status rows; last_payment_at is the latest confirmed one.
+    total_paid = Column(Numeric, nullable=False, server_default='0', default=0)
+    total_pending = Column(Numeric, nullable=False, server_default='0', default=0)
+    last_payment_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # Unclamped (negative when over-paid) so it can be sorted and filtered in
+    # SQL against idx_event_contributors_event_balance.
+    # The literal 0 (not a bind param) lets the planner match the index.
+    balance = column_property(func.coalesce(pledge_amount, literal_column("0")) - total_paid)
+
     __table_args__ = (
         UniqueConstraint('event_id', 'contributor_id', name='uq_event_contributor'),
+        Index('idx_event_contributors_event_balance', event_id, func.coalesce(pledge_amount, literal_column("0")) - total_paid),
     )
 
     # Relationships
@@ -32,7 +32,10 @@ class ContributorImportJob(Base):
     successful_rows = Column(Integer, nullable=False, default=0)
     failed_rows = Column(Integer, nullable=False, default=0)
 
+    # Rows posted as JSON live in ``payload``; spreadsheet uploads are staged
+    # on disk (utils/import_files.py) and streamed by the worker instead.
     payload = Column(JSONB, nullable=False)
+    source_path = Column(Text, nullable=True)
     errors = Column(JSONB, nullable=False, default=list)
     error_message = Column(Text, nullable=True)
 
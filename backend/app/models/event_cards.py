@@ -64,5 +64,6 @@ class SentEventCard(Base):
     __table_args__ = (
         Index("idx_sent_event_cards_event_contrib_sent", "event_id", "contributor_id", "sent_at"),
         Index("idx_sent_event_cards_event_guest_sent", "event_id", "guest_attendee_id", "sent_at"),
+        Index("idx_sent_event_cards_whatsapp_message_id", "whatsapp_message_id"),
     )
 
@@ -0,0 +1,110 @@
+"""Per-event contribution aggregates.
+
+One row per event, holding the totals every contributor screen shows in
+its summary block. Rows are recomputed inside the same transaction as the
+write that changed them (see the session hooks below), so readers get the
+summary in a single primary-key lookup instead of loading every
+``EventContributor`` with its contributions.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from core.base import Base
+
+
+class EventContributionTotals(Base):
+    __tablename__ = "event_contribution_totals"
+
+    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+
+    total_pledged = Column(Numeric, nullable=False, default=0)
+    # Confirmed (or legacy NULL-status) contributions only.
+    total_paid = Column(Numeric, nullable=False, default=0)
+    # Contributions awaiting organiser confirmation.
+    total_pending = Column(Numeric, nullable=False, default=0)
+    # Sum of per-contributor max(0, pledge - paid) — over-payers don't offset others.
+    total_balance = Column(Numeric, nullable=False, default=0)
+
+    contributor_count = Column(Integer, nullable=False, default=0)
+    confirmed_count = Column(Integer, nullable=False, default=0)
+    pending_count = Column(Integer, nullable=False, default=0)
+    rejected_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Keep these rows, and the running totals on each EventContributor, in
+# step with every ORM write path (manual recording, confirm / reject,
+# deletes, payment callbacks, self-contribute, claims) without touching
+# each call site: remember which events and event contributors a flush
+# touched and recompute them just before the transaction commits. Core
+# bulk statements bypass this and must call ``services.event_totals``
+# themselves.
+#
+# An event is locked the first time a flush marks it dirty, before that
+# flush writes (and row-locks) any of its contributors, so every writer
+# takes the event lock ahead of contributor locks and two transactions
+# on one event queue up instead of deadlocking.
+# ─────────────────────────────────────────────────────────────────────
+_DIRTY_KEY = "event_totals_dirty"
+_DIRTY_LINKS_KEY = "event_contributor_totals_dirty"
+_LOCKED_KEY = "event_totals_locked"
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_dirty_events(session, flush_context, instances):  # noqa: ANN001
+    from models.contributions import EventContribution, EventContributor, UserContributor
+
+    dirty = session.info.setdefault(_DIRTY_KEY, set())
+    dirty_links = session.info.setdefault(_DIRTY_LINKS_KEY, set())
+    contributor_ids = []
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (EventContribution, EventContributor)):
+            if obj.event_id:
+                dirty.add(obj.event_id)
+            if isinstance(obj, EventContribution) and obj.event_contributor_id:
+                dirty_links.add(obj.event_contributor_id)
+        elif isinstance(obj, UserContributor) and obj in session.deleted and obj.id:
+            # Deletes cascade to event links in the database.
+            contributor_ids.append(obj.id)
+    if contributor_ids:
+        with session.no_autoflush:
+            rows = session.query(EventContributor.event_id).filter(
+                EventContributor.contributor_id.in_(contributor_ids)
+            ).distinct().all()
+        dirty.update(r[0] for r in rows)
+
+    locked = session.info.setdefault(_LOCKED_KEY, set())
+    unlocked = dirty - locked
+    if unlocked:
+        from services.event_totals import lock_events
+        with session.no_autoflush:
+            lock_events(session, unlocked)
+        locked.update(unlocked)
+
+
+@event.listens_for(Session, "before_commit")
+def _recompute_dirty_events(session):  # noqa: ANN001
+    if not session.info.get(_DIRTY_KEY) and not session.info.get(_DIRTY_LINKS_KEY):
+        return
+    session.flush()
+    link_ids = session.info.pop(_DIRTY_LINKS_KEY, set())
+    event_ids = session.info.pop(_DIRTY_KEY, set())
+    session.info.pop(_LOCKED_KEY, None)
+    from services.event_totals import recompute_event_totals, refresh_contributor_totals
+    # The flushes already hold these events' locks. Contributor running
+    # totals first: the event row is summed from them.
+    if link_ids:
+        refresh_contributor_totals(session, link_ids)
+    if event_ids:
+        recompute_event_totals(session, event_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_events(session):  # noqa: ANN001
+    session.info.pop(_DIRTY_KEY, None)
+    session.info.pop(_DIRTY_LINKS_KEY, None)
+    session.info.pop(_LOCKED_KEY, None)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Integer, Numeric, Text, Enum, String, Index
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Integer, Numeric, Text, Enum, String, Index, Computed
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from core.base import Base
 from models.enums import EventStatusEnum, PriorityLevelEnum, TicketApprovalStatusEnum
@@ -84,6 +84,10 @@ class Event(Base):
     contribution_payment_instructions = Column(Text, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Name + location for utils.search (trigram-indexed).
+    search_document = deferred(Column(Text, Computed(
+        "lower(coalesce(name, '') || ' ' || coalesce(location, ''))", persisted=True,
+    )))
 
     __table_args__ = (
         # Hot paths: list user's events newest-first, filter by status
@@ -96,6 +100,8 @@ class Event(Base):
         Index('idx_events_ticket_approval_status', 'ticket_approval_status'),
         # Created_at desc for chronological sweeps
         Index('idx_events_created_at', 'created_at'),
+        Index('idx_events_search_trgm', 'search_document',
+              postgresql_using='gin', postgresql_ops={'search_document': 'gin_trgm_ops'}),
     )
 
     # Relationships
@@ -4,6 +4,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.base import Base
 from models.enums import RSVPStatusEnum, GuestTypeEnum
+from models.phone_keys import track_phone_key
 
 
 # ──────────────────────────────────────────────
@@ -49,6 +50,8 @@ class EventAttendee(Base):
     contributor_id = Column(UUID(as_uuid=True), ForeignKey('user_contributors.id', ondelete='SET NULL'), nullable=True)
     guest_name = Column(Text, nullable=True)
     guest_phone = Column(Text, nullable=True)
+    # Last 9 digits of ``guest_phone`` — see models/phone_keys.py.
+    phone_key = Column(Text, nullable=True, index=True)
     guest_email = Column(Text, nullable=True)
     # Optional display label used on invitation cards. Falls back to the
     # resolved full name when blank. See alembic cafe27052400.
@@ -73,6 +76,9 @@ class EventAttendee(Base):
     plus_ones = relationship("EventGuestPlusOne", back_populates="attendee")
 
 
+track_phone_key(EventAttendee, "guest_phone")
+
+
 class AttendeeProfile(Base):
     __tablename__ = 'attendee_profiles'
 
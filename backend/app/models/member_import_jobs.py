@@ -5,7 +5,7 @@ uploads triggered from the event manager UI. Rows are dropped onto a Celery
 task so the request returns immediately and the organiser can poll for
 progress and the final summary.
 
-The accepted CSV layouts are:
+The accepted CSV / XLSX layouts are:
 
   • mode='committee' → columns: s/n, full name, phone
   • mode='guests'    → columns: s/n, full name, phone, common name
@@ -52,10 +52,12 @@ class MemberImportJob(Base):
     invalid_phone_rows = Column(Integer, nullable=False, default=0)
     failed_rows = Column(Integer, nullable=False, default=0)
 
-    # Original parsed rows (small enough — CSVs are tens to a few thousand
-    # rows). Stored as JSONB so the worker can pick them up without needing
-    # a file handle that may not survive the request boundary.
+    # Upload metadata (filename). The raw CSV / XLSX is staged on disk at
+    # ``source_path`` (utils/import_files.py) and streamed by the worker, so
+    # the job row stays small however large the sheet is. Jobs queued
+    # before staging existed carry their parsed rows in ``payload["rows"]``.
     payload = Column(JSONB, nullable=False)
+    source_path = Column(Text, nullable=True)
     errors = Column(JSONB, nullable=False, default=list)
     error_message = Column(Text, nullable=True)
 
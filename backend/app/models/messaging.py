@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, Enum, Index
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, Enum, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -26,14 +26,30 @@ class Conversation(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    # Mirrors existing DB indexes (idx_conversations_user_one/two/service) and
-    # adds composite (user_*, updated_at) for inbox listings sorted by recency.
+    # Inbox preview, maintained by the send / delete paths in
+    # api/routes/messages.py so the conversation list never scans messages.
+    # Plain pointers (no FK): messages are only soft-deleted, and an FK back
+    # to messages would make the two tables mutually dependent.
+    last_message_id = Column(UUID(as_uuid=True))
+    last_message_text = Column(Text)
+    last_message_sender_id = Column(UUID(as_uuid=True))
+    last_message_at = Column(DateTime)
+    previous_message_id = Column(UUID(as_uuid=True))
+    # Unread messages *for* each participant (sent by the other one).
+    user_one_unread = Column(Integer, nullable=False, server_default="0", default=0)
+    user_two_unread = Column(Integer, nullable=False, server_default="0", default=0)
+
+    # Mirrors existing DB indexes (idx_conversations_user_one/two/service);
+    # (user_*, updated_at, id) serve the keyset-paginated inbox and the
+    # trigram index its search on the last message.
     __table_args__ = (
         Index('idx_conversations_user_one', 'user_one_id'),
         Index('idx_conversations_user_two', 'user_two_id'),
         Index('idx_conversations_service', 'service_id'),
-        Index('idx_conversations_user_one_updated', 'user_one_id', 'updated_at'),
-        Index('idx_conversations_user_two_updated', 'user_two_id', 'updated_at'),
+        Index('idx_conversations_user_one_inbox', 'user_one_id', 'updated_at', 'id'),
+        Index('idx_conversations_user_two_inbox', 'user_two_id', 'updated_at', 'id'),
+        Index('idx_conversations_last_message_trgm', 'last_message_text',
+              postgresql_using='gin', postgresql_ops={'last_message_text': 'gin_trgm_ops'}),
     )
 
     # Relationships
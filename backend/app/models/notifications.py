@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, Enum, Index, event
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Text, Enum, Index, event, inspect
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 from core.base import Base
 from models.enums import NotificationTypeEnum
@@ -42,17 +42,7 @@ class Notification(Base):
 # ─────────────────────────────────────────────────────────────────────
 @event.listens_for(Notification, "after_insert")
 def _fanout_push_on_notification_insert(mapper, connection, target):  # noqa: ANN001
-    # 1) Bust the recipient's cached notifications page + unread count so the
-    #    in-app badge / list reflects new items immediately (no 30-60s stale
-    #    window). Best-effort — Redis may be unavailable on Vercel.
-    try:
-        from core.redis import invalidate_user_notifications
-        if target.recipient_id:
-            invalidate_user_notifications(str(target.recipient_id))
-    except Exception as _e:  # noqa: BLE001
-        pass
-
-    # 2) Fan-out push notification to the recipient's devices.
+    # Cache invalidation and unread counters run after commit (below).
     try:
         from utils.fcm import send_push_async
         from utils.notification_titles import title_for_notification
@@ -90,3 +80,40 @@ def _fanout_push_on_notification_insert(mapper, connection, target):  # noqa: AN
         )
     except Exception as _e:  # noqa: BLE001
         print(f"[notifications] auto push fan-out skipped: {_e}")
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Unread counters + real-time fan-out. New notifications are collected
+# per flush and handed to services.unread_counters once the transaction
+# commits, so a rolled-back insert never bumps a badge and a client that
+# refetches on ``notification.created`` always sees the row.
+# ─────────────────────────────────────────────────────────────────────
+_NEW_KEY = "notifications_new"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_notifications(session, flush_context):  # noqa: ANN001
+    new = [obj for obj in session.new if isinstance(obj, Notification) and obj.recipient_id]
+    if new:
+        from services.unread_counters import snapshot_notification
+
+        session.info.setdefault(_NEW_KEY, []).extend(
+            snapshot_notification(inspect(obj).dict) for obj in new
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_new_notifications(session):  # noqa: ANN001
+    snapshots = session.info.pop(_NEW_KEY, None)
+    if snapshots:
+        try:
+            from services.unread_counters import notifications_committed
+
+            notifications_committed(snapshots)
+        except Exception as _e:  # noqa: BLE001
+            print(f"[notifications] unread fan-out skipped: {_e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_new_notifications(session):  # noqa: ANN001
+    session.info.pop(_NEW_KEY, None)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime
+from sqlalchemy import Column, Text, DateTime, Integer, String, LargeBinary, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from core.base import Base
@@ -18,3 +18,47 @@ class PageView(Base):
     session_id = Column(Text)
     visitor_id = Column(Text)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+class PageViewRollup(Base):
+    """Per-hour / per-day traffic totals built by ``tasks.analytics``.
+
+    ``visitor_hll`` / ``session_hll`` are HyperLogLog sketches
+    (``utils.hll``) so unique visitors and sessions can be merged across
+    any range of buckets without re-reading ``page_views``.
+    """
+    __tablename__ = 'page_view_rollups'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    granularity = Column(String(8), nullable=False)  # hour | day
+    bucket_start = Column(DateTime, nullable=False)  # UTC
+    views = Column(Integer, nullable=False, default=0)
+    visitors = Column(Integer, nullable=False, default=0)
+    sessions = Column(Integer, nullable=False, default=0)
+    visitor_hll = Column(LargeBinary, nullable=True)
+    session_hll = Column(LargeBinary, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('granularity', 'bucket_start', name='uq_page_view_rollup_bucket'),
+    )
+
+
+class PageViewRollupDimension(Base):
+    """View counts per path / device / browser for one rollup bucket."""
+    __tablename__ = 'page_view_rollup_dimensions'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    granularity = Column(String(8), nullable=False)  # hour | day
+    bucket_start = Column(DateTime, nullable=False)
+    dimension = Column(String(16), nullable=False)  # path | device | browser
+    value = Column(Text, nullable=False)
+    views = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            'granularity', 'bucket_start', 'dimension', 'value',
+            name='uq_page_view_rollup_dimension',
+        ),
+        Index('idx_page_view_rollup_dims_lookup', 'granularity', 'dimension', 'bucket_start'),
+    )
@@ -0,0 +1,98 @@
+"""Daily payment totals per (country, currency, target type, status).
+
+The finance dashboard and the collection reports used to aggregate
+``transactions`` on every request with ``func.date(...)`` filters that no
+index can serve. ``services.payment_rollups`` keeps one row per day and
+dimension tuple instead, for two date bases:
+
+  * ``completed`` — bucketed by ``completed_at`` (collections, revenue)
+  * ``created``   — bucketed by ``created_at`` (failure / status mix)
+
+A day's rows are always rebuilt from ``transactions`` as a whole, never
+incremented, so a rebuild is idempotent and repairs any drift. Days are
+queued for rebuild by the session hooks below as transactions change;
+``tasks.payment_rollups`` drains that queue every minute and re-checks the
+last few days nightly.
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Integer, Numeric, String, UniqueConstraint, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.sql import func
+
+from core.base import Base
+
+
+class PaymentDailyRollup(Base):
+    __tablename__ = "payment_daily_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    day = Column(Date, nullable=False)
+    basis = Column(String(16), nullable=False)  # completed | created
+    country_code = Column(String(2), nullable=False)
+    currency_code = Column(String(3), nullable=False)
+    target_type = Column(String(32), nullable=False)
+    status = Column(String(16), nullable=False)
+
+    tx_count = Column(Integer, nullable=False, default=0)
+    gross = Column(Numeric(16, 2), nullable=False, default=0)
+    commission = Column(Numeric(16, 2), nullable=False, default=0)
+    net = Column(Numeric(16, 2), nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "day", "basis", "country_code", "currency_code", "target_type", "status",
+            name="uq_payment_daily_rollup",
+        ),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Incremental refresh. A flush that inserts, changes or deletes a
+# transaction records the days it touches on either basis — including
+# the day it used to be completed on, if ``completed_at`` moved — and
+# once the transaction commits those days are queued for a rebuild.
+# ─────────────────────────────────────────────────────────────────────
+_DIRTY_KEY = "payment_rollups_dirty"
+
+
+def _days_of(obj, attr: str, default=None) -> set:
+    # Loads an expired attribute, so the old day is known even when the
+    # row was committed earlier in this session.
+    hist = get_history(obj, attr)
+    values = list(hist.added) + list(hist.deleted) + list(hist.unchanged)
+    if not values and default is not None:
+        values = [default]
+    return {v.date() for v in values if isinstance(v, datetime)}
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_transaction_days(session, flush_context, instances):  # noqa: ANN001
+    from models.payments import Transaction
+
+    dirty = None
+    now = datetime.utcnow()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, Transaction):
+            continue
+        days = _days_of(obj, "created_at", default=now) | _days_of(obj, "completed_at")
+        if dirty is None:
+            dirty = session.info.setdefault(_DIRTY_KEY, set())
+        dirty.update(days)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_rollup_refresh(session):  # noqa: ANN001
+    days = session.info.pop(_DIRTY_KEY, None)
+    if days:
+        from services.payment_rollups import mark_days_dirty
+
+        mark_days_dirty(days)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_transaction_days(session):  # noqa: ANN001
+    session.info.pop(_DIRTY_KEY, None)
@@ -255,6 +255,9 @@ class Transaction(Base):
         Index("ix_transaction_target", "target_type", "target_id"),
         Index("ix_transaction_status_created", "status", "created_at"),
         Index("ix_transaction_external_ref", "external_reference"),
+        # Range scans behind the daily payment rollups.
+        Index("ix_transaction_completed_at", "completed_at"),
+        Index("ix_transaction_created_at", "created_at"),
     )
 
 
@@ -0,0 +1,28 @@
+"""Keep the persisted ``phone_key`` column in sync with its source phone.
+
+``phone_key`` holds the last 9 digits of a phone number and is indexed so
+lookups like "every row for this subscriber" are index seeks instead of
+``regexp_replace`` / leading-wildcard ``ilike`` scans. The ORM hooks below
+fill it on every insert/update made through a mapped instance; Core-level
+bulk statements (``insert()``/``update()`` with value lists) bypass mapper
+events and must set ``phone_key`` explicitly via
+``utils.phone_numbers.phone_key``.
+"""
+from sqlalchemy import event
+
+from utils.phone_numbers import phone_key
+
+
+def track_phone_key(model, *sources: str) -> None:
+    """Fill ``model.phone_key`` from the first non-empty ``sources`` attribute."""
+
+    def _sync(mapper, connection, target):  # noqa: ANN001
+        raw = None
+        for attr in sources:
+            raw = getattr(target, attr, None)
+            if raw:
+                break
+        target.phone_key = phone_key(raw)
+
+    event.listen(model, "before_insert", _sync)
+    event.listen(model, "before_update", _sync)
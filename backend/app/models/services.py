@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Integer, Numeric, Text, Enum, UniqueConstraint, CheckConstraint, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import event, Column, Boolean, ForeignKey, DateTime, Integer, Numeric, Text, Enum, UniqueConstraint, CheckConstraint, Index, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import Session, deferred, relationship
 from sqlalchemy.sql import func
 from core.base import Base
 from models.enums import (
@@ -38,8 +38,18 @@ class UserService(Base):
     business_phone_id = Column(UUID(as_uuid=True), ForeignKey('service_business_phones.id', ondelete='SET NULL'))
     is_active = Column(Boolean, default=True)
     years_in_business = Column(Integer)
+    # Maintained from user_service_ratings by the session hooks below.
+    rating_avg = Column(Numeric(3, 2), nullable=False, default=0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # utils.search: trigram document for the title, full-text vector for
+    # title (weight A) + description (weight B).
+    search_document = deferred(Column(Text, Computed("lower(coalesce(title, ''))", persisted=True)))
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+        persisted=True,
+    )))
 
     __table_args__ = (
         # Owner's services — newest first
@@ -49,6 +59,11 @@ class UserService(Base):
         Index('idx_user_services_active_type', 'is_active', 'service_type_id'),
         # Verified providers list
         Index('idx_user_services_verified_active', 'is_verified', 'is_active'),
+        Index('idx_user_services_search_trgm', 'search_document',
+              postgresql_using='gin', postgresql_ops={'search_document': 'gin_trgm_ops'}),
+        Index('idx_user_services_search_vector', 'search_vector', postgresql_using='gin'),
+        # Radius search: bounding-box prefilter (services.service_ranking)
+        Index('idx_user_services_lat_lng', 'latitude', 'longitude'),
     )
 
     # Relationships
@@ -281,3 +296,37 @@ class ServiceBusinessPhone(Base):
     # Relationships
     user = relationship("User")
     services = relationship("UserService", back_populates="business_phone")
+
+
+# ──────────────────────────────────────────────
+# Denormalized rating aggregates
+# ──────────────────────────────────────────────
+# ``UserService.rating_avg`` / ``rating_count`` are recomputed just before
+# commit for every service whose ratings a flush added, changed or removed,
+# so search can rank and sort on them without loading the ratings.
+_RATINGS_DIRTY_KEY = "service_ratings_dirty"
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_rated_services(session, flush_context, instances):  # noqa: ANN001
+    dirty = None
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, UserServiceRating) and obj.user_service_id:
+            if dirty is None:
+                dirty = session.info.setdefault(_RATINGS_DIRTY_KEY, set())
+            dirty.add(obj.user_service_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_rated_services(session):  # noqa: ANN001
+    if not session.info.get(_RATINGS_DIRTY_KEY):
+        return
+    session.flush()
+    service_ids = session.info.pop(_RATINGS_DIRTY_KEY, set())
+    from services.service_ranking import refresh_service_ratings
+    refresh_service_ratings(session, service_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rated_services(session):  # noqa: ANN001
+    session.info.pop(_RATINGS_DIRTY_KEY, None)
@@ -0,0 +1,162 @@
+"""Per-user "Contribution Insights" snapshot.
+
+One row per Nuru user holding everything the mobile Insights screen shows
+for their giving history: totals in the dominant currency, counters, the
+full monthly payment series, method mix and top organisers. The screen
+reads it with one primary-key lookup; only the parts that depend on
+"now" (the trailing 12-month window, the streak, the impact message) are
+derived from the stored series at read time.
+
+Rows are rebuilt per user by ``services.contribution_insights`` whenever a
+contribution linked to that user is recorded, confirmed, rejected or
+deleted, a pledge / address-book link moves, or an event they gave to or
+their own phone changes (see the session hooks below).
+"""
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, Numeric, Text, event, inspect
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from core.base import Base
+from utils.phone_numbers import phone_key
+
+
+class UserContributionInsights(Base):
+    __tablename__ = "user_contribution_insights"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    # Figures below are restricted to events in this currency.
+    currency = Column(Text, nullable=False, default="TZS")
+    total_pledged = Column(Numeric, nullable=False, default=0)
+    total_paid = Column(Numeric, nullable=False, default=0)
+    total_pending = Column(Numeric, nullable=False, default=0)
+    total_balance = Column(Numeric, nullable=False, default=0)
+
+    events_count = Column(Integer, nullable=False, default=0)
+    complete_count = Column(Integer, nullable=False, default=0)
+    active_count = Column(Integer, nullable=False, default=0)
+    pending_count = Column(Integer, nullable=False, default=0)
+    payments_count = Column(Integer, nullable=False, default=0)
+    organisations_supported = Column(Integer, nullable=False, default=0)
+
+    avg_per_event = Column(Float, nullable=False, default=0)
+    on_time_rate = Column(Float, nullable=False, default=0)
+    first_contribution_at = Column(DateTime, nullable=True)
+    last_contribution_at = Column(DateTime, nullable=True)
+
+    # {"amount", "currency", "event_id", "event_name", "contributed_at"}
+    biggest_contribution = Column(JSONB, nullable=True)
+    # {"YYYY-MM": {"amount": float, "count": int}} in EAT, every month with a payment.
+    monthly = Column(JSONB, nullable=False, default=dict)
+    by_method = Column(JSONB, nullable=False, default=list)
+    top_organisers = Column(JSONB, nullable=False, default=list)
+
+    # Set in the writing transaction; the rebuild clears it.
+    stale = Column(Boolean, nullable=False, default=False, server_default="false")
+    computed_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Invalidation. A flush that touches a contribution, an event-contributor
+# link, an address-book entry's owner / phone, an event's name, start
+# date, currency or organiser (or deletes the event), or a user's phone /
+# currency marks the snapshot of every user it resolves to as stale
+# inside the same transaction; once the transaction commits those users
+# are queued for a rebuild. Readers
+# that still see ``stale`` rebuild inline, so a missing worker only costs
+# latency, never correctness.
+# ─────────────────────────────────────────────────────────────────────
+_DIRTY_KEY = "insights_dirty"
+_PENDING_USERS_KEY = "insights_pending_users"
+
+
+def _dirty(session) -> dict:  # noqa: ANN001
+    return session.info.setdefault(_DIRTY_KEY, {
+        "links": set(), "contributors": set(), "users": set(), "phone_keys": set(),
+    })
+
+
+# Event columns a snapshot copies (name, start date) or groups by (currency,
+# organiser). Users are resolved through the event's links, so a deleted
+# event is resolved before the flush cascades its links away.
+_EVENT_FIELDS = ("name", "organizer_id", "start_date", "currency_id")
+# A user's phone decides which unclaimed address-book entries are theirs;
+# their currency is the fallback for events without one.
+_USER_FIELDS = ("phone", "currency_code")
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_dirty_insights(session, flush_context, instances):  # noqa: ANN001
+    from models.contributions import EventContribution, EventContributor, UserContributor
+    from models.events import Event
+    from models.users import User
+
+    dirty = None
+    event_ids = []
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, EventContribution):
+            if obj.event_contributor_id:
+                dirty = dirty or _dirty(session)
+                dirty["links"].add(obj.event_contributor_id)
+        elif isinstance(obj, EventContributor):
+            if obj.contributor_id:
+                dirty = dirty or _dirty(session)
+                dirty["contributors"].add(obj.contributor_id)
+        elif isinstance(obj, UserContributor) and obj.id and obj not in session.new:
+            attrs = inspect(obj).attrs
+            owner, phone = attrs.contributor_user_id.history, attrs.phone.history
+            if obj in session.deleted or owner.has_changes() or phone.has_changes():
+                dirty = dirty or _dirty(session)
+                dirty["contributors"].add(obj.id)
+                # Whoever the entry resolved to before the change loses its
+                # history, and a deleted entry can't be resolved after the flush.
+                dirty["users"].update(u for u in owner.deleted or [obj.contributor_user_id] if u)
+                dirty["phone_keys"].update(
+                    k for k in map(phone_key, phone.deleted or [obj.phone]) if k
+                )
+        elif isinstance(obj, Event) and obj.id and obj not in session.new:
+            attrs = inspect(obj).attrs
+            if obj in session.deleted or any(attrs[f].history.has_changes() for f in _EVENT_FIELDS):
+                event_ids.append(obj.id)
+        elif isinstance(obj, User) and obj.id and obj in session.dirty:
+            attrs = inspect(obj).attrs
+            if any(attrs[f].history.has_changes() for f in _USER_FIELDS):
+                dirty = dirty or _dirty(session)
+                dirty["users"].add(obj.id)
+    if event_ids:
+        with session.no_autoflush:
+            rows = session.query(EventContributor.contributor_id).filter(
+                EventContributor.event_id.in_(event_ids)
+            ).distinct().all()
+        if rows:
+            dirty = dirty or _dirty(session)
+            dirty["contributors"].update(r[0] for r in rows if r[0])
+
+
+@event.listens_for(Session, "before_commit")
+def _invalidate_dirty_insights(session):  # noqa: ANN001
+    if not session.info.get(_DIRTY_KEY):
+        return
+    session.flush()
+    dirty = session.info.pop(_DIRTY_KEY)
+    from services.contribution_insights import mark_insights_stale
+
+    user_ids = mark_insights_stale(session, **dirty)
+    if user_ids:
+        session.info.setdefault(_PENDING_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_insights_rebuild(session):  # noqa: ANN001
+    user_ids = session.info.pop(_PENDING_USERS_KEY, None)
+    if user_ids:
+        from services.contribution_insights import queue_insights_rebuild
+
+        queue_insights_rebuild(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_insights(session):  # noqa: ANN001
+    session.info.pop(_DIRTY_KEY, None)
+    session.info.pop(_PENDING_USERS_KEY, None)
@@ -0,0 +1,91 @@
+"""Precomputed "People You May Know" candidates.
+
+Up to ``services.people_suggestions.TOP_N`` rows per user, scored from the
+follow / circle / invitation / community graph by a batched SQL job, so
+``GET /users/search?suggested=true`` is one indexed read instead of five
+graph expansions per screen open.
+
+Rows are refreshed by ``tasks.suggestions``: nightly for every recently
+active user, and within minutes for users whose own edges changed (see
+the session hooks below).
+"""
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from core.base import Base
+
+
+class UserSuggestion(Base):
+    __tablename__ = "user_suggestions"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    suggested_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    score = Column(Float, nullable=False, default=0)
+    # How many of the user's followings the candidate also follows.
+    mutual_count = Column(Integer, nullable=False, default=0)
+    computed_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_user_suggestions_user_score", "user_id", "score"),
+        Index("idx_user_suggestions_suggested", "suggested_user_id"),
+    )
+
+
+class UserSuggestionRefresh(Base):
+    """When a user's candidates were last computed — recorded even when
+    there were none, so the read path can tell "no suggestions" from
+    "never computed"."""
+    __tablename__ = "user_suggestion_refreshes"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    refreshed_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Incremental refresh. A flush that adds or removes a follow, circle,
+# invitation or community membership marks the users on the edge; once
+# the transaction commits they are queued for the next refresh. Effects
+# two hops out (a friend's new follow) wait for the nightly run, and
+# the read path filters out anyone the user has since connected with.
+# ─────────────────────────────────────────────────────────────────────
+_DIRTY_KEY = "suggestions_dirty"
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_graph_changes(session, flush_context, instances):  # noqa: ANN001
+    from models.communities import CommunityMember
+    from models.invitations import EventInvitation
+    from models.users import UserCircle, UserFollower
+
+    dirty = None
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, UserFollower):
+            users = (obj.follower_id, obj.following_id)
+        elif isinstance(obj, UserCircle):
+            users = (obj.user_id, obj.circle_member_id)
+        elif isinstance(obj, EventInvitation):
+            users = (obj.invited_user_id,)
+        elif isinstance(obj, CommunityMember):
+            users = (obj.user_id,)
+        else:
+            continue
+        if dirty is None:
+            dirty = session.info.setdefault(_DIRTY_KEY, set())
+        dirty.update(u for u in users if u)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_suggestion_refresh(session):  # noqa: ANN001
+    user_ids = session.info.pop(_DIRTY_KEY, None)
+    if user_ids:
+        from services.people_suggestions import mark_suggestions_dirty
+
+        mark_suggestions_dirty(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_graph_changes(session):  # noqa: ANN001
+    session.info.pop(_DIRTY_KEY, None)
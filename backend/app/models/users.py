@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Integer, Text, Enum, UniqueConstraint, String
+from sqlalchemy import Column, Boolean, ForeignKey, DateTime, Integer, Text, Enum, UniqueConstraint, String, Computed, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from core.base import Base
+from models.phone_keys import track_phone_key
 from models.enums import (
     VerificationStatusEnum,
     OTPVerificationTypeEnum,
@@ -23,6 +24,8 @@ class User(Base):
     username = Column(Text, unique=True)
     email = Column(Text, unique=True)
     phone = Column(Text)
+    # Last 9 digits of ``phone`` — see models/phone_keys.py.
+    phone_key = Column(Text, nullable=True, index=True)
     password_hash = Column(Text)
     is_active = Column(Boolean, default=True)
     is_suspended = Column(Boolean, default=False)
@@ -35,6 +38,16 @@ class User(Base):
     account_setup_completed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Names, username, email and phone digits for utils.search (trigram-indexed).
+    search_document = deferred(Column(Text, Computed(
+        "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(username, '') || ' ' || coalesce(email, '') || ' ' || regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g'))",
+        persisted=True,
+    )))
+
+    __table_args__ = (
+        Index('idx_users_search_trgm', 'search_document',
+              postgresql_using='gin', postgresql_ops={'search_document': 'gin_trgm_ops'}),
+    )
 
     # One-to-one relationships
     profile = relationship("UserProfile", back_populates="user", uselist=False)
@@ -107,6 +120,9 @@ class User(Base):
     meeting_participations = relationship("EventMeetingParticipant", back_populates="user", foreign_keys="[EventMeetingParticipant.user_id]")
 
 
+track_phone_key(User, "phone")
+
+
 class UserProfile(Base):
     __tablename__ = 'user_profiles'
 
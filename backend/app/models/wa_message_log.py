@@ -20,6 +20,7 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 
 from core.base import Base
+from models.phone_keys import track_phone_key
 
 
 class WAMessageLog(Base):
@@ -32,6 +33,9 @@ class WAMessageLog(Base):
     recipient_phone = Column(String(32), nullable=False, index=True)
     recipient_name = Column(String(255), nullable=True, index=True)
     normalized_phone = Column(String(32), nullable=True, index=True)
+    # Last 9 digits of normalized_phone (or recipient_phone) — see
+    # models/phone_keys.py.
+    phone_key = Column(String(9), nullable=True, index=True)
     user_id = Column(UUID(as_uuid=True),
                      ForeignKey("users.id", ondelete="SET NULL"),
                      nullable=True, index=True)
@@ -114,6 +118,8 @@ class WAMessageLog(Base):
                         server_default=func.now(), onupdate=func.now())
 
 
+track_phone_key(WAMessageLog, "normalized_phone", "recipient_phone")
+
 Index("ix_wa_message_logs_status_created", WAMessageLog.status, WAMessageLog.created_at.desc())
 Index("ix_wa_message_logs_category_created", WAMessageLog.category, WAMessageLog.created_at.desc())
 Index("ix_wa_message_logs_event_created", WAMessageLog.event_id, WAMessageLog.created_at.desc())
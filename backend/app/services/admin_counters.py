@@ -0,0 +1,108 @@
+"""Admin dashboard counters in Redis (definitions in ``models.admin_counters``).
+
+``get_counters``
+    One ``HGETALL``. On a cold or partial hash (first load, Redis flushed)
+    the counts are computed and stored; with Redis down they are computed
+    on every call, as before.
+
+``apply_deltas``
+    ``HINCRBY`` for the net changes of a committed transaction. Skipped
+    while the hash doesn't exist, so a counter is never seeded from zero.
+
+``count_all`` / ``reconcile``
+    Recompute every counter. Unfiltered counters on tables past
+    ``ESTIMATE_ABOVE`` rows use the planner's ``pg_class.reltuples``
+    estimate instead of a full ``COUNT(*)``; the hooks keep the number
+    moving between reconciles.
+
+Counters are eventually exact: a delta that lands between a reconcile's
+count and its write is counted twice until the next reconcile.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from core.redis import CacheKeys, get_redis
+from models.admin_counters import COUNTERS, counter_specs
+
+ESTIMATE_ABOVE = 1_000_000
+
+
+def _estimate(db: Session, table: str) -> int:
+    # reltuples is -1 for a table that has never been analysed.
+    n = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"), {"t": table},
+    ).scalar()
+    return int(n) if n is not None else -1
+
+
+def count_all(db: Session) -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    for name, model, attr, values in counter_specs():
+        if attr is None:
+            estimate = _estimate(db, model.__tablename__)
+            if estimate >= ESTIMATE_ABOVE:
+                out[name] = estimate
+                continue
+        q = db.query(func.count()).select_from(model)
+        if attr:
+            q = q.filter(getattr(model, attr).in_(list(values)))
+        out[name] = int(q.scalar() or 0)
+    return out
+
+
+def _store(counts: Dict[str, int]) -> None:
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.hset(CacheKeys.ADMIN_COUNTERS, mapping=counts)
+    except Exception as e:
+        print(f"[admin_counters] store failed: {e}")
+
+
+def reconcile(db: Session) -> Dict[str, int]:
+    counts = count_all(db)
+    _store(counts)
+    return counts
+
+
+def apply_deltas(deltas: Dict[str, int]) -> None:
+    deltas = {k: v for k, v in deltas.items() if v}
+    r = get_redis()
+    if not deltas or r is None:
+        return
+    try:
+        if not r.exists(CacheKeys.ADMIN_COUNTERS):
+            return
+        pipe = r.pipeline(transaction=False)
+        for name, n in deltas.items():
+            pipe.hincrby(CacheKeys.ADMIN_COUNTERS, name, n)
+        pipe.execute()
+    except Exception as e:
+        print(f"[admin_counters] apply deltas failed: {e}")
+
+
+def _cached() -> Optional[Dict[str, int]]:
+    r = get_redis()
+    if r is None:
+        return None
+    try:
+        raw = r.hgetall(CacheKeys.ADMIN_COUNTERS)
+    except Exception as e:
+        print(f"[admin_counters] read failed: {e}")
+        return None
+    counts = {(k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()}
+    if not all(name in counts for name in COUNTERS):
+        return None
+    return counts
+
+
+def get_counters(db: Session) -> Dict[str, int]:
+    counts = _cached()
+    if counts is None:
+        counts = reconcile(db)
+    return {name: max(counts[name], 0) for name in COUNTERS}
@@ -1,8 +1,23 @@
 """Finance report generation — CSV (always available) + PDF (reportlab).
 
-Used by /admin/payments/reports. Each report type is a small pure builder
-that takes a SQLAlchemy session + date range and returns a list of rows
-(headers + data). Output formatters then turn rows into a streamable file.
+Used by /admin/payments/reports. Each report type is a small builder
+that takes a SQLAlchemy session + date range and returns ``(headers, rows)``
+where ``rows`` is a generator reading through a server-side cursor
+(``yield_per``), so a year-long ledger is never held in memory at once.
+Iterate the rows before the session closes. The collection and commission
+reports read the daily rollups (``services.payment_rollups``) rather than
+``transactions``.
+
+Output:
+  * CSV   — ``iter_csv_report`` streams straight to the response on its
+            own session.
+  * PDF   — rendered by ``tasks.admin_reports`` into ``REPORT_OUTPUT_DIR``
+            (``write_pdf``); the request only queues an ``AdminReportJob``.
+            A finished job is reused for the same (type, range) while
+            ``reusable_job`` considers it fresh. Without a Celery worker
+            (``DEPLOYMENT_MODE=vercel``) the route renders the PDF in the
+            request and returns it, as it did before jobs existed.
+  * JSON  — the in-app preview, cached per (type, range) in Redis.
 
 Report types:
   * daily_collections          — one row per day (gross, commission, net, tx_count)
@@ -19,15 +34,21 @@ Report types:
 
 from __future__ import annotations
 
-import csv
-import io
+import os
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Iterable
+from itertools import chain, groupby
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
-from sqlalchemy import func, and_
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from models.admin_report_jobs import AdminReportJob
+from services import payment_rollups
+from services.payment_rollups import COMPLETED_STATUSES, day_range
+from utils.import_files import iter_chunks
+
 from models.payments import Transaction, Wallet
 from models.withdrawal_requests import WithdrawalRequest
 from models.users import User
@@ -40,127 +61,100 @@ from models.enums import (
 )
 
 
+REPORT_OUTPUT_DIR = Path(os.getenv("NURU_REPORT_OUTPUT_DIR", "/tmp/nuru_reports"))
+YIELD_PER = 1000
+# A finished PDF is served again for the same (type, range) for this long;
+# ranges that end before today can't change, so they keep for a day.
+OPEN_RANGE_TTL = timedelta(minutes=15)
+CLOSED_RANGE_TTL = timedelta(hours=24)
+# A queued / processing job older than this is taken to be lost (worker
+# crash, purged broker) and is failed rather than handed out again.
+STALE_JOB_AGE = timedelta(minutes=10)
+PREVIEW_CACHE_TTL = 300
+
+
 # ──────────────────────────────────────────────
 # Builders — return (headers, rows) tuple
 # ──────────────────────────────────────────────
 
 ReportRow = list
-Report = tuple[list[str], list[ReportRow]]
+Report = tuple[list[str], Iterator[ReportRow]]
+
+
+def _stream(query) -> Iterator:
+    return iter(query.yield_per(YIELD_PER))
 
 
 def _completed_tx_query(db: Session, start: date, end: date):
+    lo, hi = day_range(start, end)
     return (
         db.query(Transaction)
         .filter(
-            Transaction.status.in_([TransactionStatusEnum.paid, TransactionStatusEnum.credited]),
-            func.date(Transaction.completed_at) >= start,
-            func.date(Transaction.completed_at) <= end,
+            Transaction.status.in_(COMPLETED_STATUSES),
+            Transaction.completed_at >= lo,
+            Transaction.completed_at < hi,
         )
     )
 
 
+def _money_cells(r: dict) -> list:
+    return [r["tx_count"], float(r["gross"]), float(r["commission"]), float(r["net"])]
+
+
+def _by_period(db: Session, start: date, end: date, label) -> Iterator[ReportRow]:
+    # Daily rollups come back in day order, so each period is one run.
+    days = payment_rollups.totals(db, start, end, group_by=("day",))
+    for period, group in groupby(days, key=lambda r: label(r["day"])):
+        group = list(group)
+        yield [period, sum(r["tx_count"] for r in group),
+               *(float(sum(r[k] for r in group)) for k in ("gross", "commission", "net"))]
+
+
 def daily_collections(db: Session, start: date, end: date) -> Report:
-    rows = (
-        _completed_tx_query(db, start, end)
-        .with_entities(
-            func.date(Transaction.completed_at).label("d"),
-            func.count(Transaction.id),
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-            func.coalesce(func.sum(Transaction.net_amount), 0),
-        )
-        .group_by("d")
-        .order_by("d")
-        .all()
-    )
+    rows = payment_rollups.totals(db, start, end, group_by=("day",))
     return (
         ["Date", "Transactions", "Gross", "Commission", "Net"],
-        [[str(r[0]), int(r[1]), float(r[2]), float(r[3]), float(r[4])] for r in rows],
+        ([str(r["day"]), *_money_cells(r)] for r in rows),
     )
 
 
 def weekly_collections(db: Session, start: date, end: date) -> Report:
-    rows = (
-        _completed_tx_query(db, start, end)
-        .with_entities(
-            func.to_char(Transaction.completed_at, "IYYY-IW").label("wk"),
-            func.count(Transaction.id),
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-            func.coalesce(func.sum(Transaction.net_amount), 0),
-        )
-        .group_by("wk")
-        .order_by("wk")
-        .all()
-    )
+    def iso_week(d: date) -> str:
+        year, week, _ = d.isocalendar()
+        return f"{year}-{week:02d}"
+
     return (
         ["ISO Week", "Transactions", "Gross", "Commission", "Net"],
-        [[r[0], int(r[1]), float(r[2]), float(r[3]), float(r[4])] for r in rows],
+        _by_period(db, start, end, iso_week),
     )
 
 
 def monthly_collections(db: Session, start: date, end: date) -> Report:
-    rows = (
-        _completed_tx_query(db, start, end)
-        .with_entities(
-            func.to_char(Transaction.completed_at, "YYYY-MM").label("m"),
-            func.count(Transaction.id),
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-            func.coalesce(func.sum(Transaction.net_amount), 0),
-        )
-        .group_by("m")
-        .order_by("m")
-        .all()
-    )
     return (
         ["Month", "Transactions", "Gross", "Commission", "Net"],
-        [[r[0], int(r[1]), float(r[2]), float(r[3]), float(r[4])] for r in rows],
+        _by_period(db, start, end, lambda d: d.strftime("%Y-%m")),
     )
 
 
 def country_breakdown(db: Session, start: date, end: date) -> Report:
-    rows = (
-        _completed_tx_query(db, start, end)
-        .with_entities(
-            Transaction.country_code,
-            Transaction.currency_code,
-            func.count(Transaction.id),
-            func.coalesce(func.sum(Transaction.gross_amount), 0),
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-            func.coalesce(func.sum(Transaction.net_amount), 0),
-        )
-        .group_by(Transaction.country_code, Transaction.currency_code)
-        .order_by(Transaction.country_code)
-        .all()
-    )
+    rows = payment_rollups.totals(db, start, end, group_by=("country_code", "currency_code"))
     return (
         ["Country", "Currency", "Transactions", "Gross", "Commission", "Net"],
-        [[r[0], r[1], int(r[2]), float(r[3]), float(r[4]), float(r[5])] for r in rows],
+        ([r["country_code"], r["currency_code"], *_money_cells(r)] for r in rows),
     )
 
 
 def commission_revenue(db: Session, start: date, end: date) -> Report:
-    rows = (
-        _completed_tx_query(db, start, end)
-        .with_entities(
-            func.date(Transaction.completed_at).label("d"),
-            Transaction.currency_code,
-            func.coalesce(func.sum(Transaction.commission_amount), 0),
-        )
-        .group_by("d", Transaction.currency_code)
-        .order_by("d")
-        .all()
-    )
+    rows = payment_rollups.totals(db, start, end, group_by=("day", "currency_code"))
     return (
         ["Date", "Currency", "Commission Earned"],
-        [[str(r[0]), r[1], float(r[2])] for r in rows],
+        ([str(r["day"]), r["currency_code"], float(r["commission"])] for r in rows),
     )
 
 
 def pending_liabilities(db: Session, start: date, end: date) -> Report:
     """Snapshot — date range is informational only; this is the live picture."""
-    rows = (
+    rows = _stream(
         db.query(
             Wallet.user_id,
             User.first_name,
@@ -173,16 +167,15 @@ def pending_liabilities(db: Session, start: date, end: date) -> Report:
         .join(User, User.id == Wallet.user_id)
         .filter(Wallet.pending_balance > 0)
         .order_by(Wallet.pending_balance.desc())
-        .all()
     )
     return (
         ["User ID", "First Name", "Last Name", "Phone", "Currency", "Pending", "Available"],
-        [[str(r[0]), r[1] or "", r[2] or "", r[3] or "", r[4], float(r[5]), float(r[6])] for r in rows],
+        ([str(r[0]), r[1] or "", r[2] or "", r[3] or "", r[4], float(r[5]), float(r[6])] for r in rows),
     )
 
 
 def completed_settlements(db: Session, start: date, end: date) -> Report:
-    rows = (
+    rows = _stream(
         db.query(WithdrawalRequest, User)
         .join(User, User.id == WithdrawalRequest.user_id)
         .filter(
@@ -191,11 +184,11 @@ def completed_settlements(db: Session, start: date, end: date) -> Report:
             func.date(WithdrawalRequest.settled_at) <= end,
         )
         .order_by(WithdrawalRequest.settled_at.desc())
-        .all()
     )
-    out = []
-    for wd, u in rows:
-        out.append([
+    return (
+        ["Request Code", "Beneficiary", "Phone", "Currency", "Amount",
+         "Method", "Provider", "Account", "External Ref", "Settled At"],
+        ([
             wd.request_code,
             (u.first_name or "") + " " + (u.last_name or ""),
             u.phone or "",
@@ -206,29 +199,26 @@ def completed_settlements(db: Session, start: date, end: date) -> Report:
             wd.payout_account_number or "",
             wd.external_reference or "",
             wd.settled_at.isoformat() if wd.settled_at else "",
-        ])
-    return (
-        ["Request Code", "Beneficiary", "Phone", "Currency", "Amount",
-         "Method", "Provider", "Account", "External Ref", "Settled At"],
-        out,
+        ] for wd, u in rows),
     )
 
 
 def failed_payments(db: Session, start: date, end: date) -> Report:
-    rows = (
+    lo, hi = day_range(start, end)
+    rows = _stream(
         db.query(Transaction, User)
         .outerjoin(User, User.id == Transaction.payer_user_id)
         .filter(
             Transaction.status == TransactionStatusEnum.failed,
-            func.date(Transaction.created_at) >= start,
-            func.date(Transaction.created_at) <= end,
+            Transaction.created_at >= lo,
+            Transaction.created_at < hi,
         )
         .order_by(Transaction.created_at.desc())
-        .all()
     )
-    out = []
-    for t, u in rows:
-        out.append([
+    return (
+        ["TX Code", "Payer", "Phone", "Country", "Currency", "Amount",
+         "Method", "Provider", "Reason", "Created At"],
+        ([
             t.transaction_code,
             (u.first_name or "") + " " + (u.last_name or "") if u else "",
             u.phone if u else "",
@@ -239,16 +229,15 @@ def failed_payments(db: Session, start: date, end: date) -> Report:
             t.provider_name or "",
             t.failure_reason or "",
             t.created_at.isoformat() if t.created_at else "",
-        ])
-    return (
-        ["TX Code", "Payer", "Phone", "Country", "Currency", "Amount",
-         "Method", "Provider", "Reason", "Created At"],
-        out,
+        ] for t, u in rows),
     )
 
 
-def _earnings_by_target(db: Session, start: date, end: date, target_type: PaymentTargetTypeEnum) -> Report:
-    rows = (
+EARNINGS_HEADERS = ["User ID", "Name", "Phone", "Currency", "Transactions", "Gross", "Commission", "Net"]
+
+
+def _iter_earnings(db: Session, start: date, end: date, target_type: PaymentTargetTypeEnum) -> Iterator[ReportRow]:
+    rows = _stream(
         _completed_tx_query(db, start, end)
         .filter(Transaction.target_type == target_type, Transaction.beneficiary_user_id.isnot(None))
         .with_entities(
@@ -261,35 +250,29 @@ def _earnings_by_target(db: Session, start: date, end: date, target_type: Paymen
         )
         .group_by(Transaction.beneficiary_user_id, Transaction.currency_code)
         .order_by(func.sum(Transaction.net_amount).desc())
-        .all()
-    )
-    if not rows:
-        return (["User ID", "Name", "Phone", "Currency", "Transactions", "Gross", "Commission", "Net"], [])
-    user_ids = [r[0] for r in rows]
-    user_map = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
-    out = []
-    for r in rows:
-        u = user_map.get(r[0])
-        name = ((u.first_name or "") + " " + (u.last_name or "")) if u else ""
-        out.append([str(r[0]), name.strip(), (u.phone if u else "") or "", r[1],
-                    int(r[2]), float(r[3]), float(r[4]), float(r[5])])
-    return (
-        ["User ID", "Name", "Phone", "Currency", "Transactions", "Gross", "Commission", "Net"],
-        out,
     )
+    # Beneficiaries are looked up one batch at a time.
+    for batch in iter_chunks(rows, YIELD_PER):
+        user_ids = {r[0] for r in batch}
+        user_map = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
+        for r in batch:
+            u = user_map.get(r[0])
+            name = ((u.first_name or "") + " " + (u.last_name or "")) if u else ""
+            yield [str(r[0]), name.strip(), (u.phone if u else "") or "", r[1],
+                   int(r[2]), float(r[3]), float(r[4]), float(r[5])]
 
 
 def vendor_earnings(db: Session, start: date, end: date) -> Report:
-    return _earnings_by_target(db, start, end, PaymentTargetTypeEnum.booking)
+    return EARNINGS_HEADERS, _iter_earnings(db, start, end, PaymentTargetTypeEnum.booking)
 
 
 def organizer_earnings(db: Session, start: date, end: date) -> Report:
-    # Aggregate event + ticket targets together.
-    h1, r1 = _earnings_by_target(db, start, end, PaymentTargetTypeEnum.event_contribution) \
-        if hasattr(PaymentTargetTypeEnum, "event_contribution") else (None, [])
-    h2, r2 = _earnings_by_target(db, start, end, PaymentTargetTypeEnum.ticket)
-    headers = h2 or h1 or ["User ID", "Name", "Phone", "Currency", "Transactions", "Gross", "Commission", "Net"]
-    return (headers, list(r1) + list(r2))
+    # Aggregate event + ticket targets together; the second query only
+    # runs once the first is exhausted.
+    targets = [PaymentTargetTypeEnum.ticket]
+    if hasattr(PaymentTargetTypeEnum, "event_contribution"):
+        targets.insert(0, PaymentTargetTypeEnum.event_contribution)
+    return EARNINGS_HEADERS, chain.from_iterable(_iter_earnings(db, start, end, t) for t in targets)
 
 
 # ──────────────────────────────────────────────
@@ -314,17 +297,28 @@ REPORTS: dict[str, tuple[str, callable]] = {
 # Output formatters
 # ──────────────────────────────────────────────
 
-def to_csv(headers: list[str], rows: list[ReportRow]) -> bytes:
-    buf = io.StringIO()
-    w = csv.writer(buf)
-    w.writerow(headers)
-    w.writerows(rows)
-    return buf.getvalue().encode("utf-8")
+def iter_csv_report(builder, start: date, end: date) -> Iterator[bytes]:
+    """CSV bytes for ``builder`` over its own session — the request's
+    session is closed before a streamed body is read."""
+    from core.database import SessionLocal
+    from utils.exports import iter_csv
 
+    db = SessionLocal()
+    try:
+        headers, rows = builder(db, start, end)
+        yield from iter_csv(headers, rows)
+    finally:
+        db.close()
 
-def to_pdf(title: str, headers: list[str], rows: list[ReportRow],
-           start: date, end: date, generated_by: str) -> bytes:
-    """Branded landscape PDF using reportlab Platypus."""
+
+PDF_TABLE_ROWS = 500
+
+
+def write_pdf(fh, title: str, headers: list[str], rows: Iterable[ReportRow],
+              start: date, end: date, generated_by: str) -> int:
+    """Branded landscape PDF using reportlab Platypus, written to ``fh``.
+    Rows are laid out in tables of ``PDF_TABLE_ROWS`` (one huge table is
+    slow to split across pages) with running totals. Returns the row count."""
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import landscape, A4
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -333,9 +327,8 @@ def to_pdf(title: str, headers: list[str], rows: list[ReportRow],
         SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
     )
 
-    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        buf,
+        fh,
         pagesize=landscape(A4),
         leftMargin=12 * mm, rightMargin=12 * mm,
         topMargin=12 * mm, bottomMargin=12 * mm,
@@ -358,44 +351,57 @@ def to_pdf(title: str, headers: list[str], rows: list[ReportRow],
     ))
     story.append(Spacer(1, 8))
 
-    if not rows:
+    # Format numbers a bit
+    def fmt(v):
+        if isinstance(v, float):
+            return f"{v:,.2f}"
+        return str(v) if v is not None else ""
+
+    base_style = [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0f172a")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8fafc")]),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#cbd5e1")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    ]
+    totals_style = [
+        ("ROWBACKGROUNDS", (0, 1), (-1, -2), [colors.white, colors.HexColor("#f8fafc")]),
+        ("BACKGROUND", (0, -1), (-1, -1), colors.HexColor("#e2e8f0")),
+        ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+    ]
+
+    count = 0
+    # Totals row over every column with numeric cells; blanks (None) and
+    # text in those columns are skipped rather than failing the job.
+    totals: dict[int, float] = {}
+    chunk: list = []
+    for row in rows:
+        for i, v in enumerate(row):
+            if isinstance(v, (int, float, Decimal)) and not isinstance(v, bool):
+                totals[i] = totals.get(i, 0) + (float(v) if isinstance(v, Decimal) else v)
+        chunk.append([fmt(c) for c in row])
+        count += 1
+        if len(chunk) == PDF_TABLE_ROWS:
+            story.append(Table([headers] + chunk, repeatRows=1, style=TableStyle(base_style)))
+            chunk = []
+
+    if not count:
         story.append(Paragraph("<i>No data in this date range.</i>", styles["Normal"]))
-    else:
-        # Format numbers a bit
-        def fmt(v):
-            if isinstance(v, float):
-                return f"{v:,.2f}"
-            return str(v) if v is not None else ""
-
-        data = [headers] + [[fmt(c) for c in row] for row in rows]
-        # Add totals row when first column is a date/period.
-        try:
-            numeric_cols = [i for i, v in enumerate(rows[0]) if isinstance(v, (int, float))]
-            if numeric_cols:
-                totals = [""] * len(headers)
-                totals[0] = "TOTAL"
-                for i in numeric_cols:
-                    totals[i] = sum((r[i] for r in rows), 0)
-                data.append([fmt(c) for c in totals])
-        except Exception:
-            pass
-
-        table = Table(data, repeatRows=1)
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0f172a")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -2), [colors.white, colors.HexColor("#f8fafc")]),
-            ("BACKGROUND", (0, -1), (-1, -1), colors.HexColor("#e2e8f0")),
-            ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#cbd5e1")),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-        ]))
-        story.append(table)
+    elif totals:
+        totals_row = [""] * len(headers)
+        totals_row[0] = "TOTAL"
+        for i, total in totals.items():
+            if i < len(headers):
+                totals_row[i] = fmt(total)
+        story.append(Table([headers] + chunk + [totals_row], repeatRows=1,
+                           style=TableStyle(base_style + totals_style)))
+    elif chunk:
+        story.append(Table([headers] + chunk, repeatRows=1, style=TableStyle(base_style)))
 
     story.append(Spacer(1, 10))
     story.append(Paragraph(
@@ -404,4 +410,64 @@ def to_pdf(title: str, headers: list[str], rows: list[ReportRow],
     ))
 
     doc.build(story)
-    return buf.getvalue()
+    return count
+
+
+# ──────────────────────────────────────────────
+# PDF jobs
+# ──────────────────────────────────────────────
+
+def report_path(job: AdminReportJob) -> Path:
+    return REPORT_OUTPUT_DIR / f"{job.report_type}-{job.date_from.isoformat()}-{job.date_to.isoformat()}-{job.id}.{job.format}"
+
+
+def reusable_job(db: Session, report_type: str, start: date, end: date, fmt: str = "pdf") -> Optional[AdminReportJob]:
+    """A queued/processing job for the same (type, range), or a completed
+    one that is still fresh (see ``OPEN_RANGE_TTL`` / ``CLOSED_RANGE_TTL``).
+
+    An unfinished job older than ``STALE_JOB_AGE`` is marked failed and not
+    returned, so one lost job can't block the report; the caller commits.
+    """
+    now = datetime.utcnow()
+    ttl = CLOSED_RANGE_TTL if end < now.date() else OPEN_RANGE_TTL
+    job = (
+        db.query(AdminReportJob)
+        .filter(
+            AdminReportJob.report_type == report_type,
+            AdminReportJob.date_from == start,
+            AdminReportJob.date_to == end,
+            AdminReportJob.format == fmt,
+            AdminReportJob.status.in_(["queued", "processing", "completed"]),
+        )
+        .order_by(AdminReportJob.created_at.desc())
+        .first()
+    )
+    if not job:
+        return None
+    if job.status != "completed":
+        if (job.started_at or job.created_at or now) >= now - STALE_JOB_AGE:
+            return job
+        job.status = "failed"
+        job.error_message = "Report job timed out"
+        job.finished_at = now
+        return None
+    if job.finished_at and job.finished_at >= now - ttl and report_path(job).exists():
+        return job
+    return None
+
+
+def job_dict(job: AdminReportJob) -> dict:
+    return {
+        "id": str(job.id),
+        "type": job.report_type,
+        "title": REPORTS[job.report_type][0] if job.report_type in REPORTS else job.report_type,
+        "format": job.format,
+        "date_from": job.date_from.isoformat(),
+        "date_to": job.date_to.isoformat(),
+        "status": job.status,
+        "row_count": job.row_count,
+        "error": job.error_message,
+        "download_url": f"/admin/payments/reports/jobs/{job.id}/download" if job.status == "completed" else None,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
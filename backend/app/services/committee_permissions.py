@@ -0,0 +1,81 @@
+"""Committee permissions per (event, user), cached in Redis.
+
+Nearly every event-management endpoint starts with a permission check
+(``_verify_event_access`` and its copies in the expenses, templates,
+offline-payments and contributors routers), which used to cost a
+membership lookup plus a ``CommitteePermission`` lookup per request.
+
+``get_member_permissions``
+    ``None`` when the user is not on the event's committee, otherwise a
+    ``MemberPermissions`` with ``member_id``, ``role`` and every stored
+    ``can_*`` flag, so existing ``perms.can_x`` / ``getattr(perms, x)``
+    checks keep working. Both answers are cached for ``PERMISSIONS_TTL``.
+
+``invalidate_member_permissions``
+    Call after committing a change to a membership, its role or its
+    permission row. The TTL bounds staleness for writes that miss it.
+
+The organizer check is not cached; callers already load the event.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from core.redis import CacheKeys, cache_get, cache_set, get_redis
+from models import CommitteePermission, CommitteeRole, EventCommitteeMember
+
+PERMISSIONS_TTL = 600
+
+PERMISSION_FIELDS = tuple(
+    c.name for c in CommitteePermission.__table__.columns if c.name.startswith("can_")
+)
+
+
+class MemberPermissions(SimpleNamespace):
+    """Cached committee membership: ``member_id``, ``role`` and the
+    ``can_*`` flags as stored (no manage-implies-view expansion)."""
+
+
+def _load(db: Session, event_id, user_id) -> Optional[dict]:
+    row = db.query(EventCommitteeMember.id, CommitteeRole.role_name, CommitteePermission).outerjoin(
+        CommitteeRole, CommitteeRole.id == EventCommitteeMember.role_id,
+    ).outerjoin(
+        CommitteePermission, CommitteePermission.committee_member_id == EventCommitteeMember.id,
+    ).filter(
+        EventCommitteeMember.event_id == event_id,
+        EventCommitteeMember.user_id == user_id,
+    ).first()
+    if row is None:
+        return None
+    member_id, role_name, perm = row
+    return {
+        "member_id": str(member_id),
+        "role": role_name,
+        **{f: bool(getattr(perm, f, False)) if perm else False for f in PERMISSION_FIELDS},
+    }
+
+
+def get_member_permissions(db: Session, event_id, user_id) -> Optional[MemberPermissions]:
+    key = CacheKeys.for_committee_permissions(str(event_id), str(user_id))
+    cached = cache_get(key)
+    if cached is None:
+        data = _load(db, event_id, user_id)
+        cached = {"member": data is not None, **(data or {})}
+        cache_set(key, cached, PERMISSIONS_TTL)
+    if not cached.get("member"):
+        return None
+    return MemberPermissions(**{k: v for k, v in cached.items() if k != "member"})
+
+
+def invalidate_member_permissions(event_id, user_ids: Iterable) -> None:
+    keys = [CacheKeys.for_committee_permissions(str(event_id), str(u)) for u in user_ids if u]
+    r = get_redis()
+    if not keys or r is None:
+        return
+    try:
+        r.delete(*keys)
+    except Exception as e:
+        print(f"[committee] permission cache invalidation failed for event {event_id}: {e}")
@@ -0,0 +1,369 @@
+"""Per-user contribution insights (``user_contribution_insights``).
+
+``GET /user-contributors/my-contributions/insights`` used to rebuild the
+whole giving history on every request. It now reads one snapshot row:
+
+``rebuild_user_insights``
+    Recomputes a user's snapshot from their ``event_contributors`` links
+    (one query, events and currencies joined) and their confirmed
+    payments (one column-only query), and upserts it with ``stale``
+    cleared. Does not commit.
+
+``mark_insights_stale``
+    Called by the session hooks in ``models.user_contribution_insights``
+    inside the writing transaction: resolves the touched links /
+    address-book entries to Nuru users (by ``contributor_user_id`` or, for
+    unclaimed entries, ``phone_key``) and flags their existing snapshots.
+    Users who never opened the screen have no row and cost nothing.
+
+``queue_insights_rebuild``
+    After commit, hands the flagged users to the Celery worker.
+
+``get_user_insights`` / ``insights_payload``
+    The read path: a primary-key lookup, rebuilt inline only when the row
+    is missing or still stale, then shaped into the response. The trailing
+    12-month window, streak and impact message depend on today's date and
+    are derived from the stored monthly series here.
+"""
+from __future__ import annotations
+
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+
+import pytz
+from sqlalchemy import or_, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models import (
+    ContributionStatusEnum, Currency, Event, EventContribution, EventContributor,
+    User, UserContributionInsights, UserContributor,
+)
+from utils.phone_numbers import phone_key
+
+EAT = pytz.timezone("Africa/Nairobi")
+TREND_MONTHS = 12
+TOP_ORGANISERS = 5
+
+_RESOLVE_USERS_SQL = text("""
+WITH touched AS (
+    SELECT unnest(CAST(:contributor_ids AS uuid[])) AS id
+    UNION
+    SELECT contributor_id FROM event_contributors
+    WHERE id = ANY(CAST(:link_ids AS uuid[]))
+)
+SELECT uc.contributor_user_id
+FROM user_contributors uc JOIN touched t ON t.id = uc.id
+WHERE uc.contributor_user_id IS NOT NULL
+UNION
+SELECT u.id
+FROM user_contributors uc
+JOIN touched t ON t.id = uc.id
+JOIN users u ON u.phone_key = uc.phone_key
+WHERE uc.contributor_user_id IS NULL AND uc.phone_key <> ''
+UNION
+SELECT id FROM users WHERE phone_key = ANY(CAST(:phone_keys AS text[]))
+UNION
+SELECT unnest(CAST(:user_ids AS uuid[]))
+""")
+
+_MARK_STALE_SQL = text("""
+UPDATE user_contribution_insights SET stale = true
+WHERE user_id = ANY(CAST(:user_ids AS uuid[]))
+RETURNING user_id
+""")
+
+
+def _ids(values: Iterable) -> list:
+    return sorted({str(v) for v in values if v})
+
+
+def mark_insights_stale(
+    db: Session,
+    links: Iterable = (),
+    contributors: Iterable = (),
+    users: Iterable = (),
+    phone_keys: Iterable = (),
+) -> Set[uuid.UUID]:
+    """Flag the snapshots of every user the given rows resolve to.
+
+    Returns the ids of users that had a snapshot. Does not commit.
+    """
+    params = {
+        "link_ids": _ids(links),
+        "contributor_ids": _ids(contributors),
+        "user_ids": _ids(users),
+        "phone_keys": _ids(phone_keys),
+    }
+    if not any(params.values()):
+        return set()
+    user_ids = _ids(r[0] for r in db.execute(_RESOLVE_USERS_SQL, params))
+    if not user_ids:
+        return set()
+    return {r[0] for r in db.execute(_MARK_STALE_SQL, {"user_ids": user_ids})}
+
+
+def queue_insights_rebuild(user_ids: Iterable) -> None:
+    """Rebuild the given snapshots on the worker; without one, readers rebuild inline."""
+    ids = _ids(user_ids)
+    if not ids:
+        return
+    try:
+        from core.celery_app import CELERY_ENABLED
+        if not CELERY_ENABLED:
+            return
+        from tasks.maintenance import rebuild_contribution_insights
+        rebuild_contribution_insights.delay(ids)
+    except Exception as e:
+        print(f"[insights] enqueue failed for {len(ids)} user(s): {e}")
+
+
+# ─────────────────────────────────────────────
+# Rebuild
+# ─────────────────────────────────────────────
+def _linked_contributor_ids(db: Session, user: User) -> list:
+    """Address-book entries that point at ``user`` — claimed, or unclaimed
+    with a matching phone."""
+    key = phone_key(user.phone) if getattr(user, "phone", None) else None
+    criteria = [UserContributor.contributor_user_id == user.id]
+    if key:
+        criteria.append(
+            (UserContributor.contributor_user_id.is_(None)) & (UserContributor.phone_key == key)
+        )
+    return [r[0] for r in db.query(UserContributor.id).filter(or_(*criteria)).all()]
+
+
+def _month_key(d: datetime) -> str:
+    try:
+        d = d.astimezone(EAT) if d.tzinfo else d
+    except Exception:
+        pass
+    return f"{d.year:04d}-{d.month:02d}"
+
+
+def _as_date(value):
+    return value.date() if hasattr(value, "hour") else value
+
+
+def rebuild_user_insights(db: Session, user: User) -> UserContributionInsights:
+    user_currency = (getattr(user, "currency_code", None) or "").strip() or "TZS"
+    snapshot: Dict[str, Any] = {
+        "currency": user_currency,
+        "total_pledged": 0, "total_paid": 0, "total_pending": 0, "total_balance": 0,
+        "events_count": 0, "complete_count": 0, "active_count": 0, "pending_count": 0,
+        "payments_count": 0, "organisations_supported": 0,
+        "avg_per_event": 0, "on_time_rate": 0,
+        "first_contribution_at": None, "last_contribution_at": None,
+        "biggest_contribution": None, "monthly": {}, "by_method": [], "top_organisers": [],
+    }
+
+    contributor_ids = _linked_contributor_ids(db, user)
+    links = []
+    if contributor_ids:
+        links = (
+            db.query(
+                EventContributor.id, EventContributor.pledge_amount,
+                EventContributor.total_paid, EventContributor.total_pending,
+                EventContributor.last_payment_at,
+                Event.id, Event.name, Event.organizer_id, Event.start_date, Currency.code,
+            )
+            .join(Event, Event.id == EventContributor.event_id)
+            .outerjoin(Currency, Currency.id == Event.currency_id)
+            .filter(EventContributor.contributor_id.in_(contributor_ids))
+            .all()
+        )
+
+    per_event = []
+    for ec_id, pledge, paid, pending, last_pay, ev_id, ev_name, organizer_id, start_date, code in links:
+        pledge, paid, pending = float(pledge or 0), float(paid or 0), float(pending or 0)
+        balance = max(0.0, pledge - paid - pending)
+        per_event.append({
+            "ec_id": ec_id, "event_id": ev_id, "event_name": ev_name,
+            "organizer_id": organizer_id, "start_date": start_date, "last_payment_at": last_pay,
+            "currency": (code or "").strip() or user_currency,
+            "pledge": pledge, "paid": paid, "pending": pending, "balance": balance,
+            "complete": pledge > 0 and balance == 0 and pending == 0,
+        })
+
+    if per_event:
+        cur_amounts: Dict[str, float] = {}
+        for r in per_event:
+            cur_amounts[r["currency"]] = cur_amounts.get(r["currency"], 0) + r["paid"] + r["pledge"]
+        currency = max(cur_amounts.items(), key=lambda x: x[1])[0]
+        rows = [r for r in per_event if r["currency"] == currency]
+        total_paid = sum(r["paid"] for r in rows)
+        snapshot.update({
+            "currency": currency,
+            "total_pledged": sum(r["pledge"] for r in rows),
+            "total_paid": total_paid,
+            "total_pending": sum(r["pending"] for r in rows),
+            "total_balance": sum(r["balance"] for r in rows),
+            "events_count": len(rows),
+            "complete_count": sum(1 for r in rows if r["complete"]),
+            "active_count": sum(1 for r in rows if not r["complete"] and (r["paid"] > 0 or r["pending"] > 0)),
+            "pending_count": sum(1 for r in rows if r["paid"] == 0 and r["pending"] == 0),
+            "organisations_supported": len({r["organizer_id"] for r in rows if r["organizer_id"]}),
+            "avg_per_event": round(total_paid / len(rows), 2),
+        })
+
+        pledged = [r for r in rows if r["pledge"] > 0]
+        kept = 0
+        for r in pledged:
+            if not r["complete"]:
+                continue
+            if not r["start_date"] or r["last_payment_at"] is None:
+                kept += 1
+            elif _as_date(r["last_payment_at"]) <= _as_date(r["start_date"]):
+                kept += 1
+        snapshot["on_time_rate"] = round((kept / len(pledged)) * 100, 1) if pledged else 0.0
+
+        org_totals: Dict[str, Dict[str, Any]] = {}
+        for r in rows:
+            if not r["organizer_id"]:
+                continue
+            oid = str(r["organizer_id"])
+            org = org_totals.setdefault(oid, {"organizer_id": oid, "amount": 0.0, "events": 0, "name": None})
+            org["amount"] += r["paid"]
+            org["events"] += 1
+        top = sorted(org_totals.values(), key=lambda v: v["amount"], reverse=True)[:TOP_ORGANISERS]
+        if top:
+            names = db.query(User.id, User.first_name, User.last_name).filter(
+                User.id.in_([o["organizer_id"] for o in top])
+            ).all()
+            for uid, first, last in names:
+                org_totals[str(uid)]["name"] = f"{first or ''} {last or ''}".strip() or "Organiser"
+        snapshot["top_organisers"] = top
+
+        _add_payments(db, snapshot, {r["ec_id"]: r for r in rows})
+
+    stmt = pg_insert(UserContributionInsights).values(
+        user_id=user.id, stale=False, computed_at=datetime.utcnow(), **snapshot,
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[UserContributionInsights.user_id],
+        set_={k: stmt.excluded[k] for k in list(snapshot) + ["stale", "computed_at"]},
+    ))
+    return db.get(UserContributionInsights, user.id, populate_existing=True)
+
+
+def _add_payments(db: Session, snapshot: Dict[str, Any], by_ec: Dict[Any, Dict[str, Any]]) -> None:
+    """Monthly series, method mix, biggest gift and first/last dates from
+    the confirmed payments on ``by_ec``."""
+    payments = db.query(
+        EventContribution.event_contributor_id,
+        EventContribution.amount,
+        EventContribution.payment_method,
+        EventContribution.recorded_by,
+        EventContribution.contributed_at,
+        EventContribution.confirmed_at,
+        EventContribution.created_at,
+    ).filter(
+        EventContribution.event_contributor_id.in_(list(by_ec)),
+        or_(
+            EventContribution.confirmation_status.is_(None),
+            EventContribution.confirmation_status == ContributionStatusEnum.confirmed,
+        ),
+    ).all()
+
+    monthly: Dict[str, Dict[str, Any]] = {}
+    methods: Dict[str, Dict[str, Any]] = {}
+    biggest = None
+    dates = []
+    for ec_id, amount, method, recorded_by, contributed_at, confirmed_at, created_at in payments:
+        amount = float(amount or 0)
+        d = contributed_at or confirmed_at or created_at
+        if biggest is None or amount > biggest[0]:
+            biggest = (amount, by_ec[ec_id], d)
+        if d:
+            dates.append(d)
+            month = monthly.setdefault(_month_key(d), {"amount": 0.0, "count": 0})
+            month["amount"] += amount
+            month["count"] += 1
+        m = method.value if method else ("manual" if recorded_by else "other")
+        entry = methods.setdefault(m, {"method": m, "amount": 0.0, "count": 0})
+        entry["amount"] += amount
+        entry["count"] += 1
+
+    method_total = sum(v["amount"] for v in methods.values()) or 1
+    snapshot.update({
+        "payments_count": len(payments),
+        "monthly": monthly,
+        "by_method": sorted(
+            [{**v, "percent": round((v["amount"] / method_total) * 100, 1)} for v in methods.values()],
+            key=lambda v: v["amount"], reverse=True,
+        ),
+        "first_contribution_at": min(dates) if dates else None,
+        "last_contribution_at": max(dates) if dates else None,
+    })
+    if biggest:
+        amount, r, d = biggest
+        snapshot["biggest_contribution"] = {
+            "amount": amount,
+            "currency": snapshot["currency"],
+            "event_id": str(r["event_id"]),
+            "event_name": r["event_name"],
+            "contributed_at": d.isoformat() if d else None,
+        }
+
+
+# ─────────────────────────────────────────────
+# Read path
+# ─────────────────────────────────────────────
+def get_user_insights(db: Session, user: User) -> UserContributionInsights:
+    row = db.get(UserContributionInsights, user.id)
+    if row is None or row.stale:
+        row = rebuild_user_insights(db, user)
+        db.commit()
+    return row
+
+
+def _impact_message(row: UserContributionInsights, streak: int) -> str:
+    if float(row.total_paid or 0) <= 0:
+        return "Your generosity story starts with your first contribution."
+    if row.organisations_supported >= 3:
+        return (f"You've helped {row.organisations_supported} organisers across "
+                f"{row.events_count} event{'s' if row.events_count != 1 else ''}. Keep showing up.")
+    if streak >= 3:
+        return f"{streak} months of giving in a row — that's real consistency."
+    return (f"You've contributed {row.payments_count} time"
+            f"{'s' if row.payments_count != 1 else ''} so far. Every gift counts.")
+
+
+def insights_payload(row: UserContributionInsights, now: Optional[datetime] = None) -> Dict[str, Any]:
+    now = now or datetime.now(EAT)
+    stored = row.monthly or {}
+    months: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    for i in range(TREND_MONTHS - 1, -1, -1):
+        y = now.year + ((now.month - 1 - i) // 12)
+        m = ((now.month - 1 - i) % 12) + 1
+        key = f"{y:04d}-{m:02d}"
+        entry = stored.get(key) or {}
+        months[key] = {"month": key, "amount": float(entry.get("amount", 0)), "count": int(entry.get("count", 0))}
+
+    streak = 0
+    for entry in reversed(months.values()):
+        if not entry["count"]:
+            break
+        streak += 1
+
+    return {
+        "summary": {"total_pledged": float(row.total_pledged or 0), "total_paid": float(row.total_paid or 0),
+                    "total_pending": float(row.total_pending or 0), "total_balance": float(row.total_balance or 0),
+                    "currency": row.currency},
+        "counts": {"events_count": row.events_count, "complete_count": row.complete_count,
+                   "active_count": row.active_count, "pending_count": row.pending_count,
+                   "payments_count": row.payments_count,
+                   "organisations_supported": row.organisations_supported},
+        "streak_months": streak,
+        "biggest_contribution": row.biggest_contribution,
+        "first_contribution_at": row.first_contribution_at.isoformat() if row.first_contribution_at else None,
+        "last_contribution_at": row.last_contribution_at.isoformat() if row.last_contribution_at else None,
+        "avg_per_event": row.avg_per_event,
+        "on_time_rate": row.on_time_rate,
+        "by_month": list(months.values()),
+        "by_method": row.by_method or [],
+        "top_organisers": row.top_organisers or [],
+        "impact_message": _impact_message(row, streak),
+    }
@@ -28,14 +28,13 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from utils.phone_numbers import phone_key
+
 logger = logging.getLogger(__name__)
 
 
 def _last9(phone: Optional[str]) -> Optional[str]:
-    if not phone:
-        return None
-    digits = "".join(ch for ch in phone if ch.isdigit())
-    return digits[-9:] if len(digits) >= 9 else None
+    return phone_key(phone)
 
 
 def _last_n(phone: Optional[str], n: int) -> Optional[str]:
@@ -107,8 +106,8 @@ def claim_existing_contributor_records_for_user(
         return summary
 
     # ── 1. Link orphan user_contributors rows by phone-last9 OR email ─────
-    # We use raw SQL with the same `right(regexp_replace(...))` pattern as
-    # the existing 2026_04_19 migration so behavior is consistent.
+    # ``phone_key`` holds the same last-9 digits the 2026_04_19 migration
+    # matched with `right(regexp_replace(...))`, but is indexed.
     try:
         result = db.execute(
             text(
@@ -117,8 +116,7 @@ def claim_existing_contributor_records_for_user(
                 SET contributor_user_id = :uid
                 WHERE uc.contributor_user_id IS NULL
                   AND (
-                    (:last9 <> '' AND uc.phone IS NOT NULL
-                       AND RIGHT(REGEXP_REPLACE(uc.phone, '[^0-9]', '', 'g'), 9) = :last9)
+                    (:last9 <> '' AND uc.phone_key = :last9)
                     OR
                     (:email <> '' AND uc.email IS NOT NULL
                        AND LOWER(uc.email) = :email)
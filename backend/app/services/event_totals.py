@@ -0,0 +1,240 @@
+"""Per-event contribution totals (``event_contribution_totals``).
+
+``recompute_event_totals`` rebuilds an event's row from
+``event_contributors`` / ``event_contributions`` with one aggregate
+``INSERT ... ON CONFLICT`` per event. It runs inside the caller's
+transaction — the session hooks in ``models.event_contribution_totals``
+call it for every event an ORM flush touched, and bulk writers (the
+contributor import worker) call it directly — so the stored summary
+commits or rolls back together with the change that moved it.
+
+``get_event_totals`` is what the summary endpoints read: a primary-key
+lookup, lazily building the row for events that predate the table.
+
+``refresh_contributor_totals`` maintains the per-contributor running
+totals on ``event_contributors`` (``total_paid``, ``total_pending``,
+``last_payment_at``) the same way, and the event row is summed from them.
+
+WhatsApp availability is not stored here: ``whatsapp_counts`` reads it
+live, since statuses move with every delivery callback rather than with
+contributor writes.
+
+Both recomputes read the rows other transactions have committed, so
+concurrent writers on one event must not interleave: under READ COMMITTED
+two payments committing together would each write totals missing the
+other. ``lock_events`` takes the event row (``FOR NO KEY UPDATE``, which
+doesn't conflict with the key-share locks contribution inserts hold on
+it) before either recompute, so the second writer waits for the first to
+commit and then aggregates a snapshot that includes it. Locks are always
+taken events first, then contributor links, each in id order.
+
+``rebuild_all_event_totals`` is the drift repair (nightly Celery job and
+``POST /admin/repair/event-contribution-totals``); it rebuilds both levels.
+"""
+from __future__ import annotations
+
+import uuid
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models import EventContributionTotals
+
+_RECOMPUTE_SQL = text(r"""
+WITH per_ec AS (
+    SELECT
+        COALESCE(ec.pledge_amount, 0) AS pledge,
+        ec.total_paid AS paid,
+        ec.total_pending AS pending
+    FROM event_contributors ec
+    WHERE ec.event_id = :event_id
+),
+by_status AS (
+    SELECT
+        COUNT(*) FILTER (
+            WHERE confirmation_status IS NULL OR confirmation_status = 'confirmed'
+        ) AS confirmed,
+        COUNT(*) FILTER (WHERE confirmation_status = 'pending') AS pending,
+        COUNT(*) FILTER (WHERE confirmation_status = 'rejected') AS rejected
+    FROM event_contributions
+    WHERE event_id = :event_id
+)
+INSERT INTO event_contribution_totals (
+    event_id, total_pledged, total_paid, total_pending, total_balance,
+    contributor_count, confirmed_count, pending_count, rejected_count, updated_at
+)
+SELECT
+    e.id,
+    (SELECT COALESCE(SUM(pledge), 0) FROM per_ec),
+    (SELECT COALESCE(SUM(paid), 0) FROM per_ec),
+    (SELECT COALESCE(SUM(pending), 0) FROM per_ec),
+    (SELECT COALESCE(SUM(GREATEST(pledge - paid, 0)), 0) FROM per_ec),
+    (SELECT COUNT(*) FROM per_ec),
+    b.confirmed, b.pending, b.rejected,
+    now()
+FROM events e CROSS JOIN by_status b
+WHERE e.id = :event_id
+ON CONFLICT (event_id) DO UPDATE SET
+    total_pledged = EXCLUDED.total_pledged,
+    total_paid = EXCLUDED.total_paid,
+    total_pending = EXCLUDED.total_pending,
+    total_balance = EXCLUDED.total_balance,
+    contributor_count = EXCLUDED.contributor_count,
+    confirmed_count = EXCLUDED.confirmed_count,
+    pending_count = EXCLUDED.pending_count,
+    rejected_count = EXCLUDED.rejected_count,
+    updated_at = EXCLUDED.updated_at
+""")
+
+
+# Running totals on each event_contributors row. ``last_payment_at`` is the
+# latest confirmed payment.
+_REFRESH_CONTRIBUTORS_SQL = """
+UPDATE event_contributors ec SET
+    total_paid = agg.paid,
+    total_pending = agg.pending,
+    last_payment_at = agg.last_payment_at
+FROM (
+    SELECT
+        t.id,
+        COALESCE(SUM(c.amount) FILTER (
+            WHERE c.confirmation_status IS NULL OR c.confirmation_status = 'confirmed'
+        ), 0) AS paid,
+        COALESCE(SUM(c.amount) FILTER (WHERE c.confirmation_status = 'pending'), 0) AS pending,
+        MAX(COALESCE(c.contributed_at, c.created_at)) FILTER (
+            WHERE c.confirmation_status IS NULL OR c.confirmation_status = 'confirmed'
+        ) AS last_payment_at
+    FROM event_contributors t
+    LEFT JOIN event_contributions c ON c.event_contributor_id = t.id
+    WHERE {where}
+    GROUP BY t.id
+) agg
+WHERE ec.id = agg.id
+"""
+_LOCK_EVENTS_SQL = text("""
+SELECT id FROM events WHERE id = ANY(CAST(:ids AS uuid[])) ORDER BY id FOR NO KEY UPDATE
+""")
+_LOCK_CONTRIBUTORS_SQL = text("""
+SELECT id FROM event_contributors WHERE {where} ORDER BY id FOR NO KEY UPDATE
+""")
+_LOCK_BY_IDS_SQL = text(_LOCK_CONTRIBUTORS_SQL.text.format(where="id = ANY(CAST(:ids AS uuid[]))"))
+_LOCK_BY_EVENT_SQL = text(_LOCK_CONTRIBUTORS_SQL.text.format(where="event_id = :event_id"))
+_REFRESH_BY_IDS_SQL = text(_REFRESH_CONTRIBUTORS_SQL.format(where="t.id = ANY(CAST(:ids AS uuid[]))"))
+_REFRESH_BY_EVENT_SQL = text(_REFRESH_CONTRIBUTORS_SQL.format(where="t.event_id = :event_id"))
+
+
+def lock_events(db: Session, event_ids: Iterable) -> None:
+    """Lock the given events' rows until the transaction ends, serialising
+    totals recomputes per event. Call it before locking any
+    ``event_contributors`` row. Does not commit."""
+    ids = sorted({str(e) for e in event_ids if e})
+    if ids:
+        db.execute(_LOCK_EVENTS_SQL, {"ids": ids})
+
+
+def refresh_contributor_totals(db: Session, event_contributor_ids: Iterable) -> None:
+    """Recompute ``total_paid`` / ``total_pending`` / ``last_payment_at`` on
+    the given ``event_contributors`` rows. Does not commit.
+
+    The rows are locked first, so the aggregate runs on a snapshot taken
+    after any concurrent payment on them has committed.
+    """
+    ids = sorted({str(i) for i in event_contributor_ids if i})
+    if ids:
+        db.execute(_LOCK_BY_IDS_SQL, {"ids": ids})
+        db.execute(_REFRESH_BY_IDS_SQL, {"ids": ids})
+
+
+def recompute_event_totals(db: Session, event_ids: Iterable) -> None:
+    """Rebuild the totals row of each event. Does not commit.
+
+    Events that no longer exist are skipped (the ``events`` join yields no
+    row), so this is safe to call for events deleted in the same flush.
+    """
+    eids = sorted({str(e) for e in event_ids if e})
+    lock_events(db, eids)
+    for eid in eids:
+        db.execute(_RECOMPUTE_SQL, {"event_id": eid})
+
+
+def get_event_totals(db: Session, event_id) -> Optional[EventContributionTotals]:
+    eid = uuid.UUID(str(event_id))
+    row = db.get(EventContributionTotals, eid)
+    if row is None:
+        recompute_event_totals(db, [eid])
+        db.commit()
+        row = db.get(EventContributionTotals, eid)
+    return row
+
+
+def totals_summary(row: Optional[EventContributionTotals]) -> dict:
+    """The summary block shared by the contributor list and report."""
+    if row is None:
+        return {
+            "total_pledged": 0.0, "total_paid": 0.0, "total_pending": 0.0,
+            "total_balance": 0.0, "contributor_count": 0,
+            "contributions": {"confirmed": 0, "pending": 0, "rejected": 0},
+        }
+    return {
+        "total_pledged": float(row.total_pledged or 0),
+        "total_paid": float(row.total_paid or 0),
+        "total_pending": float(row.total_pending or 0),
+        "total_balance": float(row.total_balance or 0),
+        "contributor_count": int(row.contributor_count or 0),
+        "contributions": {
+            "confirmed": int(row.confirmed_count or 0),
+            "pending": int(row.pending_count or 0),
+            "rejected": int(row.rejected_count or 0),
+        },
+    }
+
+
+def whatsapp_counts(db: Session, event_id) -> dict:
+    """Count the event's contributors by the WhatsApp status of their primary
+    phone, matched the way ``statuses_by_phones`` matches it (through
+    ``normalize_phone``, so local and international spellings agree)."""
+    from models import EventContributor, PhoneWhatsAppStatus, UserContributor
+    from utils.phone_numbers import normalize_phone
+
+    phones = [r[0] for r in db.query(UserContributor.phone).select_from(EventContributor).outerjoin(
+        UserContributor, UserContributor.id == EventContributor.contributor_id,
+    ).filter(EventContributor.event_id == event_id).all()]
+    keys = {p: normalize_phone(p).get("normalized") for p in set(phones) if p}
+    wanted = sorted({k for k in keys.values() if k})
+    statuses = {}
+    for start in range(0, len(wanted), 1000):
+        statuses.update(db.query(PhoneWhatsAppStatus.normalized_phone, PhoneWhatsAppStatus.status).filter(
+            PhoneWhatsAppStatus.normalized_phone.in_(wanted[start:start + 1000])
+        ).all())
+    counts = {"whatsapp": 0, "not_whatsapp": 0, "unknown": 0, "checking": 0, "failed": 0}
+    for p in phones:
+        st = statuses.get(keys.get(p)) or "unknown"
+        counts[st] = counts.get(st, 0) + 1
+    return counts
+
+
+def rebuild_event_totals(db: Session, event_ids: Iterable) -> None:
+    """Rebuild both levels for the given events: every contributor's running
+    totals, then the event rows. Takes the same locks, in the same order, as
+    the write path. Does not commit."""
+    eids = sorted({str(e) for e in event_ids if e})
+    lock_events(db, eids)
+    for eid in eids:
+        db.execute(_LOCK_BY_EVENT_SQL, {"event_id": eid})
+        db.execute(_REFRESH_BY_EVENT_SQL, {"event_id": eid})
+    recompute_event_totals(db, eids)
+
+
+def rebuild_all_event_totals(db: Session, batch_size: int = 200) -> dict:
+    """Recompute every event that has contributors (or a stale totals row)."""
+    rows = db.execute(text("""
+        SELECT DISTINCT event_id FROM event_contributors
+        UNION
+        SELECT event_id FROM event_contribution_totals
+    """)).all()
+    event_ids = [r[0] for r in rows]
+    for start in range(0, len(event_ids), batch_size):
+        rebuild_event_totals(db, event_ids[start:start + batch_size])
+        db.commit()
+    return {"events": len(event_ids)}
@@ -0,0 +1,168 @@
+"""Daily payment rollups (``models.payment_rollups``).
+
+``rebuild_days``
+    Recomputes whole days on both bases from ``transactions`` with one
+    range-filtered ``INSERT … SELECT … GROUP BY`` each. Caller commits.
+
+``mark_days_dirty`` / ``pop_dirty_days``
+    Redis set of days waiting for a rebuild, filled after commit by the
+    ``Transaction`` session hooks and drained by ``tasks.payment_rollups``.
+
+``totals``
+    Gross / commission / net / count over a date range, grouped by any of
+    ``DIMENSIONS``. Closed days come from the rollups; today (still being
+    written) is aggregated live from ``transactions`` over an indexed
+    ``completed_at`` / ``created_at`` range. Without Celery
+    (``DEPLOYMENT_MODE=vercel``) there is no beat and no Redis dirty set,
+    so nothing keeps the rollups current after the migration's backfill;
+    there the whole range is aggregated live.
+
+Days are UTC calendar days of the naive timestamps, as before.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, String, cast, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from core.redis import CacheKeys, get_redis
+from models.enums import TransactionStatusEnum
+from models.payment_rollups import PaymentDailyRollup
+from models.payments import Transaction
+
+BASES = ("completed", "created")
+DIMENSIONS = ("day", "country_code", "currency_code", "target_type", "status")
+COMPLETED_STATUSES = (TransactionStatusEnum.paid, TransactionStatusEnum.credited)
+
+_TIMESTAMPS = {"completed": Transaction.completed_at, "created": Transaction.created_at}
+
+
+def day_range(start: date, end: date) -> Tuple[datetime, datetime]:
+    """Half-open ``[start 00:00, end+1 00:00)`` for index-friendly filters."""
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+def _dimension_columns(basis: str) -> dict:
+    return {
+        "day": cast(_TIMESTAMPS[basis], Date),
+        "country_code": Transaction.country_code,
+        "currency_code": Transaction.currency_code,
+        "target_type": cast(Transaction.target_type, String),
+        "status": cast(Transaction.status, String),
+    }
+
+
+def _measures():
+    return (
+        func.count(Transaction.id),
+        func.coalesce(func.sum(Transaction.gross_amount), 0),
+        func.coalesce(func.sum(Transaction.commission_amount), 0),
+        func.coalesce(func.sum(Transaction.net_amount), 0),
+    )
+
+
+# ─────────────────────────────────────────────
+# Rebuild
+# ─────────────────────────────────────────────
+def rebuild_days(db: Session, days: Iterable[date]) -> int:
+    days = sorted(set(days))
+    R = PaymentDailyRollup
+    for d in days:
+        db.query(R).filter(R.day == d).delete(synchronize_session=False)
+        lo, hi = day_range(d, d)
+        for basis in BASES:
+            ts = _TIMESTAMPS[basis]
+            dims = _dimension_columns(basis)
+            db.execute(
+                insert(R).from_select(
+                    ["day", "basis", *DIMENSIONS[1:], "tx_count", "gross", "commission", "net"],
+                    select(dims["day"], literal(basis), *(dims[k] for k in DIMENSIONS[1:]), *_measures())
+                    .where(ts >= lo, ts < hi)
+                    .group_by(*(dims[k] for k in DIMENSIONS)),
+                )
+            )
+    return len(days)
+
+
+def mark_days_dirty(days: Iterable[date]) -> None:
+    values = sorted({d.isoformat() for d in days if d})
+    r = get_redis()
+    if not values or r is None:
+        return
+    try:
+        r.sadd(CacheKeys.PAYMENT_ROLLUP_DIRTY, *values)
+    except Exception as e:
+        print(f"[payment_rollups] mark dirty failed for {len(values)} day(s): {e}")
+
+
+def pop_dirty_days(count: int) -> List[date]:
+    r = get_redis()
+    if r is None:
+        return []
+    try:
+        values = r.spop(CacheKeys.PAYMENT_ROLLUP_DIRTY, count) or []
+    except Exception as e:
+        print(f"[payment_rollups] pop dirty failed: {e}")
+        return []
+    return [date.fromisoformat(v.decode() if isinstance(v, bytes) else v) for v in values]
+
+
+# ─────────────────────────────────────────────
+# Read
+# ─────────────────────────────────────────────
+def totals(
+    db: Session,
+    start: date,
+    end: date,
+    *,
+    basis: str = "completed",
+    statuses: Optional[Sequence[TransactionStatusEnum]] = COMPLETED_STATUSES,
+    group_by: Sequence[str] = (),
+) -> List[dict]:
+    """One dict per group, sorted by the group values, with ``tx_count``,
+    ``gross``, ``commission`` and ``net``. Without ``group_by`` the list
+    holds exactly one (possibly zero) row. ``statuses=None`` keeps all."""
+    from core.celery_app import CELERY_ENABLED
+
+    today = datetime.utcnow().date()
+    # First day read from ``transactions`` rather than the rollups.
+    live_from = today if CELERY_ENABLED else start
+    acc: dict = {}
+    if not group_by:
+        acc[()] = [0, Decimal(0), Decimal(0), Decimal(0)]
+
+    def add(rows):
+        n = len(group_by)
+        for r in rows:
+            cur = acc.setdefault(tuple(r[:n]), [0, Decimal(0), Decimal(0), Decimal(0)])
+            for i, v in enumerate(r[n:]):
+                cur[i] += v or 0
+
+    if start < live_from:
+        R = PaymentDailyRollup
+        cols = [getattr(R, g) for g in group_by]
+        q = db.query(
+            *cols,
+            func.sum(R.tx_count), func.sum(R.gross), func.sum(R.commission), func.sum(R.net),
+        ).filter(R.basis == basis, R.day >= start, R.day <= min(end, live_from - timedelta(days=1)))
+        if statuses:
+            q = q.filter(R.status.in_([s.value for s in statuses]))
+        add(q.group_by(*cols).all() if cols else q.all())
+
+    if end >= live_from:
+        ts = _TIMESTAMPS[basis]
+        dims = _dimension_columns(basis)
+        cols = [dims[g] for g in group_by]
+        lo, hi = day_range(max(start, live_from), end)
+        q = db.query(*cols, *_measures()).filter(ts >= lo, ts < hi)
+        if statuses:
+            q = q.filter(Transaction.status.in_(statuses))
+        add(q.group_by(*cols).all() if cols else q.all())
+
+    return [
+        {**dict(zip(group_by, key)), "tx_count": int(v[0]), "gross": v[1], "commission": v[2], "net": v[3]}
+        for key, v in sorted(acc.items())
+    ]
@@ -0,0 +1,207 @@
+"""People You May Know (``user_suggestions``).
+
+``refresh_suggestions``
+    Rebuilds the top ``TOP_N`` candidates of a batch of users in one
+    ``DELETE`` + ``INSERT ... SELECT``. The signals and weights are the
+    ones the endpoint used to compute live:
+
+    ====================================================  =======
+    followed by someone I follow (friend of friend)       3.0
+    in the circle of someone in my circle                 2.5
+    follows someone I follow                              2.0
+    invited to an event I was invited to                  1.5
+    member of a community I belong to                     1.0
+    ====================================================  =======
+
+    Each path counts once, so a candidate reached through five of my
+    followings scores 5 x 3.0. People I follow, who follow me or who are
+    in my circle are never candidates, nor are inactive accounts. Each
+    refreshed user also gets a ``user_suggestion_refreshes`` row, even
+    when no candidate qualified.
+
+``mark_suggestions_dirty`` / ``pop_dirty_users``
+    A Redis set of users whose own edges changed, drained by
+    ``tasks.suggestions.refresh_dirty_suggestions``.
+
+``get_suggestions``
+    The read path: the stored rows minus anyone the user has connected
+    with since they were computed. A user who was never refreshed (new
+    account) is computed inline once. Without Celery nothing drains the
+    dirty set or runs the nightly job, so there a refresh older than
+    ``INLINE_REFRESH_AFTER`` is redone inline too.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import exists, func, text
+from sqlalchemy.orm import Session
+
+from core.redis import CacheKeys, get_redis
+from models import User, UserCircle, UserFollower, UserSession, UserSuggestion, UserSuggestionRefresh
+
+TOP_N = 50
+BATCH_SIZE = 200
+ACTIVE_WITHIN_DAYS = 30
+INLINE_REFRESH_AFTER = timedelta(hours=6)
+
+_REFRESH_SQL = text("""
+WITH src AS (
+    SELECT DISTINCT unnest(CAST(:ids AS uuid[])) AS user_id
+),
+known AS (
+    SELECT s.user_id, f.following_id AS other
+    FROM src s JOIN user_followers f ON f.follower_id = s.user_id
+    UNION
+    SELECT s.user_id, f.follower_id
+    FROM src s JOIN user_followers f ON f.following_id = s.user_id
+    UNION
+    SELECT s.user_id, c.circle_member_id
+    FROM src s JOIN user_circles c ON c.user_id = s.user_id
+),
+signals AS (
+    SELECT s.user_id, f2.following_id AS candidate, 3.0 AS weight, 0 AS mutual
+    FROM src s
+    JOIN user_followers f1 ON f1.follower_id = s.user_id
+    JOIN user_followers f2 ON f2.follower_id = f1.following_id
+    UNION ALL
+    SELECT s.user_id, c2.circle_member_id, 2.5, 0
+    FROM src s
+    JOIN user_circles c1 ON c1.user_id = s.user_id
+    JOIN user_circles c2 ON c2.user_id = c1.circle_member_id
+    UNION ALL
+    SELECT s.user_id, f2.follower_id, 2.0, 1
+    FROM src s
+    JOIN user_followers f1 ON f1.follower_id = s.user_id
+    JOIN user_followers f2 ON f2.following_id = f1.following_id
+    UNION ALL
+    SELECT s.user_id, i2.invited_user_id, 1.5, 0
+    FROM src s
+    JOIN event_invitations i1 ON i1.invited_user_id = s.user_id
+    JOIN event_invitations i2 ON i2.event_id = i1.event_id
+    UNION ALL
+    SELECT s.user_id, m2.user_id, 1.0, 0
+    FROM src s
+    JOIN community_members m1 ON m1.user_id = s.user_id
+    JOIN community_members m2 ON m2.community_id = m1.community_id
+),
+scored AS (
+    SELECT g.user_id, g.candidate, sum(g.weight) AS score, sum(g.mutual) AS mutual_count
+    FROM signals g
+    WHERE g.candidate IS NOT NULL
+      AND g.candidate <> g.user_id
+      AND NOT EXISTS (
+          SELECT 1 FROM known k WHERE k.user_id = g.user_id AND k.other = g.candidate
+      )
+    GROUP BY g.user_id, g.candidate
+),
+ranked AS (
+    SELECT sc.user_id, sc.candidate, sc.score, sc.mutual_count,
+           row_number() OVER (PARTITION BY sc.user_id ORDER BY sc.score DESC, sc.candidate) AS rn
+    FROM scored sc
+    JOIN users u ON u.id = sc.candidate AND u.is_active = true
+)
+INSERT INTO user_suggestions (user_id, suggested_user_id, score, mutual_count, computed_at)
+SELECT user_id, candidate, score, mutual_count, now()
+FROM ranked
+WHERE rn <= :top_n
+""")
+
+_CLEAR_SQL = text("DELETE FROM user_suggestions WHERE user_id = ANY(CAST(:ids AS uuid[]))")
+
+_MARK_REFRESHED_SQL = text("""
+INSERT INTO user_suggestion_refreshes (user_id, refreshed_at)
+SELECT u.id, now() FROM users u WHERE u.id = ANY(CAST(:ids AS uuid[]))
+ON CONFLICT (user_id) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+""")
+
+
+def _ids(values: Iterable) -> List[str]:
+    return sorted({str(v) for v in values if v})
+
+
+def refresh_suggestions(db: Session, user_ids: Iterable) -> int:
+    """Rebuild the stored candidates of ``user_ids``. Does not commit.
+    Returns the number of users refreshed."""
+    ids = _ids(user_ids)
+    for start in range(0, len(ids), BATCH_SIZE):
+        batch = ids[start:start + BATCH_SIZE]
+        db.execute(_CLEAR_SQL, {"ids": batch})
+        db.execute(_REFRESH_SQL, {"ids": batch, "top_n": TOP_N})
+        db.execute(_MARK_REFRESHED_SQL, {"ids": batch})
+    return len(ids)
+
+
+def active_user_ids(db: Session, within_days: int = ACTIVE_WITHIN_DAYS) -> List:
+    """Users with a session used in the last ``within_days`` days."""
+    since = datetime.utcnow() - timedelta(days=within_days)
+    return [r[0] for r in db.query(UserSession.user_id).join(User, User.id == UserSession.user_id).filter(
+        UserSession.last_active_at >= since,
+        User.is_active == True,
+    ).distinct().all()]
+
+
+# ─────────────────────────────────────────────
+# Dirty set
+# ─────────────────────────────────────────────
+def mark_suggestions_dirty(user_ids: Iterable) -> None:
+    ids = _ids(user_ids)
+    r = get_redis()
+    if not ids or r is None:
+        return
+    try:
+        r.sadd(CacheKeys.SUGGESTIONS_DIRTY, *ids)
+    except Exception as e:
+        print(f"[suggestions] mark dirty failed for {len(ids)} user(s): {e}")
+
+
+def pop_dirty_users(count: int) -> List[str]:
+    r = get_redis()
+    if r is None:
+        return []
+    try:
+        return [v.decode() if isinstance(v, bytes) else v for v in r.spop(CacheKeys.SUGGESTIONS_DIRTY, count) or []]
+    except Exception as e:
+        print(f"[suggestions] pop dirty failed: {e}")
+        return []
+
+
+# ─────────────────────────────────────────────
+# Read
+# ─────────────────────────────────────────────
+def _stored(db: Session, user_id, limit: int) -> List[Tuple[User, float, int]]:
+    return db.query(User, UserSuggestion.score, UserSuggestion.mutual_count).join(
+        UserSuggestion, UserSuggestion.suggested_user_id == User.id,
+    ).filter(
+        UserSuggestion.user_id == user_id,
+        User.is_active == True,
+        ~exists().where(UserFollower.follower_id == user_id, UserFollower.following_id == User.id),
+        ~exists().where(UserFollower.follower_id == User.id, UserFollower.following_id == user_id),
+        ~exists().where(UserCircle.user_id == user_id, UserCircle.circle_member_id == User.id),
+    ).order_by(UserSuggestion.score.desc(), UserSuggestion.suggested_user_id).limit(limit).all()
+
+
+def _is_fresh(db: Session, user_id, celery_enabled: bool) -> bool:
+    R = UserSuggestionRefresh
+    q = db.query(R.user_id).filter(R.user_id == user_id)
+    if not celery_enabled:
+        q = q.filter(R.refreshed_at >= func.now() - INLINE_REFRESH_AFTER)
+    return db.query(q.exists()).scalar()
+
+
+def get_suggestions(db: Session, user_id, limit: int) -> List[Tuple[User, float, int]]:
+    """``[(user, score, mutual_count)]``, best first."""
+    from core.celery_app import CELERY_ENABLED
+
+    if CELERY_ENABLED:
+        # The worker keeps stored rows current; only a user who was never
+        # refreshed needs the extra lookup.
+        rows = _stored(db, user_id, limit)
+        if rows or _is_fresh(db, user_id, True):
+            return rows
+    elif _is_fresh(db, user_id, False):
+        return _stored(db, user_id, limit)
+    refresh_suggestions(db, [user_id])
+    db.commit()
+    return _stored(db, user_id, limit)
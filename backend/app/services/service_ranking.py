@@ -0,0 +1,144 @@
+"""Marketplace ranking for ``GET /services/`` — computed in SQL.
+
+Search used to load up to 500 matching services with every rating, image
+and package, score them in Python and slice a page out of that list, so
+anything past the first 500 was never ranked and ``radius_km`` was only
+a score bump. Everything here is a SQL expression instead, and the route
+orders and paginates in the database.
+
+``refresh_service_ratings``
+    Keeps ``user_services.rating_avg`` / ``rating_count`` in step with
+    ``user_service_ratings``. Run from the session hooks in
+    ``models.services`` for every service a flush touched a rating of.
+
+``within_radius``
+    A latitude/longitude bounding box (served by the
+    ``(latitude, longitude)`` index) followed by the exact great-circle
+    distance. Services without coordinates stay eligible; they just earn
+    no proximity points.
+
+``relevance_score``
+    The same weights ``_compute_relevance_score`` used:
+
+    ======================  =========================================
+    rating                  ``rating_avg / 5 * 25``
+    review volume           ``min(log10(count + 1) * 10, 20)``
+    event-type match        20
+    proximity               15 / 12 / 8 / 4 within 10 / 25 / 50 / 100 km
+    verified                10
+    completeness            description > 50 chars 2, images 3,
+                            price 2, packages 3
+    preferred location      15
+    ======================  =========================================
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, case, exists, func, or_, text
+from sqlalchemy.orm import Session
+
+from models import ServicePackage, UserService, UserServiceImage
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.045
+
+_REFRESH_RATINGS_SQL = text("""
+UPDATE user_services s SET
+    rating_avg = COALESCE(r.avg_rating, 0),
+    rating_count = COALESCE(r.n, 0)
+FROM (
+    SELECT ids.id, avg(rt.rating) AS avg_rating, count(rt.id) AS n
+    FROM unnest(CAST(:ids AS uuid[])) AS ids(id)
+    LEFT JOIN user_service_ratings rt ON rt.user_service_id = ids.id
+    GROUP BY ids.id
+) r
+WHERE s.id = r.id
+""")
+# NO KEY UPDATE doesn't conflict with the key-share lock a rating insert
+# holds on its service through the foreign key.
+_LOCK_SERVICES_SQL = text("""
+SELECT id FROM user_services WHERE id = ANY(CAST(:ids AS uuid[])) ORDER BY id FOR NO KEY UPDATE
+""")
+
+
+def refresh_service_ratings(db: Session, service_ids: Iterable) -> None:
+    """Recompute ``rating_avg`` / ``rating_count`` on the given services.
+    Does not commit.
+
+    The services are locked first, so when two reviews of one service
+    commit together the second aggregate runs after the first commits
+    and sees both ratings.
+    """
+    ids = sorted({str(i) for i in service_ids if i})
+    if ids:
+        db.execute(_LOCK_SERVICES_SQL, {"ids": ids})
+        db.execute(_REFRESH_RATINGS_SQL, {"ids": ids})
+
+
+def distance_km(lat: float, lng: float):
+    """Haversine distance from ``(lat, lng)`` to each service, in km
+    (NULL for services without coordinates)."""
+    dlat = func.radians(UserService.latitude - lat)
+    dlng = func.radians(UserService.longitude - lng)
+    a = (
+        func.power(func.sin(dlat / 2), 2)
+        + math.cos(math.radians(lat)) * func.cos(func.radians(UserService.latitude))
+        * func.power(func.sin(dlng / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(a, 1.0)))
+
+
+def bounding_box(lat: float, lng: float, radius_km: float):
+    """``(min_lat, max_lat, min_lng, max_lng)`` enclosing the circle."""
+    dlat = radius_km / KM_PER_DEGREE
+    cos_lat = max(math.cos(math.radians(lat)), 0.01)
+    dlng = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+    return lat - dlat, lat + dlat, lng - dlng, lng + dlng
+
+
+def within_radius(lat: float, lng: float, radius_km: float):
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    nearby = and_(
+        UserService.latitude.between(min_lat, max_lat),
+        UserService.longitude.between(min_lng, max_lng),
+        distance_km(lat, lng) <= radius_km,
+    )
+    return or_(nearby, UserService.latitude.is_(None), UserService.longitude.is_(None))
+
+
+def relevance_score(
+    matching_service_type_ids: Optional[Iterable] = None,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    location: Optional[str] = None,
+):
+    score = (
+        UserService.rating_avg * 5
+        + func.least(func.log(UserService.rating_count + 1) * 10, 20)
+        + case(
+            (and_(UserService.is_verified == True, UserService.verification_status == "verified"), 10),
+            else_=0,
+        )
+        + case((func.length(UserService.description) > 50, 2), else_=0)
+        + case((UserService.min_price != 0, 2), else_=0)
+        + case((exists().where(UserServiceImage.user_service_id == UserService.id), 3), else_=0)
+        + case((exists().where(ServicePackage.user_service_id == UserService.id), 3), else_=0)
+    )
+
+    type_ids = list(matching_service_type_ids or [])
+    if type_ids:
+        score = score + case((UserService.service_type_id.in_(type_ids), 20), else_=0)
+
+    if lat is not None and lng is not None:
+        dist = distance_km(lat, lng)
+        score = score + case(
+            (dist <= 10, 15), (dist <= 25, 12), (dist <= 50, 8), (dist <= 100, 4),
+            else_=0,
+        )
+
+    if location:
+        score = score + case((UserService.location.ilike(f"%{location}%"), 15), else_=0)
+
+    return score
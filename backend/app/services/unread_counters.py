@@ -0,0 +1,250 @@
+"""Per-user unread counters (notifications, direct messages) kept in Redis.
+
+The notification badge and the inbox badge used to be a ``COUNT(*)`` per
+poll. Each user now has two integer keys (``CacheKeys.UNREAD_NOTIFICATIONS``
+/ ``UNREAD_MESSAGES``) that are changed atomically after the writing
+transaction commits, and every change is pushed to the user's real-time
+channel (``Channels.for_user``) as ``unread.updated``.
+
+``get_unread`` / ``get_unread_counts``
+    Read path. A missing key is seeded from the database with ``SET NX``,
+    so a cold or flushed Redis only costs one count per user.
+
+``adjust``
+    ``+n`` / ``-n`` after a commit. The Lua script only touches keys that
+    already exist (an unseeded key will be counted fresh on the next read,
+    which already includes this change) and clamps at zero.
+
+``reset``
+    After a bulk read / clear: drops the key rather than writing ``0`` so a
+    notification committed in between is never lost.
+
+``notifications_committed``
+    Called from the session hook in ``models.notifications`` with the
+    notifications a transaction inserted; bumps the counters and, for users
+    with an open stream, publishes ``notification.created`` with the same
+    payload ``GET /notifications`` returns.
+
+``notifications_bulk_inserted``
+    For bulk inserts that bypass that hook (the admin broadcast): drops the
+    recipients' counters in pipelined ``DEL``s so the next read reseeds
+    them, and pushes fresh counts to the few with an open stream.
+
+A seed can race a concurrent insert and miss it, and a ``-n`` that lands
+before the matching ``+n`` is lost to the clamp at zero. The TTL is set
+when a key is seeded and never extended, so every counter is recounted
+from the database at least every ``COUNTER_TTL`` and such drift can't
+outlive it. With Redis disabled every read falls back to the database
+count.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional
+
+import pytz
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from core import realtime
+from core.redis import CacheKeys, get_redis, invalidate_notifications
+
+EAT = pytz.timezone("Africa/Nairobi")
+
+NOTIFICATIONS = "notifications"
+MESSAGES = "messages"
+KINDS = (NOTIFICATIONS, MESSAGES)
+COUNTER_TTL = 6 * 3600
+
+_KEYS = {
+    NOTIFICATIONS: CacheKeys.for_unread_notifications,
+    MESSAGES: CacheKeys.for_unread_messages,
+}
+
+# KEYS[1] counter, ARGV[1] delta. Returns the new value, or nil when the
+# counter isn't seeded. INCRBY keeps the seed's TTL and nothing renews
+# it, so the key is recounted on schedule however busy the user is.
+_ADJUST_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return false end
+local v = redis.call('INCRBY', KEYS[1], ARGV[1])
+if v < 0 then
+    redis.call('INCRBY', KEYS[1], -v)
+    v = 0
+end
+return v
+"""
+_adjust_script = None
+
+
+def _key(kind: str, user_id) -> str:
+    return _KEYS[kind](str(user_id))
+
+
+def _count_from_db(db: Session, kind: str, user_id) -> int:
+    from models import Conversation, Message, Notification
+
+    if kind == NOTIFICATIONS:
+        query = db.query(func.count(Notification.id)).filter(
+            Notification.recipient_id == user_id, Notification.is_read == False,
+        )
+    else:
+        query = db.query(func.count(Message.id)).join(
+            Conversation, Conversation.id == Message.conversation_id,
+        ).filter(
+            or_(Conversation.user_one_id == user_id, Conversation.user_two_id == user_id),
+            Message.sender_id != user_id,
+            Message.is_read == False,
+        )
+    return query.scalar() or 0
+
+
+def get_unread_counts(db: Session, user_id, kinds: Iterable[str] = KINDS) -> Dict[str, int]:
+    """``{kind: count}``; one MGET when warm, a count per missing key otherwise."""
+    kinds = list(kinds)
+    r = get_redis()
+    values = [None] * len(kinds)
+    if r is not None:
+        try:
+            values = r.mget([_key(k, user_id) for k in kinds])
+        except Exception as e:
+            print(f"[unread] read failed: {e}")
+            r = None
+
+    counts = {}
+    for kind, value in zip(kinds, values):
+        if value is not None:
+            counts[kind] = int(value)
+            continue
+        counts[kind] = _count_from_db(db, kind, user_id)
+        if r is not None:
+            try:
+                r.set(_key(kind, user_id), counts[kind], ex=COUNTER_TTL, nx=True)
+            except Exception:
+                pass
+    return counts
+
+
+def get_unread(db: Session, user_id, kind: str) -> int:
+    return get_unread_counts(db, user_id, [kind])[kind]
+
+
+def _apply(user_id, kind: str, delta: int) -> Optional[int]:
+    global _adjust_script
+    r = get_redis()
+    if r is None:
+        return None
+    try:
+        if _adjust_script is None:
+            _adjust_script = r.register_script(_ADJUST_LUA)
+        value = _adjust_script(keys=[_key(kind, user_id)], args=[delta], client=r)
+        return None if value is None else int(value)
+    except Exception as e:
+        print(f"[unread] adjust failed: {e}")
+        return None
+
+
+def _publish_counts(user_id, counts: Dict[str, int], **extra) -> None:
+    realtime.publish(realtime.Channels.for_user(user_id), "unread.updated", {**counts, **extra})
+
+
+def adjust(db: Optional[Session], user_id, kind: str, delta: int, **extra) -> Optional[int]:
+    """Apply a committed change of ``delta`` unread items and publish it.
+
+    When the counter isn't seeded it is only counted here if the user has
+    a stream open (otherwise the next read does it). ``extra`` is merged
+    into the ``unread.updated`` payload, e.g. ``conversation_id``."""
+    if not delta or not user_id:
+        return None
+    value = _apply(user_id, kind, delta)
+    if value is None and db is not None and realtime.has_subscribers([realtime.Channels.for_user(user_id)]):
+        value = get_unread(db, user_id, kind)
+    if value is not None:
+        _publish_counts(user_id, {kind: value}, **extra)
+    return value
+
+
+def reset(user_id, kind: str, **extra) -> None:
+    """All of ``kind`` was read or removed (already committed)."""
+    r = get_redis()
+    if r is not None:
+        try:
+            r.delete(_key(kind, user_id))
+        except Exception as e:
+            print(f"[unread] reset failed: {e}")
+    _publish_counts(user_id, {kind: 0}, **extra)
+
+
+# ─────────────────────────────────────────────────────────
+# New notifications (session hook)
+# ─────────────────────────────────────────────────────────
+
+def snapshot_notification(state_dict: dict) -> SimpleNamespace:
+    """Detached copy of a just-flushed ``Notification``'s loaded columns,
+    shaped for ``build_notification_dicts``. Taken from the instance dict
+    so no attribute load is triggered inside the flush."""
+    return SimpleNamespace(
+        id=state_dict.get("id"),
+        recipient_id=state_dict.get("recipient_id"),
+        sender_ids=state_dict.get("sender_ids") or [],
+        type=state_dict.get("type"),
+        reference_id=state_dict.get("reference_id"),
+        reference_type=state_dict.get("reference_type"),
+        message_template=state_dict.get("message_template"),
+        message_data=state_dict.get("message_data") or {},
+        is_read=bool(state_dict.get("is_read")),
+        created_at=state_dict.get("created_at") or datetime.now(EAT),
+    )
+
+
+def notifications_committed(snapshots: List[SimpleNamespace]) -> None:
+    by_user: Dict[str, List[SimpleNamespace]] = defaultdict(list)
+    for n in snapshots:
+        by_user[str(n.recipient_id)].append(n)
+
+    invalidate_notifications(by_user)
+    counts = {}
+    for user_id, items in by_user.items():
+        unread = sum(1 for n in items if not n.is_read)
+        counts[user_id] = _apply(user_id, NOTIFICATIONS, unread) if unread else None
+
+    live = realtime.has_subscribers(realtime.Channels.for_user(u) for u in by_user)
+    if not live:
+        return
+
+    from core.database import SessionLocal
+    from utils.batch_loaders import build_notification_dicts
+
+    items = [n for n in snapshots if realtime.Channels.for_user(n.recipient_id) in live]
+    db = SessionLocal()
+    try:
+        for n, payload in zip(items, build_notification_dicts(db, items)):
+            realtime.publish(realtime.Channels.for_user(n.recipient_id), "notification.created", payload)
+        for user_id in by_user:
+            if realtime.Channels.for_user(user_id) in live:
+                value = counts[user_id]
+                if value is None:
+                    value = get_unread(db, user_id, NOTIFICATIONS)
+                _publish_counts(user_id, {NOTIFICATIONS: value})
+    except Exception as e:
+        print(f"[unread] notification fan-out failed: {e}")
+    finally:
+        db.close()
+
+
+def notifications_bulk_inserted(db: Session, user_ids: Iterable, batch_size: int = 500) -> None:
+    ids = sorted({str(u) for u in user_ids if u})
+    invalidate_notifications(ids)
+    r = get_redis()
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        if r is not None:
+            try:
+                r.delete(*(_key(NOTIFICATIONS, u) for u in batch))
+            except Exception as e:
+                print(f"[unread] bulk reset failed: {e}")
+        live = realtime.has_subscribers(realtime.Channels.for_user(u) for u in batch)
+        for user_id in batch:
+            if realtime.Channels.for_user(user_id) in live:
+                _publish_counts(user_id, {NOTIFICATIONS: get_unread(db, user_id, NOTIFICATIONS)})
@@ -0,0 +1,329 @@
+"""Meta delivery statuses: Redis stream in, bulk updates out.
+
+``POST /whatsapp/webhook`` used to apply every ``statuses[]`` item inside
+the request, several row-by-row updates and commits each. After a large
+card send Meta delivers thousands of sent / delivered / read callbacks
+within minutes. The webhook now only appends them to a Redis stream and
+returns; ``tasks.whatsapp_statuses`` applies them in batches.
+
+  • ``enqueue_statuses`` — ``XADD`` one entry per webhook change. Returns
+    False when Redis is unavailable so the caller can apply inline.
+  • ``read_batch`` / ``ack`` — consumer-group reads; entries left pending
+    by a dead worker are reclaimed after ``CLAIM_IDLE_MS``.
+  • ``coalesce``          — one update per wamid (the furthest state, a
+    failure winning) and one outcome per recipient phone.
+  • ``apply_statuses``    — writes a batch to ``wa_messages``,
+    ``sent_event_cards``, ``wa_message_logs`` and
+    ``phone_whatsapp_statuses`` with one ``UPDATE … FROM (VALUES …)``
+    each, following the same rules as ``_mirror_delivery_status``,
+    ``wa_logging.update_from_status`` and
+    ``whatsapp_availability.record_delivery_outcome``. Caller commits.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, case, cast, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, aliased
+
+from core.redis import CacheKeys, get_redis
+
+CONSUMER_GROUP = "wa-status-appliers"
+STREAM_MAXLEN = 200_000
+CLAIM_IDLE_MS = 5 * 60 * 1000
+
+# Position in the delivery lifecycle; a later position never moves back.
+STATUS_RANK = {"sent": 1, "delivered": 2, "read": 3}
+SUCCESS_STATUSES = tuple(STATUS_RANK)
+
+
+def consumer_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+# ─────────────────────────────────────────────
+# Stream
+# ─────────────────────────────────────────────
+def enqueue_statuses(statuses: List[dict]) -> bool:
+    r = get_redis()
+    if not statuses or r is None:
+        return False
+    try:
+        r.xadd(
+            CacheKeys.WA_STATUS_STREAM, {"statuses": json.dumps(statuses)},
+            maxlen=STREAM_MAXLEN, approximate=True,
+        )
+        return True
+    except Exception as e:
+        print(f"[wa-status] enqueue failed, applying inline: {e}")
+        return False
+
+
+def _ensure_group(r) -> None:
+    try:
+        r.xgroup_create(CacheKeys.WA_STATUS_STREAM, CONSUMER_GROUP, id="0", mkstream=True)
+    except Exception as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+
+def _decode(entries) -> List[Tuple[str, List[dict]]]:
+    out = []
+    for entry_id, fields in entries or []:
+        try:
+            out.append((entry_id, json.loads((fields or {}).get("statuses") or "[]")))
+        except ValueError:
+            out.append((entry_id, []))
+    return out
+
+
+def read_batch(consumer: str, count: int, block_ms: Optional[int] = None) -> List[Tuple[str, List[dict]]]:
+    """Up to ``count`` ``(entry_id, statuses)`` pairs; stale pending
+    entries of other consumers first, then new ones. Returns at once when
+    there are none unless ``block_ms`` is given."""
+    r = get_redis()
+    if r is None:
+        return []
+    _ensure_group(r)
+    claimed = r.xautoclaim(
+        CacheKeys.WA_STATUS_STREAM, CONSUMER_GROUP, consumer,
+        min_idle_time=CLAIM_IDLE_MS, start_id="0-0", count=count,
+    )
+    entries = _decode(claimed[1] if claimed else [])
+    if entries:
+        return entries
+    resp = r.xreadgroup(CONSUMER_GROUP, consumer, {CacheKeys.WA_STATUS_STREAM: ">"}, count=count, block=block_ms)
+    return _decode(resp[0][1] if resp else [])
+
+
+def ack(entry_ids: List[str]) -> None:
+    r = get_redis()
+    if not entry_ids or r is None:
+        return
+    pipe = r.pipeline(transaction=False)
+    pipe.xack(CacheKeys.WA_STATUS_STREAM, CONSUMER_GROUP, *entry_ids)
+    pipe.xdel(CacheKeys.WA_STATUS_STREAM, *entry_ids)
+    pipe.execute()
+
+
+# ─────────────────────────────────────────────
+# Coalesce
+# ─────────────────────────────────────────────
+def _errors(st: dict) -> Tuple[Optional[str], Optional[str]]:
+    errs = st.get("errors") or []
+    if not errs:
+        return None, None
+    first = errs[0] or {}
+    code = str(first.get("code")) if first.get("code") is not None else None
+    return code, first.get("title") or first.get("message") or first.get("details")
+
+
+def _wins(new: str, old: str) -> bool:
+    if old == "failed":
+        return False
+    return new == "failed" or STATUS_RANK.get(new, 0) > STATUS_RANK.get(old, 0)
+
+
+def coalesce(statuses: Iterable[dict]) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """``({wamid: update}, {recipient: outcome})``. Each wamid keeps its
+    furthest status, a failure winning; a recipient counts as reached if
+    any of its messages was sent, delivered or read."""
+    by_wamid: Dict[str, dict] = {}
+    by_phone: Dict[str, dict] = {}
+    for st in statuses:
+        status = (st.get("status") or "").lower()
+        if not status:
+            continue
+        code, message = _errors(st)
+        update_ = {"status": status, "error_code": code, "error_message": message, "payload": st}
+
+        wamid = st.get("id")
+        if wamid and (wamid not in by_wamid or _wins(status, by_wamid[wamid]["status"])):
+            by_wamid[wamid] = update_
+
+        phone = st.get("recipient_id") or st.get("recipient_phone")
+        if phone and status in SUCCESS_STATUSES + ("failed",):
+            prev = by_phone.get(phone)
+            if prev is None or prev["status"] == "failed":
+                by_phone[phone] = update_
+    return by_wamid, by_phone
+
+
+# ─────────────────────────────────────────────
+# Apply
+# ─────────────────────────────────────────────
+def _apply_wa_messages(db: Session, by_wamid: Dict[str, dict]) -> None:
+    from models import WAMessage
+
+    rows = [
+        (w, u["status"], -1 if u["status"] == "failed" else STATUS_RANK[u["status"]] - 1)
+        for w, u in by_wamid.items() if u["status"] in SUCCESS_STATUSES + ("failed",)
+    ]
+    if not rows:
+        return
+    v = values(column("wamid", String), column("status", String), column("rank", Integer), name="v").data(rows)
+    current = case(
+        (WAMessage.status == "read", 2), (WAMessage.status == "delivered", 1),
+        (WAMessage.status == "failed", -1), else_=0,
+    )
+    db.execute(
+        update(WAMessage)
+        .where(WAMessage.wa_message_id == v.c.wamid, (v.c.status == "failed") | (v.c.rank > current))
+        .values(status=cast(v.c.status, WAMessage.__table__.c.status.type))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _apply_sent_cards(db: Session, by_wamid: Dict[str, dict]) -> None:
+    from models import SentEventCard
+
+    v = values(column("wamid", String), column("status", String), column("error_message", Text), name="v").data([
+        (w, u["status"], u["error_message"]) for w, u in by_wamid.items()
+    ])
+    db.execute(
+        update(SentEventCard)
+        .where(SentEventCard.whatsapp_message_id == v.c.wamid)
+        .values(
+            delivery_status=v.c.status,
+            error_message=func.coalesce(v.c.error_message, SentEventCard.error_message),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _apply_message_logs(db: Session, by_wamid: Dict[str, dict]) -> None:
+    from models.wa_message_log import WAMessageLog
+    from utils.wa_logging import _NOT_ON_WA_CODES, _humanize, _safe_jsonable
+
+    L = WAMessageLog
+    v = values(
+        column("wamid", String), column("status", String), column("error_code", String),
+        column("error_message", Text), column("failure_reason", Text), column("payload", JSONB),
+        name="v",
+    ).data([
+        (
+            w, u["status"],
+            u["error_code"][:64] if u["error_code"] else None,
+            str(u["error_message"])[:2000] if u["error_message"] else None,
+            _humanize(u["error_code"], u["error_message"]) if u["status"] == "failed" else None,
+            _safe_jsonable(u["payload"]),
+        )
+        for w, u in by_wamid.items()
+    ])
+    # Only the newest log row per wamid, as update_from_status does.
+    newest = aliased(L)
+    t = (
+        select(newest.id.label("log_id"), *v.c)
+        .join(v, newest.provider_message_id == v.c.wamid)
+        .distinct(newest.provider_message_id)
+        .order_by(newest.provider_message_id, newest.created_at.desc())
+        .subquery("t")
+    )
+
+    def rank(col):
+        return case(*((col == s, r) for s, r in STATUS_RANK.items()), else_=0)
+
+    failed = t.c.status == "failed"
+    now = func.now()
+    db.execute(
+        update(L)
+        .where(L.id == t.c.log_id)
+        .values(
+            last_status_at=now,
+            status=case((failed, "failed"), (rank(t.c.status) >= rank(L.status), t.c.status), else_=L.status),
+            failed_at=case((failed, now), else_=L.failed_at),
+            error_code=case((failed, func.coalesce(t.c.error_code, L.error_code)), else_=L.error_code),
+            error_message=case((failed, func.coalesce(t.c.error_message, L.error_message)), else_=L.error_message),
+            failure_reason=case((failed, t.c.failure_reason), else_=L.failure_reason),
+            sent_at=case((t.c.status.in_(SUCCESS_STATUSES), func.coalesce(L.sent_at, now)), else_=L.sent_at),
+            delivered_at=case(
+                (t.c.status.in_(("delivered", "read")), func.coalesce(L.delivered_at, now)), else_=L.delivered_at,
+            ),
+            read_at=case((t.c.status == "read", func.coalesce(L.read_at, now)), else_=L.read_at),
+            whatsapp_available=case(
+                (t.c.status.in_(("delivered", "read")), True),
+                (failed & t.c.error_code.in_(list(_NOT_ON_WA_CODES)), False),
+                else_=L.whatsapp_available,
+            ),
+            webhook_payload=cast(t.c.payload, JSONB),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _apply_phone_statuses(db: Session, by_phone: Dict[str, dict]) -> int:
+    from models.phone_whatsapp import PhoneWhatsAppStatus as P
+    from utils.phone_numbers import normalize_phone
+    from utils.whatsapp_availability import (
+        NOT_ON_WHATSAPP_CODES, ST_AVAILABLE, ST_ERROR, ST_UNAVAILABLE,
+        _next_check_after, record_delivery_outcome,
+    )
+
+    rows = {}
+    for phone, u in by_phone.items():
+        norm = normalize_phone(phone)
+        if not norm.get("ok") or not norm.get("normalized"):
+            continue
+        if u["status"] in SUCCESS_STATUSES:
+            state = ST_AVAILABLE
+        elif u["error_code"] in NOT_ON_WHATSAPP_CODES:
+            state = ST_UNAVAILABLE
+        else:
+            state = ST_ERROR
+        rows[norm["normalized"]] = (phone, u, state)
+    if not rows:
+        return 0
+
+    v = values(
+        column("phone", String), column("state", String), column("response_code", String),
+        column("error_code", String), column("error_message", Text),
+        column("next_check_after", DateTime(timezone=True)), column("is_whatsapp", Boolean),
+        name="v",
+    ).data([
+        (
+            normalized, state, u["status"], u["error_code"], u["error_message"],
+            _next_check_after(state),
+            True if state == ST_AVAILABLE else False if state == ST_UNAVAILABLE else None,
+        )
+        for normalized, (_, u, state) in rows.items()
+    ])
+    available = v.c.state == ST_AVAILABLE
+    updated = db.execute(
+        update(P)
+        .where(P.normalized_phone == v.c.phone)
+        .values(
+            status=v.c.state,
+            is_whatsapp=func.coalesce(cast(v.c.is_whatsapp, Boolean), P.is_whatsapp),
+            provider_response_code=case((available, v.c.response_code), else_=P.provider_response_code),
+            provider_error_code=case((available, None), else_=v.c.error_code),
+            provider_error_message=case((available, None), else_=v.c.error_message),
+            last_checked_at=func.now(),
+            next_check_after=cast(v.c.next_check_after, DateTime(timezone=True)),
+        )
+        .returning(P.normalized_phone)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    # Phones with no cache row yet take the single-row path, which
+    # creates the row (and commits).
+    for normalized in set(rows) - set(updated):
+        phone, u, _ = rows[normalized]
+        record_delivery_outcome(
+            db, phone, delivery_status=u["status"],
+            error_code=u["error_code"], error_message=u["error_message"],
+        )
+    return len(rows)
+
+
+def apply_statuses(db: Session, statuses: Iterable[dict]) -> dict:
+    by_wamid, by_phone = coalesce(statuses)
+    if by_wamid:
+        _apply_wa_messages(db, by_wamid)
+        _apply_sent_cards(db, by_wamid)
+        _apply_message_logs(db, by_wamid)
+    phones = _apply_phone_statuses(db, by_phone) if by_phone else 0
+    return {"messages": len(by_wamid), "phones": phones}
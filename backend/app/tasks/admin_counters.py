@@ -0,0 +1,27 @@
+"""
+Task: Admin dashboard counters
+==============================
+Reconciles the Redis counters behind ``GET /admin/stats`` and
+``/admin/stats/extended`` (see ``services.admin_counters``).
+
+Jobs:
+
+* reconcile_admin_counters
+    Every 10 minutes: recounts every counter (exact, or the
+    ``pg_class.reltuples`` estimate for the largest unfiltered tables) and
+    overwrites the hash. Repairs drift from bulk updates and deletes that
+    the session hooks don't see.
+"""
+from core.celery_app import celery_app
+from core.database import SessionLocal
+
+
+@celery_app.task(name="tasks.admin_counters.reconcile_admin_counters", bind=True)
+def reconcile_admin_counters(self):
+    from services.admin_counters import reconcile
+
+    db = SessionLocal()
+    try:
+        return reconcile(db)
+    finally:
+        db.close()
@@ -0,0 +1,97 @@
+"""
+Task: Finance report PDFs
+=========================
+Renders an ``AdminReportJob`` (see ``services.admin_reports``) to
+``REPORT_OUTPUT_DIR`` outside the request. The builder streams its rows
+from a server-side cursor into ``write_pdf``, which writes straight to
+disk. The ``/admin/payments/reports/jobs`` list (shared by finance
+admins) shows the job as completed with a download link once it's done.
+
+Jobs:
+
+* generate_report_pdf
+    One job. Safe to re-run: completed jobs are skipped.
+
+* prune_report_files
+    Daily: deletes report files (and their job rows) older than
+    ``KEEP_DAYS``.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+from core.celery_app import celery_app
+from core.database import SessionLocal
+
+KEEP_DAYS = 7
+
+
+@celery_app.task(name="tasks.admin_reports.generate_report_pdf", bind=True, max_retries=1, default_retry_delay=60)
+def generate_report_pdf(self, job_id: str):
+    from models import AdminReportJob
+    from services.admin_reports import REPORT_OUTPUT_DIR, REPORTS, report_path, write_pdf
+
+    db = SessionLocal()
+    try:
+        job = db.query(AdminReportJob).filter(AdminReportJob.id == uuid.UUID(str(job_id))).first()
+        if not job:
+            return {"ok": False, "error": "job-not-found"}
+        if job.status == "completed":
+            return {"ok": True, "status": job.status}
+        if job.report_type not in REPORTS:
+            job.status = "failed"
+            job.error_message = f"Unknown report type: {job.report_type}"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            return {"ok": False, "error": "unknown-type"}
+
+        job.status = "processing"
+        job.started_at = datetime.utcnow()
+        db.commit()
+
+        from models import AdminUser
+        admin = db.query(AdminUser).filter(AdminUser.id == job.requested_by).first() if job.requested_by else None
+        title, builder = REPORTS[job.report_type]
+        REPORT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        path = report_path(job)
+        tmp = path.with_suffix(".part")
+        try:
+            headers, rows = builder(db, job.date_from, job.date_to)
+            with open(tmp, "wb") as fh:
+                count = write_pdf(fh, title, headers, rows, job.date_from, job.date_to,
+                                  generated_by=admin.full_name if admin else "Nuru Finance")
+            tmp.replace(path)
+        except Exception as e:  # noqa: BLE001
+            tmp.unlink(missing_ok=True)
+            db.rollback()
+            job.status = "failed"
+            job.error_message = str(e)[:500]
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            print(f"[admin_reports] job {job_id} failed: {e}")
+            return {"ok": False, "error": str(e)}
+
+        job.status = "completed"
+        job.row_count = count
+        job.finished_at = datetime.utcnow()
+        db.commit()
+        return {"ok": True, "rows": count}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="tasks.admin_reports.prune_report_files", bind=True)
+def prune_report_files(self):
+    from models import AdminReportJob
+    from services.admin_reports import report_path
+
+    db = SessionLocal()
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=KEEP_DAYS)
+        jobs = db.query(AdminReportJob).filter(AdminReportJob.created_at < cutoff).all()
+        for job in jobs:
+            report_path(job).unlink(missing_ok=True)
+            db.delete(job)
+        db.commit()
+        return {"pruned": len(jobs)}
+    finally:
+        db.close()
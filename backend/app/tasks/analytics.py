@@ -0,0 +1,254 @@
+"""
+Task: Page-view ingestion and rollups
+=====================================
+``POST /analytics/page-views`` no longer writes to Postgres per hit. Rows
+are pushed onto a Redis list (``CacheKeys.PAGE_VIEW_BUFFER``) and drained
+here in multi-row INSERTs. The admin dashboard reads only the rollup
+tables maintained below, so its numbers are exact (bar HLL error on
+uniques) over any range and independent of ``page_views`` retention.
+
+Jobs:
+
+* flush_page_views
+    Pops up to ``FLUSH_BATCH`` buffered rows at a time and bulk-inserts
+    them into ``page_views``. A failed insert pushes the batch back.
+
+* rollup_page_views
+    Rebuilds the hourly rollups for the last ``hours_back`` hours from
+    ``page_views`` (views, sessions, visitors + HLL sketches, per-path /
+    device / browser counts), then rebuilds every touched day from its
+    hourly rows. Idempotent — buckets are recomputed, never incremented,
+    so late flushes and re-runs converge. Run once with
+    ``hours_back=24 * 90`` to backfill after deploying.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import distinct, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from core.celery_app import CELERY_ENABLED, celery_app
+from core.database import SessionLocal
+from core.redis import CacheKeys, get_redis
+from models import PageView, PageViewRollup, PageViewRollupDimension
+from utils import hll
+
+FLUSH_BATCH = 2000
+MAX_FLUSH_BATCHES = 50
+# Per-hour cap on distinct paths kept; the long tail only matters for the
+# "top pages" list, which shows ten.
+MAX_PATHS_PER_BUCKET = 200
+
+_PAGE_VIEW_FIELDS = (
+    "path", "referrer", "user_agent", "device_type", "browser",
+    "session_id", "visitor_id",
+)
+_DIMENSIONS = {
+    "path": PageView.path,
+    "device": PageView.device_type,
+    "browser": PageView.browser,
+}
+
+
+# ─────────────────────────────────────────────
+# Ingestion
+# ─────────────────────────────────────────────
+def page_view_row(body: Dict[str, Any]) -> Dict[str, Any]:
+    row = {f: body.get(f) for f in _PAGE_VIEW_FIELDS}
+    row["path"] = row["path"] or "/"
+    row["created_at"] = datetime.utcnow()
+    return row
+
+
+def buffer_page_view(row: Dict[str, Any]) -> bool:
+    """Queue ``row`` for the next flush. False → caller should write it directly.
+
+    Buffering only makes sense where a Celery worker will drain the list,
+    so serverless deployments keep the synchronous insert.
+    """
+    if not CELERY_ENABLED:
+        return False
+    try:
+        r = get_redis()
+        if r is None:
+            return False
+        payload = dict(row, created_at=row["created_at"].isoformat())
+        r.rpush(CacheKeys.PAGE_VIEW_BUFFER, json.dumps(payload))
+        return True
+    except Exception:
+        return False
+
+
+def _decode(raw: str) -> Optional[Dict[str, Any]]:
+    try:
+        item = json.loads(raw)
+        row = {f: item.get(f) for f in _PAGE_VIEW_FIELDS}
+        row["path"] = row["path"] or "/"
+        row["created_at"] = datetime.fromisoformat(item["created_at"])
+        return row
+    except Exception:
+        return None
+
+
+@celery_app.task(
+    name="tasks.analytics.flush_page_views",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=60,
+)
+def flush_page_views(self):
+    r = get_redis()
+    if r is None:
+        return {"flushed": 0}
+    db = SessionLocal()
+    flushed = 0
+    try:
+        for _ in range(MAX_FLUSH_BATCHES):
+            pipe = r.pipeline(transaction=True)
+            pipe.lrange(CacheKeys.PAGE_VIEW_BUFFER, 0, FLUSH_BATCH - 1)
+            pipe.ltrim(CacheKeys.PAGE_VIEW_BUFFER, FLUSH_BATCH, -1)
+            raw_rows, _ = pipe.execute()
+            if not raw_rows:
+                break
+            rows = [row for row in map(_decode, raw_rows) if row]
+            if rows:
+                try:
+                    db.execute(insert(PageView), rows)
+                    db.commit()
+                except Exception as exc:  # noqa: BLE001
+                    db.rollback()
+                    r.lpush(CacheKeys.PAGE_VIEW_BUFFER, *reversed(raw_rows))
+                    raise self.retry(exc=exc)
+            flushed += len(rows)
+            if len(raw_rows) < FLUSH_BATCH:
+                break
+        return {"flushed": flushed}
+    finally:
+        db.close()
+
+
+# ─────────────────────────────────────────────
+# Rollups
+# ─────────────────────────────────────────────
+def _upsert_rollup(db, granularity: str, bucket: datetime, stats: Dict[str, Any]) -> None:
+    stmt = pg_insert(PageViewRollup).values(
+        granularity=granularity, bucket_start=bucket, **stats,
+    )
+    db.execute(stmt.on_conflict_do_update(
+        constraint="uq_page_view_rollup_bucket",
+        set_={**{k: stmt.excluded[k] for k in stats}, "updated_at": func.now()},
+    ))
+
+
+def _replace_dimensions(db, granularity: str, bucket: datetime, rows: List[Dict[str, Any]]) -> None:
+    db.query(PageViewRollupDimension).filter(
+        PageViewRollupDimension.granularity == granularity,
+        PageViewRollupDimension.bucket_start == bucket,
+    ).delete(synchronize_session=False)
+    if rows:
+        db.execute(insert(PageViewRollupDimension), [
+            dict(r, granularity=granularity, bucket_start=bucket) for r in rows
+        ])
+
+
+def _rollup_hour(db, hour: datetime) -> None:
+    window = (PageView.created_at >= hour, PageView.created_at < hour + timedelta(hours=1))
+
+    views = db.query(func.count(PageView.id)).filter(*window).scalar() or 0
+    visitor_ids = db.query(distinct(PageView.visitor_id)).filter(
+        *window, PageView.visitor_id.isnot(None),
+    ).yield_per(5000)
+    visitor_hll = hll.build(v for (v,) in visitor_ids)
+    session_ids = db.query(distinct(PageView.session_id)).filter(
+        *window, PageView.session_id.isnot(None),
+    ).yield_per(5000)
+    session_hll = hll.build(s for (s,) in session_ids)
+    _upsert_rollup(db, "hour", hour, {
+        "views": views,
+        "visitors": hll.count(visitor_hll),
+        "sessions": hll.count(session_hll),
+        "visitor_hll": visitor_hll,
+        "session_hll": session_hll,
+    })
+
+    dims: List[Dict[str, Any]] = []
+    for name, column in _DIMENSIONS.items():
+        value = func.coalesce(column, "unknown")
+        q = (
+            db.query(value, func.count(PageView.id))
+            .filter(*window)
+            .group_by(value)
+            .order_by(func.count(PageView.id).desc())
+        )
+        if name == "path":
+            q = q.limit(MAX_PATHS_PER_BUCKET)
+        dims.extend({"dimension": name, "value": v, "views": c} for v, c in q)
+    _replace_dimensions(db, "hour", hour, dims)
+
+
+def _rollup_day(db, day: datetime) -> None:
+    window = (
+        PageViewRollup.granularity == "hour",
+        PageViewRollup.bucket_start >= day,
+        PageViewRollup.bucket_start < day + timedelta(days=1),
+    )
+    hours = db.query(
+        PageViewRollup.views, PageViewRollup.visitor_hll, PageViewRollup.session_hll,
+    ).filter(*window).all()
+    visitor_hll = hll.merge(h.visitor_hll for h in hours)
+    session_hll = hll.merge(h.session_hll for h in hours)
+    _upsert_rollup(db, "day", day, {
+        "views": sum(h.views for h in hours),
+        "visitors": hll.count(visitor_hll),
+        "sessions": hll.count(session_hll),
+        "visitor_hll": visitor_hll,
+        "session_hll": session_hll,
+    })
+
+    dims = (
+        db.query(
+            PageViewRollupDimension.dimension,
+            PageViewRollupDimension.value,
+            func.sum(PageViewRollupDimension.views),
+        )
+        .filter(
+            PageViewRollupDimension.granularity == "hour",
+            PageViewRollupDimension.bucket_start >= day,
+            PageViewRollupDimension.bucket_start < day + timedelta(days=1),
+        )
+        .group_by(PageViewRollupDimension.dimension, PageViewRollupDimension.value)
+        .all()
+    )
+    _replace_dimensions(db, "day", day, [
+        {"dimension": d, "value": v, "views": int(c or 0)} for d, v, c in dims
+    ])
+
+
+@celery_app.task(
+    name="tasks.analytics.rollup_page_views",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=120,
+)
+def rollup_page_views(self, hours_back: int = 2):
+    db = SessionLocal()
+    try:
+        current = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        days = set()
+        for n in range(max(int(hours_back), 0), -1, -1):
+            hour = current - timedelta(hours=n)
+            _rollup_hour(db, hour)
+            db.commit()
+            days.add(hour.replace(hour=0))
+        for day in sorted(days):
+            _rollup_day(db, day)
+            db.commit()
+        return {"hours": int(hours_back) + 1, "days": len(days)}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
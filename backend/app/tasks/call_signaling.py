@@ -0,0 +1,57 @@
+"""
+Task: Ring timeouts for 1:1 calls
+=================================
+``GET /calls/incoming`` and ``GET /calls/{id}/status`` used to mark stale
+ringing calls ``missed`` on every poll — a write on the hottest read path.
+Expiry now happens here and the participants are told over ``/calls/ws``.
+
+* expire_ringing_call
+    Scheduled by ``POST /calls/start`` with a countdown of the ring
+    timeout. Marks that one call ``missed`` if nobody answered, declined
+    or hung up in the meantime; otherwise a no-op.
+
+* expire_stale_calls
+    One-minute sweep for calls whose scheduled task was lost (worker
+    restart before the countdown elapsed).
+"""
+from core.celery_app import celery_app
+from core.database import SessionLocal
+
+
+@celery_app.task(
+    name="tasks.call_signaling.expire_ringing_call",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=5,
+)
+def expire_ringing_call(self, call_id: str):
+    # Imported lazily to avoid circular imports at worker boot.
+    from api.routes.calls import expire_stale_ringing
+
+    db = SessionLocal()
+    try:
+        return {"expired": expire_stale_ringing(db, call_id=call_id)}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="tasks.call_signaling.expire_stale_calls",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=30,
+)
+def expire_stale_calls(self):
+    from api.routes.calls import expire_stale_ringing
+
+    db = SessionLocal()
+    try:
+        return {"expired": expire_stale_ringing(db)}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
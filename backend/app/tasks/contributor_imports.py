@@ -4,15 +4,30 @@ Mirrors the inline logic that used to live in
 ``POST /events/{event_id}/contributors/bulk`` so behaviour stays
 identical, with the difference that work happens in the background and
 the HTTP request returns immediately with a ``job_id``.
+
+Rows are processed set-based rather than one at a time: phones are
+normalised in Python, the event's contributors and the owner's address
+book are preloaded once into dicts keyed by ``_phone_key``, and new
+``UserContributor`` / ``EventContributor`` / ``EventContribution`` rows
+are written per chunk with multi-row ``INSERT ... ON CONFLICT``. A
+10k-row spreadsheet costs a handful of queries per chunk instead of
+several sequential lookups per row.
+
+Spreadsheet uploads are staged on disk (``job.source_path``) and streamed
+through ``utils.import_files`` one chunk at a time, so the worker's memory
+is bounded by ``CHUNK_SIZE`` rather than the size of the sheet. JSON jobs
+keep their rows in ``payload["contributors"]``.
 """
 from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import pytz
-from sqlalchemy import func as sa_func
+from sqlalchemy import func as sa_func, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload
 
 
 from core.celery_app import celery_app
@@ -20,16 +35,24 @@ from core.database import SessionLocal
 from models import (
     ContributorImportJob,
     Event,
+    EventContribution,
     EventContributor,
     User,
     UserContributor,
 )
+from services.contribution_insights import mark_insights_stale, queue_insights_rebuild
+from services.event_totals import lock_events, recompute_event_totals, refresh_contributor_totals
 from utils.helpers import format_phone_display
+from utils.import_files import iter_chunks, iter_sheet_records, remove_import_upload
+from utils.phone_numbers import phone_key
 from utils.validation_functions import validate_phone_number
 
 
 EAT = pytz.timezone("Africa/Dar_es_Salaam")
 
+# Rows written per INSERT/UPDATE round-trip and per progress checkpoint.
+CHUNK_SIZE = 500
+
 
 def _currency_code(db, event: Event) -> str:
     try:
@@ -48,64 +71,304 @@ def _phone_key(phone: str | None) -> str:
     return digits[-9:] if len(digits) >= 9 else digits
 
 
-def _phone_key_expr(column):
-    return sa_func.right(sa_func.regexp_replace(column, r"[^0-9]", "", "g"), 9)
+_CONTRIBUTOR_FIELDS = {
+    "name": (("name", "full name", "contributor", "contributor name"), 0),
+    "phone": (("phone", "phone number", "mobile", "mobile number"), 1),
+    "amount": (("amount", "pledge", "target", "pledge amount"), 2),
+}
 
 
-def _find_event_contributor_by_phone(db, event_id, phone: str):
-    key = _phone_key(phone)
-    if not key:
-        return None
-    return (
-        db.query(EventContributor)
-        .join(UserContributor, EventContributor.contributor_id == UserContributor.id)
-        .filter(
-            EventContributor.event_id == event_id,
-            UserContributor.phone.isnot(None),
-            _phone_key_expr(UserContributor.phone) == key,
-        )
-        .order_by(EventContributor.created_at.asc(), EventContributor.id.asc())
-        .first()
-    )
+def _job_rows(job: ContributorImportJob):
+    """Generator over the job's input rows (staged file or JSON payload)."""
+    if job.source_path:
+        return iter_sheet_records(job.source_path, _CONTRIBUTOR_FIELDS)
+    return iter((job.payload or {}).get("contributors") or [])
 
 
-def _find_event_contributor_by_name_without_phone(db, event_id, name: str):
-    return (
-        db.query(EventContributor)
-        .join(UserContributor, EventContributor.contributor_id == UserContributor.id)
-        .filter(
-            EventContributor.event_id == event_id,
-            sa_func.lower(UserContributor.name) == name.lower(),
-            (UserContributor.phone.is_(None) | (sa_func.trim(UserContributor.phone) == "")),
-        )
-        .order_by(EventContributor.created_at.asc(), EventContributor.id.asc())
-        .first()
-    )
+def _count_rows(job: ContributorImportJob) -> int:
+    return sum(1 for _ in _job_rows(job))
 
 
-def _find_address_book_contributor_by_phone(db, owner_id, phone: str):
-    key = _phone_key(phone)
-    if not key:
-        return None
-    contributor = (
-        db.query(UserContributor)
-        .filter(UserContributor.user_id == owner_id, UserContributor.phone == phone)
-        .first()
-    )
-    if contributor:
-        return contributor
-    return (
-        db.query(UserContributor)
-        .filter(
-            UserContributor.user_id == owner_id,
-            UserContributor.phone.isnot(None),
-            _phone_key_expr(UserContributor.phone) == key,
+def _parse_amount(raw: Any) -> float:
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    text = str(raw or "").replace(",", "").strip()
+    return float(text) if text else 0.0
+
+
+class _ImportIndex:
+    """In-memory view of the event's contributors and the owner's address book.
+
+    Contributors and event links are held as plain dicts (not ORM objects)
+    so a chunk can be written with bulk statements and the index kept in
+    step without a flush. Entries created during the import are registered
+    immediately so duplicate phones/names later in the file resolve to the
+    same row, exactly as the per-row lookups used to after each flush.
+    """
+
+    def __init__(self, db, event_id, owner_id):
+        self.event_id = event_id
+        self.owner_id = owner_id
+        self.uc_by_id: Dict[Any, Dict[str, Any]] = {}
+        self.ab_by_phone: Dict[str, Dict[str, Any]] = {}
+        self.ab_by_key: Dict[str, Dict[str, Any]] = {}
+        self.ec_by_key: Dict[str, Dict[str, Any]] = {}
+        self.ec_by_blank_name: Dict[str, Dict[str, Any]] = {}
+        self.ec_by_contributor: Dict[Any, Dict[str, Any]] = {}
+        self._load(db)
+
+    @staticmethod
+    def _uc(row) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "name": row.name,
+            "phone": row.phone,
+            "secondary_phone": row.secondary_phone,
+            "notify_target": row.notify_target,
+            "new": False,
+        }
+
+    def _load(self, db) -> None:
+        uc_cols = (
+            UserContributor.id,
+            UserContributor.name,
+            UserContributor.phone,
+            UserContributor.secondary_phone,
+            UserContributor.notify_target,
+        )
+        for row in (
+            db.query(*uc_cols)
+            .filter(UserContributor.user_id == self.owner_id)
+            .order_by(UserContributor.created_at.asc(), UserContributor.id.asc())
+        ):
+            uc = self._uc(row)
+            self.uc_by_id[uc["id"]] = uc
+            self._index_address_book(uc)
+
+        paid_by_ec = dict(
+            db.query(EventContribution.event_contributor_id, sa_func.sum(EventContribution.amount))
+            .filter(EventContribution.event_id == self.event_id)
+            .group_by(EventContribution.event_contributor_id)
+            .all()
         )
-        .order_by(UserContributor.created_at.asc(), UserContributor.id.asc())
-        .first()
+        for row in (
+            db.query(
+                EventContributor.id.label("ec_id"),
+                EventContributor.pledge_amount,
+                *uc_cols,
+            )
+            .join(UserContributor, EventContributor.contributor_id == UserContributor.id)
+            .filter(EventContributor.event_id == self.event_id)
+            .order_by(EventContributor.created_at.asc(), EventContributor.id.asc())
+        ):
+            uc = self.uc_by_id.get(row.id)
+            if uc is None:
+                # Linked contributor from another address book (e.g. the
+                # creator's, when ownership was transferred).
+                uc = self._uc(row)
+                self.uc_by_id[uc["id"]] = uc
+            self._index_event_link({
+                "id": row.ec_id,
+                "contributor": uc,
+                "pledge_amount": float(row.pledge_amount or 0),
+                "paid": float(paid_by_ec.get(row.ec_id) or 0),
+                "new": False,
+            })
+
+    def _index_address_book(self, uc: Dict[str, Any]) -> None:
+        phone = uc["phone"]
+        if not phone:
+            return
+        self.ab_by_phone.setdefault(phone, uc)
+        key = _phone_key(phone)
+        if key:
+            self.ab_by_key.setdefault(key, uc)
+
+    def _index_event_link(self, ec: Dict[str, Any]) -> None:
+        uc = ec["contributor"]
+        self.ec_by_contributor.setdefault(uc["id"], ec)
+        phone = (uc["phone"] or "").strip()
+        if phone:
+            key = _phone_key(phone)
+            if key:
+                self.ec_by_key.setdefault(key, ec)
+        else:
+            self.ec_by_blank_name.setdefault((uc["name"] or "").lower(), ec)
+
+    def find_event_link(self, phone: Optional[str], name: str):
+        if phone:
+            return self.ec_by_key.get(_phone_key(phone))
+        return self.ec_by_blank_name.get(name.lower())
+
+    def find_address_book(self, phone: str):
+        return self.ab_by_phone.get(phone) or self.ab_by_key.get(_phone_key(phone))
+
+    def add_contributor(self, name: str, phone: Optional[str]) -> Dict[str, Any]:
+        uc = {
+            "id": uuid.uuid4(),
+            "name": name,
+            "phone": phone,
+            "secondary_phone": None,
+            "notify_target": "primary",
+            "new": True,
+        }
+        self.uc_by_id[uc["id"]] = uc
+        self._index_address_book(uc)
+        return uc
+
+    def change_phone(self, uc: Dict[str, Any], phone: str) -> bool:
+        """Move ``uc`` to ``phone`` unless another address-book row owns it."""
+        owner = self.ab_by_phone.get(phone)
+        if owner is not None and owner is not uc:
+            return False
+        if uc["phone"] and self.ab_by_phone.get(uc["phone"]) is uc:
+            del self.ab_by_phone[uc["phone"]]
+        elif not uc["phone"]:
+            blank = (uc["name"] or "").lower()
+            ec = self.ec_by_blank_name.get(blank)
+            if ec is not None and ec["contributor"] is uc:
+                del self.ec_by_blank_name[blank]
+        uc["phone"] = phone
+        self._index_address_book(uc)
+        key = _phone_key(phone)
+        ec = self.ec_by_contributor.get(uc["id"])
+        if ec is not None and key:
+            self.ec_by_key.setdefault(key, ec)
+        return True
+
+    def add_event_link(self, uc: Dict[str, Any], pledge: float) -> Dict[str, Any]:
+        ec = {
+            "id": uuid.uuid4(),
+            "contributor": uc,
+            "pledge_amount": pledge,
+            "paid": 0.0,
+            "new": True,
+        }
+        self._index_event_link(ec)
+        return ec
+
+
+def _write_chunk(db, index: _ImportIndex, plan: Dict[str, Any], now, mode: str) -> None:
+    """Flush one chunk's planned writes with bulk statements."""
+    # Take the event's totals lock before any contributor row, in the same
+    # order as the ORM hooks, so a concurrent payment can't deadlock us.
+    lock_events(db, [index.event_id])
+    # Updates first so a phone freed by a rename is available to the
+    # inserts below.
+    if plan["uc_updates"]:
+        db.execute(update(UserContributor), [
+            {
+                "id": uc["id"],
+                "name": uc["name"],
+                "phone": uc["phone"],
+                "phone_key": phone_key(uc["phone"]),
+                "updated_at": now,
+            }
+            for uc in plan["uc_updates"].values()
+        ])
+
+    new_ucs = plan["uc_inserts"]
+    if new_ucs:
+        stmt = pg_insert(UserContributor).values([
+            {
+                "id": uc["id"],
+                "user_id": index.owner_id,
+                "name": uc["name"],
+                "phone": uc["phone"],
+                "phone_key": phone_key(uc["phone"]),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for uc in new_ucs
+        ])
+        # DO UPDATE (rather than DO NOTHING) so RETURNING also yields the
+        # id of a row a concurrent writer inserted for the same phone.
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_contributor_phone",
+            set_={"updated_at": stmt.excluded.updated_at},
+        ).returning(UserContributor.id, UserContributor.phone)
+        by_phone = {uc["phone"]: uc for uc in new_ucs if uc["phone"]}
+        for row_id, phone in db.execute(stmt):
+            uc = by_phone.get(phone)
+            if uc is not None and uc["id"] != row_id:
+                index.uc_by_id.pop(uc["id"], None)
+                uc["id"] = row_id
+                index.uc_by_id[row_id] = uc
+        for uc in new_ucs:
+            uc["new"] = False
+
+    new_ecs = plan["ec_inserts"]
+    if new_ecs:
+        stmt = pg_insert(EventContributor).values([
+            {
+                "id": ec["id"],
+                "event_id": index.event_id,
+                "contributor_id": ec["contributor"]["id"],
+                "pledge_amount": ec["pledge_amount"],
+                "secondary_phone": ec["contributor"]["secondary_phone"],
+                "notify_target": ec["contributor"]["notify_target"] or "primary",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for ec in new_ecs
+        ])
+        set_ = {"updated_at": stmt.excluded.updated_at}
+        if mode == "targets":
+            set_["pledge_amount"] = stmt.excluded.pledge_amount
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_event_contributor", set_=set_,
+        ).returning(EventContributor.id, EventContributor.contributor_id)
+        by_contributor = {ec["contributor"]["id"]: ec for ec in new_ecs}
+        for row_id, contributor_id in db.execute(stmt):
+            ec = by_contributor.get(contributor_id)
+            if ec is not None:
+                ec["id"] = row_id
+        for ec in new_ecs:
+            ec["new"] = False
+
+    if plan["ec_updates"]:
+        db.execute(update(EventContributor), [
+            {"id": ec["id"], "pledge_amount": ec["pledge_amount"], "updated_at": now}
+            for ec in plan["ec_updates"].values()
+        ])
+
+    if plan["contributions"]:
+        values = []
+        for item in plan["contributions"]:
+            value = {k: v for k, v in item.items() if k != "_ec"}
+            value["event_contributor_id"] = item["_ec"]["id"]
+            values.append(value)
+        db.execute(insert(EventContribution), values)
+        refresh_contributor_totals(db, {v["event_contributor_id"] for v in values})
+
+
+def _mark_chunk_insights_stale(db, plan: Dict[str, Any]) -> set:
+    """Flag the insights snapshots of users whose history the chunk moved
+    (the ORM hooks in ``models.user_contribution_insights`` don't see bulk
+    statements). Run after ``_write_chunk``, once the ids are final."""
+    contributors = set(plan["uc_updates"])
+    contributors.update(ec["contributor"]["id"] for ec in plan["ec_inserts"])
+    contributors.update(ec["contributor"]["id"] for ec in plan["ec_updates"].values())
+    return mark_insights_stale(
+        db,
+        links={item["_ec"]["id"] for item in plan["contributions"]},
+        contributors=contributors,
+        phone_keys=plan["old_phone_keys"],
     )
 
 
+def _load_event_contributors(db, ids: List[Any]) -> Dict[Any, EventContributor]:
+    out: Dict[Any, EventContributor] = {}
+    for batch in iter_chunks(ids, CHUNK_SIZE):
+        for ec in (
+            db.query(EventContributor)
+            .options(joinedload(EventContributor.contributor))
+            .filter(EventContributor.id.in_(batch))
+        ):
+            out[ec.id] = ec
+    return out
+
+
 @celery_app.task(name="contributors.process_import_job", bind=True, max_retries=2)
 def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
     db = SessionLocal()
@@ -129,13 +392,29 @@ def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
             db.commit()
             return {"ok": False, "error": "event-not-found"}
 
-        rows: List[Dict[str, Any]] = list(job.payload.get("contributors") or [])
+        try:
+            total_rows = _count_rows(job)
+        except Exception as e:
+            job.status = "failed"
+            job.error_message = f"Could not read file: {e}"[:1000]
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            remove_import_upload(job.source_path)
+            return {"ok": False, "error": "unreadable-file"}
+        if total_rows == 0:
+            job.status = "failed"
+            job.error_message = "No data rows found in file"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            remove_import_upload(job.source_path)
+            return {"ok": False, "error": "no-rows"}
+
         send_sms = bool(job.send_sms)
         mode = (job.mode or "targets").strip()
 
         job.status = "processing"
         job.started_at = datetime.utcnow()
-        job.total_rows = len(rows)
+        job.total_rows = total_rows
         job.processed_rows = 0
         job.successful_rows = 0
         job.failed_rows = 0
@@ -151,198 +430,182 @@ def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
             format_phone_display(organizer.phone) if organizer and organizer.phone else None
         )
 
+        pm = None
+        if mode != "targets" and job.payment_method:
+            from models import PaymentMethodEnum
+            try:
+                pm = PaymentMethodEnum(job.payment_method)
+            except Exception:
+                pm = None
+        from models import ContributionStatusEnum
+
         errors: List[Dict[str, Any]] = []
         success_count = 0
         failure_count = 0
         notifications: List[Dict[str, Any]] = []
         wa_phones: set[str] = set()
+        index = _ImportIndex(db, event.id, owner_id)
+
+        processed = 0
+        for chunk in iter_chunks(_job_rows(job), CHUNK_SIZE):
+            offset = processed
+            processed += len(chunk)
+            plan: Dict[str, Any] = {
+                "uc_inserts": [],
+                "uc_updates": {},
+                "ec_inserts": [],
+                "ec_updates": {},
+                "contributions": [],
+                # Phones moved off an address-book entry: whoever they
+                # resolved to loses that history.
+                "old_phone_keys": set(),
+            }
+            chunk_ok: List[int] = []
+            chunk_notifications: List[Dict[str, Any]] = []
+
+            for i, row in enumerate(chunk):
+                row_num = row.get("_row") or offset + i + 1
+                try:
+                    name = (row.get("name") or "").strip()
+                    phone_raw = (row.get("phone") or "").strip()
+                    amount = _parse_amount(row.get("amount"))
 
-        for idx, row in enumerate(rows):
-            row_num = idx + 1
-            try:
-                name = (row.get("name") or "").strip()
-                phone_raw = (row.get("phone") or "").strip()
-                amount = float(row.get("amount") or 0)
-
-                if not name:
-                    errors.append({"row": row_num, "message": "Name is required"})
-                    failure_count += 1
-                    continue
-                phone = None
-                if phone_raw:
-                    try:
-                        phone = validate_phone_number(phone_raw)
-                        wa_phones.add(phone)
-                    except ValueError:
-                        errors.append({
-                            "row": row_num,
-                            "message": f"Invalid phone for {name}: {phone_raw}",
-                        })
+                    if not name:
+                        errors.append({"row": row_num, "message": "Name is required"})
                         failure_count += 1
                         continue
+                    phone = None
+                    if phone_raw:
+                        try:
+                            phone = validate_phone_number(phone_raw)
+                            wa_phones.add(phone)
+                        except ValueError:
+                            errors.append({
+                                "row": row_num,
+                                "message": f"Invalid phone for {name}: {phone_raw}",
+                            })
+                            failure_count += 1
+                            continue
 
-                ec = _find_event_contributor_by_phone(db, event.id, phone) if phone else None
-                if not ec and not phone:
-                    ec = _find_event_contributor_by_name_without_phone(db, event.id, name)
-
-                # Upsert UserContributor without deleting anything. Phone is
-                # authoritative when present; rows without a phone are recorded
-                # as new/no-phone contributors unless the same no-phone name is
-                # already linked to this event.
-                contributor = ec.contributor if ec and ec.contributor else None
-                if not contributor and phone:
-                    contributor = _find_address_book_contributor_by_phone(db, owner_id, phone)
-                if not contributor:
-                    contributor = UserContributor(
-                        id=uuid.uuid4(),
-                        user_id=owner_id,
-                        name=name,
-                        phone=phone,
-                        created_at=now,
-                        updated_at=now,
-                    )
-                    db.add(contributor)
-                    db.flush()
-                else:
-                    changed = False
-                    if name and contributor.name != name:
-                        contributor.name = name
-                        changed = True
-                    # Backfill / update phone on the matched contributor so
-                    # subsequent uploads stay in sync.
-                    if phone and contributor.phone != phone:
-                        # Guard against violating the (user_id, phone) unique
-                        # constraint — if another row already owns this phone,
-                        # keep the original phone instead of overwriting.
-                        clash = (
-                            db.query(UserContributor.id)
-                            .filter(
-                                UserContributor.user_id == owner_id,
-                                UserContributor.phone == phone,
-                                UserContributor.id != contributor.id,
-                            )
-                            .first()
-                        )
-                        if not clash:
-                            contributor.phone = phone
+                    ec = index.find_event_link(phone, name)
+
+                    # Upsert UserContributor without deleting anything. Phone is
+                    # authoritative when present; rows without a phone are recorded
+                    # as new/no-phone contributors unless the same no-phone name is
+                    # already linked to this event.
+                    contributor = ec["contributor"] if ec else None
+                    if not contributor and phone:
+                        contributor = index.find_address_book(phone)
+                    if not contributor:
+                        contributor = index.add_contributor(name, phone)
+                        plan["uc_inserts"].append(contributor)
+                    else:
+                        changed = False
+                        if contributor["name"] != name:
+                            contributor["name"] = name
                             changed = True
-                    if changed:
-                        contributor.updated_at = now
-
-                if not ec:
-                    ec = (
-                        db.query(EventContributor)
-                        .filter(
-                            EventContributor.event_id == event.id,
-                            EventContributor.contributor_id == contributor.id,
-                        )
-                        .first()
-                    )
-
-                if mode == "targets":
-                    if ec:
-                        old_pledge = float(ec.pledge_amount or 0)
-                        ec.pledge_amount = amount
-                        ec.updated_at = now
-                        if send_sms and amount > 0 and amount != old_pledge:
-                            ec.contributor = contributor
-                            notifications.append({
-                                "event_contributor": ec,
-                                "contributor_name": contributor.name,
-                                "amount": amount,
-                                "old_pledge": old_pledge,
-                                "kind": "updated" if old_pledge > 0 and amount > old_pledge else "set",
-                            })
+                        # Backfill / update phone on the matched contributor so
+                        # subsequent uploads stay in sync. ``change_phone``
+                        # refuses when another address-book row already owns
+                        # the phone (uq_user_contributor_phone).
+                        old_phone = contributor["phone"]
+                        if phone and old_phone != phone and index.change_phone(contributor, phone):
+                            changed = True
+                            if old_phone:
+                                plan["old_phone_keys"].add(phone_key(old_phone))
+                        if changed and not contributor["new"]:
+                            plan["uc_updates"][contributor["id"]] = contributor
+
+                    if not ec:
+                        ec = index.ec_by_contributor.get(contributor["id"])
+
+                    if mode == "targets":
+                        if ec:
+                            old_pledge = ec["pledge_amount"]
+                            ec["pledge_amount"] = amount
+                            if not ec["new"]:
+                                plan["ec_updates"][ec["id"]] = ec
+                            if send_sms and amount > 0 and amount != old_pledge:
+                                chunk_notifications.append({
+                                    "event_contributor": ec,
+                                    "contributor_name": name,
+                                    "amount": amount,
+                                    "old_pledge": old_pledge,
+                                    "kind": "updated" if old_pledge > 0 and amount > old_pledge else "set",
+                                })
+                        else:
+                            ec = index.add_event_link(contributor, amount)
+                            plan["ec_inserts"].append(ec)
+                            if send_sms and amount > 0:
+                                chunk_notifications.append({
+                                    "event_contributor": ec,
+                                    "contributor_name": name,
+                                    "amount": amount,
+                                    "old_pledge": 0,
+                                    "kind": "set",
+                                })
                     else:
-                        ec = EventContributor(
-                            id=uuid.uuid4(),
-                            event_id=event.id,
-                            contributor_id=contributor.id,
-                            pledge_amount=amount,
-                            secondary_phone=getattr(contributor, "secondary_phone", None),
-                            notify_target=getattr(contributor, "notify_target", None) or "primary",
-                            created_at=now,
-                            updated_at=now,
-                        )
-                        db.add(ec)
-                        db.flush()
-                        if send_sms and amount > 0:
-                            ec.contributor = contributor
-                            notifications.append({
-                                "event_contributor": ec,
-                                "contributor_name": contributor.name,
+                        if not ec:
+                            ec = index.add_event_link(contributor, 0)
+                            plan["ec_inserts"].append(ec)
+                        if amount > 0:
+                            total_paid_before = ec["paid"]
+                            ec["paid"] = total_paid_before + amount
+                            plan["contributions"].append({
+                                "id": uuid.uuid4(),
+                                "event_id": event.id,
+                                "_ec": ec,
+                                "contributor_name": name,
                                 "amount": amount,
-                                "old_pledge": 0,
-                                "kind": "set",
+                                "payment_method": pm,
+                                "confirmation_status": ContributionStatusEnum.confirmed,
+                                "confirmed_at": now,
+                                "contributed_at": now,
+                                "created_at": now,
+                                "updated_at": now,
                             })
-                else:
-                    if not ec:
-                        ec = EventContributor(
-                            id=uuid.uuid4(),
-                            event_id=event.id,
-                            contributor_id=contributor.id,
-                            pledge_amount=0,
-                            secondary_phone=getattr(contributor, "secondary_phone", None),
-                            notify_target=getattr(contributor, "notify_target", None) or "primary",
-                            created_at=now,
-                            updated_at=now,
-                        )
-                        db.add(ec)
-                        db.flush()
-                    # Contribution recording delegates to existing helpers
-                    # to keep semantics aligned with the inline path.
-                    if amount > 0:
-                        try:
-                            from models import EventContribution, PaymentMethodEnum, ContributionStatusEnum
-                            pm = None
-                            if job.payment_method:
-                                try:
-                                    pm = PaymentMethodEnum(job.payment_method)
-                                except Exception:
-                                    pm = None
-                            total_paid_before = sum(float(c.amount or 0) for c in getattr(ec, "contributions", []) or [])
-                            db.add(EventContribution(
-                                id=uuid.uuid4(),
-                                event_id=event.id,
-                                event_contributor_id=ec.id,
-                                contributor_name=contributor.name,
-                                amount=amount,
-                                payment_method=pm,
-                                confirmation_status=ContributionStatusEnum.confirmed,
-                                confirmed_at=now,
-                                contributed_at=now,
-                                created_at=now,
-                                updated_at=now,
-                            ))
                             if send_sms:
-                                ec.contributor = contributor
-                                notifications.append({
+                                chunk_notifications.append({
                                     "event_contributor": ec,
-                                    "contributor_name": contributor.name,
+                                    "contributor_name": name,
                                     "amount": amount,
                                     "total_paid": total_paid_before + amount,
-                                    "pledge": float(ec.pledge_amount or 0),
+                                    "pledge": ec["pledge_amount"],
                                     "kind": "recorded",
                                 })
-                        except Exception as e:
-                            errors.append({"row": row_num, "message": f"Payment record failed: {e}"})
-                            failure_count += 1
-                            continue
 
-                success_count += 1
-            except Exception as e:  # pragma: no cover
-                errors.append({"row": row_num, "message": str(e)})
-                failure_count += 1
-            finally:
-                # Periodic progress checkpoint
-                if (idx + 1) % 25 == 0:
-                    job.processed_rows = idx + 1
-                    job.successful_rows = success_count
-                    job.failed_rows = failure_count
-                    job.errors = errors
-                    db.commit()
+                    chunk_ok.append(row_num)
+                except Exception as e:  # pragma: no cover
+                    errors.append({"row": row_num, "message": str(e)})
+                    failure_count += 1
 
-        db.commit()
+            stale_users: set = set()
+            try:
+                _write_chunk(db, index, plan, now, mode)
+                # Bulk statements bypass the ORM hooks that keep the event's
+                # totals row and contributors' insights current; refresh /
+                # invalidate them in the same transaction.
+                recompute_event_totals(db, [event.id])
+                stale_users = _mark_chunk_insights_stale(db, plan)
+                success_count += len(chunk_ok)
+                notifications.extend(chunk_notifications)
+            except Exception as e:
+                # The chunk is written atomically: report every row in it as
+                # failed and rebuild the index from what actually committed.
+                db.rollback()
+                stale_users = set()
+                for row_num in chunk_ok:
+                    errors.append({"row": row_num, "message": f"Could not save row: {e}"})
+                failure_count += len(chunk_ok)
+                index = _ImportIndex(db, event.id, owner_id)
+
+            # Progress checkpoint per chunk
+            job.processed_rows = processed
+            job.successful_rows = success_count
+            job.failed_rows = failure_count
+            job.errors = list(errors)
+            db.commit()
+            queue_insights_rebuild(stale_users)
 
         if notifications:
             try:
@@ -357,8 +620,13 @@ def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
                                        recipient_type="contributor")
                 except Exception: pass
                 pay_instr = resolve_payment_instructions(event)
+                ec_rows = _load_event_contributors(
+                    db, {item["event_contributor"]["id"] for item in notifications}
+                )
                 for item in notifications:
-                    ec = item["event_contributor"]
+                    ec = ec_rows.get(item["event_contributor"]["id"])
+                    if ec is None:
+                        continue
                     recipients = contributor_notify_phones(ec)
                     for ph in recipients:
                         try:
@@ -436,7 +704,7 @@ def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
             except Exception as e:
                 print(f"[bulk_import] notification setup failed: {e}")
 
-        job.processed_rows = len(rows)
+        job.processed_rows = processed
         job.successful_rows = success_count
         job.failed_rows = failure_count
         job.errors = errors
@@ -449,7 +717,7 @@ def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
         else:
             job.status = "partially_completed"
         db.commit()
-
+        remove_import_upload(job.source_path)
 
         # Best-effort: queue WhatsApp availability checks for every unique
         # phone discovered. Never blocks the import — failures are swallowed.
@@ -463,7 +731,7 @@ def process_contributor_import_job(self, job_id: str) -> Dict[str, Any]:
         return {
             "ok": True,
             "status": job.status,
-            "total": len(rows),
+            "total": total_rows,
             "successful": success_count,
             "failed": failure_count,
         }
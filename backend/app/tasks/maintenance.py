@@ -25,6 +25,15 @@ Jobs:
 * prune_old_page_views
     Deletes ``page_views`` older than 90 days — pure analytics, no business
     impact, but the table grows fast.
+
+* rebuild_event_contribution_totals
+    Recomputes ``event_contribution_totals`` for one event or all of them.
+    Writes keep the rows current; this repairs drift from raw SQL edits.
+
+* rebuild_contribution_insights
+    Rebuilds the ``user_contribution_insights`` snapshots of the given
+    users. Queued after commit by the session hooks whenever a payment,
+    pledge or address-book link behind a snapshot changes.
 """
 from datetime import datetime, timedelta
 
@@ -221,3 +230,56 @@ def prune_old_page_views(self, retention_days: int = 90):
         raise self.retry(exc=exc)
     finally:
         db.close()
+
+
+# ─────────────────────────────────────────────
+# Event contribution totals
+# ─────────────────────────────────────────────
+@celery_app.task(
+    name="tasks.maintenance.rebuild_event_contribution_totals",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=600,
+)
+def rebuild_event_contribution_totals(self, event_id: str = None):
+    from services.event_totals import rebuild_all_event_totals, rebuild_event_totals
+
+    db = SessionLocal()
+    try:
+        if event_id:
+            rebuild_event_totals(db, [event_id])
+            db.commit()
+            return {"events": 1}
+        return rebuild_all_event_totals(db)
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
+
+
+# ─────────────────────────────────────────────
+# Contribution insights
+# ─────────────────────────────────────────────
+@celery_app.task(
+    name="tasks.maintenance.rebuild_contribution_insights",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=60,
+)
+def rebuild_contribution_insights(self, user_ids: list):
+    from models import User
+    from services.contribution_insights import rebuild_user_insights
+
+    db = SessionLocal()
+    try:
+        users = db.query(User).filter(User.id.in_(user_ids)).all()
+        for user in users:
+            rebuild_user_insights(db, user)
+            db.commit()
+        return {"users": len(users)}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
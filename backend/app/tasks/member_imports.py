@@ -8,21 +8,25 @@ Each row resolves (or creates) a Nuru user using phone as the dedupe key,
 then attaches that user to the committee or the guest list. Idempotent —
 existing memberships are reported as duplicates and skipped.
 
-The task purposefully reuses the existing helpers used by single-add
-endpoints (`utils.validation_functions.validate_phone_number`,
-`utils.sms.sms_committee_invite`, `utils.sms.sms_guest_added`,
-`utils.notify.notify_*`) so behaviour stays identical to the per-row UI.
+Rows are processed set-based in chunks of ``CHUNK_SIZE``: phones are
+validated in Python, existing users are resolved with one query per chunk,
+missing users / memberships / invitations are written with multi-row
+INSERTs, and progress is committed once per chunk. Per-row validation
+(`utils.validation_functions.validate_phone_number`) and the SMS helpers
+(`utils.sms.sms_committee_invite`, `utils.sms.sms_guest_added`) are the
+same ones the single-add endpoints use, so behaviour matches the per-row UI.
 """
 from __future__ import annotations
 
 import secrets
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pytz
 from passlib.hash import bcrypt
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import insert, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from core.celery_app import celery_app
 from core.database import SessionLocal
@@ -37,6 +41,10 @@ from models import (
     User,
 )
 from models.enums import GuestTypeEnum, RSVPStatusEnum
+from services.committee_permissions import invalidate_member_permissions
+from services.people_suggestions import mark_suggestions_dirty
+from utils.import_files import iter_chunks, iter_sheet_records, remove_import_upload
+from utils.phone_numbers import phone_key
 from utils.validation_functions import validate_phone_number
 
 
@@ -47,6 +55,21 @@ EAT = pytz.timezone("Africa/Dar_es_Salaam")
 # that can't receive notifications.
 ALLOWED_CC_PREFIXES: Tuple[str, ...] = ("255", "254")
 
+# Rows resolved / written per round-trip and per progress checkpoint.
+CHUNK_SIZE = 500
+
+# Matches the single-add UserSearchInput.register flow.
+DEFAULT_PASSWORD = "Nuru@2026"
+
+# Sheet columns (case-insensitive, by header or in order):
+#   committee → s/n, full name, phone
+#   guests    → s/n, full name, phone, common name
+_MEMBER_FIELDS = {
+    "full_name": (("full name", "name"), 1),
+    "phone": (("phone", "phone number", "mobile"), 2),
+}
+_GUEST_FIELDS = dict(_MEMBER_FIELDS, common_name=(("common name", "card name", "display name"), 3))
+
 
 # ──────────────────────────────────────────────
 # Helpers
@@ -64,12 +87,44 @@ def _split_full_name(raw: str) -> Tuple[str, str]:
     return (parts[0], " ".join(parts[1:]))
 
 
+def _job_rows(job: MemberImportJob, mode: str):
+    """Generator over the job's input rows.
+
+    Staged uploads are streamed from disk; jobs queued before staging
+    existed still carry their parsed rows in ``payload["rows"]``.
+    """
+    if job.source_path:
+        return iter_sheet_records(
+            job.source_path, _MEMBER_FIELDS if mode == "committee" else _GUEST_FIELDS
+        )
+    return iter((job.payload or {}).get("rows") or [])
+
+
+def _count_rows(job: MemberImportJob, mode: str) -> int:
+    return sum(1 for _ in _job_rows(job, mode))
+
+
 def _normalize_invitation_code() -> str:
     return secrets.token_hex(6)
 
 
-def _resolve_or_create_user(db, raw_phone: str, full_name: str, registered_by: str) -> Tuple[Optional[User], bool, Optional[str]]:
-    """Returns (user, was_created, error_message).
+def _invitation_codes(db, count: int) -> List[str]:
+    """Generate ``count`` invitation codes unused in the DB and in the batch."""
+    codes: Set[str] = set()
+    while len(codes) < count:
+        fresh = {_normalize_invitation_code() for _ in range(count - len(codes))}
+        taken = {
+            row[0] for row in
+            db.query(EventInvitation.invitation_code)
+            .filter(EventInvitation.invitation_code.in_(list(fresh)))
+            .all()
+        }
+        codes |= fresh - taken
+    return list(codes)
+
+
+def _normalize_member_phone(raw_phone: str) -> Tuple[Optional[str], Optional[str]]:
+    """Returns (normalized_phone, error_message).
 
     Bulk imports REQUIRE the international format. Unlike the single-add UI
     we do NOT silently rewrite a local 07.../06... number to 2557.../2556...,
@@ -79,82 +134,105 @@ def _resolve_or_create_user(db, raw_phone: str, full_name: str, registered_by: s
     """
     cleaned = "".join(ch for ch in (raw_phone or "") if ch.isdigit() or ch == "+").strip()
     if not cleaned:
-        return (None, False, "Phone is required")
+        return (None, "Phone is required")
 
     digits_only = cleaned.lstrip("+")
     # Reject local formats — they must include the country code.
     if cleaned.startswith("0") or (not cleaned.startswith("+") and not any(digits_only.startswith(p) for p in ALLOWED_CC_PREFIXES)):
-        return (None, False, "Phone must be in international format (e.g. +255712345678 or 255712345678). Local formats like 07... are not accepted.")
+        return (None, "Phone must be in international format (e.g. +255712345678 or 255712345678). Local formats like 07... are not accepted.")
 
     try:
         normalized = validate_phone_number(cleaned)
     except ValueError as exc:
-        return (None, False, str(exc))
+        return (None, str(exc))
 
     if not any(normalized.startswith(p) for p in ALLOWED_CC_PREFIXES):
-        return (None, False, f"Only +{ '/+'.join(ALLOWED_CC_PREFIXES) } mobile numbers are supported (got +{normalized}).")
+        return (None, f"Only +{ '/+'.join(ALLOWED_CC_PREFIXES) } mobile numbers are supported (got +{normalized}).")
+    return (normalized, None)
+
 
+def _is_phone_error(message: str) -> bool:
+    return "Only +" in message or "Phone" in message or "Tanzanian" in message
 
-    plus_form = f"+{normalized}"
-    username = f"u{normalized}"
-    existing = (
-        db.query(User)
-        .filter((User.phone == normalized) | (User.phone == plus_form) | (User.username == username))
-        .first()
+
+def _resolve_or_create_users(
+    db,
+    wanted: Dict[str, str],
+    password_hash: str,
+) -> Tuple[Dict[str, Tuple[uuid.UUID, Optional[str], str]], Set[str]]:
+    """Resolve ``{normalized_phone: full_name}`` to users in bulk.
+
+    Returns (``{normalized_phone: (user_id, phone, first_name)}``,
+    ``{normalized_phones that were newly created}``). Existing users are
+    matched the same way the single-add flow does — bare phone, ``+`` form
+    or the ``u<phone>`` username — with one query for the whole chunk.
+    """
+    resolved: Dict[str, Tuple[uuid.UUID, Optional[str], str]] = {}
+    if not wanted:
+        return resolved, set()
+
+    phones = list(wanted)
+    rows = (
+        db.query(User.id, User.phone, User.username, User.first_name)
+        .filter(or_(
+            User.phone.in_(phones + [f"+{p}" for p in phones]),
+            User.username.in_([f"u{p}" for p in phones]),
+        ))
+        .all()
     )
-    if existing:
-        return (existing, False, None)
-
-    first_name, last_name = _split_full_name(full_name)
-    if not first_name:
-        return (None, False, "Full name is required")
-
-    # Match the single-add UserSearchInput.register flow: default password
-    # Nuru@2026, stored hashed.
-    user = User(
-        id=uuid.uuid4(),
-        first_name=first_name,
-        last_name=last_name or first_name,
-        phone=normalized,
-        username=username,
-        password_hash=bcrypt.hash("Nuru@2026"),
+    for row in rows:
+        for candidate in (
+            (row.phone or "").lstrip("+"),
+            (row.username or "")[1:] if (row.username or "").startswith("u") else "",
+        ):
+            if candidate in wanted and candidate not in resolved:
+                resolved[candidate] = (row.id, row.phone, row.first_name or "")
+
+    missing = [p for p in phones if p not in resolved]
+    if not missing:
+        return resolved, set()
+
+    values = []
+    for normalized in missing:
+        first_name, last_name = _split_full_name(wanted[normalized])
+        values.append({
+            "id": uuid.uuid4(),
+            "first_name": first_name,
+            "last_name": last_name or first_name,
+            "phone": normalized,
+            "phone_key": phone_key(normalized),
+            "username": f"u{normalized}",
+            "password_hash": password_hash,
+        })
+    stmt = (
+        pg_insert(User)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["username"])
+        .returning(User.id, User.phone, User.first_name)
     )
-    db.add(user)
-    try:
-        db.flush()
-    except IntegrityError:
-        db.rollback()
-        existing_after_race = (
-            db.query(User)
-            .filter((User.phone == normalized) | (User.phone == plus_form) | (User.username == username))
-            .first()
-        )
-        if existing_after_race:
-            return (existing_after_race, False, None)
-        return (None, False, "Could not create user because that phone or username already exists")
-    except Exception as e:
-        db.rollback()
-        return (None, False, f"Could not create user: {e}")
-    return (user, True, None)
+    created: Set[str] = set()
+    for row in db.execute(stmt):
+        resolved[row.phone] = (row.id, row.phone, row.first_name or "")
+        created.add(row.phone)
+
+    # A concurrent signup may have taken the username between our lookup
+    # and the INSERT — pick those rows up instead of failing the chunk.
+    raced = [p for p in missing if p not in resolved]
+    if raced:
+        for row in (
+            db.query(User.id, User.phone, User.username, User.first_name)
+            .filter(User.username.in_([f"u{p}" for p in raced]))
+            .all()
+        ):
+            resolved[row.username[1:]] = (row.id, row.phone, row.first_name or "")
+    return resolved, created
 
 
 # ──────────────────────────────────────────────
 # Committee mode
 # ──────────────────────────────────────────────
 
-def _assign_committee(db, event: Event, user: User, assigned_by_id, now) -> Tuple[bool, Optional[str]]:
-    """Returns (created_new, error). Reused-existing → (False, None)."""
-    existing = (
-        db.query(EventCommitteeMember)
-        .filter(
-            EventCommitteeMember.event_id == event.id,
-            EventCommitteeMember.user_id == user.id,
-        )
-        .first()
-    )
-    if existing:
-        return (False, None)
-
+def _member_role_id(db, now) -> uuid.UUID:
     # Default to a "Member" role for bulk imports — organisers can edit
     # roles individually afterwards.
     role = db.query(CommitteeRole).filter(CommitteeRole.role_name == "Member").first()
@@ -168,83 +246,114 @@ def _assign_committee(db, event: Event, user: User, assigned_by_id, now) -> Tupl
         )
         db.add(role)
         db.flush()
-
-    cm = EventCommitteeMember(
-        id=uuid.uuid4(),
-        event_id=event.id,
-        user_id=user.id,
-        role_id=role.id,
-        assigned_by=assigned_by_id,
-        assigned_at=now,
-        created_at=now,
-        updated_at=now,
-    )
-    db.add(cm)
-    db.flush()
-    db.add(CommitteePermission(
-        id=uuid.uuid4(),
-        committee_member_id=cm.id,
-        created_at=now,
-        updated_at=now,
-    ))
-    return (True, None)
+    return role.id
+
+
+def _existing_committee_user_ids(db, event_id) -> Set[uuid.UUID]:
+    return {
+        row[0] for row in
+        db.query(EventCommitteeMember.user_id)
+        .filter(EventCommitteeMember.event_id == event_id)
+        .all()
+    }
+
+
+def _assign_committee_batch(db, event: Event, user_ids: List[uuid.UUID], role_id, assigned_by_id, now) -> None:
+    """Insert committee memberships (plus default permissions) for ``user_ids``."""
+    if not user_ids:
+        return
+    members = [
+        {
+            "id": uuid.uuid4(),
+            "event_id": event.id,
+            "user_id": user_id,
+            "role_id": role_id,
+            "assigned_by": assigned_by_id,
+            "assigned_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for user_id in user_ids
+    ]
+    db.execute(insert(EventCommitteeMember), members)
+    db.execute(insert(CommitteePermission), [
+        {
+            "id": uuid.uuid4(),
+            "committee_member_id": m["id"],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for m in members
+    ])
 
 
 # ──────────────────────────────────────────────
 # Guest mode
 # ──────────────────────────────────────────────
 
-def _assign_guest(
+def _existing_guests(db, event_id) -> Dict[uuid.UUID, Dict[str, Any]]:
+    return {
+        row.attendee_id: {"id": row.id, "common_name": row.common_name}
+        for row in
+        db.query(EventAttendee.id, EventAttendee.attendee_id, EventAttendee.common_name)
+        .filter(EventAttendee.event_id == event_id, EventAttendee.attendee_id.isnot(None))
+        .all()
+    }
+
+
+def _assign_guest_batch(
     db,
     event: Event,
-    user: User,
-    common_name: Optional[str],
+    guests: List[Dict[str, Any]],
+    backfills: List[Tuple[uuid.UUID, str]],
     invited_by_id,
     now,
-) -> Tuple[bool, Optional[str]]:
-    existing = (
-        db.query(EventAttendee)
-        .filter(
-            EventAttendee.event_id == event.id,
-            EventAttendee.attendee_id == user.id,
-        )
-        .first()
-    )
-    if existing:
-        # Backfill common_name on duplicate rows so a later upload with the
-        # display label still wins, without re-inviting.
-        if common_name and not existing.common_name:
-            existing.common_name = common_name
-            existing.updated_at = now
-        return (False, None)
-
-    invitation = EventInvitation(
-        id=uuid.uuid4(),
-        event_id=event.id,
-        guest_type=GuestTypeEnum.user,
-        invited_user_id=user.id,
-        invited_by_user_id=invited_by_id,
-        invitation_code=_normalize_invitation_code(),
-        rsvp_status=RSVPStatusEnum.pending,
-        created_at=now,
-        updated_at=now,
-    )
-    db.add(invitation)
-    db.flush()
-
-    att = EventAttendee(
-        id=uuid.uuid4(),
-        event_id=event.id,
-        guest_type=GuestTypeEnum.user,
-        attendee_id=user.id,
-        common_name=common_name or None,
-        invitation_id=invitation.id,
-        rsvp_status=RSVPStatusEnum.pending,
-        created_at=now,
-        updated_at=now,
-    )
-    db.add(att)
-    return (True, None)
+) -> None:
+    """Insert invitation + attendee rows for ``guests`` — the pending
+    ``{"id", "user_id", "common_name"}`` plans, whose ``id`` is set to the
+    new attendee row's.
+
+    ``backfills`` ([(attendee_id, common_name)]) sets ``common_name`` on
+    duplicate rows so a later upload with the display label still wins,
+    without re-inviting.
+    """
+    if guests:
+        codes = _invitation_codes(db, len(guests))
+        invitations = []
+        attendees = []
+        for guest, code in zip(guests, codes):
+            user_id = guest["user_id"]
+            guest["id"] = uuid.uuid4()
+            invitation_id = uuid.uuid4()
+            invitations.append({
+                "id": invitation_id,
+                "event_id": event.id,
+                "guest_type": GuestTypeEnum.user,
+                "invited_user_id": user_id,
+                "invited_by_user_id": invited_by_id,
+                "invitation_code": code,
+                "rsvp_status": RSVPStatusEnum.pending,
+                "created_at": now,
+                "updated_at": now,
+            })
+            attendees.append({
+                "id": guest["id"],
+                "event_id": event.id,
+                "guest_type": GuestTypeEnum.user,
+                "attendee_id": user_id,
+                "common_name": guest["common_name"] or None,
+                "invitation_id": invitation_id,
+                "rsvp_status": RSVPStatusEnum.pending,
+                "created_at": now,
+                "updated_at": now,
+            })
+        db.execute(insert(EventInvitation), invitations)
+        db.execute(insert(EventAttendee), attendees)
+    if backfills:
+        db.execute(update(EventAttendee), [
+            {"id": attendee_id, "common_name": common_name, "updated_at": now}
+            for attendee_id, common_name in backfills
+        ])
 
 
 # ──────────────────────────────────────────────
@@ -273,13 +382,31 @@ def process_member_import_job(self, job_id: str) -> Dict[str, Any]:
             db.commit()
             return {"ok": False, "error": "event-not-found"}
 
-        rows: List[Dict[str, Any]] = list(job.payload.get("rows") or [])
         mode = (job.mode or "guests").strip()
         notify_sms = bool(job.notify_sms)
+        if job.source_path:
+            try:
+                total_rows = _count_rows(job, mode)
+            except Exception as e:
+                job.status = "failed"
+                job.error_message = f"Could not read file: {e}"[:1000]
+                job.finished_at = datetime.utcnow()
+                db.commit()
+                remove_import_upload(job.source_path)
+                return {"ok": False, "error": "unreadable-file"}
+        else:
+            total_rows = len((job.payload or {}).get("rows") or [])
+        if total_rows == 0:
+            job.status = "failed"
+            job.error_message = "No data rows found in file"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            remove_import_upload(job.source_path)
+            return {"ok": False, "error": "no-rows"}
 
         job.status = "processing"
         job.started_at = datetime.utcnow()
-        job.total_rows = len(rows)
+        job.total_rows = total_rows
         job.processed_rows = 0
         job.successful_rows = 0
         job.reused_rows = 0
@@ -304,9 +431,28 @@ def process_member_import_job(self, job_id: str) -> Dict[str, Any]:
         invalid_phone_count = 0
         failure_count = 0
 
-        for idx, row in enumerate(rows):
-            row_num = int(row.get("_row") or (idx + 1))
-            try:
+        assigned_by_id = organizer.id if organizer else event.organizer_id
+        # One bcrypt hash for every user created by this import — hashing is
+        # deliberately slow and they all share the same default password.
+        password_hash = bcrypt.hash(DEFAULT_PASSWORD)
+        if mode == "committee":
+            role_id = _member_role_id(db, datetime.now(EAT))
+            db.commit()
+            committee_user_ids = _existing_committee_user_ids(db, event.id)
+        else:
+            guests_by_user = _existing_guests(db, event.id)
+
+        processed = 0
+        for chunk in iter_chunks(_job_rows(job, mode), CHUNK_SIZE):
+            offset = processed
+            processed += len(chunk)
+            now = datetime.now(EAT)
+
+            # 1. Validate every row in Python.
+            valid: List[Tuple[int, str, str, Optional[str]]] = []
+            wanted: Dict[str, str] = {}
+            for i, row in enumerate(chunk):
+                row_num = int(row.get("_row") or (offset + i + 1))
                 full_name = (row.get("full_name") or "").strip()
                 phone_raw = (row.get("phone") or "").strip()
                 common_name = (row.get("common_name") or "").strip() or None
@@ -319,60 +465,99 @@ def process_member_import_job(self, job_id: str) -> Dict[str, Any]:
                     errors.append({"row": row_num, "message": f"Phone is required for {full_name}"})
                     failure_count += 1
                     continue
-
-                user, created, err = _resolve_or_create_user(
-                    db, phone_raw, full_name, registered_by=organizer_name
-                )
-                if err or not user:
-                    if err and "Only +" in err or err and "Phone" in err or err and "Tanzanian" in err:
+                normalized, err = _normalize_member_phone(phone_raw)
+                if err:
+                    if _is_phone_error(err):
                         invalid_phone_count += 1
                     else:
                         failure_count += 1
-                    errors.append({"row": row_num, "message": err or "Unknown error"})
+                    errors.append({"row": row_num, "message": err})
                     continue
+                valid.append((row_num, normalized, full_name, common_name))
+                wanted.setdefault(normalized, full_name)
 
-                if not created:
-                    reused_count += 1
-
-                now = datetime.now(EAT)
-                if mode == "committee":
-                    created_assignment, err2 = _assign_committee(
-                        db, event, user, organizer.id if organizer else event.organizer_id, now,
-                    )
-                else:
-                    created_assignment, err2 = _assign_guest(
-                        db, event, user, common_name, organizer.id if organizer else event.organizer_id, now,
-                    )
+            # 2. Resolve users and plan memberships, then write the chunk.
+            planned = {"success": 0, "reused": 0, "duplicate": 0}
+            chunk_sms: List[Tuple[str, str]] = []
+            try:
+                users, created = _resolve_or_create_users(db, wanted, password_hash)
+                new_members: List[uuid.UUID] = []
+                new_guests: List[Dict[str, Any]] = []
+                backfills: List[Tuple[uuid.UUID, str]] = []
+                seen_created: Set[str] = set()
+                for row_num, normalized, full_name, common_name in valid:
+                    user_id, user_phone, first_name = users[normalized]
+                    # Only the first row for a newly created user counts as
+                    # "created"; any later row for the same phone reuses it.
+                    if normalized in created and normalized not in seen_created:
+                        seen_created.add(normalized)
+                    else:
+                        planned["reused"] += 1
 
-                if err2:
-                    failure_count += 1
-                    errors.append({"row": row_num, "message": err2})
-                    continue
+                    if mode == "committee":
+                        assigned = user_id not in committee_user_ids
+                        if assigned:
+                            committee_user_ids.add(user_id)
+                            new_members.append(user_id)
+                    else:
+                        existing = guests_by_user.get(user_id)
+                        assigned = existing is None
+                        if assigned:
+                            pending = {"id": None, "user_id": user_id, "common_name": common_name}
+                            guests_by_user[user_id] = pending
+                            new_guests.append(pending)
+                        elif common_name and not existing["common_name"]:
+                            # A guest planned earlier in this chunk (no id
+                            # yet) picks it up in the plan written below;
+                            # a stored one gets a backfill.
+                            existing["common_name"] = common_name
+                            if existing["id"] is not None:
+                                backfills.append((existing["id"], common_name))
+
+                    if assigned:
+                        planned["success"] += 1
+                        if notify_sms and user_phone:
+                            chunk_sms.append((user_phone, first_name or "Friend"))
+                    else:
+                        planned["duplicate"] += 1
 
-                if created_assignment:
-                    success_count += 1
-                    if notify_sms and user.phone:
-                        sms_queue.append((user.phone, user.first_name or "Friend"))
+                if mode == "committee":
+                    _assign_committee_batch(db, event, new_members, role_id, assigned_by_id, now)
                 else:
-                    duplicate_count += 1
-            except Exception as e:  # pragma: no cover
+                    _assign_guest_batch(db, event, new_guests, backfills, assigned_by_id, now)
+                db.commit()
+                if mode == "committee":
+                    invalidate_member_permissions(event.id, new_members)
+                elif new_guests:
+                    # Core inserts skip the session hook that queues this.
+                    mark_suggestions_dirty(g["user_id"] for g in new_guests)
+                success_count += planned["success"]
+                reused_count += planned["reused"]
+                duplicate_count += planned["duplicate"]
+                sms_queue.extend(chunk_sms)
+            except Exception as e:
+                # The chunk is written atomically: report each of its valid
+                # rows as failed and reload membership state from the DB.
                 try:
                     db.rollback()
                 except Exception:
                     pass
-                failure_count += 1
-                errors.append({"row": row_num, "message": str(e)})
-            finally:
-                job.processed_rows = idx + 1
-                job.successful_rows = success_count
-                job.reused_rows = reused_count
-                job.duplicate_rows = duplicate_count
-                job.invalid_phone_rows = invalid_phone_count
-                job.failed_rows = failure_count
-                job.errors = errors
-                db.commit()
-
-        db.commit()
+                for row_num, _, _, _ in valid:
+                    errors.append({"row": row_num, "message": str(e)})
+                failure_count += len(valid)
+                if mode == "committee":
+                    committee_user_ids = _existing_committee_user_ids(db, event.id)
+                else:
+                    guests_by_user = _existing_guests(db, event.id)
+
+            job.processed_rows = processed
+            job.successful_rows = success_count
+            job.reused_rows = reused_count
+            job.duplicate_rows = duplicate_count
+            job.invalid_phone_rows = invalid_phone_count
+            job.failed_rows = failure_count
+            job.errors = list(errors)
+            db.commit()
 
         # Fire SMS only for newly-assigned rows, never for duplicates/reused.
         if notify_sms and sms_queue:
@@ -395,19 +580,20 @@ def process_member_import_job(self, job_id: str) -> Dict[str, Any]:
             except Exception as e:  # pragma: no cover
                 print(f"[member_import] SMS dispatch fatal: {e}")
 
-        job.processed_rows = len(rows)
+        job.processed_rows = processed
         job.successful_rows = success_count
         job.reused_rows = reused_count
         job.duplicate_rows = duplicate_count
         job.invalid_phone_rows = invalid_phone_count
         job.failed_rows = failure_count
-        job.errors = errors
+        job.errors = list(errors)
         job.finished_at = datetime.utcnow()
         job.status = (
             "completed" if failure_count == 0 and invalid_phone_count == 0
             else ("partially_completed" if (success_count + duplicate_count + reused_count) > 0 else "failed")
         )
         db.commit()
+        remove_import_upload(job.source_path)
         return {
             "ok": True,
             "status": job.status,
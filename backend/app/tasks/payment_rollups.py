@@ -0,0 +1,76 @@
+"""
+Task: Daily payment rollups
+===========================
+Keeps ``payment_daily_rollups`` (see ``services.payment_rollups``) in step
+with ``transactions`` so the finance dashboard and collection reports read
+a few hundred rows instead of aggregating the ledger.
+
+Jobs:
+
+* refresh_dirty_rollups
+    Every minute: drains up to ``MAX_DIRTY_PER_RUN`` days from the Redis
+    dirty set (filled after commit whenever a transaction is created, paid,
+    credited, failed or reversed, from the callback, verification or any
+    other path) and rebuilds them. A burst of callbacks on one day collapses
+    into one rebuild. Failed days are put back in the set.
+
+* reconcile_rollups
+    Nightly: rebuilds the last ``RECONCILE_DAYS`` days regardless, which
+    repairs anything a missed dirty mark (Redis down, raw SQL updates) left
+    behind. Pass ``days_back`` to backfill further.
+"""
+from datetime import datetime, timedelta
+
+from core.celery_app import celery_app
+from core.database import SessionLocal
+
+MAX_DIRTY_PER_RUN = 60
+DIRTY_BATCH = 10
+RECONCILE_DAYS = 7
+
+
+@celery_app.task(name="tasks.payment_rollups.refresh_dirty_rollups", bind=True)
+def refresh_dirty_rollups(self):
+    from services.payment_rollups import mark_days_dirty, pop_dirty_days, rebuild_days
+
+    rebuilt = 0
+    while rebuilt < MAX_DIRTY_PER_RUN:
+        days = pop_dirty_days(DIRTY_BATCH)
+        if not days:
+            break
+        db = SessionLocal()
+        try:
+            rebuilt += rebuild_days(db, days)
+            db.commit()
+        except Exception as e:  # noqa: BLE001
+            db.rollback()
+            mark_days_dirty(days)
+            print(f"[payment_rollups] rebuild of {len(days)} day(s) failed: {e}")
+            break
+        finally:
+            db.close()
+    return {"days": rebuilt}
+
+
+@celery_app.task(
+    name="tasks.payment_rollups.reconcile_rollups",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=600,
+)
+def reconcile_rollups(self, days_back: int = RECONCILE_DAYS):
+    from services.payment_rollups import rebuild_days
+
+    today = datetime.utcnow().date()
+    db = SessionLocal()
+    try:
+        # One commit per day keeps each delete + insert short.
+        for n in range(max(int(days_back), 0), -1, -1):
+            rebuild_days(db, [today - timedelta(days=n)])
+            db.commit()
+        return {"days": int(days_back) + 1}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
@@ -0,0 +1,73 @@
+"""
+Task: People You May Know refresh
+=================================
+Keeps ``user_suggestions`` (see ``services.people_suggestions``) current so
+``GET /users/search?suggested=true`` is a single indexed read.
+
+Jobs:
+
+* refresh_dirty_suggestions
+    Drains up to ``MAX_DIRTY_PER_RUN`` users from the Redis dirty set (filled
+    after commit whenever a follow, circle, invitation or community
+    membership of theirs is added or removed) and rebuilds them. A burst of
+    follows by one user collapses into one rebuild. Failed batches are put
+    back in the set.
+
+* refresh_all_suggestions
+    Nightly rebuild for every user active in the last
+    ``ACTIVE_WITHIN_DAYS`` days, which also picks up changes two hops out
+    (a friend's new follow) that the dirty set doesn't track.
+"""
+from core.celery_app import celery_app
+from core.database import SessionLocal
+
+MAX_DIRTY_PER_RUN = 2000
+
+
+@celery_app.task(name="tasks.suggestions.refresh_dirty_suggestions", bind=True)
+def refresh_dirty_suggestions(self):
+    from services.people_suggestions import (
+        BATCH_SIZE, mark_suggestions_dirty, pop_dirty_users, refresh_suggestions,
+    )
+
+    refreshed = 0
+    while refreshed < MAX_DIRTY_PER_RUN:
+        user_ids = pop_dirty_users(BATCH_SIZE)
+        if not user_ids:
+            break
+        db = SessionLocal()
+        try:
+            refresh_suggestions(db, user_ids)
+            db.commit()
+            refreshed += len(user_ids)
+        except Exception as e:  # noqa: BLE001
+            db.rollback()
+            mark_suggestions_dirty(user_ids)
+            print(f"[suggestions] refresh of {len(user_ids)} user(s) failed: {e}")
+            break
+        finally:
+            db.close()
+    return {"users": refreshed}
+
+
+@celery_app.task(
+    name="tasks.suggestions.refresh_all_suggestions",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=600,
+)
+def refresh_all_suggestions(self):
+    from services.people_suggestions import BATCH_SIZE, active_user_ids, refresh_suggestions
+
+    db = SessionLocal()
+    try:
+        user_ids = active_user_ids(db)
+        for start in range(0, len(user_ids), BATCH_SIZE):
+            refresh_suggestions(db, user_ids[start:start + BATCH_SIZE])
+            db.commit()
+        return {"users": len(user_ids)}
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        raise self.retry(exc=exc)
+    finally:
+        db.close()
@@ -0,0 +1,60 @@
+"""
+Task: WhatsApp delivery statuses
+================================
+Applies the Meta status callbacks that ``POST /whatsapp/webhook`` appends
+to a Redis stream (see ``services.whatsapp_status_stream``).
+
+Jobs:
+
+* apply_whatsapp_statuses
+    Every minute: reads the stream through the consumer group
+    ``BATCH_ENTRIES`` entries at a time until it is empty, then exits — it
+    never blocks waiting for new entries, so the worker is free between
+    runs. Each batch is coalesced per wamid, written with one bulk UPDATE
+    per table and acknowledged after commit. If a batch fails, its entries
+    are retried one at a time; an entry that still fails is logged and
+    dropped so it can't wedge the stream. Overlapping runs are safe: each
+    is its own consumer.
+"""
+from core.celery_app import celery_app
+from core.database import SessionLocal
+
+BATCH_ENTRIES = 200
+
+
+def _apply(entries) -> None:
+    from services.whatsapp_status_stream import apply_statuses
+
+    db = SessionLocal()
+    try:
+        apply_statuses(db, [st for _, statuses in entries for st in statuses])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="tasks.whatsapp_statuses.apply_whatsapp_statuses", bind=True)
+def apply_whatsapp_statuses(self):
+    from services.whatsapp_status_stream import ack, consumer_name, read_batch
+
+    consumer = consumer_name()
+    applied = 0
+    while True:
+        entries = read_batch(consumer, BATCH_ENTRIES)
+        if not entries:
+            break
+        try:
+            _apply(entries)
+        except Exception as e:  # noqa: BLE001
+            print(f"[wa-status] batch of {len(entries)} entries failed, retrying singly: {e}")
+            for entry in entries:
+                try:
+                    _apply([entry])
+                except Exception as e:  # noqa: BLE001
+                    print(f"[wa-status] dropping entry {entry[0]}: {e}")
+        ack([entry_id for entry_id, _ in entries])
+        applied += len(entries)
+    return {"entries": applied}
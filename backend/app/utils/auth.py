@@ -116,6 +116,20 @@ def get_optional_user(
     return user if (user and user.is_active) else None
 
 
+def get_user_from_token(db: Session, token: Optional[str]) -> Optional[User]:
+    """Resolve an access token passed outside the Authorization header
+    (WebSocket / EventSource query string). Returns None if invalid."""
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
+        return None
+    user_id = payload.get("uid")
+    user = _get_user_by_id(db, user_id) if user_id else None
+    return user if (user and user.is_active) else None
+
+
 def hash_password(plain_password: str) -> str:
     """Hash a password using bcrypt."""
     return bcrypt.hashpw(plain_password.encode(), bcrypt.gensalt()).decode()
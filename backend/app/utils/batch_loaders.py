@@ -899,18 +899,16 @@ def build_booking_dicts(db: Session, bookings: List[ServiceBookingRequest]) -> L
 
 def build_conversation_dicts(db: Session, conversations: list, current_user_id) -> List[Dict]:
     """
-    Batch-load other-participant users/profiles, last messages, unread counts,
-    and service info for a list of conversations.
-    Replaces ~5 per-conversation queries with ~6 grouped queries.
+    Batch-load other-participant users/profiles, the previous message and
+    service info for a list of conversations (last message and unread
+    counts are columns on the conversation). At most 5 grouped queries.
     """
-    from models import Conversation, Message, UserService, UserServiceImage
-    from sqlalchemy import case
+    from models import Message, UserService, UserServiceImage
 
     if not conversations:
         return []
 
     cur = str(current_user_id)
-    conv_ids = [c.id for c in conversations]
 
     # Other participant per conversation
     other_ids = set()
@@ -924,49 +922,15 @@ def build_conversation_dicts(db: Session, conversations: list, current_user_id)
     profiles = db.query(UserProfile).filter(UserProfile.user_id.in_(list(other_ids))).all() if other_ids else []
     profile_map = {p.user_id: p for p in profiles}
 
-    # Last + previous (second-most-recent) message per conversation.
-    # We fetch the two newest messages per conversation in a single windowed
-    # query so the conversations list can render two preview lines per card
-    # (matches the design). Falls back gracefully when only one message exists.
-    last_msg_map: Dict = {}
+    # The last message and unread counts are denormalized on the
+    # conversation row; only the second-most-recent message (the card's
+    # second preview line) is loaded, by primary key.
+    prev_ids = [c.previous_message_id for c in conversations if c.previous_message_id]
     prev_msg_map: Dict = {}
-    if conv_ids:
-        from sqlalchemy import desc
-        # Use ROW_NUMBER() window so we can pull the top 2 messages per conv in
-        # one round-trip rather than N+1 per-conv queries.
-        rn = sa_func.row_number().over(
-            partition_by=Message.conversation_id,
-            order_by=desc(Message.created_at),
-        ).label("rn")
-        sub = db.query(Message, rn).filter(
-            Message.conversation_id.in_(conv_ids)
-        ).subquery()
-        rows = db.query(Message).join(
-            sub, Message.id == sub.c.id
-        ).filter(sub.c.rn <= 2).all()
-        # Group by conversation, ordered newest → oldest
-        grouped: Dict = defaultdict(list)
-        for m in rows:
-            grouped[m.conversation_id].append(m)
-        for cid, msgs in grouped.items():
-            msgs.sort(key=lambda x: x.created_at, reverse=True)
-            if msgs:
-                last_msg_map[cid] = msgs[0]
-            if len(msgs) > 1:
-                prev_msg_map[cid] = msgs[1]
-
-    # Unread counts (other sender, unread) grouped per conversation
-    unread_map: Dict = {}
-    if conv_ids:
-        rows = db.query(
-            Message.conversation_id,
-            sa_func.count(Message.id)
-        ).filter(
-            Message.conversation_id.in_(conv_ids),
-            Message.sender_id != current_user_id,
-            Message.is_read == False,
-        ).group_by(Message.conversation_id).all()
-        unread_map = {cid: int(cnt) for cid, cnt in rows}
+    if prev_ids:
+        prev_msg_map = {
+            m.id: m for m in db.query(Message).filter(Message.id.in_(prev_ids)).all()
+        }
 
     # Service info bulk
     service_ids = {c.service_id for c in conversations if c.service_id}
@@ -986,9 +950,11 @@ def build_conversation_dicts(db: Session, conversations: list, current_user_id)
         other_id = conv.user_two_id if str(conv.user_one_id) == cur else conv.user_one_id
         other = user_map.get(other_id) if other_id else None
         profile = profile_map.get(other_id) if other_id else None
-        last_msg = last_msg_map.get(conv.id)
-        prev_msg = prev_msg_map.get(conv.id)
-        unread = unread_map.get(conv.id, 0)
+        prev_msg = prev_msg_map.get(conv.previous_message_id)
+        if str(conv.user_one_id) == cur:
+            unread = conv.user_one_unread or 0
+        else:
+            unread = conv.user_two_unread or 0
 
         service_info = None
         if conv.service_id:
@@ -1025,10 +991,10 @@ def build_conversation_dicts(db: Session, conversations: list, current_user_id)
             },
             "service": service_info,
             "last_message": {
-                "content": last_msg.message_text if last_msg else None,
-                "sent_at": last_msg.created_at.isoformat() if last_msg else None,
-                "is_mine": str(last_msg.sender_id) == cur if last_msg else False,
-            } if last_msg else None,
+                "content": conv.last_message_text,
+                "sent_at": conv.last_message_at.isoformat() if conv.last_message_at else None,
+                "is_mine": str(conv.last_message_sender_id) == cur,
+            } if conv.last_message_id else None,
             # Second-most-recent message — surfaced so the conversations list
             # can render two preview lines (matches the WhatsApp-style design).
             "previous_message": {
@@ -1756,3 +1722,70 @@ def build_event_attendee_dicts(db: Session, attendees: list) -> List[Dict]:
 
     return out
 
+
+# ─────────────────────────────────────────────────────────
+# Moments (stories tray)
+# ─────────────────────────────────────────────────────────
+
+def _moment_content_type(value) -> str:
+    if hasattr(value, "value"):
+        return value.value
+    raw = str(value or "image")
+    return raw.split(".")[-1]
+
+
+def build_moment_dicts(db: Session, moments: list, current_user_id=None) -> List[Dict]:
+    """Authors + profiles, viewer counts and the viewer's seen set for a
+    list of moments: four queries regardless of how many moments or
+    authors there are."""
+    from models import UserMoment, UserMomentViewer
+    if not moments:
+        return []
+
+    moment_ids = [m.id for m in moments]
+    authors = batch_load_users(db, {m.user_id for m in moments})
+
+    # Exclude the author from viewer counts — viewing your own glimpse must not inflate the count.
+    count_rows = db.query(UserMomentViewer.moment_id, sa_func.count(UserMomentViewer.id)).join(
+        UserMoment, UserMoment.id == UserMomentViewer.moment_id,
+    ).filter(
+        UserMomentViewer.moment_id.in_(moment_ids),
+        UserMomentViewer.viewer_id != UserMoment.user_id,
+    ).group_by(UserMomentViewer.moment_id).all()
+    viewer_counts = {mid: cnt for mid, cnt in count_rows}
+
+    seen: Set = set()
+    if current_user_id:
+        seen = {r[0] for r in db.query(UserMomentViewer.moment_id).filter(
+            UserMomentViewer.moment_id.in_(moment_ids),
+            UserMomentViewer.viewer_id == current_user_id,
+        ).all()}
+
+    out: List[Dict] = []
+    for m in moments:
+        author = authors.get(str(m.user_id))
+        ct = _moment_content_type(m.content_type)
+        media_url = m.media_url
+        background_color = None
+        if isinstance(media_url, str) and media_url.startswith("text:"):
+            ct = "text"
+            background_color = media_url[5:] or None
+            media_url = None
+
+        out.append({
+            "id": str(m.id),
+            "author": {
+                "id": author["id"], "name": author["name"],
+                "avatar": author["avatar"], "is_verified": author["is_verified"],
+            } if author else None,
+            "caption": m.caption, "content_type": ct,
+            "media_url": media_url,
+            "thumbnail_url": m.thumbnail_url if hasattr(m, "thumbnail_url") else None,
+            "background_color": background_color,
+            "location": m.location if hasattr(m, "location") else None,
+            "viewer_count": viewer_counts.get(m.id, 0), "has_seen": m.id in seen,
+            "is_active": m.is_active,
+            "expires_at": m.expires_at.isoformat() if m.expires_at else None,
+            "created_at": m.created_at.isoformat() if m.created_at else None,
+        })
+    return out
@@ -1,8 +1,10 @@
 # utils/helpers.py
 # Contains general helper functions used across the application
 
+import base64
 import random
 import logging
+import uuid
 from datetime import datetime, timedelta
 from math import ceil
 import httpx
@@ -72,6 +74,24 @@ def paginate(query, page: int = 1, limit: int = 20):
 
     return items, pagination
 
+def encode_cursor(at: datetime, row_id) -> str:
+    """Opaque keyset cursor for ``(timestamp, id)`` ordered listings."""
+    raw = f"{at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None):
+    """Inverse of ``encode_cursor``. Returns ``(datetime, UUID)`` or None if malformed."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(at), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
 def paginated_response(items, pagination, message="Records retrieved successfully", wrap_items=True):
     if wrap_items:
         data = {"items": items, "pagination": pagination}
@@ -0,0 +1,72 @@
+"""Minimal HyperLogLog sketch for the analytics rollups.
+
+Postgres has no built-in HLL type and the ``postgresql-hll`` extension
+isn't installed on our hosts, so the rollup job builds sketches in
+Python and stores the raw registers in a ``bytea`` column. Sketches from
+any number of hourly / daily buckets merge with a register-wise ``max``,
+which is what lets ``GET /admin/analytics`` report unique visitors over
+90 days without touching ``page_views``.
+
+``PRECISION = 12`` → 4096 one-byte registers (4 KB per sketch), standard
+error ≈ 1.6 %. Small cardinalities fall back to linear counting and are
+effectively exact.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Iterable, Optional
+
+PRECISION = 12
+REGISTERS = 1 << PRECISION
+_REST_BITS = 64 - PRECISION
+_REST_MASK = (1 << _REST_BITS) - 1
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def empty() -> bytearray:
+    return bytearray(REGISTERS)
+
+
+def add(registers: bytearray, value: Optional[str]) -> None:
+    """Add ``value`` to ``registers`` in place; empty values are ignored."""
+    if not value:
+        return
+    x = _hash64(value)
+    idx = x >> _REST_BITS
+    rank = _REST_BITS - (x & _REST_MASK).bit_length() + 1
+    if rank > registers[idx]:
+        registers[idx] = rank
+
+
+def build(values: Iterable[Optional[str]]) -> bytes:
+    registers = empty()
+    for v in values:
+        add(registers, v)
+    return bytes(registers)
+
+
+def merge(sketches: Iterable[Optional[bytes]]) -> bytes:
+    """Union of several sketches. ``None`` / malformed entries are skipped."""
+    out = bytes(REGISTERS)
+    for s in sketches:
+        if s and len(s) == REGISTERS:
+            out = bytes(map(max, out, s))
+    return out
+
+
+def count(sketch: Optional[bytes]) -> int:
+    """Estimated number of distinct values added to ``sketch``."""
+    if not sketch or len(sketch) != REGISTERS:
+        return 0
+    zeros = sketch.count(0)
+    if zeros == REGISTERS:
+        return 0
+    estimate = _ALPHA * REGISTERS * REGISTERS / sum(2.0 ** -r for r in sketch)
+    if estimate <= 2.5 * REGISTERS and zeros:
+        estimate = REGISTERS * math.log(REGISTERS / zeros)
+    return int(round(estimate))
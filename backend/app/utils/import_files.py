@@ -0,0 +1,195 @@
+"""Staging + streaming readers for spreadsheet imports.
+
+The import endpoints (contributors, committee, guests) used to parse the
+whole upload in the request and park every row in the job's JSONB
+``payload``. Large sheets bloated the job row and the worker then loaded
+the full list back into memory. Instead the raw upload is now written
+once to ``$NURU_IMPORT_UPLOAD_DIR`` (default ``/tmp/nuru_imports``) —
+the API and Celery workers share a host — and the worker re-reads it
+row by row:
+
+  • ``store_import_upload``  — copy an ``UploadFile`` to disk in fixed-size
+    blocks, enforcing ``MAX_IMPORT_FILE_SIZE`` without buffering it.
+  • ``iter_sheet_rows``      — generator over the raw cell lists of a CSV or
+    XLSX file (openpyxl read-only mode streams the sheet XML).
+  • ``iter_sheet_records``   — the same rows mapped to named fields, by
+    header when the sheet has one, else by column position.
+  • ``iter_chunks``          — bounded batches from any iterator, so the
+    worker validates and upserts ``CHUNK_SIZE`` rows at a time.
+
+Memory stays constant in the file size: at most one chunk of rows is
+alive at any time.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import os
+import uuid
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+IMPORT_UPLOAD_DIR = Path(os.getenv("NURU_IMPORT_UPLOAD_DIR", "/tmp/nuru_imports"))
+MAX_IMPORT_FILE_SIZE = 20 * 1024 * 1024  # 20MB
+_COPY_BLOCK = 64 * 1024
+
+ALLOWED_IMPORT_EXTENSIONS = {"csv", "xlsx"}
+
+
+class ImportFileTooLarge(ValueError):
+    pass
+
+
+def _extension(filename: Optional[str]) -> str:
+    return (filename or "").rsplit(".", 1)[-1].lower() if "." in (filename or "") else ""
+
+
+def store_import_upload(upload, kind: str) -> str:
+    """Write ``upload`` (a FastAPI ``UploadFile``) to the staging dir.
+
+    Returns the absolute path. Raises ``ImportFileTooLarge`` once more than
+    ``MAX_IMPORT_FILE_SIZE`` bytes have been read, and ``ValueError`` for an
+    empty file; the partial file is removed in both cases.
+    """
+    IMPORT_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    ext = _extension(getattr(upload, "filename", None))
+    if ext not in ALLOWED_IMPORT_EXTENSIONS:
+        ext = "csv"
+    path = IMPORT_UPLOAD_DIR / f"{kind}-{uuid.uuid4().hex}.{ext}"
+    written = 0
+    try:
+        with open(path, "wb") as out:
+            while True:
+                block = upload.file.read(_COPY_BLOCK)
+                if not block:
+                    break
+                written += len(block)
+                if written > MAX_IMPORT_FILE_SIZE:
+                    raise ImportFileTooLarge(
+                        f"File is too large (max {MAX_IMPORT_FILE_SIZE // (1024 * 1024)} MB)"
+                    )
+                out.write(block)
+        if written == 0:
+            raise ValueError("Uploaded file is empty")
+    except Exception:
+        remove_import_upload(str(path))
+        raise
+    finally:
+        try:
+            upload.file.close()
+        except Exception:
+            pass
+    return str(path)
+
+
+def remove_import_upload(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _is_xlsx(path: str) -> bool:
+    if _extension(path) == "xlsx":
+        return True
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(4) == b"PK\x03\x04"
+    except OSError:
+        return False
+
+
+def iter_sheet_rows(path: str) -> Iterator[List[str]]:
+    """Yield every row of a CSV / XLSX file as a list of cell strings."""
+    if _is_xlsx(path):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0] if wb.worksheets else None
+            if ws is None:
+                return
+            for row in ws.iter_rows(values_only=True):
+                yield [_cell_text(c) for c in row]
+        finally:
+            wb.close()
+        return
+
+    with open(path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace", newline="")
+        for row in csv.reader(text):
+            yield [("" if c is None else str(c)) for c in row]
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        # Phones typed into Excel come back as 255712345678.0
+        return str(int(value))
+    return str(value)
+
+
+def _norm_header(h: str) -> str:
+    return (h or "").strip().lower().replace("/", "").replace("_", " ").replace("-", " ").strip()
+
+
+def iter_sheet_records(
+    path: str,
+    fields: Dict[str, Tuple[Sequence[str], int]],
+) -> Iterator[Dict[str, Any]]:
+    """Yield ``{"_row": n, field: value, ...}`` for every non-blank row.
+
+    ``fields`` maps an output key to (header aliases, fallback position).
+    The first row is treated as a header when any cell matches an alias;
+    otherwise columns are read by position. ``_row`` is the 1-based line
+    number in the sheet so per-row errors point at what the organiser sees.
+    """
+    rows = iter_sheet_rows(path)
+    first = next(rows, None)
+    if first is None:
+        return
+    header = [_norm_header(c) for c in first]
+    aliases = {a for names, _ in fields.values() for a in names}
+    has_header = any(h in aliases for h in header)
+
+    columns: Dict[str, int] = {}
+    for key, (names, pos) in fields.items():
+        columns[key] = pos
+        if has_header:
+            for n in names:
+                if n in header:
+                    columns[key] = header.index(n)
+                    break
+
+    def _records(start: int, cells_iter: Iterable[List[str]]):
+        for row_num, cells in enumerate(cells_iter, start=start):
+            if not any((c or "").strip() for c in cells):
+                continue
+            item: Dict[str, Any] = {"_row": row_num}
+            for key, idx in columns.items():
+                item[key] = (cells[idx] if idx < len(cells) else "").strip()
+            yield item
+
+    if has_header:
+        yield from _records(2, rows)
+    else:
+        yield from _records(1, _prepend(first, rows))
+
+
+def _prepend(first: List[str], rest: Iterator[List[str]]) -> Iterator[List[str]]:
+    yield first
+    yield from rest
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of at most ``size`` items from ``items``."""
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
@@ -204,3 +204,35 @@ def phone_tail(normalized: str, n: int = 4) -> str:
     if not normalized:
         return ""
     return normalized[-n:]
+
+
+# ──────────────────────────────────────────────
+# Last-9-digit phone keys
+# ──────────────────────────────────────────────
+# The same subscriber is stored as 0653750805, 255653750805, +255 653 750 805
+# … depending on where the row came from. Matching on the last 9 digits is
+# the project-wide convention; ``users``, ``user_contributors``,
+# ``event_attendees`` and ``wa_message_logs`` persist that key in an indexed
+# ``phone_key`` column (see models/phone_keys.py) so lookups are index seeks.
+
+PHONE_KEY_LENGTH = 9
+
+
+def phone_key(raw: Optional[str]) -> Optional[str]:
+    """Return the last 9 digits of ``raw``, or None when it has fewer."""
+    if not raw:
+        return None
+    digits = "".join(ch for ch in str(raw) if ch.isdigit())
+    return digits[-PHONE_KEY_LENGTH:] if len(digits) >= PHONE_KEY_LENGTH else None
+
+
+def match_phone_key(column, raw: Optional[str]):
+    """SQL clause matching ``column`` (a ``phone_key`` column) against ``raw``.
+
+    Evaluates to FALSE when ``raw`` is too short to produce a key, so callers
+    can drop it straight into ``.filter()`` / ``or_()``.
+    """
+    from sqlalchemy import false
+
+    key = phone_key(raw)
+    return column == key if key else false()
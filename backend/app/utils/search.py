@@ -0,0 +1,88 @@
+# utils/search.py
+# Shared text search over the indexed ``search_document`` / ``search_vector``
+# columns (users, user_services, events, user_contributors).
+#
+# Every searchable table carries a STORED generated ``search_document``:
+# the searchable columns lower-cased and joined with spaces, phone numbers
+# reduced to their digits. A pg_trgm GIN index on it serves
+# ``LIKE '%term%'`` (no leading-wildcard sequential scans) and
+# ``word_similarity`` ranking. ``user_services`` also has a
+# ``search_vector`` (title weighted over description) for word-prefix
+# full-text matches on long descriptions.
+#
+# Normalisation is deliberately language-neutral: the text search config
+# is ``simple`` (Postgres ships no Swahili stemmer, and English stemming
+# mangles Swahili words and names), so matching is on lower-cased words
+# and trigrams, which works the same for both languages.
+#
+# Usage:
+#     match = text_match(User.search_document, q)
+#     if match is not None:
+#         query = query.filter(match.condition).order_by(match.rank.desc())
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+TS_CONFIG = "simple"
+MAX_TERMS = 6
+
+_PHONE_LIKE = re.compile(r"^\+?[\d\s\-()]{4,}$")
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class TextMatch:
+    condition: ColumnElement
+    rank: ColumnElement
+
+
+def normalize_query(q: Optional[str]) -> str:
+    """Lower-case, collapse whitespace, and map phone-looking input onto
+    the digits-only form stored in ``search_document`` (a leading local
+    ``0`` is dropped so ``0764…`` finds ``+255764…``)."""
+    q = " ".join((q or "").split()).lower()
+    if _PHONE_LIKE.match(q) and sum(c.isdigit() for c in q) >= 4:
+        digits = re.sub(r"\D", "", q)
+        return digits[1:] if digits.startswith("0") and len(digits) > 4 else digits
+    return q
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _terms(q: str) -> List[str]:
+    return q.split(" ")[:MAX_TERMS]
+
+
+def prefix_tsquery(q: str) -> Optional[str]:
+    """``to_tsquery`` text matching every word as a prefix (``w1:* & w2:*``).
+    Punctuation is dropped so user input can't break the query syntax."""
+    words = _WORD.findall(q)[:MAX_TERMS]
+    return " & ".join(f"{w}:*" for w in words) or None
+
+
+def text_match(document, q: Optional[str], vector=None) -> Optional[TextMatch]:
+    """Condition + rank for ``q`` against a ``search_document`` column and,
+    optionally, a ``search_vector``. Every word must occur in the document
+    (each one an index-assisted trigram ``LIKE``), or — with a vector — all
+    words must prefix-match it. Returns None for a blank query."""
+    q = normalize_query(q)
+    if not q:
+        return None
+
+    condition = and_(*[document.like(_like_pattern(t), escape="\\") for t in _terms(q)])
+    rank = func.word_similarity(q, document)
+
+    tsquery = prefix_tsquery(q) if vector is not None else None
+    if tsquery:
+        ts = func.to_tsquery(TS_CONFIG, tsquery)
+        condition = or_(condition, vector.op("@@")(ts))
+        rank = rank + func.ts_rank_cd(vector, ts)
+
+    return TextMatch(condition=condition, rank=rank)
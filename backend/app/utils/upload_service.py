@@ -0,0 +1,95 @@
+"""Forwarding user uploads to ``UPLOAD_SERVICE_URL``.
+
+  • ``get_upload_client`` — one pooled ``httpx.Client`` per process, so
+    keep-alive connections to the upload service are reused instead of a
+    new client (and TLS handshake) per file. It is the sync client because
+    ``core.blocking`` runs each handler on its own short-lived event loop,
+    which an ``AsyncClient``'s connections can't outlive; the sync client
+    is thread-safe.
+  • ``forward_upload``    — posts one ``UploadFile``. The multipart body is
+    read from the spooled upload in fixed-size chunks as it is sent, so
+    memory per upload stays constant whatever the file size.
+  • ``forward_uploads``   — forwards several files concurrently on worker
+    threads, at most ``MAX_CONCURRENT_UPLOADS`` at a time, and returns one
+    result per file, in order. A failed file doesn't stop the others.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import List, Optional, Sequence
+
+import httpx
+from fastapi import UploadFile
+
+from core.config import UPLOAD_SERVICE_URL
+
+MAX_CONCURRENT_UPLOADS = 4
+DEFAULT_TIMEOUT = 60
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+class UploadError(Exception):
+    """The upload service rejected the file or could not be reached."""
+
+
+def get_upload_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=10.0),
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                )
+    return _client
+
+
+def upload_size(file: UploadFile) -> int:
+    """Size in bytes without reading the file into memory."""
+    if file.size is not None:
+        return file.size
+    fh = file.file
+    fh.seek(0, os.SEEK_END)
+    size = fh.tell()
+    fh.seek(0)
+    return size
+
+
+def forward_upload(file: UploadFile, filename: str, target_path: str,
+                   content_type: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """Upload one file and return the service's ``data`` (``url``, …)."""
+    file.file.seek(0)
+    try:
+        resp = get_upload_client().post(
+            UPLOAD_SERVICE_URL,
+            data={"target_path": target_path},
+            files={"file": (filename, file.file, content_type or file.content_type)},
+            timeout=timeout,
+        )
+        result = resp.json()
+    except Exception as e:
+        raise UploadError(f"Upload failed: {str(e)}") from e
+    if not result.get("success"):
+        raise UploadError(result.get("message", "Upload failed"))
+    return result["data"]
+
+
+async def forward_uploads(items: Sequence[tuple], target_path: str, timeout: float = DEFAULT_TIMEOUT,
+                          concurrency: int = MAX_CONCURRENT_UPLOADS) -> List[dict]:
+    """``items`` are ``(file, filename)`` pairs. Each result is
+    ``{"success": True, "data": {...}}`` or ``{"success": False, "message": ...}``."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(file: UploadFile, filename: str) -> dict:
+        async with semaphore:
+            try:
+                data = await asyncio.to_thread(forward_upload, file, filename, target_path, None, timeout)
+            except UploadError as e:
+                return {"success": False, "message": str(e)}
+            return {"success": True, "data": data}
+
+    return list(await asyncio.gather(*(one(f, name) for f, name in items)))
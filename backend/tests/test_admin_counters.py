@@ -0,0 +1,38 @@
+"""Tests for the admin dashboard counter deltas (models/admin_counters).
+
+Run with: ``pytest backend/tests/test_admin_counters.py -q``
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from models import LiveChatSession, ServiceBookingRequest, SupportTicket, UserFeed  # noqa: E402
+from models.admin_counters import _DELTAS_KEY, _collect_counter_deltas  # noqa: E402
+from models.enums import ChatSessionStatusEnum  # noqa: E402
+
+
+def test_inserts_and_deletes_use_column_defaults_and_filters():
+    session = SimpleNamespace(
+        new=[SupportTicket(), ServiceBookingRequest(status="accepted")],
+        deleted=[UserFeed(is_active=True)],
+        dirty=[],
+        info={},
+    )
+    _collect_counter_deltas(session, None, None)
+    assert session.info[_DELTAS_KEY] == {"open_tickets": 1, "total_bookings": 1, "total_posts": -1}
+
+
+def test_status_change_moves_between_counters():
+    chat = LiveChatSession()
+    set_committed_value(chat, "status", ChatSessionStatusEnum.waiting)
+    chat.status = ChatSessionStatusEnum.active
+    session = SimpleNamespace(new=[], deleted=[], dirty=[chat], info={})
+    _collect_counter_deltas(session, None, None)
+    assert session.info[_DELTAS_KEY] == {"waiting_chats": -1, "active_chats": 1}
@@ -0,0 +1,93 @@
+"""Tests for the finance report writers (services/admin_reports).
+
+Run with: ``pytest backend/tests/test_admin_reports.py -q``
+"""
+import io
+import os
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from services import admin_reports  # noqa: E402
+
+
+def test_pdf_is_written_from_a_generator_in_chunks(monkeypatch):
+    monkeypatch.setattr(admin_reports, "PDF_TABLE_ROWS", 50)
+    consumed = []
+
+    def rows():
+        for i in range(120):
+            consumed.append(i)
+            yield [f"2026-01-{i % 28 + 1:02d}", i, float(i)]
+
+    fh = io.BytesIO()
+    count = admin_reports.write_pdf(
+        fh, "Daily Collections", ["Date", "Transactions", "Gross"], rows(),
+        date(2026, 1, 1), date(2026, 1, 31), generated_by="Test",
+    )
+    assert count == 120 == len(consumed)
+    assert fh.getvalue().startswith(b"%PDF")
+
+
+def test_pdf_totals_skip_blank_and_decimal_cells():
+    from decimal import Decimal
+    rows = [
+        ["Alice", 1, 10.5],
+        ["Bob", None, Decimal("2.25")],
+        ["Carol", 3, "n/a"],
+    ]
+    fh = io.BytesIO()
+    count = admin_reports.write_pdf(
+        fh, "Vendor Earnings", ["Name", "Transactions", "Net"], iter(rows),
+        date(2026, 1, 1), date(2026, 1, 31), generated_by="Test",
+    )
+    assert count == 3
+    assert fh.getvalue().startswith(b"%PDF")
+
+
+def test_empty_pdf():
+    fh = io.BytesIO()
+    count = admin_reports.write_pdf(
+        fh, "Failed Payments", ["TX Code"], iter([]),
+        date(2026, 1, 1), date(2026, 1, 31), generated_by="Test",
+    )
+    assert count == 0
+    assert fh.getvalue().startswith(b"%PDF")
+
+
+class _Query:
+    def __init__(self, job):
+        self.job = job
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def first(self):
+        return self.job
+
+
+class _Db:
+    def __init__(self, job):
+        self.job = job
+
+    def query(self, model):
+        return _Query(self.job)
+
+
+def test_lost_job_is_failed_instead_of_reused():
+    now = datetime.utcnow()
+    fresh = SimpleNamespace(status="queued", created_at=now - timedelta(minutes=1), started_at=None)
+    assert admin_reports.reusable_job(_Db(fresh), "daily_collections", date(2026, 1, 1), date(2026, 1, 31)) is fresh
+
+    lost = SimpleNamespace(status="processing", created_at=now - timedelta(hours=1),
+                           started_at=now - timedelta(minutes=30), finished_at=None, error_message=None)
+    assert admin_reports.reusable_job(_Db(lost), "daily_collections", date(2026, 1, 1), date(2026, 1, 31)) is None
+    assert lost.status == "failed" and lost.finished_at is not None
@@ -0,0 +1,28 @@
+"""Tests for the cached committee permission lookup (services/committee_permissions).
+
+Run with: ``pytest backend/tests/test_committee_permissions.py -q``
+"""
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from services import committee_permissions as cp  # noqa: E402
+
+
+def test_cached_member_reads_like_a_permission_row(monkeypatch):
+    monkeypatch.setattr(cp, "cache_get", lambda key: {
+        "member": True, "member_id": "m1", "role": "Treasurer", "can_manage_budget": True,
+    })
+    perms = cp.get_member_permissions(None, "e1", "u1")
+    assert perms.role == "Treasurer"
+    assert perms.can_manage_budget
+    assert not getattr(perms, "can_edit_event", False)
+
+
+def test_cached_non_member_is_none(monkeypatch):
+    monkeypatch.setattr(cp, "cache_get", lambda key: {"member": False})
+    assert cp.get_member_permissions(None, "e1", "u1") is None
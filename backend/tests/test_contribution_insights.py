@@ -0,0 +1,52 @@
+"""Tests for the read-time shaping in services/contribution_insights.
+
+Run with: ``pytest backend/tests/test_contribution_insights.py -q``
+"""
+import os
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+
+def _row(**overrides):
+    row = dict(
+        currency="TZS", total_pledged=300, total_paid=250, total_pending=0, total_balance=50,
+        events_count=2, complete_count=1, active_count=1, pending_count=0,
+        payments_count=4, organisations_supported=1, avg_per_event=125.0, on_time_rate=50.0,
+        first_contribution_at=datetime(2025, 1, 5), last_contribution_at=datetime(2026, 3, 2),
+        biggest_contribution=None, by_method=[], top_organisers=[],
+        monthly={
+            "2025-01": {"amount": 50, "count": 1},
+            "2026-01": {"amount": 50, "count": 1},
+            "2026-02": {"amount": 50, "count": 1},
+            "2026-03": {"amount": 100, "count": 1},
+        },
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def test_trailing_window_and_streak():
+    from services.contribution_insights import insights_payload
+
+    data = insights_payload(_row(), now=datetime(2026, 3, 15))
+    months = [m["month"] for m in data["by_month"]]
+    assert months[0] == "2025-04" and months[-1] == "2026-03"
+    assert len(months) == 12
+    # 2025-01 falls outside the window.
+    assert sum(m["count"] for m in data["by_month"]) == 3
+    assert data["streak_months"] == 3
+    assert data["impact_message"].startswith("3 months of giving")
+
+
+def test_streak_breaks_on_current_empty_month():
+    from services.contribution_insights import insights_payload
+
+    data = insights_payload(_row(), now=datetime(2026, 4, 1))
+    assert data["streak_months"] == 0
+    assert data["impact_message"] == "You've contributed 4 times so far. Every gift counts."
@@ -0,0 +1,30 @@
+"""Tests for the HyperLogLog sketch used by the analytics rollups.
+
+Run with: ``pytest backend/tests/test_hll.py -q``
+"""
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from utils import hll  # noqa: E402
+
+
+def test_small_counts_are_exact():
+    assert hll.count(hll.build([])) == 0
+    assert hll.count(hll.build(["a", "b", "a", None, ""])) == 2
+
+
+def test_large_count_within_error():
+    sketch = hll.build(f"visitor-{i}" for i in range(50000))
+    assert abs(hll.count(sketch) - 50000) / 50000 < 0.05
+
+
+def test_merge_is_union():
+    day1 = hll.build(f"v{i}" for i in range(0, 3000))
+    day2 = hll.build(f"v{i}" for i in range(2000, 5000))
+    merged = hll.count(hll.merge([day1, day2, None]))
+    assert abs(merged - 5000) / 5000 < 0.05
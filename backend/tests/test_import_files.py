@@ -0,0 +1,41 @@
+"""Tests for the streaming spreadsheet readers in utils/import_files.
+
+Run with: ``pytest backend/tests/test_import_files.py -q``
+"""
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from utils.import_files import iter_chunks, iter_sheet_records  # noqa: E402
+
+FIELDS = {
+    "name": (("name", "full name"), 0),
+    "phone": (("phone", "mobile"), 1),
+}
+
+
+def test_records_by_header(tmp_path):
+    path = tmp_path / "sheet.csv"
+    path.write_text("Mobile,Full Name\n0653750805,Asha\n,\n0712000000,Juma\n")
+    rows = list(iter_sheet_records(str(path), FIELDS))
+    assert rows == [
+        {"_row": 2, "name": "Asha", "phone": "0653750805"},
+        {"_row": 4, "name": "Juma", "phone": "0712000000"},
+    ]
+
+
+def test_records_by_position_without_header(tmp_path):
+    path = tmp_path / "sheet.csv"
+    path.write_text("Asha,0653750805\nJuma,0712000000\n")
+    rows = list(iter_sheet_records(str(path), FIELDS))
+    assert [r["_row"] for r in rows] == [1, 2]
+    assert rows[1]["name"] == "Juma"
+
+
+def test_iter_chunks_is_bounded():
+    chunks = list(iter_chunks(iter(range(7)), 3))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
@@ -0,0 +1,28 @@
+"""Tests for the keyset cursor helpers in utils/helpers.
+
+Run with: ``pytest backend/tests/test_keyset_cursor.py -q``
+"""
+import os
+import sys
+import uuid
+from datetime import datetime
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from utils.helpers import decode_cursor, encode_cursor  # noqa: E402
+
+
+def test_round_trip_keeps_microseconds():
+    at, row_id = datetime(2026, 6, 14, 10, 0, 0, 123456), uuid.uuid4()
+    cursor = encode_cursor(at, row_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (at, row_id)
+
+
+def test_malformed_cursor_is_rejected():
+    assert decode_cursor(None) is None
+    assert decode_cursor("not-a-cursor") is None
+    assert decode_cursor(encode_cursor(datetime(2026, 1, 1), "x")) is None
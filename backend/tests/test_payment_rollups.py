@@ -0,0 +1,72 @@
+"""Tests for the daily payment rollups (models/payment_rollups, services/admin_reports).
+
+Run with: ``pytest backend/tests/test_payment_rollups.py -q``
+"""
+import os
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+import core.celery_app  # noqa: E402
+from models import Transaction, UserProfile  # noqa: E402
+from models.payment_rollups import _DIRTY_KEY, _collect_transaction_days  # noqa: E402
+from services import admin_reports, payment_rollups  # noqa: E402
+
+
+def test_new_transaction_marks_creation_and_completion_days():
+    tx = Transaction(completed_at=datetime(2026, 5, 31, 23, 59))
+    session = SimpleNamespace(new=[tx, UserProfile()], dirty=[], deleted=[], info={})
+    _collect_transaction_days(session, None, None)
+    assert session.info[_DIRTY_KEY] == {datetime.utcnow().date(), date(2026, 5, 31)}
+
+
+def test_weekly_collections_sum_daily_rollups(monkeypatch):
+    def row(d, n):
+        return {"day": d, "tx_count": n, "gross": Decimal(n * 100),
+                "commission": Decimal(n * 5), "net": Decimal(n * 95)}
+
+    days = [row(date(2026, 6, 7), 1), row(date(2026, 6, 8), 2), row(date(2026, 6, 9), 3)]
+    monkeypatch.setattr(payment_rollups, "totals", lambda *a, **k: days)
+    headers, rows = admin_reports.weekly_collections(None, date(2026, 6, 1), date(2026, 6, 14))
+    assert headers[0] == "ISO Week"
+    assert list(rows) == [
+        ["2026-23", 1, 100.0, 5.0, 95.0],
+        ["2026-24", 5, 500.0, 25.0, 475.0],
+    ]
+
+
+class _Query:
+    def __init__(self, log, cols):
+        self.log, self.cols = log, cols
+
+    def filter(self, *criteria):
+        self.log.append(" ".join(str(c) for c in criteria))
+        return self
+
+    def group_by(self, *cols):
+        return self
+
+    def all(self):
+        return []
+
+
+class _Db:
+    def __init__(self):
+        self.log = []
+
+    def query(self, *cols):
+        return _Query(self.log, cols)
+
+
+def test_totals_aggregate_live_without_celery(monkeypatch):
+    monkeypatch.setattr(core.celery_app, "CELERY_ENABLED", False)
+    db = _Db()
+    rows = payment_rollups.totals(db, date(2026, 1, 1), date(2026, 1, 31))
+    assert rows == [{"tx_count": 0, "gross": 0, "commission": 0, "net": 0}]
+    assert db.log and not any("payment_daily_rollups" in f for f in db.log)
@@ -0,0 +1,33 @@
+"""Tests for the People You May Know dirty tracking (models/user_suggestions).
+
+Run with: ``pytest backend/tests/test_people_suggestions.py -q``
+"""
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from models import CommunityMember, EventInvitation, UserCircle, UserFollower, UserProfile  # noqa: E402
+from models.user_suggestions import _DIRTY_KEY, _collect_graph_changes  # noqa: E402
+
+
+def test_graph_edges_mark_both_ends():
+    a, b, c, d, e = (uuid.uuid4() for _ in range(5))
+    session = SimpleNamespace(
+        new=[UserFollower(follower_id=a, following_id=b), EventInvitation(invited_user_id=None)],
+        deleted=[UserCircle(user_id=c, circle_member_id=d), CommunityMember(user_id=e)],
+        info={},
+    )
+    _collect_graph_changes(session, None, None)
+    assert session.info[_DIRTY_KEY] == {a, b, c, d, e}
+
+
+def test_unrelated_writes_are_ignored():
+    session = SimpleNamespace(new=[UserProfile(user_id=uuid.uuid4())], deleted=[], info={})
+    _collect_graph_changes(session, None, None)
+    assert _DIRTY_KEY not in session.info
@@ -0,0 +1,34 @@
+"""Tests for the last-9-digit phone key helpers in utils/phone_numbers.
+
+Run with: ``pytest backend/tests/test_phone_numbers.py -q``
+"""
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from utils.phone_numbers import match_phone_key, phone_key  # noqa: E402
+
+
+def test_phone_key_formats_agree():
+    assert phone_key("+255 653 750 805") == "653750805"
+    assert phone_key("0653750805") == "653750805"
+    assert phone_key("255653750805") == "653750805"
+    assert phone_key("653-750-805") == "653750805"
+
+
+def test_phone_key_too_short():
+    assert phone_key(None) is None
+    assert phone_key("") is None
+    assert phone_key("12345") is None
+
+
+def test_match_phone_key_clause():
+    from sqlalchemy import column
+
+    clause = match_phone_key(column("phone_key"), "0653750805")
+    assert clause.right.value == "653750805"
+    assert str(match_phone_key(column("phone_key"), "123")) == "false"
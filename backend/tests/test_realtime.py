@@ -0,0 +1,109 @@
+"""Tests for the per-process pub/sub hub in core/realtime.
+
+A fake pub/sub object stands in for Redis so the fan-out, overflow and
+unsubscribe bookkeeping can be exercised without a server.
+
+Run with: ``pytest backend/tests/test_realtime.py -q``
+"""
+import asyncio
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from core import realtime  # noqa: E402
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels = set()
+        self.inbox = asyncio.Queue()
+
+    @property
+    def subscribed(self):
+        return bool(self.channels)
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.inbox.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+    def deliver(self, channel, data):
+        self.inbox.put_nowait({"type": "message", "channel": channel, "data": data})
+
+
+def _hub(monkeypatch):
+    hub = realtime._Hub()
+    fake = FakePubSub()
+
+    async def _start():
+        if hub._reader is None:
+            hub._pubsub = fake
+            hub._reader = asyncio.create_task(hub._read())
+
+    monkeypatch.setattr(hub, "_ensure_started", _start)
+    monkeypatch.setattr(realtime, "REDIS_ENABLED", True)
+    return hub, fake
+
+
+def test_fan_out_and_unsubscribe(monkeypatch):
+    async def scenario():
+        hub, fake = _hub(monkeypatch)
+        async with hub.subscribe(["a"]) as q1, hub.subscribe(["a", "b"]) as q2:
+            assert fake.channels == {"a", "b"}
+            fake.deliver("a", "one")
+            fake.deliver("b", "two")
+            assert await q1.get() == "one"
+            assert [await q2.get(), await q2.get()] == ["one", "two"]
+            assert q1.empty()
+        assert fake.channels == set()
+        hub._reader.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_is_dropped(monkeypatch):
+    monkeypatch.setattr(realtime, "QUEUE_SIZE", 2)
+
+    async def scenario():
+        hub, fake = _hub(monkeypatch)
+        async with hub.subscribe(["a"]) as q:
+            for i in range(3):
+                fake.deliver("a", str(i))
+            await asyncio.sleep(0.05)
+            # Oldest event makes room for the reconnect sentinel.
+            assert [q.get_nowait(), q.get_nowait()] == ["1", None]
+            assert not hub._queues.get("a")
+        hub._reader.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_sse_stream_frames(monkeypatch):
+    async def scenario():
+        hub, fake = _hub(monkeypatch)
+        monkeypatch.setattr(realtime, "_hub", hub)
+        stream = realtime.stream_sse(["u"], ready={"unread": {"notifications": 2}})
+        first = await stream.__anext__()
+        assert first.startswith("retry: ") and first.endswith("\n\n")
+        assert '"type": "ready"' in first and '"notifications": 2' in first
+        fake.deliver("u", realtime.encode("unread.updated", {"messages": 1}))
+        assert await stream.__anext__() == "data: " + realtime.encode("unread.updated", {"messages": 1}) + "\n\n"
+        await stream.aclose()
+        assert fake.channels == set()
+        hub._reader.cancel()
+
+    asyncio.run(scenario())
@@ -0,0 +1,56 @@
+"""Tests for services/service_ranking (SQL-side service search ranking).
+
+Run with: ``pytest backend/tests/test_service_ranking.py -q``
+"""
+import math
+import os
+import sys
+import uuid
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from services.service_ranking import (  # noqa: E402
+    KM_PER_DEGREE, bounding_box, relevance_score, within_radius,
+)
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 6371 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def test_bounding_box_encloses_radius():
+    lat, lng, radius = -6.7924, 39.2083, 50  # Dar es Salaam
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
+    assert math.isclose(max_lat - lat, radius / KM_PER_DEGREE)
+    # Points on the circle in each direction fall inside the box.
+    for bearing in range(0, 360, 15):
+        b = math.radians(bearing)
+        d = radius / 6371
+        plat = math.asin(math.sin(math.radians(lat)) * math.cos(d)
+                         + math.cos(math.radians(lat)) * math.sin(d) * math.cos(b))
+        plng = math.radians(lng) + math.atan2(
+            math.sin(b) * math.sin(d) * math.cos(math.radians(lat)),
+            math.cos(d) - math.sin(math.radians(lat)) * math.sin(plat),
+        )
+        plat, plng = math.degrees(plat), math.degrees(plng)
+        assert abs(_haversine(lat, lng, plat, plng) - radius) < 0.01
+        assert min_lat <= plat <= max_lat and min_lng <= plng <= max_lng
+
+
+def test_score_compiles_for_postgres():
+    score = relevance_score([uuid.uuid4()], -6.79, 39.21, "Arusha")
+    sql = str(score.compile(dialect=postgresql.dialect()))
+    assert "rating_avg" in sql and "rating_count" in sql
+    assert sql.count("EXISTS") == 2
+    assert "asin" in sql
+
+    where = str(within_radius(-6.79, 39.21, 25).compile(dialect=postgresql.dialect()))
+    assert "BETWEEN" in where and "latitude IS NULL" in where
@@ -0,0 +1,44 @@
+"""Tests for concurrent upload forwarding (utils/upload_service).
+
+Run with: ``pytest backend/tests/test_upload_service.py -q``
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+import httpx
+from fastapi import UploadFile
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from utils import upload_service  # noqa: E402
+
+
+def _upload(name: str, body: bytes) -> UploadFile:
+    fh = tempfile.SpooledTemporaryFile()
+    fh.write(body)
+    fh.seek(0)
+    return UploadFile(fh, filename=name)
+
+
+def test_forward_uploads_returns_one_result_per_file(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        if b"bad.jpg" in body:
+            return httpx.Response(200, json={"success": False, "message": "Unsupported file"})
+        return httpx.Response(200, json={"success": True, "data": {"url": f"https://cdn/{len(body)}"}})
+
+    monkeypatch.setattr(upload_service, "UPLOAD_SERVICE_URL", "https://upload.test/")
+    monkeypatch.setattr(upload_service, "_client", httpx.Client(transport=httpx.MockTransport(handler)))
+
+    files = [_upload("a.jpg", b"a" * 200_000), _upload("b.jpg", b"b"), _upload("c.jpg", b"c")]
+    items = [(files[0], "a.jpg"), (files[1], "bad.jpg"), (files[2], "c.jpg")]
+    results = asyncio.run(upload_service.forward_uploads(items, "nuru/uploads/general/x/", concurrency=2))
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["message"] == "Unsupported file"
+    assert upload_service.upload_size(files[0]) == 200_000
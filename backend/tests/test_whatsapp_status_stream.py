@@ -0,0 +1,39 @@
+"""Tests for coalescing queued Meta statuses (services/whatsapp_status_stream).
+
+Run with: ``pytest backend/tests/test_whatsapp_status_stream.py -q``
+"""
+import os
+import sys
+
+HERE = os.path.dirname(__file__)
+APP = os.path.abspath(os.path.join(HERE, "..", "app"))
+if APP not in sys.path:
+    sys.path.insert(0, APP)
+
+from services.whatsapp_status_stream import coalesce  # noqa: E402
+
+
+def test_each_wamid_keeps_its_furthest_state():
+    by_wamid, _ = coalesce([
+        {"id": "wamid.A", "status": "sent"},
+        {"id": "wamid.A", "status": "read"},
+        {"id": "wamid.A", "status": "delivered"},  # arrives late
+        {"id": "wamid.B", "status": "sent"},
+        {"id": "wamid.B", "status": "failed", "errors": [{"code": 131026, "title": "Not on WhatsApp"}]},
+        {"id": "wamid.B", "status": "delivered"},
+    ])
+    assert by_wamid["wamid.A"]["status"] == "read"
+    assert by_wamid["wamid.B"]["status"] == "failed"
+    assert by_wamid["wamid.B"]["error_code"] == "131026"
+    assert by_wamid["wamid.B"]["error_message"] == "Not on WhatsApp"
+
+
+def test_a_recipient_reached_once_counts_as_reached():
+    _, by_phone = coalesce([
+        {"id": "wamid.A", "status": "failed", "recipient_id": "255700000001", "errors": [{"code": 131049}]},
+        {"id": "wamid.B", "status": "delivered", "recipient_id": "255700000001"},
+        {"id": "wamid.C", "status": "failed", "recipient_id": "255700000001", "errors": [{"code": 131049}]},
+        {"id": "wamid.D", "status": "failed", "recipient_id": "255700000002", "errors": [{"code": 131047}]},
+    ])
+    assert by_phone["255700000001"]["status"] == "delivered"
+    assert by_phone["255700000002"]["error_code"] == "131047"